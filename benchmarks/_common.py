@@ -0,0 +1,152 @@
+# benchmarks/_common.py
+# 基准脚本公共部分：导入插件包（不加载 main.py / astrbot），加载/放大 fixtures 回包，生成合成 Qzone 负载，计时。
+
+from __future__ import annotations
+
+import importlib
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+_TID_RE = re.compile(r"\b([0-9a-f]{8})([0-9a-f]{8})([0-9a-f]{8})\b")
+
+
+def load(module: str) -> Any:
+    """Import `<plugin dir>.<module>` so relative imports inside the plugin keep working."""
+
+    parent = str(ROOT.parent)
+    if parent not in sys.path:
+        sys.path.insert(0, parent)
+    return importlib.import_module(f"{ROOT.name}.{module}")
+
+
+def fixture(name: str) -> str:
+    """Raw text of an anonymized recorded response in benchmarks/fixtures/."""
+
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+def _retag(item: str, copy: int) -> str:
+    # Give replicated items distinct 24-hex tids so dedup-by-tid doesn't collapse them.
+    if not copy:
+        return item
+    return _TID_RE.sub(lambda m: m.group(1) + f"{copy:08x}" + m.group(3), item)
+
+
+def scale_js_array(text: str, key: str, n: int) -> str:
+    """Replicate the items of the `key:[...]` array in a JS-literal/JSON payload up to `n` items."""
+
+    jsparse = load("qzone_jsparse")
+    m = re.search(r"[\"']?\b" + re.escape(key) + r"[\"']?\s*:\s*\[", text)
+    if not m:
+        raise ValueError(f"array {key!r} not found")
+    items: List[str] = []
+    pos = m.end()
+    while True:
+        pos = jsparse._skip_ws(text, pos)
+        if text[pos] == "]":
+            end = pos
+            break
+        _, e = jsparse.parse_value(text, pos)
+        items.append(text[pos:e])
+        pos = jsparse._skip_ws(text, e)
+        if text[pos] == ",":
+            pos += 1
+    if not items:
+        raise ValueError(f"array {key!r} is empty")
+    out = [_retag(items[i % len(items)], i // len(items)) for i in range(n)]
+    return text[: m.end()] + ",".join(out) + text[end:]
+
+
+def scale_module_html(html: str, n: int) -> str:
+    """Replicate `<li class="f-single ...">` feed blocks of a feeds_html_module page up to `n`."""
+
+    marker = '<li class="f-single'
+    parts = html.split(marker)
+    head, blocks = parts[0], parts[1:]
+    tail_at = blocks[-1].rfind("</ul>")
+    tail = blocks[-1][tail_at:]
+    blocks[-1] = blocks[-1][:tail_at]
+    out = [_retag(marker + blocks[i % len(blocks)], i // len(blocks)) for i in range(n)]
+    return head + "".join(out) + tail
+
+
+class FixtureResponse:
+    def __init__(self, text: str, status_code: int = 200):
+        self.status_code = status_code
+        self.text = text
+        self.content = text.encode("utf-8")
+        self.encoding = "utf-8"
+
+
+class FixtureSession:
+    """requests.Session stand-in: returns canned bodies by URL substring (no network)."""
+
+    def __init__(self, routes: Dict[str, str], default: Optional[str] = None):
+        self.routes = routes
+        self.default = default
+
+    def _serve(self, url: str) -> FixtureResponse:
+        for needle, body in self.routes.items():
+            if needle in url:
+                return FixtureResponse(body)
+        if self.default is not None:
+            return FixtureResponse(self.default)
+        return FixtureResponse("", 404)
+
+    def get(self, url: str, **kwargs: Any) -> FixtureResponse:
+        return self._serve(url)
+
+    def post(self, url: str, **kwargs: Any) -> FixtureResponse:
+        return self._serve(url)
+
+
+def synth_feed_item_html(i: int, host_uin: str = "10001", comments: int = 3, pad: int = 9000) -> str:
+    """One escaped feed html blob as it appears inside a feeds3_html_more JS literal."""
+
+    tid = f"{i:08x}a1b2c3d4e5f6"
+    parts = [
+        "\\x3Cli class=\\\"f-single f-s-s\\\"\\x3E",
+        f"\\x3Ci name=\\\"feed_data\\\" data-tid=\\\"{tid}\\\" data-topicid=\\\"{host_uin}_{tid}__1\\\" "
+        f"data-abstime=\\\"{1700000000 + i}\\\" data-uin=\\\"{host_uin}\\\"\\x3E\\x3C\\/i\\x3E",
+        f"\\x3Cdiv class=\\\"f-info\\\"\\x3E synthetic mood #{i} \\x3C\\/div\\x3E",
+    ]
+    for c in range(comments):
+        parts.append(
+            f"\\x3Cli class=\\\"comments-item bor3\\\" data-type=\\\"commentroot\\\" data-tid=\\\"{c + 1}\\\" "
+            f"data-uin=\\\"{20000 + c}\\\" data-nick=\\\"n{c}\\\"\\x3E\\x3C\\/li\\x3E"
+        )
+    body = "".join(parts)
+    filler = "\\x3Cspan class=\\\"pad\\\"\\x3E[x] \\'q\\' \\x3C\\/span\\x3E"
+    while len(body) < pad:
+        body += filler
+    return body + "\\x3C\\/li\\x3E"
+
+
+def synth_feeds3_payload(items: int = 200, pad: int = 9000, key: str = "data") -> str:
+    """A feeds3_html_more-style `_Callback({...})` JS-literal response (~items * pad bytes)."""
+
+    rows: List[str] = []
+    for i in range(items):
+        rows.append(
+            "{appid:'311',typeid:'0',key:'k%d',abstime:'%d',html:'%s',opuin:'10001',uin:'10001',nickname:'x'}"
+            % (i, 1700000000 + i, synth_feed_item_html(i, pad=pad))
+        )
+    return "_Callback({code:0,subcode:0,message:'',data:{main:{hasMoreFeeds:true},%s:[%s]}});" % (key, ",".join(rows))
+
+
+def timeit(fn: Callable[[], Any], repeat: int = 5) -> Tuple[float, Any]:
+    """Best-of-`repeat` wall time in seconds, plus the last result."""
+
+    best = float("inf")
+    result = None
+    for _ in range(max(1, repeat)):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
@@ -0,0 +1,85 @@
+# benchmarks/bench_blob_extract.py
+# html blob 提取基准：合成的大 feeds3_html_more 负载（默认 200 条 / ~2MB）。
+#
+#   python benchmarks/bench_blob_extract.py [--items 200] [--pad 10000] [--repeat 5]
+#
+# 对比 qzone_jsparse.slice_html_items 与旧的“每次 match 都切片剩余负载”写法（保留在本文件里作为参照）。
+
+from __future__ import annotations
+
+import argparse
+import re
+from typing import Any, Dict, List
+
+from _common import load, synth_feeds3_payload, timeit
+
+
+def _legacy_iter_html_blobs(arr_body: str, limit: int = 200) -> List[str]:
+    # Previous qzone_protect implementation: copies the remaining payload for every match.
+    out: List[str] = []
+    for m in re.finditer(r"\bhtml\s*:\s*", arr_body):
+        tail = arr_body[m.end() :]
+        end_m = re.search(r",\s*opuin\s*:\s*", tail)
+        if not end_m:
+            end_m = re.search(r",\s*uin\s*:\s*", tail)
+        if not end_m:
+            continue
+        blob = tail[: end_m.start()].strip().rstrip(",")
+        html = blob[1:-1] if len(blob) >= 2 and blob[0] in ("'", '"') and blob[-1] == blob[0] else blob
+        html = html.replace("\\x3C", "<").replace("\\x3E", ">").replace("\\/", "/")
+        html = html.replace("\\\"", '"').replace("\\'", "'").replace("\\x22", '"')
+        out.append(html)
+        if limit > 0 and len(out) >= limit:
+            break
+    return out
+
+
+def _legacy_feed_items(arr: str) -> List[Dict[str, Any]]:
+    # Previous qzone_feed_fetch loop body (array already located).
+    items: List[Dict[str, Any]] = []
+    abstime_pat = re.compile(r"\babstime\s*:\s*'?([0-9]{6,})'?")
+    for m in re.finditer(r"\bhtml\s*:\s*", arr):
+        end_m = re.search(r",\s*opuin\s*:\s*", arr[m.end() :])
+        if not end_m:
+            continue
+        html_blob = arr[m.end() : m.end() + end_m.start()].strip().rstrip(",")
+        html = html_blob[1:-1] if len(html_blob) >= 2 and html_blob[0] in ("'", '"') and html_blob[-1] == html_blob[0] else html_blob
+        html = html.replace("\\x3C", "<").replace("\\x3E", ">").replace("\\/", "/")
+        html = html.replace("\\\"", '"').replace("\\'", "'").replace("\\x22", '"')
+        am = abstime_pat.search(arr[m.end() : m.end() + 2000])
+        items.append({"html": html, "abstime": am.group(1) if am else ""})
+        if len(items) >= 200:
+            break
+    return items
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--items", type=int, default=200)
+    ap.add_argument("--pad", type=int, default=10000, help="approx bytes of html per item")
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    jsparse = load("qzone_jsparse")
+
+    payload = synth_feeds3_payload(args.items, pad=args.pad)
+    mb = len(payload) / 1e6
+    print(f"payload: items={args.items} size={mb:.2f}MB")
+
+    # old code sliced the array body out first; kept here only as the legacy input
+    start = payload.index("data:[") + len("data:[")
+    arr_body = payload[start : payload.rindex("]", start, payload.rindex("}"))]
+
+    t_new, new = timeit(lambda: jsparse.slice_html_items(payload, "data", limit=0), args.repeat)
+    print(f"slice_html_items  : {t_new * 1000:8.1f} ms  ({mb / t_new:7.1f} MB/s) items={len(new)} (incl. array scan)")
+
+    t_old, old = timeit(lambda: _legacy_iter_html_blobs(arr_body, limit=0), args.repeat)
+    assert [x["html"] for x in new] == old, "html blob extraction mismatch"
+    print(f"legacy html_blobs : {t_old * 1000:8.1f} ms  (x{t_old / max(t_new, 1e-9):.1f}, excl. array scan)")
+
+    t_old, old = timeit(lambda: _legacy_feed_items(arr_body), args.repeat)
+    assert new[:200] == old, "feed item extraction mismatch"
+    print(f"legacy feed items : {t_old * 1000:8.1f} ms  (x{t_old / max(t_new, 1e-9):.1f}, excl. array scan, first 200)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+# benchmarks/bench_feed_html.py
+# feed_data 属性提取微基准：qzone_feed_html（归一化一次 + 单个预编译正则）vs 旧的逐变体 re.search 链。
+#
+#   python benchmarks/bench_feed_html.py [--corpus saved_feeds3_response.txt] [--repeat 5]
+#
+# --corpus：从浏览器 DevTools 保存下来的 feeds3_html_more / feeds_html_act_all 原始回包；
+# 不给则用合成负载（单引号 / 双引号 / 转义双引号三种写法混合）。
+
+from __future__ import annotations
+
+import argparse
+import re
+from pathlib import Path
+from typing import Dict, List
+
+from _common import load, synth_feed_item_html, timeit
+
+
+def _legacy_extract(html: str) -> Dict[str, str]:
+    # Previous per-item logic (qzone_feed_fetch): up to 4 tag searches + 9 attribute patterns + time/info.
+    tag = ""
+    for pat in (
+        r"<i[^>]*\bname=\"feed_data\"[^>]*>",
+        r"<i[^>]*\bname='feed_data'[^>]*>",
+        r"<i[^>]*\bname=\\\"feed_data\\\"[^>]*>",
+        r"<i[^>]*\bname=\\'feed_data\\'[^>]*>",
+    ):
+        m = re.search(pat, html)
+        if m:
+            tag = m.group(0)
+            break
+    if not tag:
+        return {}
+    out: Dict[str, str] = {}
+    for pat, key in (
+        (r"\bdata-tid=\\\"([^\\\"]+)\\\"", "tid"),
+        (r"\bdata-uin=\\\"(\d+)\\\"", "uin"),
+        (r"\bdata-topicid=\\\"([^\\\"]+)\\\"", "topic"),
+        (r"\bdata-tid=\"([^\"]+)\"", "tid"),
+        (r"\bdata-uin=\"(\d+)\"", "uin"),
+        (r"\bdata-topicid=\"([^\"]+)\"", "topic"),
+        (r"\bdata-tid='([^']+)'", "tid"),
+        (r"\bdata-uin='(\d+)'", "uin"),
+        (r"\bdata-topicid='([^']+)'", "topic"),
+    ):
+        mm = re.search(pat, tag)
+        if mm and key not in out:
+            out[key] = mm.group(1)
+    for pat in (r"\bdata-abstime=\\\"(\d+)\\\"", r"\bdata-abstime=\"(\d+)\"", r"\bdata-abstime='(\d+)'"):
+        mm = re.search(pat, tag)
+        if mm:
+            out["abstime"] = mm.group(1)
+            break
+    m_fs = re.search(
+        r"<span[^>]*\bclass=\\\"[^\\\"]*\bstate\b[^\\\"]*\\\"[^>]*>\s*(\d{4}年\d{1,2}月\d{1,2}日\s*\d{1,2}:\d{2})\s*</span>",
+        html,
+        re.S,
+    ) or re.search(
+        r"<span[^>]*\bclass=\"[^\"]*\bstate\b[^\"]*\"[^>]*>\s*(\d{4}年\d{1,2}月\d{1,2}日\s*\d{1,2}:\d{2})\s*</span>",
+        html,
+        re.S,
+    )
+    out["feedstime"] = m_fs.group(1) if m_fs else ""
+    m_info = re.search(r"<div[^>]*class=\\\"f-info\\\"[^>]*>(.*?)</div>", html, re.S) or re.search(
+        r"<div[^>]*class=\"f-info\"[^>]*>(.*?)</div>", html, re.S
+    )
+    out["text"] = re.sub(r"\s+", " ", re.sub(r"<[^>]+>", "", m_info.group(1) if m_info else "")).strip()
+    return out
+
+
+def _corpus_from_file(path: Path, jsparse) -> List[str]:
+    text = path.read_text(encoding="utf-8", errors="ignore")
+    htmls: List[str] = []
+    for name in ("data", "friend_data", "host_data"):
+        try:
+            htmls = [str(x.get("html")) for x in jsparse.iter_array(text, name) if isinstance(x, dict) and x.get("html")]
+        except jsparse.JsParseError:
+            htmls = [x["html"] for x in jsparse.slice_html_items(text, name) or []]
+        if htmls:
+            break
+    return htmls
+
+
+def _synthetic_corpus(n: int) -> List[str]:
+    # Mixed quoting as seen across endpoints: escaped-double (raw JS), double (decoded), single.
+    out: List[str] = []
+    for i in range(n):
+        h = synth_feed_item_html(i, pad=4000).replace("\\x3C", "<").replace("\\x3E", ">").replace("\\/", "/")
+        h = h.replace(
+            "synthetic mood",
+            '<span class=\\"state\\">2025年12月11日 01:39</span><div class=\\"f-info\\">synthetic mood',
+            1,
+        )
+        if i % 3 == 1:
+            h = h.replace('\\"', '"')
+        elif i % 3 == 2:
+            h = h.replace('\\"', "'")
+        out.append(h)
+    return out
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--corpus", type=Path, default=None, help="saved raw feeds response (optional)")
+    ap.add_argument("--items", type=int, default=300, help="synthetic corpus size when --corpus is not given")
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    feed_html = load("qzone_feed_html")
+    jsparse = load("qzone_jsparse")
+
+    corpus = _corpus_from_file(args.corpus, jsparse) if args.corpus else _synthetic_corpus(args.items)
+    if not corpus:
+        raise SystemExit("no feed html found in corpus")
+    kb = sum(len(h) for h in corpus) / 1e3
+    print(f"corpus: items={len(corpus)} html={kb:.0f}KB source={args.corpus or 'synthetic'}")
+
+    def _new() -> List[Dict[str, str]]:
+        out = []
+        for h in corpus:
+            f = feed_html.feed_data(h)
+            out.append(
+                {
+                    "tid": f.tid,
+                    "uin": f.uin,
+                    "topic": f.topic_id,
+                    "abstime": str(f.abstime or ""),
+                    "feedstime": feed_html.state_time(f.html),
+                    "text": feed_html.info_text(f.html),
+                }
+            )
+        return out
+
+    t_new, new = timeit(_new, args.repeat)
+    t_old, old = timeit(lambda: [_legacy_extract(h) for h in corpus], args.repeat)
+    same = sum(1 for a, b in zip(new, old) if (a["tid"], a["topic"]) == (b.get("tid", ""), b.get("topic", "")))
+    n = len(corpus)
+    print(f"feed_html  : {t_new * 1000:8.2f} ms  ({t_new / n * 1e6:6.1f} us/item)")
+    print(f"legacy     : {t_old * 1000:8.2f} ms  ({t_old / n * 1e6:6.1f} us/item)  x{t_old / max(t_new, 1e-9):.1f}")
+    print(f"tid/topic agreement: {same}/{n}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+# benchmarks/bench_jsparse.py
+# qzone_jsparse 基准：完整解析 vs 懒解析前 N 条 vs 旧的锚点切片启发式。
+#
+#   python benchmarks/bench_jsparse.py [--items 200] [--pad 10000] [--take 20] [--repeat 5]
+
+from __future__ import annotations
+
+import argparse
+from itertools import islice
+
+from _common import load, synth_feeds3_payload, timeit
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--items", type=int, default=200)
+    ap.add_argument("--pad", type=int, default=10000, help="approx bytes of html per item")
+    ap.add_argument("--take", type=int, default=20, help="items consumed by the lazy path")
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    jsparse = load("qzone_jsparse")
+
+    payload = synth_feeds3_payload(args.items, pad=args.pad)
+    mb = len(payload) / 1e6
+    print(f"payload: items={args.items} size={mb:.2f}MB")
+
+    t, v = timeit(lambda: jsparse.parse_callback(payload), args.repeat)
+    print(f"parse_callback (full)     : {t * 1000:8.1f} ms  ({mb / t:6.1f} MB/s) items={len(v['data']['data'])}")
+
+    t, v = timeit(lambda: list(islice(jsparse.iter_array(payload, "data"), args.take)), args.repeat)
+    print(f"iter_array (first {args.take:>4})   : {t * 1000:8.1f} ms  items={len(v)}")
+
+    t, v = timeit(lambda: jsparse.slice_html_items(payload, "data", limit=0), args.repeat)
+    print(f"anchor slicing (html only): {t * 1000:8.1f} ms  blobs={len(v)}")
+
+
+if __name__ == "__main__":
+    main()
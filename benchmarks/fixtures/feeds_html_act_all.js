@@ -0,0 +1 @@
+_Callback({code:0,subcode:0,message:'',default:0,data:{main:{attach:'back_server_info=offset%3D3%26total%3D3',searchtype:'',hasMoreFeeds:false,daylist:'',uinlist:'',error:'',hotkey:'',icGroupData:[],host_level:'0',friend_level:'0',lastaccesstime:'',lastAccessRelateTime:'',begintime:'0',endtime:'0',dayspac:'0',hidedNameList:[],aisortBeginTime:'0',aisortEndTime:'0',aisortOffset:'0',aisortNextTime:'0',owner_bitmap:'',pagenum:'1',externparam:''},friend_data:[{appid:'311',typeid:'0',key:'6a1f2b3c4d5e6f7a8b9c0d01',abstime:'1765388340',feedstime:'2025年12月11日 01:39',uin:'10001',nickname:'tester',html:'\x3Cli class=\"f-single f-s-s\"\x3E\x3Cdiv class=\"f-single-head f-aside\"\x3E\x3Cdiv class=\"user-info\"\x3E\x3Cdiv class=\"f-nick\"\x3E\x3Ca href=\"http:\/\/user.qzone.qq.com\/10001\" class=\"f-name q_namecard\" link=\"nameCard_10001\"\x3Etester\x3C\/a\x3E\x3C\/div\x3E\x3Cdiv class=\"info-detail\"\x3E\x3Cspan class=\"ui-mr8 state\"\x3E2025年12月11日 01:39\x3C\/span\x3E\x3C\/div\x3E\x3C\/div\x3E\x3C\/div\x3E\x3Cdiv class=\"f-single-content f-wrap\"\x3E\x3Cdiv class=\"f-item f-s-i\"\x3E\x3Cdiv class=\"f-info\"\x3E今天天气不错 &amp; 出门走走\x3C\/div\x3E\x3C\/div\x3E\x3C\/div\x3E\x3Cdiv class=\"f-single-foot\"\x3E\x3Cdiv class=\"f-op-wrap\"\x3E\x3Ca href=\"javascript:;\" class=\"item qz_like_btn_v3 \" data-islike=\"0\" data-likecnt=\"3\" data-showcount=\"3\" data-unikey=\"http:\/\/user.qzone.qq.com\/10001\/mood\/6a1f2b3c4d5e6f7a8b9c0d01\" data-curkey=\"http:\/\/user.qzone.qq.com\/10001\/mood\/6a1f2b3c4d5e6f7a8b9c0d01\" data-clicklog=\"like\"\x3E赞\x3C\/a\x3E\x3C\/div\x3E\x3C\/div\x3E\x3Ci name=\"feed_data\" class=\"none\" data-topicid=\"10001_6a1f2b3c4d5e6f7a8b9c0d01__1\" data-tid=\"6a1f2b3c4d5e6f7a8b9c0d01\" data-uin=\"10001\" data-abstime=\"1765388340\" data-appid=\"311\" data-typeid=\"0\" data-origtid=\"\" data-feedstype=\"100\"\x3E\x3C\/i\x3E\x3Cdiv class=\"comments-list \"\x3E\x3Cul\x3E\x3Cli class=\"comments-item bor3\" data-type=\"commentroot\" data-tid=\"1\" data-uin=\"10002\" data-nick=\"friend\" data-who=\"1\"\x3E\x3Cdiv class=\"comments-content\"\x3E\x3Ca class=\"nickname name c_tx q_namecard\" href=\"http:\/\/user.qzone.qq.com\/10002\"\x3Efriend\x3C\/a\x3E&nbsp;:&nbsp;好看！\x3C\/div\x3E\x3C\/li\x3E\x3Cli class=\"comments-item bor3\" data-type=\"commentroot\" data-tid=\"2\" data-uin=\"10003\" data-nick=\"other\" data-who=\"1\"\x3E\x3Cdiv class=\"comments-content\"\x3E\x3Ca class=\"nickname name c_tx q_namecard\" href=\"http:\/\/user.qzone.qq.com\/10003\"\x3Eother\x3C\/a\x3E&nbsp;:&nbsp;[em]e100[\/em]\x3C\/div\x3E\x3C\/li\x3E\x3C\/ul\x3E\x3C\/div\x3E\x3C\/li\x3E',opuin:'10001',flag:'0',emoji:[],rightflag:'',bitmap:'0800000000000000',clscFold:undefined},{appid:'311',typeid:'0',key:'6a1f2b3c4d5e6f7a8b9c0d02',abstime:'1765375500',feedstime:'2025年12月10日 22:05',uin:'10001',nickname:'tester',html:'\x3Cli class=\"f-single f-s-s\"\x3E\x3Cdiv class=\"f-single-head f-aside\"\x3E\x3Cdiv class=\"user-info\"\x3E\x3Cdiv class=\"f-nick\"\x3E\x3Ca href=\"http:\/\/user.qzone.qq.com\/10001\" class=\"f-name q_namecard\" link=\"nameCard_10001\"\x3Etester\x3C\/a\x3E\x3C\/div\x3E\x3Cdiv class=\"info-detail\"\x3E\x3Cspan class=\"ui-mr8 state\"\x3E2025年12月10日 22:05\x3C\/span\x3E\x3C\/div\x3E\x3C\/div\x3E\x3C\/div\x3E\x3Cdiv class=\"f-single-content f-wrap\"\x3E\x3Cdiv class=\"f-item f-s-i\"\x3E\x3Cdiv class=\"f-info\"\x3E晚安～ [em]e400823[\/em]\x3C\/div\x3E\x3C\/div\x3E\x3C\/div\x3E\x3Cdiv class=\"f-single-foot\"\x3E\x3Cdiv class=\"f-op-wrap\"\x3E\x3Ca href=\"javascript:;\" class=\"item qz_like_btn_v3 \" data-islike=\"0\" data-likecnt=\"3\" data-showcount=\"3\" data-unikey=\"http:\/\/user.qzone.qq.com\/10001\/mood\/6a1f2b3c4d5e6f7a8b9c0d02\" data-curkey=\"http:\/\/user.qzone.qq.com\/10001\/mood\/6a1f2b3c4d5e6f7a8b9c0d02\" data-clicklog=\"like\"\x3E赞\x3C\/a\x3E\x3C\/div\x3E\x3C\/div\x3E\x3Ci name=\"feed_data\" class=\"none\" data-topicid=\"10001_6a1f2b3c4d5e6f7a8b9c0d02__1\" data-tid=\"6a1f2b3c4d5e6f7a8b9c0d02\" data-uin=\"10001\" data-abstime=\"1765375500\" data-appid=\"311\" data-typeid=\"0\" data-origtid=\"\" data-feedstype=\"100\"\x3E\x3C\/i\x3E\x3Cdiv class=\"comments-list \"\x3E\x3Cul\x3E\x3Cli class=\"comments-item bor3\" data-type=\"commentroot\" data-tid=\"1\" data-uin=\"10002\" data-nick=\"friend\" data-who=\"1\"\x3E\x3Cdiv class=\"comments-content\"\x3E\x3Ca class=\"nickname name c_tx q_namecard\" href=\"http:\/\/user.qzone.qq.com\/10002\"\x3Efriend\x3C\/a\x3E&nbsp;:&nbsp;好看！\x3C\/div\x3E\x3C\/li\x3E\x3Cli class=\"comments-item bor3\" data-type=\"commentroot\" data-tid=\"2\" data-uin=\"10003\" data-nick=\"other\" data-who=\"1\"\x3E\x3Cdiv class=\"comments-content\"\x3E\x3Ca class=\"nickname name c_tx q_namecard\" href=\"http:\/\/user.qzone.qq.com\/10003\"\x3Eother\x3C\/a\x3E&nbsp;:&nbsp;[em]e100[\/em]\x3C\/div\x3E\x3C\/li\x3E\x3C\/ul\x3E\x3C\/div\x3E\x3C\/li\x3E',opuin:'10001',flag:'0',emoji:[],rightflag:'',bitmap:'0800000000000000',clscFold:undefined},{appid:'311',typeid:'0',key:'7b2e3c4d5e6f7a8b9c0d1e03',abstime:'1765275600',feedstime:'2025年12月09日 18:20',uin:'10001',nickname:'tester',html:'\x3Cli class=\"f-single f-s-s\"\x3E\x3Cdiv class=\"f-single-head f-aside\"\x3E\x3Cdiv class=\"user-info\"\x3E\x3Cdiv class=\"f-nick\"\x3E\x3Ca href=\"http:\/\/user.qzone.qq.com\/10001\" class=\"f-name q_namecard\" link=\"nameCard_10001\"\x3Etester\x3C\/a\x3E\x3C\/div\x3E\x3Cdiv class=\"info-detail\"\x3E\x3Cspan class=\"ui-mr8 state\"\x3E2025年12月09日 18:20\x3C\/span\x3E\x3C\/div\x3E\x3C\/div\x3E\x3C\/div\x3E\x3Cdiv class=\"f-single-content f-wrap\"\x3E\x3Cdiv class=\"f-item f-s-i\"\x3E\x3Cdiv class=\"f-info\"\x3E周末去爬山了，拍了几张照片\x3C\/div\x3E\x3C\/div\x3E\x3C\/div\x3E\x3Cdiv class=\"f-single-foot\"\x3E\x3Cdiv class=\"f-op-wrap\"\x3E\x3Ca href=\"javascript:;\" class=\"item qz_like_btn_v3 \" data-islike=\"0\" data-likecnt=\"3\" data-showcount=\"3\" data-unikey=\"http:\/\/user.qzone.qq.com\/10001\/mood\/7b2e3c4d5e6f7a8b9c0d1e03\" data-curkey=\"http:\/\/user.qzone.qq.com\/10001\/mood\/7b2e3c4d5e6f7a8b9c0d1e03\" data-clicklog=\"like\"\x3E赞\x3C\/a\x3E\x3C\/div\x3E\x3C\/div\x3E\x3Ci name=\"feed_data\" class=\"none\" data-topicid=\"10001_7b2e3c4d5e6f7a8b9c0d1e03__1\" data-tid=\"7b2e3c4d5e6f7a8b9c0d1e03\" data-uin=\"10001\" data-abstime=\"1765275600\" data-appid=\"311\" data-typeid=\"0\" data-origtid=\"\" data-feedstype=\"100\"\x3E\x3C\/i\x3E\x3Cdiv class=\"comments-list \"\x3E\x3Cul\x3E\x3Cli class=\"comments-item bor3\" data-type=\"commentroot\" data-tid=\"1\" data-uin=\"10002\" data-nick=\"friend\" data-who=\"1\"\x3E\x3Cdiv class=\"comments-content\"\x3E\x3Ca class=\"nickname name c_tx q_namecard\" href=\"http:\/\/user.qzone.qq.com\/10002\"\x3Efriend\x3C\/a\x3E&nbsp;:&nbsp;好看！\x3C\/div\x3E\x3C\/li\x3E\x3Cli class=\"comments-item bor3\" data-type=\"commentroot\" data-tid=\"2\" data-uin=\"10003\" data-nick=\"other\" data-who=\"1\"\x3E\x3Cdiv class=\"comments-content\"\x3E\x3Ca class=\"nickname name c_tx q_namecard\" href=\"http:\/\/user.qzone.qq.com\/10003\"\x3Eother\x3C\/a\x3E&nbsp;:&nbsp;[em]e100[\/em]\x3C\/div\x3E\x3C\/li\x3E\x3C\/ul\x3E\x3C\/div\x3E\x3C\/li\x3E',opuin:'10001',flag:'0',emoji:[],rightflag:'',bitmap:'0800000000000000',clscFold:undefined}],host_data:[],about_data:[],firstpage_data:[]}});
@@ -0,0 +1,296 @@
+# benchmarks/load_mock.py
+# 端到端压测：把插件的各个客户端（点赞 / 拉取说说 / 护评扫描+删评 / 发删说说 / 评论）并发地打到本地 mock_qzone 上，
+# 统计每类操作的吞吐、延迟分位和错误分布（HTTP 5xx、限流、Cookie 过期）。
+#
+#   python benchmarks/load_mock.py --duration 15 --workers 2 --multiplier 4 --latency-ms 60 --rate-limit 8
+#   python benchmarks/load_mock.py --base-url http://127.0.0.1:8780      # 用单独起的 mock_qzone.py（数字更准）
+#   python benchmarks/load_mock.py --sync                                  # 同步客户端 + 线程，对比 http_async_enabled
+#   python benchmarks/load_mock.py --plugin --duration 60 --multiplier 4   # 整个插件：_worker + _protect_worker + QzScheduler
+#
+# --plugin 需要能 import astrbot（在 AstrBot 的环境里跑）。插件从临时目录里的一份拷贝加载，
+# 点赞记录 / 待删队列等 data/ 文件写在那里，不会落到仓库里；统计按 mock 的 /__stats 每个接口汇总。
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+import json
+import random
+import shutil
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from _common import ROOT, load
+from mock_qzone import MockConfig, serve
+
+MY_QQ = "10001"
+FRIEND_QQ = "10002"
+COOKIE = f"uin=o{MY_QQ}; p_skey=mock_p_skey; skey=@mock"
+
+
+class Stats:
+    def __init__(self) -> None:
+        self.lat: Dict[str, List[float]] = {}
+        self.outcomes: Dict[str, Dict[str, int]] = {}
+
+    def add(self, op: str, seconds: float, outcome: str) -> None:
+        self.lat.setdefault(op, []).append(seconds)
+        d = self.outcomes.setdefault(op, {})
+        d[outcome] = d.get(outcome, 0) + 1
+
+    def report(self, wall: float) -> None:
+        print(f"{'op':10} {'calls':>7} {'ops/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}  outcomes")
+        for op in sorted(self.lat):
+            xs = sorted(self.lat[op])
+            pct = lambda q: xs[min(len(xs) - 1, int(q * len(xs)))] * 1000  # noqa: E731
+            outs = " ".join(f"{k}={v}" for k, v in sorted(self.outcomes[op].items()))
+            print(f"{op:10} {len(xs):>7} {len(xs) / wall:>8.1f} {pct(0.5):>8.1f} {pct(0.95):>8.1f} {xs[-1] * 1000:>8.1f}  {outs}")
+
+
+def _classify(status: int, ok: bool, message: str = "") -> str:
+    if status != 200:
+        return f"http_{status}"
+    if ok:
+        return "ok"
+    if "登录" in message:
+        return "need_login"
+    if "频繁" in message:
+        return "rate_limited"
+    return "fail"
+
+
+def build_ops(sync: bool, http: Any) -> Dict[str, Callable[[], Awaitable[str]]]:
+    """op name -> coroutine returning an outcome label (one logical plugin action each)."""
+
+    like = load("qzone_like")
+    feed_fetch = load("qzone_feed_fetch")
+    protect = load("qzone_protect")
+    post = load("qzone_post")
+    comment = load("qzone_comment")
+    del_comment = load("qzone_del_comment")
+
+    pick = lambda mod, name: getattr(mod, name if sync else "Async" + name)  # noqa: E731
+    liker = pick(like, "QzoneLikeClient")(MY_QQ, COOKIE)
+    fetcher = pick(feed_fetch, "QzoneFeedFetcher")(FRIEND_QQ, COOKIE, my_qq=MY_QQ)
+    scanner = pick(protect, "QzoneProtectScanner")(MY_QQ, COOKIE)
+    poster = pick(post, "QzonePoster")(MY_QQ, COOKIE)
+    commenter = pick(comment, "QzoneCommenter")(MY_QQ, COOKIE)
+    deleter = pick(del_comment, "QzoneCommentDeleter")(MY_QQ, COOKIE)
+    call = http.call
+
+    async def _like() -> str:
+        # 与 _like_once 相同：拉 feeds 拿 key，再逐条点赞
+        status, keys, _ = await call(liker.fetch_keys, 10, FRIEND_QQ)
+        if status != 200 or not keys:
+            return _classify(status, False) if status != 200 else "no_keys"
+        outcome = "ok"
+        for key in list(keys)[:3]:
+            st, text = await call(liker.send_like, key)
+            m = _classify(st, '"code": 0' in text or '"code":0' in text, text)
+            if m != "ok":
+                outcome = m
+        return outcome
+
+    async def _feed() -> str:
+        status, posts = await call(fetcher.fetch_mood_posts, 10, 2)
+        return _classify(status, bool(posts), getattr(fetcher, "last_diag", ""))
+
+    async def _protect() -> str:
+        status, refs = await call(scanner.scan_recent_comments, 1, 10)
+        if status != 200:
+            return _classify(status, False)
+        outcome = "ok"
+        for ref in [r for r in refs if r.comment_uin != MY_QQ][:2]:
+            st, res = await call(deleter.delete_comment, ref.topic_id, ref.comment_id, ref.comment_uin)
+            m = _classify(st, res.ok, res.message)
+            if m != "ok" and outcome == "ok":
+                outcome = m
+        return outcome
+
+    async def _post() -> str:
+        status, res = await call(poster.publish_text, f"load {random.random():.6f}")
+        if status != 200 or not res.ok or not res.tid:
+            return _classify(status, False, res.message)
+        status, res = await call(poster.delete_by_tid, res.tid)
+        return _classify(status, res.ok, res.message)
+
+    async def _comment() -> str:
+        status, posts = await call(fetcher.fetch_mood_posts, 5, 1)
+        if status != 200 or not posts:
+            return _classify(status, False)
+        p = random.choice(posts)
+        status, res = await call(commenter.add_comment, p.tid, "load comment", p.topic_id)
+        return _classify(status, res.ok, res.message)
+
+    return {"like": _like, "feed": _feed, "protect": _protect, "post": _post, "comment": _comment}
+
+
+async def run(args: argparse.Namespace, http: Any) -> Tuple[Stats, float]:
+    ops = build_ops(args.sync, http)
+    wanted = [o.strip() for o in args.ops.split(",") if o.strip()]
+    stats = Stats()
+    deadline = time.monotonic() + args.duration
+
+    async def _worker(name: str) -> None:
+        fn = ops[name]
+        while time.monotonic() < deadline:
+            t0 = time.perf_counter()
+            try:
+                outcome = await fn()
+            except Exception as e:  # keep the load going; count it (parse errors carry the response head)
+                outcome = _classify(200, False, str(e))
+                if outcome == "fail":
+                    outcome = "exc_" + type(e).__name__
+            stats.add(name, time.perf_counter() - t0, outcome)
+            if args.think_ms:
+                await asyncio.sleep(args.think_ms / 1000.0)
+
+    n = max(1, args.workers * args.multiplier)
+    t0 = time.monotonic()
+    await asyncio.gather(*(_worker(name) for name in wanted for _ in range(n)))
+    wall = time.monotonic() - t0
+    await http.aclose()
+    return stats, wall
+
+
+def _load_plugin_copy(tmp: Path) -> Any:
+    """Import main.py from a copy of the plugin under `tmp`, so its data/ files stay out of the tree."""
+
+    shutil.copytree(ROOT, tmp / ROOT.name, ignore=shutil.ignore_patterns("data", "__pycache__", "benchmarks", ".git"))
+    sys.path.insert(0, str(tmp))
+    return importlib.import_module(f"{ROOT.name}.main")
+
+
+def _mock_endpoints(base_url: str) -> Dict[str, Dict[str, int]]:
+    with urllib.request.urlopen(base_url.rstrip("/") + "/__stats", timeout=5) as resp:
+        return json.loads(resp.read().decode("utf-8")).get("endpoints", {})
+
+
+def _report_endpoints(before: Dict[str, Dict[str, int]], after: Dict[str, Dict[str, int]], wall: float) -> None:
+    print(f"{'endpoint':28} {'requests':>9} {'req/s':>7}  outcomes")
+    for ep in sorted(after):
+        d = {k: v - before.get(ep, {}).get(k, 0) for k, v in after[ep].items()}
+        n = d.pop("requests", 0)
+        if n <= 0:
+            continue
+        outs = " ".join(f"{k}={v}" for k, v in sorted(d.items()) if v)
+        print(f"{ep:28} {n:>9} {n / wall:>7.1f}  {outs}")
+
+
+async def run_plugin(args: argparse.Namespace, base_url: str, plugin_main: Any) -> float:
+    """Run the real background tasks of one plugin instance for --duration seconds.
+
+    Like targets: workers * multiplier spaces (MY_QQ, FRIEND_QQ, then made-up uins the mock seeds
+    on first use), each polled every --poll-sec. The scheduler posts a fixed text once a minute.
+    """
+
+    n = max(1, args.workers * args.multiplier)
+    targets = [MY_QQ, FRIEND_QQ] + [str(10003 + i) for i in range(max(0, n - 2))]
+    cfg = {
+        "my_qq": MY_QQ,
+        "cookie": COOKIE,
+        "qzone_base_url": base_url,
+        "http_async_enabled": not args.sync,
+        "http_max_connections": args.max_connections,
+        "enabled": True,
+        "like_targets": [f"{uin}:{args.poll_sec:g}" for uin in targets[:n]],
+        "poll_interval_sec": args.poll_sec,
+        "like_rate_per_min": args.like_rate,
+        "like_burst": 10,
+        "like_rate_max_per_min": max(args.like_rate, 10),
+        "like_history_persist": False,
+        "protect_enabled": True,
+        "protect_poll_interval_sec": args.poll_sec,
+        "protect_notify_mode": "off",
+        "ai_post_enabled": True,
+        "ai_post_mode": "fixed",
+        "ai_post_prompt": "load",
+        "ai_post_fixed_text": "load_mock scheduled post",
+        "ai_post_interval_min": 1,
+        "ai_post_delete_after_min": 1,
+        "cookie_periodic_refresh_enabled": False,
+    }
+    plugin = plugin_main.QzoneAutoLikePlugin(None, cfg)
+    t0 = time.monotonic()
+    plugin._task = asyncio.create_task(plugin._worker())
+    await plugin._maybe_start_protect_task()
+    if plugin._scheduler is not None:
+        await plugin._scheduler.start()
+    await asyncio.sleep(args.duration)
+    if plugin._scheduler is not None:
+        await plugin._scheduler.stop()
+    await plugin.terminate()
+    wall = time.monotonic() - t0
+    cache = getattr(plugin._primary, "feed_cache", None)
+    if cache is not None:
+        print(f"feed cache: {cache.stats_line()}")
+    return wall
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Drive the plugin's Qzone clients against mock_qzone")
+    ap.add_argument("--base-url", default="", help="external mock (default: start one in-process)")
+    ap.add_argument("--port", type=int, default=8781, help="port for the in-process mock")
+    ap.add_argument("--ops", default="like,feed,protect,post,comment")
+    ap.add_argument("--duration", type=float, default=10.0)
+    ap.add_argument("--workers", type=int, default=2, help="concurrent loops per op")
+    ap.add_argument("--multiplier", type=int, default=1, help="scale --workers (simulate N accounts/targets)")
+    ap.add_argument("--think-ms", type=float, default=0.0, help="pause between iterations of one loop")
+    ap.add_argument("--max-connections", type=int, default=0, help="qzone_http pool size (0 = default)")
+    ap.add_argument("--sync", action="store_true", help="sync clients in threads instead of Async* clients")
+    ap.add_argument("--plugin", action="store_true", help="run the plugin's own workers instead of --ops loops")
+    ap.add_argument("--poll-sec", type=float, default=5.0, help="--plugin: like target / protect poll interval")
+    ap.add_argument("--like-rate", type=float, default=60.0, help="--plugin: like_rate_per_min")
+    ap.add_argument("--latency-ms", type=float, default=50.0)
+    ap.add_argument("--jitter-ms", type=float, default=20.0)
+    ap.add_argument("--error-rate", type=float, default=0.0)
+    ap.add_argument("--rate-limit", type=float, default=0.0)
+    ap.add_argument("--cookie-expire-after", type=int, default=0)
+    ap.add_argument("--comment-rate", type=float, default=2.0)
+    args = ap.parse_args()
+
+    tmp = None
+    if args.plugin:
+        # before load(): the copy must be the package every later import resolves to
+        tmp = tempfile.TemporaryDirectory(prefix="qz_load_")
+        plugin_main = _load_plugin_copy(Path(tmp.name))
+        http = plugin_main.qzone_http
+    else:
+        http = load("qzone_http")
+    base_url = args.base_url
+    server = None
+    if not base_url:
+        cfg = MockConfig(
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            error_rate=args.error_rate,
+            rate_limit=args.rate_limit,
+            cookie_expire_after=args.cookie_expire_after,
+            comment_rate=args.comment_rate,
+        )
+        server, _ = serve(cfg, "127.0.0.1", args.port)
+        base_url = f"http://127.0.0.1:{args.port}"
+    http.configure(max_connections=args.max_connections, base_url=base_url)
+
+    mode = "sync+threads" if args.sync else ("aiohttp" if http.aiohttp is not None else "async (thread fallback)")
+    if args.plugin:
+        print(f"target={base_url} mode={mode} plugin targets={max(1, args.workers * args.multiplier)} duration={args.duration}s")
+        before = _mock_endpoints(base_url)
+        wall = asyncio.run(run_plugin(args, base_url, plugin_main))
+        _report_endpoints(before, _mock_endpoints(base_url), wall)
+    else:
+        print(f"target={base_url} mode={mode} loops/op={max(1, args.workers * args.multiplier)} duration={args.duration}s")
+        stats, wall = asyncio.run(run(args, http))
+        stats.report(wall)
+    if server is not None:
+        server.shutdown()
+    if tmp is not None:
+        tmp.cleanup()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,476 @@
+# benchmarks/mock_qzone.py
+# 本地 Qzone 替身服务（仅标准库）：实现插件用到的 feeds / 点赞 / 发删说说 / 评论删评 / 评论列表接口，
+# 可配置延迟、错误率、限流与 Cookie 过期，用来在不碰真实账号的情况下压测与调参。
+#
+#   python benchmarks/mock_qzone.py --port 8780 --latency-ms 80 --jitter-ms 40 --error-rate 0.01 \
+#       --rate-limit 5 --cookie-ttl-sec 0 --comment-rate 0.5
+#
+# 然后在插件配置里设置 qzone_base_url=http://127.0.0.1:8780（或 qzone_http.configure(base_url=...)）。
+# 调试接口：GET /__stats（计数）、/__reset（清空状态）、/__renew（让过期的 Cookie 恢复）。
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+ENDPOINTS = (
+    "feeds_html_act_all",
+    "feeds3_html_more",
+    "feeds_html_module",
+    "internal_dolike_app",
+    "emotion_cgi_publish_v6",
+    "emotion_cgi_delete_v6",
+    "emotion_cgi_addcomment_ugc",
+    "emotion_cgi_delcomment_ugc",
+    "emotion_cgi_msgdetail_v6",
+)
+# taotao 接口回包是 frameElement.callback(...) 包在 HTML 里；feeds / 点赞是 _Callback(...)
+_FRAME_ENDPOINTS = {
+    "emotion_cgi_publish_v6",
+    "emotion_cgi_delete_v6",
+    "emotion_cgi_addcomment_ugc",
+    "emotion_cgi_delcomment_ugc",
+}
+_WRITE_ENDPOINTS = _FRAME_ENDPOINTS | {"internal_dolike_app"}
+
+TIMES_FMT = "%Y年%m月%d日 %H:%M"
+
+
+@dataclass
+class MockConfig:
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    rate_limit: float = 0.0  # requests/s per (uin, endpoint); 0 = unlimited
+    burst: int = 0  # bucket size; 0 = max(1, rate_limit)
+    cookie_ttl_sec: float = 0.0  # cookie expires this long after first use; 0 = never
+    cookie_expire_after: int = 0  # or after this many requests; 0 = never
+    seed_posts: int = 30
+    seed_comments: int = 2
+    comment_rate: float = 0.0  # background comments/s spread over recent posts (protect load)
+
+
+@dataclass
+class MockComment:
+    cid: int
+    uin: str
+    nick: str
+    content: str
+    abstime: int
+
+
+@dataclass
+class MockPost:
+    tid: str
+    uin: str
+    text: str
+    abstime: int
+    comments: List[MockComment] = field(default_factory=list)
+    likers: set = field(default_factory=set)
+    next_cid: int = 1
+
+
+def _js_escape(html: str) -> str:
+    return (
+        html.replace("\\", "\\\\")
+        .replace("/", "\\/")
+        .replace('"', '\\"')
+        .replace("'", "\\'")
+        .replace("<", "\\x3C")
+        .replace(">", "\\x3E")
+    )
+
+
+def _html_text(s: str) -> str:
+    return s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+class MockQzone:
+    """In-memory Qzone state + response rendering. Thread-safe (one lock)."""
+
+    def __init__(self, cfg: MockConfig):
+        self.cfg = cfg
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self.lock:
+            self.spaces: Dict[str, List[MockPost]] = {}
+            self.buckets: Dict[Tuple[str, str], Tuple[float, float]] = {}
+            self.cookie_first_seen: Dict[str, float] = {}
+            self.cookie_requests: Dict[str, int] = {}
+            self.stats: Dict[str, Dict[str, int]] = {}
+            self.started = time.time()
+
+    # ---- state ----
+    def _space(self, uin: str) -> List[MockPost]:
+        posts = self.spaces.get(uin)
+        if posts is None:
+            now = int(time.time())
+            posts = []
+            for i in range(self.cfg.seed_posts):
+                p = MockPost(tid=self._new_tid(), uin=uin, text=f"mock mood #{i} from {uin}", abstime=now - i * 600)
+                for c in range(self.cfg.seed_comments):
+                    self._add_comment(p, str(20000 + c), f"seed comment {c}")
+                posts.append(p)
+            self.spaces[uin] = posts
+        return posts
+
+    @staticmethod
+    def _new_tid() -> str:
+        return "%024x" % random.getrandbits(96)
+
+    @staticmethod
+    def _add_comment(p: MockPost, uin: str, content: str) -> MockComment:
+        c = MockComment(cid=p.next_cid, uin=uin, nick=f"n{uin}", content=content, abstime=int(time.time()))
+        p.next_cid += 1
+        p.comments.append(c)
+        return c
+
+    def _find(self, topic_or_tid: str) -> Optional[MockPost]:
+        tid = topic_or_tid
+        m = re.match(r"^(\d+)_([0-9a-f]+)", topic_or_tid or "")
+        if m:
+            tid = m.group(2)
+        for posts in self.spaces.values():
+            for p in posts:
+                if p.tid == tid:
+                    return p
+        return None
+
+    def add_background_comments(self, n: int) -> None:
+        with self.lock:
+            recent = [p for posts in self.spaces.values() for p in posts[:5]]
+            for _ in range(n):
+                if recent:
+                    self._add_comment(random.choice(recent), str(random.randint(30000, 39999)), "spam " + self._new_tid()[:6])
+
+    # ---- behaviour knobs ----
+    def _stat(self, ep: str, key: str) -> None:
+        d = self.stats.setdefault(ep, {})
+        d[key] = d.get(key, 0) + 1
+
+    def _take_token(self, uin: str, ep: str) -> bool:
+        rate = self.cfg.rate_limit
+        if rate <= 0:
+            return True
+        cap = float(self.cfg.burst or max(1.0, rate))
+        now = time.monotonic()
+        tokens, last = self.buckets.get((uin, ep), (cap, now))
+        tokens = min(cap, tokens + (now - last) * rate)
+        if tokens < 1.0:
+            self.buckets[(uin, ep)] = (tokens, now)
+            return False
+        self.buckets[(uin, ep)] = (tokens - 1.0, now)
+        return True
+
+    def _cookie_expired(self, cookie: str) -> bool:
+        if "p_skey=" not in cookie and "skey=" not in cookie:
+            return True
+        now = time.time()
+        first = self.cookie_first_seen.setdefault(cookie, now)
+        n = self.cookie_requests[cookie] = self.cookie_requests.get(cookie, 0) + 1
+        if self.cfg.cookie_ttl_sec > 0 and now - first > self.cfg.cookie_ttl_sec:
+            return True
+        if self.cfg.cookie_expire_after > 0 and n > self.cfg.cookie_expire_after:
+            return True
+        return False
+
+    def renew(self) -> None:
+        with self.lock:
+            self.cookie_first_seen.clear()
+            self.cookie_requests.clear()
+
+    # ---- rendering ----
+    @staticmethod
+    def _wrap(ep: str, payload: Dict[str, Any]) -> str:
+        body = json.dumps(payload, ensure_ascii=False)
+        if ep in _FRAME_ENDPOINTS:
+            return (
+                '<html><head><meta http-equiv="Content-Type" content="text/html; charset=utf-8" /></head><body>'
+                f'<script type="text/javascript">document.domain="qq.com";frameElement.callback({body});</script></body></html>'
+            )
+        return f"_Callback({body});"
+
+    @staticmethod
+    def _item_html(p: MockPost, viewer: str) -> str:
+        link = f"http://user.qzone.qq.com/{p.uin}/mood/{p.tid}"
+        islike = "1" if viewer in p.likers else "0"
+        comments = "".join(
+            f'<li class="comments-item bor3" data-type="commentroot" data-tid="{c.cid}" data-uin="{c.uin}" data-nick="{c.nick}" data-who="1">'
+            f'<div class="comments-content"><a class="nickname name c_tx q_namecard" href="http://user.qzone.qq.com/{c.uin}">{c.nick}</a>'
+            f"&nbsp;:&nbsp;{_html_text(c.content)}</div></li>"
+            for c in p.comments
+        )
+        return (
+            '<li class="f-single f-s-s"><div class="f-single-head f-aside"><div class="user-info">'
+            f'<div class="f-nick"><a href="http://user.qzone.qq.com/{p.uin}" class="f-name q_namecard" link="nameCard_{p.uin}">u{p.uin}</a></div>'
+            f'<div class="info-detail"><span class="ui-mr8 state">{time.strftime(TIMES_FMT, time.localtime(p.abstime))}</span></div></div></div>'
+            f'<div class="f-single-content f-wrap"><div class="f-item f-s-i"><div class="f-info">{_html_text(p.text)}</div></div></div>'
+            '<div class="f-single-foot"><div class="f-op-wrap"><a href="javascript:;" class="item qz_like_btn_v3 " '
+            f'data-islike="{islike}" data-likecnt="{len(p.likers)}" data-unikey="{link}" data-curkey="{link}" data-clicklog="like">赞</a></div></div>'
+            f'<i name="feed_data" class="none" data-topicid="{p.uin}_{p.tid}__1" data-tid="{p.tid}" data-uin="{p.uin}" '
+            f'data-abstime="{p.abstime}" data-appid="311" data-typeid="0" data-origtid="" data-feedstype="100"></i>'
+            + (f'<div class="comments-list "><ul>{comments}</ul></div>' if comments else "")
+            + "</li>"
+        )
+
+    def _js_items(self, posts: List[MockPost], viewer: str) -> str:
+        return ",".join(
+            "{appid:'311',typeid:'0',key:'%s',abstime:'%d',feedstime:'%s',uin:'%s',nickname:'u%s',html:'%s',opuin:'%s',flag:'0',clscFold:undefined}"
+            % (p.tid, p.abstime, time.strftime(TIMES_FMT, time.localtime(p.abstime)), p.uin, p.uin, _js_escape(self._item_html(p, viewer)), p.uin)
+            for p in posts
+        )
+
+    # ---- endpoints ----
+    def handle(self, ep: str, q: Dict[str, str], cookie: str) -> Tuple[int, str, str]:
+        """Returns (status, content_type, body)."""
+
+        viewer = ""
+        m = re.search(r"\buin=o?0*(\d+)", cookie)
+        if m:
+            viewer = m.group(1)
+        viewer = viewer or q.get("uin") or q.get("opuin") or q.get("hostuin") or q.get("hostUin") or ""
+
+        with self.lock:
+            self._stat(ep, "requests")
+            if self.cfg.error_rate > 0 and random.random() < self.cfg.error_rate:
+                self._stat(ep, "error_5xx")
+                return 500, "text/plain", "internal error"
+            if self._cookie_expired(cookie):
+                self._stat(ep, "need_login")
+                return 200, "text/html", self._wrap(ep, {"code": -3000, "subcode": -4001, "message": "请先登录空间", "default": 0})
+            if not self._take_token(viewer, ep):
+                self._stat(ep, "rate_limited")
+                return 200, "text/html", self._wrap(ep, {"code": -10000, "subcode": -10000, "message": "操作过于频繁，请稍后再试", "default": 0})
+            self._stat(ep, "ok")
+            return self._dispatch(ep, q, viewer)
+
+    def _dispatch(self, ep: str, q: Dict[str, str], viewer: str) -> Tuple[int, str, str]:
+        if ep == "feeds_html_act_all":
+            host = q.get("hostuin") or viewer
+            start = int(q.get("start") or 0)
+            count = int(q.get("count") or 10)
+            posts = self._space(host)
+            page = posts[start : start + count]
+            more = "true" if start + count < len(posts) else "false"
+            body = (
+                "_Callback({code:0,subcode:0,message:'',default:0,data:{main:{hasMoreFeeds:%s,pagenum:'1'},"
+                "friend_data:[%s],host_data:[],about_data:[],firstpage_data:[]}});" % (more, self._js_items(page, viewer))
+            )
+            return 200, "application/javascript", body
+
+        if ep == "feeds3_html_more":
+            host = q.get("uin") or viewer
+            count = int(q.get("count") or 10)
+            pagenum = max(1, int(q.get("pagenum") or 1))
+            posts = self._space(host)
+            page = posts[(pagenum - 1) * count : pagenum * count]
+            body = "_Callback({code:0,subcode:0,message:'',default:0,data:{main:{hasMoreFeeds:%s},data:[%s]}});" % (
+                "true" if pagenum * count < len(posts) else "false",
+                self._js_items(page, viewer),
+            )
+            return 200, "application/javascript", body
+
+        if ep == "feeds_html_module":
+            host = q.get("i_uin") or viewer
+            showcount = int(q.get("showcount") or 5)
+            posts = self._space(host)[:showcount]
+            body = (
+                '<!DOCTYPE html><html><head><meta charset="utf-8"><title>feeds</title></head><body>'
+                '<div id="host_home_feeds"><ul class="fs-list">'
+                + "".join(self._item_html(p, viewer) for p in posts)
+                + "</ul></div></body></html>"
+            )
+            return 200, "text/html; charset=utf-8", body
+
+        if ep == "internal_dolike_app":
+            p = self._find(q.get("fid") or "")
+            if p is None:
+                return 200, "application/javascript", self._wrap(ep, {"code": -1, "message": "feed not found"})
+            p.likers.add(viewer)
+            return 200, "application/javascript", self._wrap(ep, {"code": 0, "subcode": 0, "message": "succ", "default": 0, "data": {}})
+
+        if ep == "emotion_cgi_publish_v6":
+            host = q.get("hostuin") or viewer
+            p = MockPost(tid=self._new_tid(), uin=host, text=q.get("con") or "", abstime=int(time.time()))
+            self._space(host).insert(0, p)
+            return 200, "text/html", self._wrap(ep, {"code": 0, "subcode": 0, "message": "", "default": 0, "tid": p.tid, "now": p.abstime})
+
+        if ep == "emotion_cgi_delete_v6":
+            host = q.get("hostuin") or viewer
+            posts = self._space(host)
+            tid = q.get("tid") or ""
+            before = len(posts)
+            posts[:] = [p for p in posts if p.tid != tid]
+            if len(posts) == before:
+                return 200, "text/html", self._wrap(ep, {"code": -1, "subcode": -1, "message": "说说不存在", "default": 0})
+            return 200, "text/html", self._wrap(ep, {"code": 0, "subcode": 0, "message": "", "default": 0, "tid": tid})
+
+        if ep == "emotion_cgi_msgdetail_v6":
+            p = self._find(q.get("tid") or "")
+            if p is None:
+                return 200, "application/javascript", self._wrap(ep, {"code": -4016, "message": "说说不存在"})
+            pos = int(q.get("pos") or 0)
+            num = int(q.get("num") or 20)
+            page = [
+                {"tid": c.cid, "uin": int(c.uin), "name": c.nick, "content": c.content, "create_time": c.abstime, "reply_num": 0}
+                for c in p.comments[pos : pos + num]
+            ]
+            return 200, "application/javascript", self._wrap(
+                ep, {"code": 0, "subcode": 0, "message": "", "cmtnum": len(p.comments), "commentlist": page or None}
+            )
+
+        if ep == "emotion_cgi_addcomment_ugc":
+            p = self._find(q.get("topicId") or "")
+            if p is None:
+                return 200, "text/html", self._wrap(ep, {"code": -1, "subcode": -1, "message": "说说不存在", "default": 0})
+            c = self._add_comment(p, viewer, q.get("content") or "")
+            return 200, "text/html", self._wrap(
+                ep, {"code": 0, "subcode": 0, "message": "", "default": 0, "data": {"id": str(c.cid), "commentid": str(c.cid)}}
+            )
+
+        if ep == "emotion_cgi_delcomment_ugc":
+            p = self._find(q.get("topicId") or "")
+            cid = str(q.get("commentId") or "")
+            if p is None or not any(str(c.cid) == cid for c in p.comments):
+                return 200, "text/html", self._wrap(ep, {"code": -1, "subcode": -1, "message": "评论不存在", "default": 0})
+            p.comments = [c for c in p.comments if str(c.cid) != cid]
+            return 200, "text/html", self._wrap(ep, {"code": 0, "subcode": 0, "message": "", "default": 0})
+
+        return 404, "text/plain", "unknown endpoint"
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                "uptime_sec": round(time.time() - self.started, 1),
+                "endpoints": {k: dict(v) for k, v in self.stats.items()},
+                "spaces": {uin: {"posts": len(ps), "comments": sum(len(p.comments) for p in ps)} for uin, ps in self.spaces.items()},
+            }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so client connection pools are exercised
+    mock: MockQzone
+
+    def log_message(self, format: str, *args: Any) -> None:  # quiet
+        return
+
+    def _send(self, status: int, ctype: str, body: str) -> None:
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", ctype if "charset" in ctype else f"{ctype}; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _route(self, form: Dict[str, str]) -> None:
+        parts = urlsplit(self.path)
+        path = parts.path
+        if path == "/__stats":
+            return self._send(200, "application/json", json.dumps(self.mock.snapshot(), ensure_ascii=False))
+        if path == "/__reset":
+            self.mock.reset()
+            return self._send(200, "application/json", '{"ok":true}')
+        if path == "/__renew":
+            self.mock.renew()
+            return self._send(200, "application/json", '{"ok":true}')
+
+        ep = next((e for e in ENDPOINTS if e in path), "")
+        if not ep:
+            return self._send(404, "text/plain", "unknown endpoint")
+
+        q = {k: v[-1] for k, v in parse_qs(parts.query, keep_blank_values=True).items()}
+        q.update(form)
+
+        cfg = self.mock.cfg
+        if cfg.latency_ms > 0 or cfg.jitter_ms > 0:
+            delay = cfg.latency_ms + random.uniform(-cfg.jitter_ms, cfg.jitter_ms)
+            if ep in _WRITE_ENDPOINTS:
+                delay *= 1.5
+            time.sleep(max(0.0, delay) / 1000.0)
+
+        status, ctype, body = self.mock.handle(ep, q, self.headers.get("cookie", ""))
+        self._send(status, ctype, body)
+
+    def do_GET(self) -> None:
+        self._route({})
+
+    def do_POST(self) -> None:
+        n = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(n).decode("utf-8", errors="replace") if n else ""
+        form = {k: v[-1] for k, v in parse_qs(raw, keep_blank_values=True).items()}
+        self._route(form)
+
+
+def serve(cfg: MockConfig, host: str = "127.0.0.1", port: int = 8780) -> Tuple[ThreadingHTTPServer, MockQzone]:
+    """Start the mock in background threads; returns (server, state). Call server.shutdown() to stop."""
+
+    mock = MockQzone(cfg)
+    handler = type("MockQzoneHandler", (_Handler,), {"mock": mock})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="mock-qzone", daemon=True).start()
+
+    if cfg.comment_rate > 0:
+
+        def _commenter() -> None:
+            acc = 0.0
+            while True:
+                time.sleep(0.2)
+                acc += cfg.comment_rate * 0.2
+                if acc >= 1:
+                    mock.add_background_comments(int(acc))
+                    acc -= int(acc)
+
+        threading.Thread(target=_commenter, name="mock-qzone-comments", daemon=True).start()
+    return server, mock
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Local stand-in for the Qzone endpoints used by the plugin")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8780)
+    ap.add_argument("--latency-ms", type=float, default=0.0)
+    ap.add_argument("--jitter-ms", type=float, default=0.0)
+    ap.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with HTTP 500")
+    ap.add_argument("--rate-limit", type=float, default=0.0, help="requests/s per (uin, endpoint); 0 = unlimited")
+    ap.add_argument("--burst", type=int, default=0)
+    ap.add_argument("--cookie-ttl-sec", type=float, default=0.0)
+    ap.add_argument("--cookie-expire-after", type=int, default=0, help="requests per cookie before it expires")
+    ap.add_argument("--seed-posts", type=int, default=30)
+    ap.add_argument("--seed-comments", type=int, default=2)
+    ap.add_argument("--comment-rate", type=float, default=0.0, help="background comments/s on recent posts")
+    a = ap.parse_args()
+
+    cfg = MockConfig(
+        latency_ms=a.latency_ms,
+        jitter_ms=a.jitter_ms,
+        error_rate=a.error_rate,
+        rate_limit=a.rate_limit,
+        burst=a.burst,
+        cookie_ttl_sec=a.cookie_ttl_sec,
+        cookie_expire_after=a.cookie_expire_after,
+        seed_posts=a.seed_posts,
+        seed_comments=a.seed_comments,
+        comment_rate=a.comment_rate,
+    )
+    server, _ = serve(cfg, a.host, a.port)
+    print(f"mock qzone listening on http://{a.host}:{a.port}  (stats: /__stats)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
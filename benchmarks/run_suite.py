@@ -0,0 +1,167 @@
+# benchmarks/run_suite.py
+# 离线基准套件：用 fixtures/ 下的匿名回包（按条数放大）测解析/扫描路径的吞吐与峰值内存，不需要真实账号。
+#
+#   python benchmarks/run_suite.py                       # 默认 10/50/200 条
+#   python benchmarks/run_suite.py --sizes 50,500 --repeat 3
+#   python benchmarks/run_suite.py --save base.json      # 部署前存一份基线
+#   python benchmarks/run_suite.py --compare base.json   # 与基线对比，变慢超过 --tolerance 时退出码为 1
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from _common import FixtureSession, fixture, load, scale_js_array, scale_module_html, timeit
+
+COOKIE = "uin=o10001; p_skey=bench_p_skey; skey=@bench"
+MY_QQ = "10001"
+RESPONSES = ("publish.html", "delete.html", "addcomment.html", "delcomment.html", "like.txt", "need_login.html")
+
+
+def _peak_kb(fn: Callable[[], Any]) -> float:
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def build_cases(n: int) -> List[Tuple[str, int, int, Callable[[], Any]]]:
+    """(name, items, payload bytes, fn) for one payload size."""
+
+    feed_fetch = load("qzone_feed_fetch")
+    feed_html = load("qzone_feed_html")
+    protect = load("qzone_protect")
+    post = load("qzone_post")
+    comment = load("qzone_comment")
+
+    act_all = scale_js_array(fixture("feeds_html_act_all.js"), "friend_data", n)
+    more_js = scale_js_array(fixture("feeds3_html_more.js"), "data", n)
+    more_json = scale_js_array(fixture("feeds3_html_more.json"), "data", n)
+    module = scale_module_html(fixture("feeds_html_module.html"), n)
+    empty_module = scale_module_html(fixture("feeds_html_module.html"), 1)
+
+    def _fetch_mood_posts() -> Any:
+        fetcher = feed_fetch.QzoneFeedFetcher(MY_QQ, COOKIE, my_qq=MY_QQ, session=FixtureSession({}, act_all))
+        status, posts = fetcher.fetch_mood_posts(count=n, max_pages=1)
+        assert status == 200 and posts, fetcher.last_diag
+        return posts
+
+    def _scan(body: str) -> Callable[[], Any]:
+        session = FixtureSession({"feeds_html_module": empty_module, "feeds3_html_more": body})
+
+        def _run() -> Any:
+            scanner = protect.QzoneProtectScanner(MY_QQ, COOKIE, session=session)
+            status, refs = scanner.scan_recent_comments(pages=1, count=n)
+            assert status == 200 and refs, scanner.last_diag
+            return refs
+
+        return _run
+
+    def _module() -> Any:
+        scanner = protect.QzoneProtectScanner(MY_QQ, COOKIE, session=FixtureSession({}))
+        st = scanner._begin_scan()
+        scanner._apply_module_html(st, 200, module)
+        assert st.out
+        return st.out
+
+    def _fetch_keys() -> Any:
+        keys = feed_html.mood_keys(act_all)
+        assert keys
+        return keys
+
+    def _feed_items() -> Any:
+        # the shared parse stage: FeedItems of one page, sliced into like keys + liked flags
+        items, _ = feed_fetch.parse_act_all_page(act_all)
+        keys = feed_html.like_keys(items)
+        assert keys and all(it.liked is not None for it in items)
+        return keys
+
+    responses = [fixture(name) for name in RESPONSES] * max(1, n // len(RESPONSES))
+
+    def _try_extract_json() -> Any:
+        out = []
+        for text in responses:
+            out.append(post._try_extract_json(text))
+            out.append(comment._try_extract_json(text))
+        return out
+
+    size = lambda s: len(s.encode("utf-8"))  # noqa: E731
+    return [
+        ("fetch_mood_posts(act_all js)", n, size(act_all), _fetch_mood_posts),
+        ("scan_recent_comments(js)", n, size(more_js), _scan(more_js)),
+        ("scan_recent_comments(json)", n, size(more_json), _scan(more_json)),
+        ("module_html comments", n, size(module), _module),
+        ("fetch_keys link extraction", n, size(act_all), _fetch_keys),
+        ("feed_items like keys (act_all)", n, size(act_all), _feed_items),
+        ("_try_extract_json responses", len(responses) * 2, sum(size(r) for r in responses) * 2, _try_extract_json),
+    ]
+
+
+def run(sizes: List[int], repeat: int) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = []
+    print(f"{'case':32} {'items':>6} {'KB':>8} {'ms':>9} {'items/s':>10} {'MB/s':>8} {'peak KB':>9}")
+    for n in sizes:
+        for name, items, nbytes, fn in build_cases(n):
+            t, _ = timeit(fn, repeat)
+            peak = _peak_kb(fn)
+            row = {
+                "case": name,
+                "size": n,
+                "items": items,
+                "bytes": nbytes,
+                "ms": t * 1000,
+                "items_per_s": items / t if t else 0.0,
+                "mb_per_s": nbytes / 1e6 / t if t else 0.0,
+                "peak_kb": peak,
+            }
+            results.append(row)
+            print(
+                f"{name:32} {items:>6} {nbytes / 1024:>8.1f} {row['ms']:>9.2f} {row['items_per_s']:>10.0f} "
+                f"{row['mb_per_s']:>8.1f} {peak:>9.0f}"
+            )
+    return results
+
+
+def compare(results: List[Dict[str, Any]], baseline_path: Path, tolerance: float) -> int:
+    base = {(r["case"], r["size"]): r for r in json.loads(baseline_path.read_text(encoding="utf-8"))}
+    regressions = 0
+    for r in results:
+        b = base.get((r["case"], r["size"]))
+        if not b or not b.get("ms"):
+            continue
+        ratio = r["ms"] / b["ms"]
+        if ratio > 1 + tolerance:
+            regressions += 1
+            print(f"REGRESSION {r['case']} size={r['size']}: {b['ms']:.2f}ms -> {r['ms']:.2f}ms (x{ratio:.2f})")
+    print(f"compared with {baseline_path}: {regressions} regression(s) beyond +{tolerance:.0%}")
+    return 1 if regressions else 0
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", default="10,50,200", help="comma-separated item counts")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--save", type=Path, default=None, help="write results as JSON")
+    ap.add_argument("--compare", type=Path, default=None, help="baseline JSON from --save")
+    ap.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown vs baseline (0.25 = +25%%)")
+    args = ap.parse_args()
+
+    sizes = [int(x) for x in args.sizes.split(",") if x.strip()]
+    results = run(sizes, args.repeat)
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"saved {len(results)} results to {args.save}")
+    if args.compare:
+        sys.exit(compare(results, args.compare, args.tolerance))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,4 @@
 import asyncio
-import json
 import random
 import re
 import time
@@ -7,17 +6,29 @@ import traceback
 from pathlib import Path
 from typing import Optional, Set, Tuple, List, Dict, Any
 
-from .qzone_post import QzonePoster
+from .qzone_post import AsyncQzonePoster, QzonePoster
+from .qz_cache import TTLCache
+from .qz_journal import JournalFile
+from .qz_accounts import AccountConfig, AccountRegistry, QzAccount, parse_accounts
+from .qz_bloom import RotatingBloom
+from .qz_feed_cache import FeedCache
+from .qz_like_engine import LikeEngine, LikeTarget, parse_like_targets
+from .qz_like_history import LikeHistory
+from .qz_pending import PendingDeleteQueue
+from .qz_protect_delete import DeleteExecutor
+from .qz_ratelimit import DEFAULT_LIMITS, AdaptivePollInterval, AimdPacer, RateLimiter, classify_like_result, parse_rate_limits
 from .qz_scheduler import QzScheduler
 from .qzone_sleep import sleep_seconds
-from .qzone_comment import QzoneCommenter
-from .qzone_del_comment import QzoneCommentDeleter
-from .qzone_feed_fetch import QzoneFeedFetcher
-from .qzone_protect import QzoneProtectScanner
+from .qzone_comment import AsyncQzoneCommenter, QzoneCommenter
+from .qzone_comments_list import AsyncQzoneCommentLister, QzoneCommentLister
+from .qzone_del_comment import AsyncQzoneCommentDeleter, QzoneCommentDeleter
+from .qzone_feed_fetch import AsyncQzoneFeedFetcher, QzoneFeedFetcher
+from .qzone_feed_html import like_keys
+from .qzone_like import AsyncQzoneLikeClient, QzoneLikeClient
+from .qzone_protect import AsyncQzoneProtectScanner, FeedCommentRef, ProtectWatermark, QzoneProtectScanner
+from . import qzone_http
 from urllib.parse import quote
 
-import requests
-
 from astrbot.api.star import Star, register
 from astrbot.api.event import filter, AstrMessageEvent
 
@@ -31,26 +42,6 @@ def _now_hms() -> str:
     return time.strftime("%H:%M:%S")
 
 
-def _get_gtk(skey: str) -> int:
-    hash_val = 5381
-    for ch in skey:
-        hash_val += (hash_val << 5) + ord(ch)
-    return hash_val & 0x7FFFFFFF
-
-
-def _pick_skey_for_gtk(cookie: str) -> str:
-    """Pick a usable skey value from cookie for g_tk calculation.
-
-    Qzone commonly uses p_skey, but some cookie sets only have skey or media_p_skey.
-    """
-
-    for key in ("p_skey", "skey", "media_p_skey"):
-        v = _extract_cookie_value(cookie, key)
-        if v:
-            return v
-    return ""
-
-
 def _extract_cookie_value(cookie: str, key: str) -> str:
     if not cookie:
         return ""
@@ -70,135 +61,6 @@ def _sanitize_cookie_for_log(cookie_str: str) -> str:
     return f"<cookie:redacted has_p_skey={has_p_skey}>"
 
 
-class _QzoneClient:
-    def __init__(self, my_qq: str, cookie: str):
-        # my_qq: 当前登录 Cookie 对应的 QQ（用于 referer / opuin）
-        self.my_qq = my_qq
-
-        # 兼容用户从 DevTools 里复制整行 "cookie: ..." 的情况
-        cookie = (cookie or "").strip()
-        if cookie.lower().startswith("cookie:"):
-            cookie = cookie.split(":", 1)[1].strip()
-
-        self.cookie = cookie
-
-        skey_for_gtk = _pick_skey_for_gtk(cookie)
-        if not skey_for_gtk:
-            raise ValueError("cookie 缺少 p_skey/skey/media_p_skey（无法计算 g_tk）")
-
-        self.g_tk = _get_gtk(skey_for_gtk)
-        self.headers = {
-            "user-agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36"
-            ),
-            "cookie": cookie,
-            "referer": f"https://user.qzone.qq.com/{my_qq}",
-        }
-
-    def fetch_keys(self, count: int, target_qq: Optional[str] = None) -> Tuple[int, Set[str], int]:
-        """拉取目标空间的动态链接集合。
-
-        该接口用于“手动 /点赞”（支持 target_qq + 分页/扩展）。
-        自动轮询不走这里（自动轮询用 legacy 自用接口，见 fetch_keys_self_legacy）。
-        """
-        target = str(target_qq or self.my_qq).strip()
-
-        # feeds_html_act_all 参数含义：uin=登录QQ，hostuin=目标空间QQ
-        feeds_url = (
-            "https://user.qzone.qq.com/proxy/domain/ic2.qzone.qq.com/cgi-bin/feeds/"
-            f"feeds_html_act_all?uin={self.my_qq}&hostuin={target}"
-            f"&scope=0&filter=all&flag=1&refresh=0&firstGetGroup=0&mixnocache=0&scene=0"
-            f"&begintime=undefined&icServerTime=&start=0&count={count}"
-            f"&sidomain=qzonestyle.gtimg.cn&useutf8=1&outputhtmlfeed=1&refer=2"
-            f"&r={random.random()}&g_tk={self.g_tk}"
-        )
-        res = requests.get(feeds_url, headers=self.headers, timeout=20)
-        status = res.status_code
-        text_len = len(res.text or "")
-
-        raw_links = re.findall(
-            r"(http[s]?[:\\/]+user\.qzone\.qq\.com[:\\/]+\d+[:\\/]+mood[:\\/]+[a-f0-9]+)",
-            res.text or "",
-        )
-        keys = {link.replace("\\", "") for link in raw_links}
-        return status, keys, text_len
-
-    def fetch_keys_self_legacy(self, count: int) -> Tuple[int, Set[str], int]:
-        """自动轮询专用：旧版 feeds3_html_more（仅拉取自己的说说）。
-
-        你这边实测该接口更稳定能返回 mood 链接；只用于 worker，不影响手动 /点赞。
-        """
-        feeds_url = (
-            "https://user.qzone.qq.com/proxy/domain/ic2.qzone.qq.com/cgi-bin/feeds/"
-            f"feeds3_html_more?uin={self.my_qq}&scope=0&view=1&flag=1&refresh=1&count={count}"
-            f"&outputhtmlfeed=1&g_tk={self.g_tk}"
-        )
-        res = requests.get(feeds_url, headers=self.headers, timeout=20)
-        status = res.status_code
-        text_len = len(res.text or "")
-
-        raw_links = re.findall(
-            r"(http[s]?[:\\/]+user\.qzone\.qq\.com[:\\/]+\d+[:\\/]+mood[:\\/]+[a-f0-9]+)",
-            res.text or "",
-        )
-        keys = {link.replace("\\", "") for link in raw_links}
-        return status, keys, text_len
-
-    def send_like(self, full_key: str) -> Tuple[int, str]:
-        # 复刻浏览器：h5.qzone.qq.com 的 proxy/domain -> w.qzone.qq.com likes CGI。
-        like_url = f"https://h5.qzone.qq.com/proxy/domain/w.qzone.qq.com/cgi-bin/likes/internal_dolike_app?g_tk={self.g_tk}"
-
-        headers = dict(self.headers)
-        headers["origin"] = "https://user.qzone.qq.com"
-        headers["referer"] = "https://user.qzone.qq.com/"
-
-        # full_key 形如：http(s)://user.qzone.qq.com/<hostuin>/mood/<fid>.1
-        # 浏览器实际传的是不带 .1 的 unikey/curkey，并额外带 from/abstime/fid 等字段。
-        hostuin = ""
-        fid = full_key
-        m = re.search(r"user\.qzone\.qq\.com/(\d+)/mood/([a-f0-9]+)", full_key)
-        if m:
-            hostuin = m.group(1)
-            fid = m.group(2)
-        else:
-            if fid.endswith(".1"):
-                fid = fid[:-2]
-            if "/mood/" in fid:
-                fid = fid.split("/mood/", 1)[1]
-
-        payload = {
-            "qzreferrer": f"https://user.qzone.qq.com/",
-            "opuin": self.my_qq,
-            "unikey": full_key[:-2] if full_key.endswith(".1") else full_key,
-            "curkey": full_key[:-2] if full_key.endswith(".1") else full_key,
-            "from": "1",
-            "appid": "311",
-            "typeid": "0",
-            "abstime": str(int(time.time())),
-            "fid": fid,
-            "active": "0",
-            "fupdate": "1",
-        }
-
-        # 与浏览器一致：如果能解析到 hostuin，就把更完整的 qzreferrer 补上。
-        if hostuin:
-            payload["qzreferrer"] = (
-                "https://user.qzone.qq.com/proxy/domain/ic2.qzone.qq.com/cgi-bin/feeds/feeds_html_module"
-                "?g_iframeUser=1"
-                f"&i_uin={hostuin}"
-                f"&i_login_uin={self.my_qq}"
-                "&mode=4&previewV8=1&style=35&version=8&needDelOpr=true&transparence=true"
-                "&hideExtend=false&showcount=5"
-                "&MORE_FEEDS_CGI=http%3A%2F%2Fic2.s8.qzone.qq.com%2Fcgi-bin%2Ffeeds%2Ffeeds_html_act_all"
-                "&refer=2"
-                "&paramstring=os-winxp%7C100"
-            )
-
-        res = requests.post(like_url, headers=headers, data=payload, timeout=20)
-        return res.status_code, res.text or ""
-
-
 @register(
     name="qzone_auto_like",
     author="AI",
@@ -220,7 +82,6 @@ class QzoneAutoLikePlugin(Star):
 
         # 运行时：目标空间（若为空则监控/点赞自己的空间）
         self._target_qq: str = ""
-        self._manual_like_limit: int = 0
 
         self._task: Optional[asyncio.Task] = None
         self._stop_event = asyncio.Event()
@@ -243,8 +104,6 @@ class QzoneAutoLikePlugin(Star):
         self.ai_post_delete_notify_private_qq = str(self.config.get("ai_post_delete_notify_private_qq", "") or "").strip()
         self.ai_post_delete_notify_group_id = str(self.config.get("ai_post_delete_notify_group_id", "") or "").strip()
 
-        self._liked: Set[str] = set()
-
         # Cookie auto fetch (Napcat/AIOCQHTTP)
         self.cookie_auto_fetch_enabled = bool(self.config.get("cookie_auto_fetch_enabled", False))
         self.cookie_auto_fetch_cooldown_sec = int(self.config.get("cookie_auto_fetch_cooldown_sec", 120) or 120)
@@ -267,7 +126,6 @@ class QzoneAutoLikePlugin(Star):
         self.llm_tool_reply_mode = str(self.config.get("llm_tool_reply_mode", "error") or "error").strip().lower()
         if self.llm_tool_reply_mode not in ("all", "error", "off"):
             self.llm_tool_reply_mode = "error"
-        self._data_path = Path(__file__).parent / "data" / "liked_records.json"
 
         # In-memory: last posted tid/content for quick follow-up actions.
         self._last_tid: str = ""
@@ -280,9 +138,11 @@ class QzoneAutoLikePlugin(Star):
         if self._comment_ref_max < 0:
             self._comment_ref_max = 0
 
-        # Optional small on-disk store for recent tids (bounded, overwrites file).
+        # Optional small on-disk store for recent tids (bounded; appends to recent_tids.journal, compacts periodically).
         self._tid_path = Path(__file__).parent / "data" / "recent_tids.json"
         self._recent_tids: list[str] = []
+        self._tid_journal = JournalFile(self._tid_path)
+        self._tid_journal.bind(lambda: self._recent_tids[-self._tid_store_max :])
         self._tid_store_max = int(self.config.get("tid_store_max", 200) or 200)
         if self._tid_store_max < 0:
             self._tid_store_max = 0
@@ -291,21 +151,72 @@ class QzoneAutoLikePlugin(Star):
         # Optional store for recent posts (tid->text). Used for auto-comment without extra API calls.
         self._post_path = Path(__file__).parent / "data" / "recent_posts.json"
         self._recent_posts: list[dict] = []
+        self._post_journal = JournalFile(self._post_path)
+        self._post_journal.bind(lambda: self._recent_posts[-self._post_store_max :])
         self._post_store_max = int(self.config.get("post_store_max", 200) or 200)
         if self._post_store_max < 0:
             self._post_store_max = 0
         self._load_recent_posts()
 
-        # 仅用于自动轮询的“内存去重”（不落盘）：避免每轮重复点同一条。
-        self._auto_seen: dict[str, float] = {}
-
-        self.my_qq = str(self.config.get("my_qq", "")).strip()
-        self.cookie = str(self.config.get("cookie", "")).strip()
+        # 自动轮询去重：点赞成功的 mood key（按写入时间过期 + 条数上限）。默认落盘到 data/like_history.json，
+        # 重启后不会把最近 max_feeds 条再点一遍（每条都要 12~25s 延迟 + 一次请求）。
+        self.dedup_cache_max = int(self.config.get("dedup_cache_max", 50000) or 0)
+        self.like_history_persist = bool(self.config.get("like_history_persist", True))
+        # exact=精确集合（LikeHistory）；bloom=轮转布隆过滤器，内存固定、与历史长度无关（监控大量/高频空间时用）
+        self.like_dedup_mode = str(self.config.get("like_dedup_mode", "exact") or "exact").strip().lower()
+
+        # 主账号 = my_qq/cookie：命令、AI 发说说、Cookie 自动获取都只作用于它；accounts 里的额外账号只跑后台任务。
+        self._primary = QzAccount(
+            str(self.config.get("my_qq", "")).strip(),
+            str(self.config.get("cookie", "")).strip(),
+            data_dir=Path(__file__).parent / "data",
+            primary=True,
+        )
+        self._accounts = AccountRegistry(self._primary)
+        self._auto_seen = self._primary.auto_seen = self._new_like_dedup("self")
         self._target_qq = str(self.config.get("target_qq", "")).strip()
 
-        # Scheduler initialization (only for AI timed posting/deletion). Must be after my_qq/cookie is loaded.
         self._ai_notify_lock = asyncio.Lock()
 
+        # 定时删说说队列（落盘 data/pending_deletes.json），与 QzScheduler 共用同一个实例。
+        self._pending_deletes = PendingDeleteQueue(Path(__file__).parent / "data" / "pending_deletes.json")
+
+        # 进程级 HTTP 连接池大小（每个 host 保持的 keep-alive 连接上限）
+        self.http_max_connections = int(self.config.get("http_max_connections", qzone_http.DEFAULT_MAX_CONNECTIONS) or qzone_http.DEFAULT_MAX_CONNECTIONS)
+        if self.http_max_connections <= 0:
+            self.http_max_connections = qzone_http.DEFAULT_MAX_CONNECTIONS
+        # 压测用：把所有 Qzone 请求指向本地 mock（benchmarks/mock_qzone.py），留空=真实 QQ 空间。
+        self.qzone_base_url = str(self.config.get("qzone_base_url", "") or "").strip()
+        if self.qzone_base_url:
+            logger.warning(f"[Qzone] qzone_base_url 已设置，所有 Qzone 请求将发往 {self.qzone_base_url}")
+        qzone_http.configure(max_connections=self.http_max_connections, base_url=self.qzone_base_url)
+        # 非阻塞 HTTP：开启后各客户端走 aiohttp（事件循环内完成），不再占用线程池。
+        self.http_async_enabled = bool(self.config.get("http_async_enabled", False))
+
+        self.poll_interval = int(self.config.get("poll_interval_sec", 20))
+        self.max_feeds = int(self.config.get("max_feeds_count", 15))
+
+        # 多目标点赞：like_targets 为空时沿用 target_qq（再空=自己）。所有目标共用一个并发上限。
+        self.like_max_concurrency = int(self.config.get("like_max_concurrency", 3) or 3)
+        # 风控友好：每账号、每接口一个令牌桶（代替每次点赞前固定 sleep）。空闲攒下的额度（burst）可以立即用，
+        # 持续速率不超过 rate；所有目标、所有 /点赞 命令、护评、定时任务共用同一账号的桶。
+        self.like_rate_per_min = float(self.config.get("like_rate_per_min", 4) or 0)
+        self.like_burst = max(1, int(self.config.get("like_burst", 2) or 1))
+        self.rate_limit_jitter = float(self.config.get("rate_limit_jitter", 0.3) or 0)
+        # /说说、/说说表、/评论、/点赞 和后台任务拉同一页 feeds_html_act_all 时共用一次请求和解析结果
+        self.feed_cache_ttl = max(0.0, float(self.config.get("feed_cache_ttl_sec", 15) or 0))
+        # 自适应点赞节奏（AIMD）：连续成功就慢慢提速，遇到“记录成功”/验证页/操作频繁立刻减半并暂停一会儿。
+        # like_rate_per_min 是起始速率，实际速率在 [like_rate_min_per_min, like_rate_max_per_min] 之间浮动。
+        self.like_pacing_adaptive = bool(self.config.get("like_pacing_adaptive", True))
+        self.like_rate_min = float(self.config.get("like_rate_min_per_min", 1) or 1)
+        self.like_rate_max = float(self.config.get("like_rate_max_per_min", 10) or 10)
+        self._primary.limiter = self._new_rate_limiter()
+        self._primary.like_pacer = self._new_like_pacer(self._primary.limiter)
+        self._like_dedups = self._primary.like_dedups
+
+        # Scheduler initialization (only for AI timed posting/deletion). Must be after my_qq/cookie and the
+        # primary account's limiter: posts/deletes take its tokens, and its last_used tells protect dormancy
+        # and the feed cache that a post was made.
         try:
             self._scheduler = QzScheduler(
                 context=self.context,
@@ -314,18 +225,14 @@ class QzoneAutoLikePlugin(Star):
                 cookie=self.cookie,
                 data_dir=Path(__file__).parent / "data",
                 notify_cb=self._send_ai_notify,
+                pending=self._pending_deletes,
+                pool=self._primary.pool,
+                limiter=self._primary.limiter,
+                http_async=self.http_async_enabled,
             )
         except Exception as e:
             logger.warning(f"[Qzone] scheduler init failed: {e}")
             self._scheduler = None
-        self.poll_interval = int(self.config.get("poll_interval_sec", 20))
-        # 风控友好：默认放慢点赞间隔（可在配置里改回去）
-        self.delay_min = int(self.config.get("like_delay_min_sec", 12))
-        self.delay_max = int(self.config.get("like_delay_max_sec", 25))
-        if self.delay_min > self.delay_max:
-            self.delay_min, self.delay_max = self.delay_max, self.delay_min
-        self.max_feeds = int(self.config.get("max_feeds_count", 15))
-        self.persist = False
 
         self.enabled = bool(self.config.get("enabled", False))
         self.auto_start = bool(self.config.get("auto_start", False))
@@ -342,15 +249,30 @@ class QzoneAutoLikePlugin(Star):
         self.protect_pages = int(self.config.get("protect_pages", 2) or 2)
         if self.protect_pages <= 0:
             self.protect_pages = 1
+        # 增量护评：内容没变的动态不再解析，翻到没有变化的一页就停（每 N 轮仍完整翻一次）
+        self.protect_incremental = bool(self.config.get("protect_incremental", True))
+        self.protect_full_scan_every = int(self.config.get("protect_full_scan_every", 30) or 30)
+        # feeds3 没带评论时才抓 feeds_html_module；同样的 feed 信号在这段时间内复用上次的解析结果
+        self.protect_module_cache_sec = max(0, int(self.config.get("protect_module_cache_sec", 120) or 0))
+        self.protect_delete_concurrency = max(1, int(self.config.get("protect_delete_concurrency", 4) or 4))
+        self.protect_adaptive_poll = bool(self.config.get("protect_adaptive_poll", True))
+        self.protect_poll_idle_sec = max(self.protect_poll_interval, int(self.config.get("protect_poll_idle_sec", 120) or 120))
+        # 休眠期间的复查间隔最多为护评窗口的 1/4：手机上发的说说最晚在窗口的前 1/4 内恢复轮询
+        self.protect_dormant_check_sec = max(0, int(self.config.get("protect_dormant_check_sec", 300) or 0))
+        if self.protect_dormant_check_sec > 0 and self.protect_window_minutes > 0:
+            self.protect_dormant_check_sec = max(1, min(self.protect_dormant_check_sec, self.protect_window_minutes * 15))
+        self.protect_delete_retries = max(0, int(self.config.get("protect_delete_retries", 2) or 0))
 
         self._protect_task: Optional[asyncio.Task] = None
         self._protect_stop = asyncio.Event()
-        self._protect_seen: dict[str, float] = {}
+        # topic:comment -> 已交给删评执行器（见 _new_protect_seen）
+        self._protect_seen = self._primary.protect_seen = self._new_protect_seen()
+
+        # 额外账号：各自的 cookie/g_tk、连接池、点赞预算、去重存储和后台任务（互不影响）
+        self._load_extra_accounts()
 
         # Some AstrBot builds don't reliably call on_astrbot_loaded for plugins.
         # To make protect actually run, schedule a best-effort autostart here.
-        self._protect_last_scan = ""
-        self._protect_last_delete = ""
         try:
             loop = asyncio.get_running_loop()
             loop.call_soon(asyncio.create_task, self._maybe_start_protect_task())
@@ -360,16 +282,14 @@ class QzoneAutoLikePlugin(Star):
             except Exception:
                 pass
 
-        # 去掉缓存/去重机制：不加载历史点赞记录
-
         logger.info(
-            "[Qzone] 插件初始化 | my_qq=%s poll=%ss delay=[%s,%s] max_feeds=%s persist=%s enabled=%s auto_start=%s protect=%s protect_window_min=%s protect_notify=%s cookie=%s",
+            "[Qzone] 插件初始化 | my_qq=%s poll=%ss like_rate=%s/min burst=%s max_feeds=%s like_history_persist=%s enabled=%s auto_start=%s protect=%s protect_window_min=%s protect_notify=%s cookie=%s",
             self.my_qq,
             self.poll_interval,
-            self.delay_min,
-            self.delay_max,
+            self.like_rate_per_min,
+            self.like_burst,
             self.max_feeds,
-            self.persist,
+            self.like_history_persist,
             self.enabled,
             self.auto_start,
             self.protect_enabled,
@@ -422,201 +342,67 @@ class QzoneAutoLikePlugin(Star):
         if not sent:
             logger.warning(f"[Qzone] AI notify dropped kind={kind}: no targets or send failed")
 
-    def _load_records(self) -> None:
-        if not self._data_path.exists():
-            return
-        try:
-            data = json.loads(self._data_path.read_text(encoding="utf-8"))
-            if isinstance(data, list):
-                self._liked = set(str(x) for x in data)
-        except Exception as e:
-            logger.error(f"[Qzone] 加载点赞记录失败: {e}")
-
     def _load_recent_tids(self) -> None:
         if self._tid_store_max <= 0:
             return
-        if not self._tid_path.exists():
-            return
-        try:
-            data = json.loads(self._tid_path.read_text(encoding="utf-8"))
-            if isinstance(data, list):
-                self._recent_tids = [str(x) for x in data if str(x).strip()]
-        except Exception as e:
-            logger.warning(f"[Qzone] 加载 recent_tids 失败: {e}")
-
-    def _save_recent_tids(self) -> None:
-        if self._tid_store_max <= 0:
-            return
-        try:
-            self._tid_path.parent.mkdir(parents=True, exist_ok=True)
-            self._tid_path.write_text(
-                json.dumps(self._recent_tids[-self._tid_store_max :], ensure_ascii=True, indent=2),
-                encoding="utf-8",
-            )
-        except Exception as e:
-            logger.warning(f"[Qzone] 保存 recent_tids 失败: {e}")
+        data, records = self._tid_journal.load("recent_tids")
+        if isinstance(data, list):
+            self._recent_tids = [str(x) for x in data if str(x).strip()]
+        for rec in records:
+            self._touch_recent_tid(str(rec.get("tid") or "").strip())
+        if records:
+            self._tid_journal.compact()
 
-    def _remember_tid(self, tid: str) -> None:
-        t = (tid or "").strip()
+    def _touch_recent_tid(self, t: str) -> None:
         if not t:
             return
-        self._last_tid = t
-        if self._tid_store_max <= 0:
-            return
         if t in self._recent_tids:
             self._recent_tids.remove(t)
         self._recent_tids.append(t)
         if len(self._recent_tids) > self._tid_store_max:
             self._recent_tids = self._recent_tids[-self._tid_store_max :]
-        self._save_recent_tids()
 
-    def _load_recent_posts(self) -> None:
-        if self._post_store_max <= 0:
+    def _remember_tid(self, tid: str) -> None:
+        t = (tid or "").strip()
+        if not t:
             return
-        if not self._post_path.exists():
+        self._last_tid = t
+        if self._tid_store_max <= 0:
             return
-        try:
-            data = json.loads(self._post_path.read_text(encoding="utf-8"))
-            if isinstance(data, list):
-                items = []
-                for x in data:
-                    if isinstance(x, dict) and str(x.get("tid", "")).strip():
-                        items.append(
-                            {
-                                "tid": str(x.get("tid")),
-                                "text": str(x.get("text", "")),
-                                "ts": float(x.get("ts", 0) or 0),
-                            }
-                        )
-                self._recent_posts = items
-        except Exception as e:
-            logger.warning(f"[Qzone] 加载 recent_posts 失败: {e}")
+        self._touch_recent_tid(t)
+        self._tid_journal.append([{"tid": t}], len(self._recent_tids))
 
-    def _save_recent_posts(self) -> None:
+    def _load_recent_posts(self) -> None:
         if self._post_store_max <= 0:
             return
-        try:
-            self._post_path.parent.mkdir(parents=True, exist_ok=True)
-            self._post_path.write_text(
-                json.dumps(self._recent_posts[-self._post_store_max :], ensure_ascii=True, indent=2),
-                encoding="utf-8",
-            )
-        except Exception as e:
-            logger.warning(f"[Qzone] 保存 recent_posts 失败: {e}")
-
-    def _load_pending_deletes(self) -> None:
-        try:
-            if not self._pending_delete_path.exists():
-                self._pending_deletes = []
-                return
-            data = json.loads(self._pending_delete_path.read_text(encoding="utf-8"))
-            if not isinstance(data, list):
-                self._pending_deletes = []
-                return
-            items: List[Dict[str, Any]] = []
-            for it in data:
-                if not isinstance(it, dict):
-                    continue
-                tid = str(it.get("tid") or "").strip()
-                due_ts = float(it.get("due_ts") or 0)
-                created_ts = float(it.get("created_ts") or 0)
-                if not tid or due_ts <= 0:
-                    continue
-                items.append({"tid": tid, "due_ts": due_ts, "created_ts": created_ts or time.time()})
-            # keep sorted by due
-            items.sort(key=lambda x: float(x.get("due_ts") or 0))
-            self._pending_deletes = items
-        except Exception as e:
-            logger.warning(f"[Qzone] 加载 pending_deletes 失败: {e}")
-            self._pending_deletes = []
+        data, records = self._post_journal.load("recent_posts")
+        for x in (data if isinstance(data, list) else []) + records:
+            if isinstance(x, dict) and str(x.get("tid", "")).strip():
+                self._touch_recent_post(
+                    {
+                        "tid": str(x.get("tid")),
+                        "text": str(x.get("text", "")),
+                        "ts": float(x.get("ts", 0) or 0),
+                    }
+                )
+        if records:
+            self._post_journal.compact()
 
-    def _save_pending_deletes(self) -> None:
-        try:
-            self._pending_delete_path.parent.mkdir(parents=True, exist_ok=True)
-            self._pending_delete_path.write_text(
-                json.dumps(self._pending_deletes, ensure_ascii=True, indent=2),
-                encoding="utf-8",
-            )
-        except Exception as e:
-            logger.warning(f"[Qzone] 保存 pending_deletes 失败: {e}")
+    def _touch_recent_post(self, item: dict) -> None:
+        t = item["tid"]
+        self._recent_posts = [x for x in self._recent_posts if str(x.get("tid")) != t]
+        self._recent_posts.append(item)
+        if len(self._recent_posts) > self._post_store_max:
+            self._recent_posts = self._recent_posts[-self._post_store_max :]
 
     async def _queue_delete(self, tid: str, delete_after_min: int) -> None:
-        t = str(tid or "").strip()
-        if not t or delete_after_min <= 0:
-            return
-        now = time.time()
-        due = now + delete_after_min * 60
-        async with self._pending_delete_lock:
-            # de-dup by tid (keep earliest due)
-            found = False
-            for it in self._pending_deletes:
-                if str(it.get("tid") or "") == t:
-                    old_due = float(it.get("due_ts") or 0)
-                    if old_due <= 0 or due < old_due:
-                        it["due_ts"] = due
-                    found = True
-                    break
-            if not found:
-                self._pending_deletes.append({"tid": t, "due_ts": due, "created_ts": now})
-            self._pending_deletes.sort(key=lambda x: float(x.get("due_ts") or 0))
-            self._save_pending_deletes()
+        if delete_after_min <= 0:
+            return
+        await self._pending_deletes.queue(tid, time.time() + delete_after_min * 60)
 
     async def _drain_due_deletes(self, poster: QzonePoster) -> int:
         """Try deleting all due items. Returns number deleted successfully."""
-        now = time.time()
-        due_items: List[Dict[str, Any]] = []
-        async with self._pending_delete_lock:
-            if not self._pending_deletes:
-                return 0
-            keep: List[Dict[str, Any]] = []
-            for it in self._pending_deletes:
-                try:
-                    due_ts = float(it.get("due_ts") or 0)
-                except Exception:
-                    due_ts = 0
-                if due_ts > 0 and due_ts <= now:
-                    due_items.append(it)
-                else:
-                    keep.append(it)
-            # tentatively remove due items; if delete fails we will requeue with backoff below
-            self._pending_deletes = keep
-            self._save_pending_deletes()
-
-        ok_count = 0
-        for it in due_items:
-            tid = str(it.get("tid") or "").strip()
-            if not tid:
-                continue
-            try:
-                ds, dr = await asyncio.to_thread(poster.delete_by_tid, tid)
-                ok = bool(ds == 200 and getattr(dr, "ok", False))
-                logger.info(
-                    "[Qzone] pending delete 执行 | status=%s ok=%s code=%s msg=%s tid=%s",
-                    ds,
-                    getattr(dr, "ok", False),
-                    getattr(dr, "code", ""),
-                    getattr(dr, "message", ""),
-                    tid,
-                )
-                if ok:
-                    ok_count += 1
-                    continue
-
-                # requeue failed delete with small backoff (avoid tight loop)
-                async with self._pending_delete_lock:
-                    backoff_due = time.time() + 60
-                    self._pending_deletes.append({"tid": tid, "due_ts": backoff_due, "created_ts": float(it.get("created_ts") or time.time())})
-                    self._pending_deletes.sort(key=lambda x: float(x.get("due_ts") or 0))
-                    self._save_pending_deletes()
-            except Exception as e:
-                logger.warning(f"[Qzone] pending delete 异常 tid={tid}: {e}")
-                async with self._pending_delete_lock:
-                    backoff_due = time.time() + 60
-                    self._pending_deletes.append({"tid": tid, "due_ts": backoff_due, "created_ts": float(it.get("created_ts") or time.time())})
-                    self._pending_deletes.sort(key=lambda x: float(x.get("due_ts") or 0))
-                    self._save_pending_deletes()
-
-        return ok_count
+        return await self._pending_deletes.drain(poster)
 
     def _remember_post(self, tid: str, text: str) -> None:
         t = (tid or "").strip()
@@ -626,23 +412,234 @@ class QzoneAutoLikePlugin(Star):
         self._last_post_text = (text or "")
         if self._post_store_max <= 0:
             return
-        self._recent_posts = [x for x in self._recent_posts if str(x.get("tid")) != t]
-        self._recent_posts.append({"tid": t, "text": (text or ""), "ts": time.time()})
-        if len(self._recent_posts) > self._post_store_max:
-            self._recent_posts = self._recent_posts[-self._post_store_max :]
-        self._save_recent_posts()
+        item = {"tid": t, "text": (text or ""), "ts": time.time()}
+        self._touch_recent_post(item)
+        self._post_journal.append([item], len(self._recent_posts))
+
+    # my_qq / cookie 就是主账号的；Cookie 自动刷新写回这里，主账号的后台任务立即用上新 cookie。
+    @property
+    def my_qq(self) -> str:
+        return self._primary.uin
+
+    @my_qq.setter
+    def my_qq(self, value: str) -> None:
+        self._primary.uin = str(value or "").strip()
+
+    @property
+    def cookie(self) -> str:
+        return self._primary.cookie
+
+    @cookie.setter
+    def cookie(self, value: str) -> None:
+        self._primary.cookie = str(value or "").strip()
+
+    def _new_protect_seen(self) -> TTLCache:
+        # topic:comment -> 已交给 DeleteExecutor。删除失败只由执行器按退避重试，扫描不再重复提交；
+        # 所以 TTL 要盖住整个护评窗口（窗口外的评论不再扫到）和执行器的全部重试时间，不限窗口时保留一天。
+        window = self.protect_window_minutes * 60.0 if self.protect_window_minutes > 0 else 86400.0
+        retries = float(self.protect_poll_interval) * (2 ** self.protect_delete_retries - 1)
+        return TTLCache(ttl=max(window, retries + self.protect_poll_idle_sec), max_size=self.dedup_cache_max)
+
+    def _protect_marks(self, acct: QzAccount) -> Optional[ProtectWatermark]:
+        # 增量护评状态按账号保存在内存里；重启后第一轮做一次完整扫描
+        if not self.protect_incremental:
+            return None
+        if acct.protect_marks is None:
+            acct.protect_marks = ProtectWatermark(full_scan_every=self.protect_full_scan_every)
+        return acct.protect_marks
+
+    def _protect_in_window(self, newest_abstime: int) -> bool:
+        # 不限窗口 / 还不知道最新说说的时间：当作仍在窗口内
+        if self.protect_window_minutes <= 0 or newest_abstime <= 0:
+            return True
+        return time.time() - newest_abstime <= self.protect_window_minutes * 60
+
+    async def _protect_dormant(self, acct: QzAccount, stop: asyncio.Event) -> None:
+        """All posts are outside protect_window_minutes: stop scanning until this account publishes
+        a post (seen on its rate limiter) or protect_dormant_check_sec passes (0 = only on publish)."""
+
+        since = time.time()
+        check = self.protect_dormant_check_sec
+        acct.protect_poll_state = f"dormant since={int(since)}" + (f" recheck={check}s" if check > 0 else "")
+        logger.info("[Qzone] protect %s: 所有说说已超出护评窗口，暂停轮询", acct.label)
+        while not stop.is_set():
+            if acct.limiter.last_call("publish") > since:
+                logger.info("[Qzone] protect %s: 检测到发布说说，恢复轮询", acct.label)
+                return
+            timeout = float(self.protect_poll_interval)
+            if check > 0:
+                left = since + check - time.time()
+                if left <= 0:
+                    return
+                timeout = min(timeout, left)
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
 
-    def _save_records(self) -> None:
-        if not self.persist:
-            return
-        try:
-            self._data_path.parent.mkdir(parents=True, exist_ok=True)
-            self._data_path.write_text(
-                json.dumps(sorted(self._liked), ensure_ascii=True, indent=2),
-                encoding="utf-8",
+    def _protect_delete_executor(self, acct: QzAccount) -> DeleteExecutor:
+        if acct.protect_deleter is None:
+            acct.protect_deleter = DeleteExecutor(
+                lambda ref, a=acct: self._protect_delete_one(a, ref),
+                concurrency=self.protect_delete_concurrency,
+                max_attempts=self.protect_delete_retries + 1,
+                retry_base=float(self.protect_poll_interval),
             )
-        except Exception as e:
-            logger.error(f"[Qzone] 保存点赞记录失败: {e}")
+        return acct.protect_deleter
+
+    async def _protect_delete_one(self, acct: QzAccount, r: FeedCommentRef) -> Tuple[bool, bool, str]:
+        """Delete one comment for the protect worker -> (ok, retryable, detail)."""
+
+        # Always use latest cookie for delete.
+        deleter = self._new_comment_deleter(acct)
+        ds, dr = await qzone_http.call(deleter.delete_comment, r.topic_id, r.comment_id, r.comment_uin)
+
+        # If delete failed and looks like cookie expired, refresh once and retry.
+        if not (ds == 200 and dr.ok):
+            hint = str(getattr(dr, 'message', '') or '')
+            if self._looks_like_cookie_expired(ds, hint):
+                if await self._maybe_refresh_cookie(reason="protect delete cookie expired", event=None, acct=acct):
+                    deleter = self._new_comment_deleter(acct)
+                    ds, dr = await qzone_http.call(deleter.delete_comment, r.topic_id, r.comment_id, r.comment_uin)
+
+        if ds == 200 and dr.ok:
+            if self.protect_notify_mode == "all":
+                logger.info(
+                    "[Qzone] protect delete ok topicId=%s commentId=%s commentUin=%s",
+                    r.topic_id,
+                    r.comment_id,
+                    r.comment_uin,
+                )
+            return True, False, ""
+
+        if self.protect_notify_mode in ("error", "all"):
+            logger.warning(
+                "[Qzone] protect delete failed status=%s code=%s msg=%s topicId=%s commentId=%s commentUin=%s",
+                ds,
+                dr.code,
+                dr.message,
+                r.topic_id,
+                r.comment_id,
+                r.comment_uin,
+            )
+        # status 0 = 请求没发出去（参数为空），重试也没用
+        return False, ds != 0, f"status={ds} code={dr.code} msg={dr.message}"
+
+    def _protect_module_cache(self, acct: QzAccount) -> Optional[TTLCache]:
+        if self.protect_module_cache_sec <= 0:
+            return None
+        if acct.protect_module_cache is None:
+            acct.protect_module_cache = TTLCache(ttl=float(self.protect_module_cache_sec), max_size=8)
+        return acct.protect_module_cache
+
+    def _feed_cache(self, acct: QzAccount) -> Optional[FeedCache]:
+        if self.feed_cache_ttl <= 0:
+            return None
+        if acct.feed_cache is None:
+            limiter = acct.limiter
+            # 本账号发/删说说之后，之前缓存的页都作废
+            acct.feed_cache = FeedCache(
+                ttl=self.feed_cache_ttl,
+                stale_before=lambda: limiter.last_call("publish", "delete"),
+            )
+        return acct.feed_cache
+
+    def _load_extra_accounts(self) -> None:
+        for spec in parse_accounts(self.config.get("accounts", [])):
+            acct = QzAccount(
+                spec.uin,
+                spec.cookie,
+                data_dir=Path(__file__).parent / "data" / "accounts" / spec.uin,
+                name=spec.name,
+                pool=qzone_http.HttpPool(self.http_max_connections),
+                limiter=self._new_rate_limiter(),
+                protect_seen=self._new_protect_seen(),
+                spec=spec,
+            )
+            if acct.g_tk is None:
+                logger.warning(f"[Qzone] 账号 {acct.label} cookie 缺少 p_skey/skey，无法计算 g_tk，已跳过")
+                continue
+            acct.auto_seen = self._new_like_dedup("self", acct)
+            acct.like_pacer = self._new_like_pacer(acct.limiter)
+            self._accounts.add(acct)
+        if self._accounts.extras():
+            logger.info("[Qzone] 额外账号: %s", ", ".join(a.label for a in self._accounts.extras()))
+
+    def _start_extra_accounts(self) -> None:
+        """Start background tasks of the extra accounts (each supervised on its own)."""
+
+        for acct in self._accounts.extras():
+            spec = acct.spec
+            if spec is None or not spec.enabled:
+                continue
+            if spec.like and self.enabled:
+                acct.supervise("like", lambda stop, a=acct: self._account_like_worker(a, stop))
+            protect = self.protect_enabled if spec.protect is None else spec.protect
+            if protect:
+                acct.supervise("protect", lambda stop, a=acct: self._protect_worker(a, stop))
+            if spec.post:
+                if acct.scheduler is None:
+                    acct.scheduler = QzScheduler(
+                        context=self.context,
+                        config=AccountConfig(acct.data_dir / "state.json", self.config),
+                        my_qq=acct.uin,
+                        cookie=acct.cookie,
+                        data_dir=acct.data_dir,
+                        pending=PendingDeleteQueue(acct.data_dir / "pending_deletes.json"),
+                        pool=acct.pool,
+                        limiter=acct.limiter,
+                        http_async=self.http_async_enabled,
+                    )
+                asyncio.create_task(acct.scheduler.start())
+
+    def _new_rate_limiter(self) -> RateLimiter:
+        limits = dict(DEFAULT_LIMITS)
+        limits["like"] = (self.like_rate_per_min, self.like_burst)
+        limits.update(parse_rate_limits(self.config.get("rate_limits", "")))
+        return RateLimiter(limits, jitter=self.rate_limit_jitter)
+
+    def _new_like_pacer(self, limiter: RateLimiter) -> Optional[AimdPacer]:
+        bucket = limiter.bucket("like")
+        if not self.like_pacing_adaptive or bucket is None or bucket.rate_per_min <= 0:
+            return None
+        return AimdPacer(bucket, min_rate=self.like_rate_min, max_rate=max(self.like_rate_min, self.like_rate_max))
+
+    # ---- client factories: sync (requests + to_thread) or async (aiohttp) per http_async_enabled ----
+    # acct=None -> 主账号（共用进程级连接池）；额外账号走自己的连接池。
+    def _new_like_client(self, acct: Optional[QzAccount] = None) -> QzoneLikeClient:
+        acct = acct or self._primary
+        cls = AsyncQzoneLikeClient if self.http_async_enabled else QzoneLikeClient
+        return cls(acct.uin, acct.cookie, pool=acct.pool, limiter=acct.limiter, feed_cache=self._feed_cache(acct))
+
+    def _new_poster(self, acct: Optional[QzAccount] = None) -> QzonePoster:
+        acct = acct or self._primary
+        cls = AsyncQzonePoster if self.http_async_enabled else QzonePoster
+        return cls(acct.uin, acct.cookie, pool=acct.pool, limiter=acct.limiter)
+
+    def _new_commenter(self, acct: Optional[QzAccount] = None) -> QzoneCommenter:
+        acct = acct or self._primary
+        cls = AsyncQzoneCommenter if self.http_async_enabled else QzoneCommenter
+        return cls(acct.uin, acct.cookie, pool=acct.pool, limiter=acct.limiter)
+
+    def _new_comment_lister(self, acct: Optional[QzAccount] = None) -> QzoneCommentLister:
+        acct = acct or self._primary
+        cls = AsyncQzoneCommentLister if self.http_async_enabled else QzoneCommentLister
+        return cls(acct.uin, acct.cookie, pool=acct.pool, limiter=acct.limiter)
+
+    def _new_comment_deleter(self, acct: Optional[QzAccount] = None) -> QzoneCommentDeleter:
+        acct = acct or self._primary
+        cls = AsyncQzoneCommentDeleter if self.http_async_enabled else QzoneCommentDeleter
+        return cls(acct.uin, acct.cookie, pool=acct.pool, limiter=acct.limiter)
+
+    def _new_feed_fetcher(self, host_uin: str, acct: Optional[QzAccount] = None) -> QzoneFeedFetcher:
+        acct = acct or self._primary
+        cls = AsyncQzoneFeedFetcher if self.http_async_enabled else QzoneFeedFetcher
+        return cls(host_uin, acct.cookie, my_qq=acct.uin, pool=acct.pool, limiter=acct.limiter, feed_cache=self._feed_cache(acct))
+
+    def _new_protect_scanner(self, acct: Optional[QzAccount] = None) -> QzoneProtectScanner:
+        acct = acct or self._primary
+        cls = AsyncQzoneProtectScanner if self.http_async_enabled else QzoneProtectScanner
+        return cls(acct.uin, acct.cookie, pool=acct.pool, limiter=acct.limiter, feed_cache=self._feed_cache(acct))
 
     def _is_running(self) -> bool:
         return self._task is not None and not self._task.done()
@@ -834,7 +831,7 @@ class QzoneAutoLikePlugin(Star):
         except Exception:
             target_umo = None
 
-        poster = QzonePoster(self.my_qq, self.cookie)
+        poster = self._new_poster()
 
         async def _send_private(to_qq: str, msg: str) -> None:
             to_qq = str(to_qq or "").strip()
@@ -904,7 +901,7 @@ class QzoneAutoLikePlugin(Star):
                 if len(content) > 120:
                     content = content[:120].rstrip()
 
-                status, result = await asyncio.to_thread(poster.publish_text, content)
+                status, result = await qzone_http.call(poster.publish_text, content)
                 try:
                     self.config["ai_post_last_run_ts"] = time.time()
                     if hasattr(self.config, "save_config"):
@@ -988,7 +985,7 @@ class QzoneAutoLikePlugin(Star):
             if bool(self.config.get("ai_post_mark", True)):
                 content = "【AI发送】" + content
 
-            status, result = await asyncio.to_thread(poster.publish_text, content)
+            status, result = await qzone_http.call(poster.publish_text, content)
             try:
                 self.config["ai_post_last_run_ts"] = time.time()
                 if hasattr(self.config, "save_config"):
@@ -1043,7 +1040,7 @@ class QzoneAutoLikePlugin(Star):
             # Use last-run as anchor when available; otherwise start immediately.
             last = float(self.config.get("ai_post_last_run_ts", 0) or 0)
             if last <= 0:
-                return time.time()
+                return 0.0  # time.time() here is always just after `now`, so it would never be due
             return last + interval_min * 60
 
         def _next_daily_due_ts() -> Optional[float]:
@@ -1075,16 +1072,15 @@ class QzoneAutoLikePlugin(Star):
                     next_candidates.append(dts)
 
                 if not next_candidates:
-                    # nothing scheduled; check deletes periodically
-                    await asyncio.wait_for(self._ai_stop.wait(), timeout=30)
+                    # nothing scheduled; sleep until the next pending delete (or a new one is queued)
+                    await self._pending_deletes.wait(self._ai_stop)
                     continue
 
                 next_due = min(next_candidates)
                 sleep_s = max(0.0, next_due - now)
-                # small cap so we still drain deletes even if far future
-                sleep_s = min(sleep_s, 30.0)
                 if sleep_s > 0:
-                    await asyncio.wait_for(self._ai_stop.wait(), timeout=sleep_s)
+                    # wakes early when a pending delete becomes due or an earlier one is queued
+                    await self._pending_deletes.wait(self._ai_stop, timeout=sleep_s)
                     continue
 
                 # time to run something; prefer whichever is due now
@@ -1116,15 +1112,54 @@ class QzoneAutoLikePlugin(Star):
                 logger.error(traceback.format_exc())
                 await asyncio.sleep(5)
 
+    def _new_like_dedup(self, name: str, acct: Optional[QzAccount] = None):
+        data_dir = (acct or self._primary).data_dir
+        if self.like_dedup_mode == "bloom":
+            return RotatingBloom(
+                data_dir / f"like_bloom_{name}.bin" if self.like_history_persist else None,
+                ttl=self._auto_dedup_ttl(),
+                capacity=int(self.config.get("like_bloom_capacity", 20000) or 20000),
+                fpr=float(self.config.get("like_bloom_fpr", 0.001) or 0.001),
+            )
+        path = data_dir / ("like_history.json" if name == "self" else f"like_history_{name}.json")
+        return LikeHistory(path if self.like_history_persist else None, ttl=self._auto_dedup_ttl(), max_size=self.dedup_cache_max)
+
+    def _like_dedup_for(self, target_qq: str, acct: Optional[QzAccount] = None):
+        # 自己的空间用 auto_seen（data/like_history.json）；其他目标各自一份，手动 /点赞 与后台轮询共用。
+        # 额外账号的记录在 data/accounts/<QQ>/ 下，互不影响。
+        acct = acct or self._primary
+        target = str(target_qq or "").strip()
+        if not target or target == acct.uin:
+            return acct.auto_seen
+        store = acct.like_dedups.get(target)
+        if store is None:
+            store = acct.like_dedups[target] = self._new_like_dedup(target, acct)
+        return store
+
+    def _like_targets(self) -> List[Tuple[str, float]]:
+        targets = parse_like_targets(self.config.get("like_targets", []), self.poll_interval)
+        if not targets:
+            targets = [(self._target_qq.strip() or self.my_qq, float(self.poll_interval))]
+        return targets
+
+    def _auto_dedup_ttl(self) -> int:
+        ttl = int(self.config.get("auto_dedup_ttl_sec", 86400))
+        return ttl if ttl > 0 else 0
+
     async def _like_once(
         self,
-        client: _QzoneClient,
+        client: QzoneLikeClient,
         target_qq: str,
         limit: int,
         *,
         dedup: bool = False,
+        acct: Optional[QzAccount] = None,
     ) -> Tuple[int, int]:
-        target = str(target_qq).strip() or self.my_qq
+        acct = acct or self._primary
+        target = str(target_qq).strip() or acct.uin
+        seen_store = self._like_dedup_for(target, acct)
+        # 自动轮询自己的空间：用旧版 self-feeds 接口，更稳定；其他目标按 hostuin 拉取。
+        legacy = dedup and target == acct.uin
         if limit <= 0:
             limit = 10
         if limit > 100:
@@ -1133,129 +1168,137 @@ class QzoneAutoLikePlugin(Star):
         liked_ok = 0
         attempted = 0
 
-        # 默认命令仍然是一次取 count=10；只有自定义请求大于10时才启用递增模式。
-        ramp_enabled = limit > 10
-        ramp_step = int(self.config.get("like_ramp_step", 10))
-        if ramp_step <= 0:
-            ramp_step = 10
-
+        # 流水线：生产者按页拉取动态（每页 like_ramp_step 条，act_all 用 start 偏移，legacy 用 pagenum），
+        # 只把新 key 放进队列；消费者边拉边点。每条动态只拉一次，不再每轮加大 count 从头重拉。
+        page_size = int(self.config.get("like_ramp_step", 10))
+        if page_size <= 0:
+            page_size = 10
         max_count = max(self.max_feeds, limit)
-        seen: Set[str] = set()
+        if dedup:
+            seen_store.ttl = self._auto_dedup_ttl()
 
         def _normalize_key(k: str) -> str:
             return k if k.endswith(".1") else (k + ".1")
 
-        cur_count = min(ramp_step if ramp_enabled else 10, max_count)
-
-        while attempted < limit:
-            if dedup:
-                # 自动轮询：用旧版 self-feeds 接口，更稳定。
-                status, keys, text_len = await asyncio.to_thread(client.fetch_keys_self_legacy, cur_count)
+        async def _fetch_page(page: int) -> Tuple[int, Set[str], int, Set[str]]:
+            # 解析好的 FeedItem 与 /说说、护评共用（见 qz_feed_cache）；liked=True 的是服务端标记已赞过的
+            if legacy:
+                status, items, text = await qzone_http.call(client.fetch_items_self_legacy, page_size, page + 1)
             else:
-                status, keys, text_len = await asyncio.to_thread(client.fetch_keys, cur_count, target)
-            logger.info(
-                "[Qzone] feeds 返回 | target=%s status=%s text_len=%s keys=%d count=%d",
-                target,
-                status,
-                text_len,
-                len(keys),
-                cur_count,
-            )
-
-            if not keys:
-                # keys=0 且 text_len 很短时，通常是权限/风控/返回结构变化；打印片段方便排查。
-                head = ""
-                head_status = None
-                try:
-                    res = await asyncio.to_thread(
-                        requests.get,
-                        (
-                            "https://user.qzone.qq.com/proxy/domain/ic2.qzone.qq.com/cgi-bin/feeds/"
-                            f"feeds_html_act_all?uin={self.my_qq}&hostuin={target}"
-                            f"&scope=0&filter=all&flag=1&refresh=0&firstGetGroup=0&mixnocache=0&scene=0"
-                            f"&begintime=undefined&icServerTime=&start=0&count={cur_count}"
-                            f"&sidomain=qzonestyle.gtimg.cn&useutf8=1&outputhtmlfeed=1&refer=2"
-                            f"&r={random.random()}&g_tk={client.g_tk}"
-                        ),
-                        headers=client.headers,
-                        timeout=20,
+                status, items, text = await qzone_http.call(client.fetch_items, page_size, target, page * page_size)
+            liked = {_normalize_key(it.like_key) for it in items if it.like_key and it.liked}
+            return status, like_keys(items, text), len(text), liked
+
+        # 队列有界：点赞跟不上时生产者停下来等，不会提前把所有页都拉完。
+        queue: "asyncio.Queue[Optional[str]]" = asyncio.Queue(maxsize=page_size)
+
+        async def _produce() -> None:
+            nonlocal client
+            seen: Set[str] = set()
+            queued = 0
+            fetched = 0
+            page = 0
+            try:
+                while queued < limit and fetched < max_count:
+                    status, keys, text_len, liked = await _fetch_page(page)
+                    logger.info(
+                        "[Qzone] feeds 返回 | target=%s status=%s text_len=%s keys=%d liked=%d page=%d count=%d",
+                        target,
+                        status,
+                        text_len,
+                        len(keys),
+                        len(liked),
+                        page,
+                        page_size,
                     )
-                    head_status = res.status_code
-                    head = (res.text or "")[:300].replace("\n", " ").replace("\r", " ")
-                    logger.info("[Qzone] feeds head | status=%s head=%s", res.status_code, head)
-                except Exception as e:
-                    logger.warning("[Qzone] feeds head 获取失败: %s", e)
 
-                # If feeds looks like cookie expired (e.g. Not log in), refresh and rebuild client once.
-                try:
-                    if (
-                        (head_status is not None and self._looks_like_cookie_expired(int(head_status), head))
-                        or (head and ("Not log in" in head or "\"code\":-4001" in head or "\"subcode\":-4001" in head))
-                    ):
-                        if await self._maybe_refresh_cookie(reason="feeds cookie expired", event=None):
-                            try:
-                                client = _QzoneClient(self.my_qq, self.cookie)
-                                # retry once with refreshed cookie
-                                if dedup:
-                                    status, keys, text_len = await asyncio.to_thread(client.fetch_keys_self_legacy, cur_count)
-                                else:
-                                    status, keys, text_len = await asyncio.to_thread(client.fetch_keys, cur_count, target)
-                                logger.info(
-                                    "[Qzone] feeds retry after refresh | target=%s status=%s text_len=%s keys=%d count=%d",
-                                    target,
-                                    status,
-                                    text_len,
-                                    len(keys),
-                                    cur_count,
-                                )
-                            except Exception as e:
-                                logger.warning("[Qzone] feeds retry skipped (client rebuild failed): %s", e)
-                except Exception:
-                    pass
+                    if not keys and page == 0:
+                        # keys=0 且 text_len 很短时，通常是权限/风控/返回结构变化；打印片段方便排查。
+                        head = ""
+                        head_status = None
+                        try:
+                            # 走 feeds 令牌桶与 feed 缓存（刚拉过的页直接复用，不再多发一次请求）
+                            head_status, head = await qzone_http.call(client.probe_head, page_size, target)
+                            logger.info("[Qzone] feeds head | status=%s head=%s", head_status, head)
+                        except Exception as e:
+                            logger.warning("[Qzone] feeds head 获取失败: %s", e)
 
-            if status != 200:
-                logger.warning("[Qzone] feeds 非200，可能登录失效/风控/重定向（请检查cookie）")
+                        # If feeds looks like cookie expired (e.g. Not log in), refresh and rebuild client once.
+                        try:
+                            if (
+                                (head_status is not None and self._looks_like_cookie_expired(int(head_status), head))
+                                or (head and ("Not log in" in head or "\"code\":-4001" in head or "\"subcode\":-4001" in head))
+                            ):
+                                if await self._maybe_refresh_cookie(reason="feeds cookie expired", event=None, acct=acct):
+                                    try:
+                                        client = self._new_like_client(acct)
+                                        # retry once with refreshed cookie
+                                        status, keys, text_len, liked = await _fetch_page(page)
+                                        logger.info(
+                                            "[Qzone] feeds retry after refresh | target=%s status=%s text_len=%s keys=%d count=%d",
+                                            target,
+                                            status,
+                                            text_len,
+                                            len(keys),
+                                            page_size,
+                                        )
+                                    except Exception as e:
+                                        logger.warning("[Qzone] feeds retry skipped (client rebuild failed): %s", e)
+                        except Exception:
+                            pass
 
-            if not keys:
-                break
+                    if status != 200:
+                        logger.warning("[Qzone] feeds 非200，可能登录失效/风控/重定向（请检查cookie）")
 
-            new_keys = []
-            for k in sorted(keys):
-                fk = _normalize_key(k)
-                if fk in seen:
-                    continue
-                seen.add(fk)
-                new_keys.append(fk)
+                    if not keys:
+                        break
+                    fetched += len(keys)
 
-            if not new_keys:
-                break
+                    fresh = 0
+                    for k in sorted(keys):
+                        fk = _normalize_key(k)
+                        if fk in seen:
+                            continue
+                        seen.add(fk)
+                        if dedup and fk in seen_store:
+                            continue
+                        if fk in liked:
+                            # 已经赞过（可能是在手机上点的）：记下来，不再发请求
+                            seen_store.add(fk, now=time.time())
+                            continue
+                        fresh += 1
+                        if queued < limit:
+                            await queue.put(fk)
+                            queued += 1
 
-            now_ts = time.time()
-            if dedup:
-                ttl = int(self.config.get("auto_dedup_ttl_sec", 86400))
-                if ttl < 0:
-                    ttl = 0
-                if ttl:
-                    # 清理过期
-                    expired = [k for k, ts in self._auto_seen.items() if now_ts - ts > ttl]
-                    for k in expired:
-                        self._auto_seen.pop(k, None)
-
-            for full_key in new_keys:
-                if attempted >= limit:
-                    break
+                    # 短页 = 没有更多动态；整页都点过 = 更早的也点过了（动态按时间倒序），都不必再翻页。
+                    if len(keys) < page_size or fresh == 0:
+                        break
+                    page += 1
+            finally:
+                try:
+                    queue.put_nowait(None)
+                except asyncio.QueueFull:
+                    # 消费者已经够数退出时才会满；它不再读队列，丢掉结束标记即可。
+                    pass
 
-                if dedup and full_key in self._auto_seen:
+        producer = asyncio.create_task(_produce())
+        try:
+            while attempted < limit:
+                full_key = await queue.get()
+                if full_key is None:
+                    break
+                # 入队后可能已被另一路（手动 /点赞 或其他目标轮次）点过
+                if dedup and full_key in seen_store:
                     continue
 
                 attempted += 1
                 logger.info("[Qzone] 发现新动态: %s", full_key[-24:])
 
-                # 进一步抖动：避免固定间隔触发风控
-                jitter = random.random() * 1.5
-                await asyncio.sleep(random.randint(self.delay_min, self.delay_max) + jitter)
-
-                like_status, resp = await asyncio.to_thread(client.send_like, full_key)
+                # send_like 经 qzone_http.call 从账号的 like 令牌桶取额度：有攒下的额度就立即发，
+                # 否则按 like_rate_per_min 排队（带抖动）；多个目标 / 并发 /点赞 共享同一个桶。
+                # 排队期间生产者继续拉下一页。
+                like_status, resp = await qzone_http.call(client.send_like, full_key)
                 resp = resp or ""
                 resp_head = resp[:300].replace("\n", " ").replace("\r", " ")
                 logger.info("[Qzone] like 返回 | status=%s resp_head=%s", like_status, resp_head)
@@ -1267,11 +1310,11 @@ class QzoneAutoLikePlugin(Star):
 
                 # Best-effort cookie refresh when response looks like login/verify page.
                 if self._looks_like_cookie_expired(like_status, resp_head) or self._looks_like_cookie_expired(like_status, resp[-800:]):
-                    if await self._maybe_refresh_cookie(reason="like cookie expired", event=None):
+                    if await self._maybe_refresh_cookie(reason="like cookie expired", event=None, acct=acct):
                         # Rebuild client with refreshed cookie (gtk depends on skey)
                         try:
-                            client = _QzoneClient(self.my_qq, self.cookie)
-                            like_status, resp = await asyncio.to_thread(client.send_like, full_key)
+                            client = self._new_like_client(acct)
+                            like_status, resp = await qzone_http.call(client.send_like, full_key)
                             resp = resp or ""
                             resp_head = resp[:300].replace("\n", " ").replace("\r", " ")
                             logger.info("[Qzone] like retry after refresh | status=%s resp_head=%s", like_status, resp_head)
@@ -1301,22 +1344,35 @@ class QzoneAutoLikePlugin(Star):
                 else:
                     ok = code == 0
 
+                if acct.like_pacer is not None:
+                    outcome = classify_like_result(like_status, code, msg, resp_head)
+                    before = acct.like_pacer.rate
+                    acct.like_pacer.record(outcome, reason=msg or resp_head[:40])
+                    if outcome == "throttled":
+                        logger.warning(
+                            "[Qzone] 点赞疑似被限流（%s），降速 %.2f -> %.2f 次/分钟",
+                            msg or resp_head[:40],
+                            before,
+                            acct.like_pacer.rate,
+                        )
+
                 if ok:
                     liked_ok += 1
                     logger.info("[Qzone] ✅ 点赞成功: %s", full_key[-24:])
-                    if dedup:
-                        self._auto_seen[full_key] = now_ts
+                    # 手动 /点赞 成功的也记下，自动轮询就不会再点同一条
+                    seen_store.add(full_key, now=time.time())
                 else:
                     logger.warning("[Qzone] ❌ 点赞失败: %s", full_key[-24:])
-
-            if not ramp_enabled:
-                break
-
-            if cur_count >= max_count:
-                break
-            cur_count = min(cur_count + ramp_step, max_count)
-            # 每次加大 count 前稍微休息一下，降低风控概率
-            await asyncio.sleep(0.5 + random.random() * 0.7)
+        finally:
+            if not producer.done():
+                producer.cancel()
+            results = await asyncio.gather(producer, return_exceptions=True)
+        err = results[0]
+        if isinstance(err, Exception):
+            # 拉取失败：一条都没点时照旧抛给调用方（记入 target 错误），否则只记日志、保留已点的结果。
+            if attempted == 0:
+                raise err
+            logger.warning("[Qzone] feeds 分页拉取中断: %s", err)
 
         return attempted, liked_ok
 
@@ -1337,8 +1393,11 @@ class QzoneAutoLikePlugin(Star):
             return True
         return False
 
-    async def _maybe_refresh_cookie(self, *, reason: str = "", event: Any = None) -> bool:
+    async def _maybe_refresh_cookie(self, *, reason: str = "", event: Any = None, acct: Optional[QzAccount] = None) -> bool:
         """Best-effort refresh cookie via Napcat get_cookies; updates self.cookie on success."""
+        if acct is not None and not acct.primary:
+            # Napcat 只能取到 bot 自己登录的 cookie；额外账号的 cookie 只能在配置里更新。
+            return False
         if not getattr(self, "cookie_fetcher", None):
             return False
         if not self.cookie_fetcher.enabled:
@@ -1353,24 +1412,28 @@ class QzoneAutoLikePlugin(Star):
         except Exception:
             return False
         return False
-    async def _protect_worker(self) -> None:
-        if not self.protect_enabled:
+    async def _protect_worker(self, acct: Optional[QzAccount] = None, stop: Optional[asyncio.Event] = None) -> None:
+        # acct=None -> 主账号（protect_enabled 控制）；额外账号由 _start_extra_accounts 按各自配置启动。
+        acct = acct or self._primary
+        stop = stop or self._protect_stop
+        if acct.primary and not self.protect_enabled:
             logger.info("[Qzone] protect_enabled=false，护评不启动")
             return
 
         # Cookie may be empty/expired at runtime; try refresh before giving up.
-        if not self.my_qq or not self.cookie:
-            if await self._maybe_refresh_cookie(reason="protect start missing cookie", event=None):
+        if not acct.uin or not acct.cookie:
+            if await self._maybe_refresh_cookie(reason="protect start missing cookie", event=None, acct=acct):
                 pass
-            if not self.my_qq or not self.cookie:
+            if not acct.uin or not acct.cookie:
                 logger.error("[Qzone] 配置缺失：my_qq 或 cookie 为空，护评无法启动")
                 return
 
         # NOTE: do not keep scanner/deleter forever; cookie may refresh later.
-        # They will be re-created inside the loop with the latest self.cookie.
+        # They will be re-created inside the loop with the latest acct.cookie.
 
         logger.info(
-            "[Qzone] protect worker 启动 | window_min=%s notify=%s interval=%ss pages=%s",
+            "[Qzone] protect worker 启动 | account=%s window_min=%s notify=%s interval=%ss pages=%s",
+            acct.label,
             self.protect_window_minutes,
             self.protect_notify_mode,
             self.protect_poll_interval,
@@ -1380,16 +1443,21 @@ class QzoneAutoLikePlugin(Star):
         last_cookie_fp = ""  # fingerprint to detect cookie rotation
 
         # runtime state for diagnostics (even if logs are filtered)
-        self._protect_last_scan = ""
-        self._protect_last_delete = ""
-
-        while not self._protect_stop.is_set():
+        acct.protect_last_scan = ""
+        acct.protect_last_delete = ""
+        # 自适应轮询：有新评论/窗口内有说说时按 protect_poll_interval_sec 快速轮询，空闲时逐步放慢到
+        # protect_poll_idle_sec；所有说说都超出 protect_window_minutes 后进入休眠，不再请求。
+        idle = self.protect_poll_idle_sec if self.protect_adaptive_poll else self.protect_poll_interval
+        poll = AdaptivePollInterval(self.protect_poll_interval, idle)
+
+        while not stop.is_set():
+            dormant = False
             try:
                 # Re-create scanner/deleter each round with latest cookie to avoid stale cookie bugs.
                 # Fingerprint cookie without logging full value.
                 cookie_fp = "" 
                 try:
-                    cookie_fp = str(hash(self.cookie))
+                    cookie_fp = str(hash(acct.cookie))
                 except Exception:
                     cookie_fp = ""
 
@@ -1398,26 +1466,30 @@ class QzoneAutoLikePlugin(Star):
                     logger.info("[Qzone] protect cookie updated (fp changed)")
 
                 try:
-                    scanner = QzoneProtectScanner(self.my_qq, self.cookie)
+                    scanner = self._new_protect_scanner(acct)
                 except Exception as e:
                     # cookie may be structurally invalid (missing p_skey) -> try refresh once
-                    if await self._maybe_refresh_cookie(reason="protect scanner init failed", event=None):
-                        scanner = QzoneProtectScanner(self.my_qq, self.cookie)
+                    if await self._maybe_refresh_cookie(reason="protect scanner init failed", event=None, acct=acct):
+                        scanner = self._new_protect_scanner(acct)
                     else:
                         raise
 
-                status, refs = await asyncio.to_thread(scanner.scan_recent_comments, self.protect_pages, 10)
+                marks = self._protect_marks(acct)
+                module_cache = self._protect_module_cache(acct)
+                # 窗口下推到扫描器：翻到窗口外的说说就停，窗口外的话题不提取评论
+                scan_args = (self.protect_pages, 10, marks, module_cache, self.protect_window_minutes)
+                status, refs = await qzone_http.call(scanner.scan_recent_comments, *scan_args)
 
                 # If protect scan failed in a way that looks like cookie expired, refresh once and retry.
                 if status != 200 and (self._looks_like_cookie_expired(status, getattr(scanner, 'last_diag', '')) or self._looks_like_cookie_expired(status, ' '.join(getattr(scanner, 'last_errors', [])[:2]))):
-                    if await self._maybe_refresh_cookie(reason="protect scan cookie expired", event=None):
-                        scanner = QzoneProtectScanner(self.my_qq, self.cookie)
-                        status, refs = await asyncio.to_thread(scanner.scan_recent_comments, self.protect_pages, 10)
+                    if await self._maybe_refresh_cookie(reason="protect scan cookie expired", event=None, acct=acct):
+                        scanner = self._new_protect_scanner(acct)
+                        status, refs = await qzone_http.call(scanner.scan_recent_comments, *scan_args)
                 diag = getattr(scanner, "last_diag", "")
                 errs = getattr(scanner, "last_errors", [])
-                self._protect_last_scan = f"ts={int(time.time())} status={status} refs={len(refs)}"
+                acct.protect_last_scan = f"ts={int(time.time())} status={status} refs={len(refs)}"
                 if diag:
-                    self._protect_last_scan += " | " + diag
+                    acct.protect_last_scan += " | " + diag
                 if diag:
                     logger.info("%s", diag)
                 if errs and self.protect_notify_mode in ("error", "all"):
@@ -1429,65 +1501,39 @@ class QzoneAutoLikePlugin(Star):
                     if self.protect_notify_mode in ("error", "all"):
                         logger.warning("[Qzone] protect scan failed status=%s", status)
                 else:
-                    refs = scanner.filter_within_window(refs, self.protect_window_minutes)
-
-                    # Always use latest cookie for delete.
-                    deleter = QzoneCommentDeleter(self.my_qq, self.cookie)
-
-                    del_try = 0
-                    del_ok = 0
-                    del_fail = 0
-
                     # Delete only others' comments; never delete own comments.
+                    todo = []
                     for r in refs:
-                        if str(r.comment_uin) == str(self.my_qq):
+                        if str(r.comment_uin) == str(acct.uin):
                             continue
 
                         k = f"{r.topic_id}:{r.comment_id}"
-                        ts = self._protect_seen.get(k)
-                        if ts and (time.time() - ts) < max(60.0, float(self.protect_poll_interval) * 2.0):
+                        if k in acct.protect_seen:
                             continue
-                        # mark first to avoid spamming on repeated failures
-                        self._protect_seen[k] = time.time()
-
-                        del_try += 1
-                        ds, dr = await asyncio.to_thread(deleter.delete_comment, r.topic_id, r.comment_id, r.comment_uin)
-
-                        # If delete failed and looks like cookie expired, refresh once and retry.
-                        if not (ds == 200 and dr.ok):
-                            hint = str(getattr(dr, 'message', '') or '')
-                            if self._looks_like_cookie_expired(ds, hint):
-                                if await self._maybe_refresh_cookie(reason="protect delete cookie expired", event=None):
-                                    deleter = QzoneCommentDeleter(self.my_qq, self.cookie)
-                                    ds, dr = await asyncio.to_thread(deleter.delete_comment, r.topic_id, r.comment_id, r.comment_uin)
-
-                        if ds == 200 and dr.ok:
-                            del_ok += 1
-                            if self.protect_notify_mode == "all":
-                                logger.info(
-                                    "[Qzone] protect delete ok topicId=%s commentId=%s commentUin=%s",
-                                    r.topic_id,
-                                    r.comment_id,
-                                    r.comment_uin,
-                                )
-                        else:
-                            del_fail += 1
-                            if self.protect_notify_mode in ("error", "all"):
-                                logger.warning(
-                                    "[Qzone] protect delete failed status=%s code=%s msg=%s topicId=%s commentId=%s commentUin=%s",
-                                    ds,
-                                    dr.code,
-                                    dr.message,
-                                    r.topic_id,
-                                    r.comment_id,
-                                    r.comment_uin,
-                                )
-
-                    self._protect_last_delete = (
-                        f"ts={int(time.time())} kept={len(refs)} try={del_try} ok={del_ok} fail={del_fail}"
+                        # mark first: a failed delete is retried only by the executor (with backoff), never resubmitted here
+                        acct.protect_seen.add(k)
+                        todo.append(r)
+
+                    # 并发删除（受 delete_comment 令牌桶限速），失败的进重试队列，后续轮次按退避重试
+                    executor = self._protect_delete_executor(acct)
+                    del_try, del_ok, del_fail = await executor.run(todo)
+
+                    acct.protect_last_delete = (
+                        f"ts={int(time.time())} kept={len(refs)} try={del_try} ok={del_ok} fail={del_fail} "
+                        f"pending_retry={executor.pending}"
                     )
 
-                await asyncio.wait_for(self._protect_stop.wait(), timeout=self.protect_poll_interval)
+                    acct.protect_newest_post = max(acct.protect_newest_post, int(getattr(scanner, "last_newest_abstime", 0) or 0))
+                    in_window = self._protect_in_window(acct.protect_newest_post)
+                    poll.record(del_try > 0 and in_window)
+                    dormant = self.protect_adaptive_poll and not in_window and not executor.pending
+
+                if dormant:
+                    await self._protect_dormant(acct, stop)
+                    poll.reset()
+                    continue
+                acct.protect_poll_state = f"poll {int(poll.interval)}s"
+                await asyncio.wait_for(stop.wait(), timeout=poll.interval)
             except asyncio.TimeoutError:
                 pass
             except Exception as e:
@@ -1518,42 +1564,61 @@ class QzoneAutoLikePlugin(Star):
                 return
 
         try:
-            client = _QzoneClient(self.my_qq, self.cookie)
+            client = self._new_like_client()
         except Exception as e:
             logger.error(f"[Qzone] 初始化客户端失败: {e}")
             return
 
-        logger.info("[Qzone] worker 启动 | g_tk=%s", client.g_tk)
+        targets = self._like_targets()
+        logger.info(
+            "[Qzone] worker 启动 | g_tk=%s targets=%s concurrency=%s rate_per_min=%s",
+            client.g_tk,
+            ",".join(f"{uin}:{int(iv)}s" for uin, iv in targets),
+            self.like_max_concurrency,
+            self.like_rate_per_min,
+        )
 
-        while not self._stop_event.is_set():
-            try:
-                logger.info("[%s] 正在侦测...（liked_cache=%d）", _now_hms(), len(self._liked))
+        async def _round(t: LikeTarget) -> Tuple[int, int]:
+            logger.info("[%s] 正在侦测... target=%s（seen=%d）", _now_hms(), t.uin, len(t.dedup))
+            # 每轮新建 client：cookie 刷新后立即生效（client 只是 cookie/g_tk/headers，开销很小）
+            attempted, ok = await self._like_once(self._new_like_client(), t.uin, self.max_feeds, dedup=True)
 
-                target = self._target_qq.strip() or self.my_qq
-                limit = self._manual_like_limit if self._manual_like_limit > 0 else self.max_feeds
+            if attempted == 0:
+                logger.info("[Qzone] 本轮没有新动态待处理 target=%s", t.uin)
+            return attempted, ok
 
-                attempted, ok = await self._like_once(client, target, limit, dedup=True)
+        engine = self._primary.like_engine = LikeEngine(_round, max_concurrency=self.like_max_concurrency)
+        engine.set_targets(targets, self._like_dedup_for)
+        try:
+            await engine.run(self._stop_event)
+        except Exception as e:
+            logger.error(f"[Qzone] worker 异常: {e}")
+            logger.error(traceback.format_exc())
 
-                if attempted == 0:
-                    logger.info("[Qzone] 本轮没有新动态待处理")
+        logger.info("[Qzone] worker 已停止")
 
-                if self._manual_like_limit > 0:
-                    logger.info(
-                        "[Qzone] 手动点赞限制=%d，本轮尝试=%d 成功=%d",
-                        self._manual_like_limit,
-                        attempted,
-                        ok,
-                    )
-                    self._manual_like_limit = 0
+    async def _account_like_worker(self, acct: QzAccount, stop: asyncio.Event) -> None:
+        """Like loop of an extra account: same engine as _worker, its own targets/budget/pool."""
 
-                await asyncio.sleep(self.poll_interval)
+        targets = parse_like_targets(acct.spec.like_targets if acct.spec else [], self.poll_interval)
+        if not targets:
+            targets = [(acct.uin, float(self.poll_interval))]
+        logger.info(
+            "[Qzone] 账号 %s like worker 启动 | targets=%s",
+            acct.label,
+            ",".join(f"{uin}:{int(iv)}s" for uin, iv in targets),
+        )
 
-            except Exception as e:
-                logger.error(f"[Qzone] worker 异常: {e}")
-                logger.error(traceback.format_exc())
-                await asyncio.sleep(self.poll_interval)
+        async def _round(t: LikeTarget) -> Tuple[int, int]:
+            attempted, ok = await self._like_once(self._new_like_client(acct), t.uin, self.max_feeds, dedup=True, acct=acct)
+            if attempted:
+                logger.info("[Qzone] 账号 %s target=%s 本轮尝试=%d 成功=%d", acct.label, t.uin, attempted, ok)
+            return attempted, ok
 
-        logger.info("[Qzone] worker 已停止")
+        engine = acct.like_engine = LikeEngine(_round, max_concurrency=self.like_max_concurrency)
+        engine.set_targets(targets, lambda uin: self._like_dedup_for(uin, acct))
+        await engine.run(stop)
+        logger.info("[Qzone] 账号 %s like worker 已停止", acct.label)
 
     @filter.command("start")
     async def start(self, event: AstrMessageEvent):
@@ -1575,6 +1640,7 @@ class QzoneAutoLikePlugin(Star):
 
         self._stop_event.clear()
         self._task = asyncio.create_task(self._worker())
+        self._start_extra_accounts()
 
         # If protect is enabled, start protect worker after cookie becomes available.
         try:
@@ -1588,11 +1654,13 @@ class QzoneAutoLikePlugin(Star):
     async def stop(self, event: AstrMessageEvent):
         if not self._is_running():
             self._set_enabled(False)
+            await self._accounts.stop_extras("like")
             yield event.plain_result("当前没有运行中的任务（已关闭 enabled 开关）")
             return
 
         self._set_enabled(False)
         self._stop_event.set()
+        await self._accounts.stop_extras("like")
         try:
             await asyncio.wait_for(self._task, timeout=10)
         except Exception:
@@ -1619,9 +1687,13 @@ class QzoneAutoLikePlugin(Star):
         lines = [
             f"护评 enabled={self.protect_enabled} running={protect_running} task={task_state}",
             f"interval={self.protect_poll_interval}s pages={self.protect_pages} window_min={self.protect_window_minutes} notify={self.protect_notify_mode}",
-            f"seen_cache={len(self._protect_seen)}",
-            f"last_scan={getattr(self, '_protect_last_scan', '')}",
-            f"last_delete={getattr(self, '_protect_last_delete', '')}",
+            f"seen_cache={self._protect_seen.stats_line()}",
+            f"incremental={self._primary.protect_marks.stats_line() if self._primary.protect_marks else 'off'}",
+            f"module_cache={self._primary.protect_module_cache.stats_line() if self._primary.protect_module_cache else 'off'}",
+            f"deleter={self._primary.protect_deleter.status_line() if self._primary.protect_deleter else '-'}",
+            f"poll={self._primary.protect_poll_state or '-'} newest_post={self._primary.protect_newest_post}",
+            f"last_scan={self._primary.protect_last_scan}",
+            f"last_delete={self._primary.protect_last_delete}",
         ]
         yield event.plain_result("\n".join([s for s in lines if s and not s.endswith('=')]))
 
@@ -1689,8 +1761,8 @@ class QzoneAutoLikePlugin(Star):
                     if not t:
                         # Nothing to delete in memory (e.g. bot restarted).
                         return
-                    poster = QzonePoster(self.my_qq, self.cookie)
-                    status, result = await asyncio.to_thread(poster.delete_by_tid, t)
+                    poster = self._new_poster()
+                    status, result = await qzone_http.call(poster.delete_by_tid, t)
                     logger.info(
                         "[Qzone] intercept delete_latest 返回 | status=%s ok=%s code=%s msg=%s head=%s",
                         status,
@@ -1956,7 +2028,7 @@ class QzoneAutoLikePlugin(Star):
             return
 
         try:
-            scanner = QzoneProtectScanner(self.my_qq, self.cookie)
+            scanner = self._new_protect_scanner()
         except Exception as e:
             yield event.plain_result(f"护评初始化失败：{e}")
             return
@@ -1964,7 +2036,7 @@ class QzoneAutoLikePlugin(Star):
         pages = self.protect_pages
         count = 10
         try:
-            status, refs = await asyncio.to_thread(scanner.scan_recent_comments, pages, count)
+            status, refs = await qzone_http.call(scanner.scan_recent_comments, pages, count)
             diag = getattr(scanner, "last_diag", "")
             errs = getattr(scanner, "last_errors", [])
             lines = [f"scan status={status} refs={len(refs)}"]
@@ -1983,7 +2055,7 @@ class QzoneAutoLikePlugin(Star):
             # This helps verify URL/params/cookie correctness.
             if self.my_qq and self.cookie:
                 try:
-                    status2, html2 = await asyncio.to_thread(scanner.fetch_feeds_module_html, self.my_qq, 5)
+                    status2, html2 = await qzone_http.call(scanner.fetch_feeds_module_html, self.my_qq, 5)
                     has_feed_data = "name=\"feed_data\"" in (html2 or "")
                     has_comments = "comments-item" in (html2 or "")
                     lines.append(f"module_fetch status={status2} has_feed_data={has_feed_data} has_comments={has_comments}")
@@ -2029,10 +2101,78 @@ class QzoneAutoLikePlugin(Star):
         target = self._target_qq.strip() or self.my_qq
         protect_running = self._protect_task is not None and (not self._protect_task.done())
         yield event.plain_result(
-            f"运行中={self._is_running()} | enabled={self.enabled} | auto_start={self.auto_start} | target={target} | liked_cache={len(self._liked)}\n"
-            f"护评 enabled={self.protect_enabled} running={protect_running} interval={self.protect_poll_interval}s pages={self.protect_pages} window_min={self.protect_window_minutes} notify={self.protect_notify_mode}"
+            f"运行中={self._is_running()} | enabled={self.enabled} | auto_start={self.auto_start} | target={target}\n"
+            f"护评 enabled={self.protect_enabled} running={protect_running} interval={self.protect_poll_interval}s pages={self.protect_pages} window_min={self.protect_window_minutes} notify={self.protect_notify_mode}\n"
+            f"去重缓存 auto_seen: {self._auto_seen.stats_line()} | protect_seen: {self._protect_seen.stats_line()}"
+            + f"\n限速 {self._primary.limiter.status_line()}"
+            + f"\nfeed缓存 {self._primary.feed_cache.stats_line() if self._primary.feed_cache else 'off'}"
+            + (f"\n点赞节奏 {self._primary.like_pacer.status_line()}" if self._primary.like_pacer else "")
+            + self._like_engine_status()
+            + self._accounts_status()
         )
 
+    def _accounts_status(self) -> str:
+        extras = self._accounts.extras()
+        if not extras:
+            return ""
+        return "\n".join([f"\n额外账号（{len(extras)}）："] + [f"- {a.status_line()}" for a in extras])
+
+    def _like_engine_status(self) -> str:
+        engine = self._primary.like_engine
+        if engine is None or not self._is_running():
+            return ""
+        lines = [f"\n点赞目标 concurrency={engine.max_concurrency} rate_per_min={self.like_rate_per_min:g}"]
+        lines += [f"- {ln}" for ln in engine.status_lines()]
+        return "\n".join(lines)
+
+    @filter.command("点赞目标")
+    async def like_targets_ctl(self, event: AstrMessageEvent):
+        """管理后台轮询的点赞目标。
+
+        用法：/点赞目标            列出
+              /点赞目标 add QQ [秒]  添加（秒=该目标的轮询间隔，默认 poll_interval_sec）
+              /点赞目标 del QQ       删除
+        """
+        text = (event.message_str or "").strip()
+        for prefix in ("/点赞目标", "点赞目标"):
+            if text.startswith(prefix):
+                text = text[len(prefix) :].strip()
+                break
+        parts = text.split()
+        targets = parse_like_targets(self.config.get("like_targets", []), self.poll_interval)
+
+        if parts and parts[0].lower() in ("add", "添加", "加", "del", "rm", "删除", "删"):
+            m = re.match(r"^\d{5,12}$", parts[1]) if len(parts) > 1 else None
+            if not m:
+                yield event.plain_result("用法：/点赞目标 add QQ [秒] | /点赞目标 del QQ")
+                return
+            uin = parts[1]
+            targets = [t for t in targets if t[0] != uin]
+            if parts[0].lower() in ("add", "添加", "加"):
+                interval = self.poll_interval
+                if len(parts) > 2:
+                    try:
+                        interval = max(1, int(float(parts[2])))
+                    except Exception:
+                        pass
+                targets.append((uin, float(interval)))
+            self.config["like_targets"] = [f"{u}:{int(iv)}" for u, iv in targets]
+            try:
+                if hasattr(self.config, "save_config"):
+                    self.config.save_config()
+            except Exception as e:
+                logger.warning(f"[Qzone] 保存 like_targets 配置失败: {e}")
+            if self._primary.like_engine is not None and self._is_running():
+                self._primary.like_engine.set_targets(self._like_targets(), self._like_dedup_for)
+
+        if not targets:
+            yield event.plain_result(
+                f"未配置 like_targets，后台轮询目标={self._target_qq.strip() or self.my_qq}（{self.poll_interval}s）"
+            )
+            return
+        lines = [f"点赞目标（{len(targets)}）："] + [f"- {u} 每 {int(iv)}s" for u, iv in targets]
+        yield event.plain_result("\n".join(lines) + self._like_engine_status())
+
     @filter.command("post")
     async def post(self, event: AstrMessageEvent):
         """发一条纯文字说说。
@@ -2065,8 +2205,8 @@ class QzoneAutoLikePlugin(Star):
                 return
 
         try:
-            poster = QzonePoster(self.my_qq, self.cookie)
-            status, result = await asyncio.to_thread(poster.publish_text, text)
+            poster = self._new_poster()
+            status, result = await qzone_http.call(poster.publish_text, text)
             logger.info(
                 "[Qzone] post 返回 | status=%s ok=%s code=%s msg=%s head=%s",
                 status,
@@ -2121,7 +2261,7 @@ class QzoneAutoLikePlugin(Star):
             yield event.plain_result(f"准备删除最近 {len(tids)} 条（可能触发风控，失败会提示 code/msg）")
             deleted = 0
             for t in tids:
-                status, result = await asyncio.to_thread(QzonePoster(self.my_qq, self.cookie).delete_by_tid, t)
+                status, result = await qzone_http.call(self._new_poster().delete_by_tid, t)
                 if status == 200 and result.ok:
                     deleted += 1
                 await asyncio.sleep(0.5 + random.random() * 0.7)
@@ -2150,8 +2290,8 @@ class QzoneAutoLikePlugin(Star):
                 return
 
         try:
-            poster = QzonePoster(self.my_qq, self.cookie)
-            status, result = await asyncio.to_thread(poster.delete_by_tid, tid)
+            poster = self._new_poster()
+            status, result = await qzone_http.call(poster.delete_by_tid, tid)
             logger.info(
                 "[Qzone] delete 返回 | status=%s ok=%s code=%s msg=%s head=%s",
                 status,
@@ -2254,10 +2394,10 @@ class QzoneAutoLikePlugin(Star):
 
         try:
             host_uin = target_uin or self.my_qq
-            fetcher = QzoneFeedFetcher(host_uin, self.cookie, my_qq=self.my_qq)
+            fetcher = self._new_feed_fetcher(host_uin)
             page_size = 10
             pages = (n + page_size - 1) // page_size
-            status, posts = await asyncio.to_thread(fetcher.fetch_mood_posts, page_size, pages)
+            status, posts = await qzone_http.call(fetcher.fetch_mood_posts, page_size, pages)
             if status != 200 or not posts:
                 diag = getattr(fetcher, "last_diag", "")
                 extra = f" | {diag}" if diag else ""
@@ -2357,11 +2497,11 @@ class QzoneAutoLikePlugin(Star):
                 if m_cq:
                     host_uin = m_cq.group(1)
 
-            fetcher = QzoneFeedFetcher(host_uin, self.cookie, my_qq=self.my_qq)
+            fetcher = self._new_feed_fetcher(host_uin)
             # page size 10, pages enough to cover n
             page_size = 10
             pages = (n + page_size - 1) // page_size
-            status, posts = await asyncio.to_thread(fetcher.fetch_mood_posts, page_size, pages)
+            status, posts = await qzone_http.call(fetcher.fetch_mood_posts, page_size, pages)
             if status != 200 or not posts:
                 diag = getattr(fetcher, "last_diag", "")
                 sample = getattr(fetcher, "last_sample_html_head", "")
@@ -2502,8 +2642,8 @@ class QzoneAutoLikePlugin(Star):
                 yield event.plain_result("找不到最近一条说说的 tid（请先用 /post 或 qz_post 发布）")
                 return
 
-            commenter = QzoneCommenter(self.my_qq, self.cookie)
-            status, result = await asyncio.to_thread(commenter.add_comment, tid, manual)
+            commenter = self._new_commenter()
+            status, result = await qzone_http.call(commenter.add_comment, tid, manual)
             logger.info(
                 "[Qzone] comment_manual 返回 | status=%s ok=%s code=%s msg=%s head=%s",
                 status,
@@ -2558,9 +2698,9 @@ class QzoneAutoLikePlugin(Star):
 
         # Always fetch target space's mood list first (same data source as /说说, do not fall back to self cache when @别人)
         try:
-            fetcher = QzoneFeedFetcher(host_uin, self.cookie, my_qq=self.my_qq)
+            fetcher = self._new_feed_fetcher(host_uin)
             # Align with /说说 and /说说表 pagination parameters to avoid triggering different response shapes.
-            status, posts_obj = await asyncio.to_thread(fetcher.fetch_mood_posts, 10, 2)
+            status, posts_obj = await qzone_http.call(fetcher.fetch_mood_posts, 10, 2)
             if status != 200 or not posts_obj:
                 diag = getattr(fetcher, "last_diag", "")
                 extra = f" | {diag}" if diag else ""
@@ -2628,7 +2768,7 @@ class QzoneAutoLikePlugin(Star):
         if delay_min > delay_max:
             delay_min, delay_max = delay_max, delay_min
 
-        commenter = QzoneCommenter(self.my_qq, self.cookie)
+        commenter = self._new_commenter()
         ok_cnt = 0
         attempted = 0
         for item in posts:
@@ -2688,7 +2828,7 @@ class QzoneAutoLikePlugin(Star):
 
             attempted += 1
             topic_id = str(item.get("topic_id") or "").strip()
-            status, result = await asyncio.to_thread(commenter.add_comment, tid, cmt, topic_id)
+            status, result = await qzone_http.call(commenter.add_comment, tid, cmt, topic_id)
             logger.info(
                 "[Qzone] comment 返回 | status=%s ok=%s code=%s msg=%s comment_id=%s topic_id=%s head=%s",
                 status,
@@ -2786,9 +2926,10 @@ class QzoneAutoLikePlugin(Star):
 
         用法：
         - /删评 1  （删除“最近一次成功评论”的那条）
+        - /删评 <topicId>  （列出该说说的评论：commentId / QQ / 昵称 / 内容）
         - /删评 <topicId> <commentId>
 
-        说明：topicId/commentId 可从浏览器请求 emotion_cgi_delcomment_ugc 的 Form Data 中获取。
+        说明：topicId 可从 /评论记录 或浏览器请求 emotion_cgi_delcomment_ugc 的 Form Data 中获取。
         """
         text = (event.message_str or "").strip()
         for prefix in ("/删评", "删评"):
@@ -2806,6 +2947,11 @@ class QzoneAutoLikePlugin(Star):
         if alias_text in ("删除刚刚的评论", "删除刚刚评论", "删刚刚的评论", "删刚刚评论"):
             parts = ["1"]
 
+        if len(parts) == 1 and not parts[0].isdigit():
+            async for r in self._list_topic_comments(event, parts[0]):
+                yield r
+            return
+
         if len(parts) == 1 and parts[0].isdigit():
             if not self._recent_comment_refs:
                 yield event.plain_result("找不到评论记录（重启后会清空）。请用 /删评 <topicId> <commentId> 或先再评论一次。")
@@ -2830,8 +2976,8 @@ class QzoneAutoLikePlugin(Star):
             return
 
         try:
-            deleter = QzoneCommentDeleter(self.my_qq, self.cookie)
-            status, result = await asyncio.to_thread(deleter.delete_comment, topic_id, comment_id, self.my_qq)
+            deleter = self._new_comment_deleter()
+            status, result = await qzone_http.call(deleter.delete_comment, topic_id, comment_id, self.my_qq)
             logger.info(
                 "[Qzone] del_comment 返回 | status=%s ok=%s code=%s msg=%s head=%s",
                 status,
@@ -2862,6 +3008,32 @@ class QzoneAutoLikePlugin(Star):
             logger.error(traceback.format_exc())
             yield event.plain_result(f"❌ 异常：{e}")
 
+    async def _list_topic_comments(self, event: AstrMessageEvent, topic_id: str, limit: int = 30):
+        """/删评 <topicId>：按话题分页拉完整评论列表，给出可直接用于删评的 commentId。"""
+        if not self.my_qq or not self.cookie:
+            yield event.plain_result("配置缺失：my_qq 或 cookie 为空")
+            return
+        try:
+            lister = self._new_comment_lister()
+            status, items = await qzone_http.call(lister.list_topic_comments, topic_id)
+        except Exception as e:
+            logger.error(f"[Qzone] 评论列表异常: {e}")
+            yield event.plain_result(f"❌ 异常：{e}")
+            return
+        if status != 200:
+            yield event.plain_result(f"❌ 获取评论列表失败：status={status}")
+            return
+        if not items:
+            yield event.plain_result("该说说没有评论")
+            return
+        lines = [f"共 {len(items)} 条评论（/删评 {topic_id} <commentId> 删除）："]
+        for c in items[:limit]:
+            content = c.content.replace("\n", " ")[:40]
+            lines.append(f"{c.comment_id} | {c.comment_uin} {c.nick}: {content}")
+        if len(items) > limit:
+            lines.append(f"……其余 {len(items) - limit} 条未显示")
+        yield event.plain_result("\n".join(lines))
+
     @filter.command("评论发")
     async def comment_send(self, event: AstrMessageEvent):
         """手动发表评论（仅自己的空间，默认评论最近一条）。
@@ -2893,8 +3065,8 @@ class QzoneAutoLikePlugin(Star):
             yield event.plain_result("配置缺失：my_qq 或 cookie 为空")
             return
 
-        commenter = QzoneCommenter(self.my_qq, self.cookie)
-        status, result = await asyncio.to_thread(commenter.add_comment, tid, content)
+        commenter = self._new_commenter()
+        status, result = await qzone_http.call(commenter.add_comment, tid, content)
         logger.info(
             "[Qzone] comment_send 返回 | status=%s ok=%s code=%s msg=%s head=%s",
             status,
@@ -2961,7 +3133,7 @@ class QzoneAutoLikePlugin(Star):
                 yield event.plain_result(f"待批量删评（未执行）：count={max_n}")
                 return
 
-            deleter = QzoneCommentDeleter(self.my_qq, self.cookie)
+            deleter = self._new_comment_deleter()
             ok_cnt = 0
             fail_cnt = 0
             for _ in range(max_n):
@@ -2971,7 +3143,7 @@ class QzoneAutoLikePlugin(Star):
                 if not rt or not rcid:
                     self._recent_comment_refs.pop()
                     continue
-                status, result = await asyncio.to_thread(deleter.delete_comment, rt, rcid, comment_uin)
+                status, result = await qzone_http.call(deleter.delete_comment, rt, rcid, comment_uin)
                 if status == 200 and result.ok:
                     ok_cnt += 1
                     self._recent_comment_refs.pop()
@@ -3016,8 +3188,8 @@ class QzoneAutoLikePlugin(Star):
             return
 
         try:
-            deleter = QzoneCommentDeleter(self.my_qq, self.cookie)
-            status, result = await asyncio.to_thread(deleter.delete_comment, t, cid, comment_uin)
+            deleter = self._new_comment_deleter()
+            status, result = await qzone_http.call(deleter.delete_comment, t, cid, comment_uin)
             logger.info(
                 "[Qzone] llm_tool del_comment 返回 | status=%s ok=%s code=%s msg=%s head=%s",
                 status,
@@ -3081,7 +3253,7 @@ class QzoneAutoLikePlugin(Star):
 
             deleted = 0
             for t2 in tids:
-                status, result = await asyncio.to_thread(QzonePoster(self.my_qq, self.cookie).delete_by_tid, t2)
+                status, result = await qzone_http.call(self._new_poster().delete_by_tid, t2)
                 if status == 200 and result.ok:
                     deleted += 1
                 await asyncio.sleep(0.5 + random.random() * 0.7)
@@ -3121,8 +3293,8 @@ class QzoneAutoLikePlugin(Star):
                 return
 
         try:
-            poster = QzonePoster(self.my_qq, self.cookie)
-            status, result = await asyncio.to_thread(poster.delete_by_tid, t)
+            poster = self._new_poster()
+            status, result = await qzone_http.call(poster.delete_by_tid, t)
             logger.info(
                 "[Qzone] llm_tool delete 返回 | status=%s ok=%s code=%s msg=%s head=%s",
                 status,
@@ -3190,8 +3362,8 @@ class QzoneAutoLikePlugin(Star):
                 return
 
         try:
-            poster = QzonePoster(self.my_qq, self.cookie)
-            status, result = await asyncio.to_thread(poster.publish_text, content)
+            poster = self._new_poster()
+            status, result = await qzone_http.call(poster.publish_text, content)
             logger.info(
                 "[Qzone] llm_tool post 返回 | status=%s ok=%s code=%s msg=%s head=%s",
                 status,
@@ -3311,8 +3483,8 @@ class QzoneAutoLikePlugin(Star):
             return
 
         try:
-            poster = QzonePoster(self.my_qq, self.cookie)
-            status, result = await asyncio.to_thread(poster.publish_text, content)
+            poster = self._new_poster()
+            status, result = await qzone_http.call(poster.publish_text, content)
             logger.info(
                 "[Qzone] genpost->post 返回 | status=%s ok=%s code=%s msg=%s head=%s",
                 status,
@@ -3391,6 +3563,9 @@ class QzoneAutoLikePlugin(Star):
             count_int = 100
 
         self._target_qq = target_qq
+        if self._primary.like_engine is not None and self._is_running() and not self.config.get("like_targets"):
+            # 未配置 like_targets 时，/点赞 仍会切换后台轮询目标（与之前行为一致）
+            self._primary.like_engine.set_targets(self._like_targets(), self._like_dedup_for)
 
         # 立即执行一次点赞（不依赖后台 worker 是否已启动）
         if not self.my_qq or not self.cookie:
@@ -3402,7 +3577,7 @@ class QzoneAutoLikePlugin(Star):
         )
 
         try:
-            client = _QzoneClient(self.my_qq, self.cookie)
+            client = self._new_like_client()
         except Exception as e:
             yield event.plain_result(f"初始化客户端失败：{e}")
             return
@@ -3457,6 +3632,9 @@ class QzoneAutoLikePlugin(Star):
         # Bot 启动完成后，根据配置决定是否自动启动
         await self._maybe_autostart()
         await self._maybe_start_ai_task()
+        # 额外账号不依赖主账号 cookie，各自独立启动
+        if self.auto_start:
+            self._start_extra_accounts()
 
         # Start periodic cookie refresh (default ON)
         try:
@@ -3513,5 +3691,20 @@ class QzoneAutoLikePlugin(Star):
             except Exception:
                 pass
 
-        self._save_records()
+        await self._accounts.close_extras()
+
+        for store in (
+            getattr(self, "_pending_deletes", None),
+            getattr(self, "_tid_journal", None),
+            getattr(self, "_post_journal", None),
+            getattr(self, "_auto_seen", None),
+            *getattr(self, "_like_dedups", {}).values(),
+        ):
+            if store is not None:
+                store.close()
+        qzone_http.close()
+        try:
+            await qzone_http.aclose()
+        except Exception:
+            pass
         logger.info("[Qzone] 插件卸载完成")
@@ -0,0 +1,292 @@
+import asyncio
+import json
+import re
+import time
+from collections import ChainMap
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from astrbot.api import logger
+
+from . import qzone_http
+from .qz_cache import TTLCache
+from .qz_feed_cache import FeedCache
+from .qz_journal import atomic_write_json
+from .qz_like_engine import LikeEngine
+from .qz_ratelimit import AimdPacer, RateLimiter
+from .qzone_comment import _get_gtk, _pick_skey_for_gtk
+from .qzone_protect import ProtectWatermark
+
+
+@dataclass
+class AccountSpec:
+    """One extra account from the `accounts` config."""
+
+    uin: str
+    cookie: str
+    name: str = ""
+    like_targets: List[str] = field(default_factory=list)
+    like: bool = True
+    protect: Optional[bool] = None  # None = follow protect_enabled
+    post: bool = False  # fixed-text timed posting (QzScheduler)
+    enabled: bool = True
+
+
+def _as_bool(v: Any, default: bool) -> bool:
+    if v is None or v == "":
+        return default
+    if isinstance(v, str):
+        return v.strip().lower() in ("1", "true", "yes", "on", "开")
+    return bool(v)
+
+
+def parse_accounts(raw: Any) -> List[AccountSpec]:
+    """`accounts` config -> [AccountSpec].
+
+    Each item is either a dict / JSON object string
+    ({"qq": "...", "cookie": "...", "like_targets": [...], "protect": true, "post": false, "enabled": true})
+    or the shorthand "QQ|cookie". Invalid items and duplicate QQs are skipped with a warning.
+    """
+
+    items = raw if isinstance(raw, (list, tuple)) else []
+    out: List[AccountSpec] = []
+    seen = set()
+    for it in items:
+        d: Dict[str, Any] = {}
+        if isinstance(it, dict):
+            d = it
+        elif isinstance(it, str) and it.strip().startswith("{"):
+            try:
+                d = json.loads(it)
+            except Exception as e:
+                logger.warning(f"[Qzone] accounts 项不是合法 JSON，已跳过: {e}")
+                continue
+        elif isinstance(it, str) and "|" in it:
+            uin, _, cookie = it.partition("|")
+            d = {"qq": uin, "cookie": cookie}
+        uin = str(d.get("qq") or d.get("uin") or "").strip()
+        cookie = str(d.get("cookie") or "").strip()
+        if not re.match(r"^\d{5,12}$", uin) or not cookie:
+            logger.warning("[Qzone] accounts 项缺少 qq/cookie，已跳过")
+            continue
+        if uin in seen:
+            continue
+        seen.add(uin)
+        targets = d.get("like_targets") or []
+        if isinstance(targets, str):
+            targets = [targets]
+        protect = d.get("protect")
+        out.append(
+            AccountSpec(
+                uin=uin,
+                cookie=cookie,
+                name=str(d.get("name") or ""),
+                like_targets=[str(t) for t in targets],
+                like=_as_bool(d.get("like"), True),
+                protect=None if protect is None else _as_bool(protect, False),
+                post=_as_bool(d.get("post"), False),
+                enabled=_as_bool(d.get("enabled"), True),
+            )
+        )
+    return out
+
+
+class AccountConfig(ChainMap):
+    """Per-account view of the plugin config: reads fall back to the plugin config,
+    writes (e.g. ai_post_last_run_ts) stay with the account and persist to `path`."""
+
+    def __init__(self, path: Path, base: Any):
+        own: Dict[str, Any] = {}
+        try:
+            if path.exists():
+                data = json.loads(path.read_text(encoding="utf-8"))
+                if isinstance(data, dict):
+                    own = data
+        except Exception as e:
+            logger.warning(f"[Qzone] 加载账号状态失败 {path}: {e}")
+        super().__init__(own, base)
+        self.path = path
+
+    def save_config(self) -> None:
+        atomic_write_json(self.path, dict(self.maps[0]))
+
+
+class QzAccount:
+    """Everything that belongs to one logged-in QQ: cookie/g_tk, connection pool, rate
+    limiter, dedup stores and the background tasks running for it.
+
+    Tasks started through supervise() form the account's failure domain: an exception
+    is logged and counted, the task restarts after an exponential backoff, and nothing
+    leaks into the other accounts sharing the event loop.
+    """
+
+    def __init__(
+        self,
+        uin: str,
+        cookie: str,
+        *,
+        data_dir: Path,
+        name: str = "",
+        primary: bool = False,
+        pool: Optional[qzone_http.HttpPool] = None,
+        limiter: Optional[RateLimiter] = None,
+        protect_seen: Optional[TTLCache] = None,
+        spec: Optional[AccountSpec] = None,
+    ):
+        self.uin = str(uin or "").strip()
+        self.cookie = str(cookie or "").strip()
+        self.name = name
+        self.primary = primary
+        self.data_dir = Path(data_dir)
+        self.pool = pool  # None = process-wide pool
+        self.spec = spec
+        # 每账号、每接口的令牌桶，该账号的所有客户端共用（见 qz_ratelimit）
+        self.limiter = limiter if limiter is not None else RateLimiter()
+        self.like_pacer: Optional[AimdPacer] = None  # 自适应点赞速率（调 limiter 里 like 桶的速率）
+        self.like_engine: Optional[LikeEngine] = None
+        self.auto_seen: Any = None
+        self.like_dedups: Dict[str, Any] = {}
+        self.feed_cache: Optional[FeedCache] = None  # feeds_html_act_all 短缓存 + 合并并发请求
+        self.protect_seen = protect_seen if protect_seen is not None else TTLCache()
+        self.protect_marks: Optional[ProtectWatermark] = None  # 增量护评扫描状态
+        self.protect_module_cache: Optional[TTLCache] = None  # feeds_html_module 解析结果缓存
+        self.protect_deleter: Any = None  # qz_protect_delete.DeleteExecutor（并发删评 + 重试队列）
+        self.protect_poll_state = ""
+        self.protect_newest_post = 0  # 见过的最新说说时间（abstime）
+        self.protect_last_scan = ""
+        self.protect_last_delete = ""
+        self.scheduler: Any = None
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._stops: Dict[str, asyncio.Event] = {}
+        self.errors = 0
+        self.restarts = 0
+        self.last_error = ""
+
+    @property
+    def label(self) -> str:
+        return f"{self.uin}({self.name})" if self.name else self.uin
+
+    @property
+    def g_tk(self) -> Optional[int]:
+        skey = _pick_skey_for_gtk(self.cookie)
+        return _get_gtk(skey) if skey else None
+
+    # ---- supervised tasks ----
+    def supervise(self, name: str, factory: Callable[[asyncio.Event], Awaitable[None]], backoff_max: float = 300.0) -> None:
+        """Run `factory(stop)` as task `name` until stop(name); restart it (5s, 10s, ... backoff_max) if it raises."""
+
+        t = self._tasks.get(name)
+        if t is not None and not t.done():
+            return
+        stop = self._stops[name] = asyncio.Event()
+        self._tasks[name] = asyncio.create_task(self._supervised(name, factory, stop, backoff_max))
+
+    async def _supervised(
+        self, name: str, factory: Callable[[asyncio.Event], Awaitable[None]], stop: asyncio.Event, backoff_max: float
+    ) -> None:
+        backoff = 5.0
+        while not stop.is_set():
+            started = time.time()
+            try:
+                await factory(stop)
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                self.last_error = f"{name}: {str(e)[:200]}"
+                logger.error(f"[Qzone] 账号 {self.label} {name} 异常（{int(backoff)}s 后重启）: {e}")
+            # A task that ran for a while before failing starts over at the short backoff.
+            if time.time() - started > backoff_max:
+                backoff = 5.0
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=backoff)
+                return
+            except asyncio.TimeoutError:
+                pass
+            self.restarts += 1
+            backoff = min(backoff * 2, backoff_max)
+
+    def task_names(self) -> List[str]:
+        names = [n for n, t in self._tasks.items() if not t.done()]
+        if self.scheduler is not None and self.scheduler.running():
+            names.append("post")
+        return names
+
+    async def stop(self, name: Optional[str] = None, timeout: float = 10.0) -> None:
+        """Stop one supervised task, or everything (including the scheduler) when name is None."""
+
+        names = [name] if name else list(self._tasks)
+        if name is None and self.scheduler is not None:
+            try:
+                await self.scheduler.stop()
+            except Exception:
+                pass
+        tasks = []
+        for n in names:
+            ev = self._stops.pop(n, None)
+            if ev is not None:
+                ev.set()
+            t = self._tasks.pop(n, None)
+            if t is not None and not t.done():
+                tasks.append(t)
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=timeout)
+            for t in pending:
+                t.cancel()
+
+    async def close(self) -> None:
+        await self.stop()
+        for store in (self.auto_seen, *self.like_dedups.values()):
+            if store is not None:
+                try:
+                    store.close()
+                except Exception as e:
+                    logger.warning(f"[Qzone] 账号 {self.label} 关闭去重存储失败: {e}")
+        if self.scheduler is not None:
+            self.scheduler.close()
+        if self.pool is not None:
+            await self.pool.aclose()
+
+    def status_line(self) -> str:
+        line = (
+            f"{self.label} g_tk={'ok' if self.g_tk else 'missing'} tasks={','.join(self.task_names()) or '-'} "
+            f"errors={self.errors} restarts={self.restarts}"
+        )
+        if self.like_pacer is not None:
+            line += f" like_rate={self.like_pacer.rate:.2f}/min throttled={self.like_pacer.throttled}"
+        if self.like_engine is not None:
+            liked = sum(t.liked for t in self.like_engine.targets.values())
+            line += f" targets={len(self.like_engine.targets)} liked={liked}"
+        if self.protect_last_delete:
+            line += f" protect[{self.protect_last_delete}]"
+        if self.last_error:
+            line += f" last_error={self.last_error[:60]}"
+        return line
+
+
+class AccountRegistry:
+    """uin -> QzAccount. The primary account (my_qq/cookie) is always present; extra
+    accounts come from the `accounts` config and only run background workers."""
+
+    def __init__(self, primary: QzAccount):
+        self.primary = primary
+        self._extras: Dict[str, QzAccount] = {}
+
+    def add(self, acct: QzAccount) -> None:
+        if acct.uin == self.primary.uin:
+            logger.warning(f"[Qzone] accounts 中的 {acct.uin} 与 my_qq 相同，已忽略")
+            return
+        self._extras[acct.uin] = acct
+
+    def extras(self) -> List[QzAccount]:
+        return list(self._extras.values())
+
+    async def stop_extras(self, name: Optional[str] = None) -> None:
+        """Stop task `name` (e.g. "like" for /stop) of every extra account, or all their tasks."""
+
+        await asyncio.gather(*(a.stop(name) for a in self._extras.values()), return_exceptions=True)
+
+    async def close_extras(self) -> None:
+        await asyncio.gather(*(a.close() for a in self._extras.values()), return_exceptions=True)
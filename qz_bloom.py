@@ -0,0 +1,214 @@
+import hashlib
+import math
+import os
+import struct
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from astrbot.api import logger
+
+from .qz_like_history import like_history_key
+
+_MAGIC = b"QZBF"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHIIdd")  # magic, version, generations, capacity, k, fpr, rotate_sec
+_GEN_HEADER = struct.Struct("<dII")  # created_ts, count, m (bits)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter (bytearray bits, double hashing over blake2b)."""
+
+    def __init__(self, capacity: int, fpr: float, created_ts: float = 0.0):
+        capacity = max(1, int(capacity))
+        fpr = min(max(float(fpr), 1e-9), 0.5)
+        self.m = max(64, int(math.ceil(-capacity * math.log(fpr) / (math.log(2) ** 2))))
+        self.k = max(1, int(round(self.m / capacity * math.log(2))))
+        self.bits = bytearray((self.m + 7) // 8)
+        self.count = 0
+        self.created_ts = created_ts or time.time()
+
+    def _indexes(self, key: str):
+        d = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(d[:8], "little")
+        h2 = int.from_bytes(d[8:], "little") | 1
+        m = self.m
+        for i in range(self.k):
+            yield (h1 + i * h2) % m
+
+    def add(self, key: str) -> None:
+        bits = self.bits
+        new = False
+        for ix in self._indexes(key):
+            b = 1 << (ix & 7)
+            if not bits[ix >> 3] & b:
+                bits[ix >> 3] |= b
+                new = True
+        if new:
+            self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        bits = self.bits
+        return all(bits[ix >> 3] & (1 << (ix & 7)) for ix in self._indexes(key))
+
+
+class RotatingBloom:
+    """Probabilistic like dedup: constant memory regardless of history length.
+
+    - `generations` Bloom filters; adds go to the newest, lookups check all of them
+    - a new generation starts when the newest one is full (`capacity` keys) or older than
+      ttl / generations; the oldest is dropped, so keys age out after roughly `ttl`
+    - per-generation fpr is fpr / generations, so the overall false-positive rate stays ≈ fpr
+      (a false positive means one post is skipped, never a double like)
+    - persisted as a small binary file (header + raw bit arrays), written atomically at most
+      every `flush_sec` and on close()
+
+    Drop-in for LikeHistory in _like_once (`in`, add/set, ttl, stats_line, close).
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path],
+        ttl: float = 0.0,
+        capacity: int = 20000,
+        fpr: float = 0.001,
+        generations: int = 3,
+        flush_sec: float = 5.0,
+    ):
+        self.path = Path(path) if path is not None else None
+        self.capacity = max(1, int(capacity))
+        self.fpr = min(max(float(fpr), 1e-9), 0.5)
+        self.generations = max(1, int(generations))
+        self.flush_sec = float(flush_sec)
+        self._ttl = float(ttl or 0)
+        self._gens: List[BloomFilter] = []
+        self._dirty = False
+        self._last_flush = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.rotations = 0
+        self._load()
+        if not self._gens:
+            self._gens.append(self._new_gen())
+
+    def _new_gen(self, created_ts: float = 0.0) -> BloomFilter:
+        return BloomFilter(self.capacity, self.fpr / self.generations, created_ts)
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, value: float) -> None:
+        self._ttl = float(value or 0)
+
+    def _rotate_if_needed(self, now: float) -> None:
+        cur = self._gens[-1]
+        age_limit = self._ttl / self.generations if self._ttl > 0 else 0.0
+        if cur.count < self.capacity and not (age_limit and now - cur.created_ts >= age_limit):
+            return
+        self._gens.append(self._new_gen(now))
+        del self._gens[: -self.generations]
+        self.rotations += 1
+        self._dirty = True
+        # Whole generations older than ttl can't hold live keys any more.
+        if self._ttl > 0:
+            while len(self._gens) > 1 and now - self._gens[1].created_ts >= self._ttl:
+                del self._gens[0]
+
+    def __contains__(self, full_key: str) -> bool:
+        self._rotate_if_needed(time.time())
+        k = like_history_key(full_key)
+        for g in reversed(self._gens):
+            if k in g:
+                self.hits += 1
+                return True
+        self.misses += 1
+        return False
+
+    def add(self, full_key: str, now: Optional[float] = None) -> None:
+        k = like_history_key(full_key)
+        if not k:
+            return
+        now = time.time() if now is None else now
+        self._rotate_if_needed(now)
+        self._gens[-1].add(k)
+        self._dirty = True
+        if time.time() - self._last_flush >= self.flush_sec:
+            self.flush()
+
+    set = add
+
+    def __len__(self) -> int:
+        return sum(g.count for g in self._gens)
+
+    # ---- persistence ----
+    def _load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            raw = self.path.read_bytes()
+            magic, ver, gens, capacity, _k, fpr, _rot = _HEADER.unpack_from(raw, 0)
+            if magic != _MAGIC or ver != _VERSION:
+                raise ValueError("bad header")
+            if capacity != self.capacity or abs(fpr - self.fpr) > 1e-12:
+                # Sizing changed in config: old bits don't fit; start fresh.
+                logger.info("[Qzone] like bloom 配置变化（capacity/fpr），重建过滤器")
+                return
+            off = _HEADER.size
+            out: List[BloomFilter] = []
+            for _ in range(gens):
+                created_ts, count, m = _GEN_HEADER.unpack_from(raw, off)
+                off += _GEN_HEADER.size
+                g = self._new_gen(created_ts)
+                nbytes = (m + 7) // 8
+                if m != g.m or off + nbytes > len(raw):
+                    raise ValueError("bad generation")
+                g.bits = bytearray(raw[off : off + nbytes])
+                g.count = count
+                off += nbytes
+                out.append(g)
+            self._gens = out[-self.generations :]
+        except Exception as e:
+            logger.warning(f"[Qzone] 加载 like bloom 失败（将重建）: {e}")
+            self._gens = []
+
+    def flush(self) -> None:
+        self._last_flush = time.time()
+        if self.path is None or not self._dirty:
+            return
+        try:
+            parts = [_HEADER.pack(_MAGIC, _VERSION, len(self._gens), self.capacity, self._gens[-1].k, self.fpr, self._ttl)]
+            for g in self._gens:
+                parts.append(_GEN_HEADER.pack(g.created_ts, g.count, g.m))
+                parts.append(bytes(g.bits))
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            with tmp.open("wb") as f:
+                f.write(b"".join(parts))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+            self._dirty = False
+        except Exception as e:
+            logger.warning(f"[Qzone] 保存 like bloom 失败: {e}")
+
+    def close(self) -> None:
+        self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "keys": len(self),
+            "generations": len(self._gens),
+            "bytes": sum(len(g.bits) for g in self._gens),
+            "hits": self.hits,
+            "misses": self.misses,
+            "rotations": self.rotations,
+        }
+
+    def stats_line(self) -> str:
+        s = self.stats()
+        return (
+            f"bloom keys≈{s['keys']} gens={s['generations']} {s['bytes'] // 1024}KB fpr={self.fpr} "
+            f"hit={s['hits']} miss={s['misses']} rotations={s['rotations']}"
+        )
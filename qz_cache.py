@@ -0,0 +1,98 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterator, Optional, Tuple
+
+
+class TTLCache:
+    """Bounded dedup cache with per-entry TTL.
+
+    - entries are kept in write order (OrderedDict), so expiry only ever pops from the front:
+      O(1) amortized per operation instead of scanning the whole dict
+    - max_size (0 = unbounded) evicts the least recently written entries
+    - ttl <= 0 disables expiry; ttl may be changed at runtime (applies to existing entries)
+    - hits / misses / expired / evicted counters for status output
+    """
+
+    def __init__(self, ttl: float = 0.0, max_size: int = 0):
+        self.ttl = float(ttl or 0)
+        self.max_size = max(0, int(max_size or 0))
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evicted = 0
+
+    def _expire(self, now: float) -> None:
+        if self.ttl <= 0:
+            return
+        data = self._data
+        cutoff = now - self.ttl
+        while data:
+            k, (ts, _) = next(iter(data.items()))
+            if ts > cutoff:
+                break
+            data.popitem(last=False)
+            self.expired += 1
+
+    def set(self, key: Hashable, value: Any = True, now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        data = self._data
+        data.pop(key, None)
+        data[key] = (now, value)
+        self._expire(now)
+        if self.max_size:
+            while len(data) > self.max_size:
+                data.popitem(last=False)
+                self.evicted += 1
+
+    add = set
+
+    def get(self, key: Hashable, default: Any = None, now: Optional[float] = None) -> Any:
+        self._expire(time.time() if now is None else now)
+        it = self._data.get(key)
+        if it is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return it[1]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def items(self) -> Iterator[Tuple[Hashable, float, Any]]:
+        """(key, write_ts, value) of live entries, oldest write first."""
+
+        self._expire(time.time())
+        for k, (ts, v) in self._data.items():
+            yield k, ts, v
+
+    def discard(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def __len__(self) -> int:
+        self._expire(time.time())
+        return len(self._data)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "size": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 3) if total else 0.0,
+            "expired": self.expired,
+            "evicted": self.evicted,
+        }
+
+    def stats_line(self) -> str:
+        s = self.stats()
+        return (
+            f"size={s['size']} hit={s['hits']} miss={s['misses']} ratio={s['hit_ratio']} "
+            f"expired={s['expired']} evicted={s['evicted']}"
+        )
+
+
+_MISSING = object()
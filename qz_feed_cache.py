@@ -0,0 +1,143 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+@dataclass
+class FeedPage:
+    """One cached feeds response plus whatever callers parsed out of it."""
+
+    status: int
+    text: str
+    ts: float = field(default_factory=time.time)  # when the load started: a post made during the load is newer
+    parsed: Dict[Hashable, Any] = field(default_factory=dict)
+
+    def memo(self, name: Hashable, parse: Callable[[], Any]) -> Any:
+        """Parse once per page: the first caller runs `parse`, later callers reuse its result."""
+
+        if name not in self.parsed:
+            self.parsed[name] = parse()
+        return self.parsed[name]
+
+
+class FeedCache:
+    """Short-TTL cache of feed pages for one account, keyed by (endpoint, host_uin, start, count).
+
+    Concurrent callers asking for the same key share one request (single-flight). The in-flight
+    map holds one concurrent.futures.Future per key, so async clients (awaiting on the loop) and
+    sync clients (blocking in to_thread workers) join the same load whichever path started it.
+    Only 200 responses are kept; a failed response is handed to the callers that were waiting
+    for it but not cached. `stale_before()` (e.g. the time of the account's last publish/delete)
+    drops pages fetched before it, so a new or deleted post never hides behind the TTL.
+    `refresh=True` always loads (a caller that needs the newest state, e.g. protect) and
+    publishes the page for the others.
+    """
+
+    def __init__(self, ttl: float = 15.0, max_entries: int = 64, stale_before: Optional[Callable[[], float]] = None):
+        self.ttl = max(0.0, float(ttl))
+        self.max_entries = max(1, int(max_entries))
+        self.stale_before = stale_before
+        self._pages: Dict[Hashable, FeedPage] = {}
+        self._inflight: Dict[Hashable, "concurrent.futures.Future[FeedPage]"] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def _fresh(self, key: Hashable) -> Optional[FeedPage]:
+        page = self._pages.get(key)
+        if page is None:
+            return None
+        if time.time() - page.ts > self.ttl or (self.stale_before is not None and page.ts < self.stale_before()):
+            self._pages.pop(key, None)
+            return None
+        return page
+
+    def _store(self, key: Hashable, page: FeedPage) -> None:
+        # called with self._lock held
+        if page.status != 200 or not page.text:
+            return
+        self._pages.pop(key, None)
+        self._pages[key] = page
+        while len(self._pages) > self.max_entries:
+            self._pages.pop(next(iter(self._pages)), None)
+
+    def peek(self, key: Hashable) -> Optional[FeedPage]:
+        with self._lock:
+            return self._fresh(key)
+
+    def _claim(self, key: Hashable, refresh: bool) -> Tuple[Optional[FeedPage], Optional["concurrent.futures.Future[FeedPage]"], bool]:
+        """(cached page, in-flight future, caller_loads). A refresh still joins a load already in flight."""
+
+        with self._lock:
+            if not refresh:
+                page = self._fresh(key)
+                if page is not None:
+                    self.hits += 1
+                    return page, None, False
+            fut = self._inflight.get(key)
+            if fut is not None:
+                self.coalesced += 1
+                return None, fut, False
+            fut = self._inflight[key] = concurrent.futures.Future()
+            self.misses += 1
+            return None, fut, True
+
+    def _settle(self, key: Hashable, fut: "concurrent.futures.Future[FeedPage]", page: Optional[FeedPage], exc: Optional[BaseException] = None) -> None:
+        with self._lock:
+            if page is not None:
+                self._store(key, page)
+            self._inflight.pop(key, None)
+        if exc is not None:
+            if isinstance(exc, asyncio.CancelledError):
+                # don't cancel the waiters along with the caller that happened to load
+                exc = RuntimeError("feed page load cancelled")
+            fut.set_exception(exc)
+        else:
+            fut.set_result(page)
+
+    async def get(self, key: Hashable, load: Callable[[], Awaitable[Tuple[int, str]]], refresh: bool = False) -> FeedPage:
+        page, fut, loads = self._claim(key, refresh)
+        if page is not None:
+            return page
+        if not loads:
+            return await asyncio.shield(asyncio.wrap_future(fut))
+        started = time.time()
+        try:
+            status, text = await load()
+        except BaseException as e:
+            self._settle(key, fut, None, e)
+            raise
+        page = FeedPage(status, text or "", started)
+        self._settle(key, fut, page)
+        return page
+
+    def get_sync(self, key: Hashable, load: Callable[[], Tuple[int, str]], refresh: bool = False) -> FeedPage:
+        page, fut, loads = self._claim(key, refresh)
+        if page is not None:
+            return page
+        if not loads:
+            return fut.result()
+        started = time.time()
+        try:
+            status, text = load()
+        except BaseException as e:
+            self._settle(key, fut, None, e)
+            raise
+        page = FeedPage(status, text or "", started)
+        self._settle(key, fut, page)
+        return page
+
+    def stats_line(self) -> str:
+        total = self.hits + self.coalesced + self.misses
+        ratio = (self.hits + self.coalesced) / total if total else 0.0
+        with self._lock:
+            ages = [time.time() - p.ts for p in self._pages.values()]
+        age = f" age={int(min(ages))}-{int(max(ages))}s" if ages else ""
+        return (
+            f"ttl={int(self.ttl)}s entries={len(ages)} hits={self.hits} coalesced={self.coalesced} "
+            f"misses={self.misses} hit_ratio={ratio:.0%}{age}"
+        )
@@ -0,0 +1,105 @@
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from astrbot.api import logger
+
+
+def atomic_write_json(path: Path, data: Any) -> None:
+    """Write JSON via temp file + fsync + os.replace, so a crash never leaves a truncated file."""
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        f.write(json.dumps(data, ensure_ascii=True, indent=2))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class JournalFile:
+    """JSON snapshot + append-only journal (one JSON record per line) for small on-disk stores.
+
+    - mutations cost one appended line instead of rewriting the whole file
+    - the snapshot keeps its original format, so existing data files still load
+    - compaction (atomic snapshot rewrite + journal removal) runs when the journal outgrows
+      the live data, and on close(); replayed records must therefore be idempotent
+    - a torn last line (crash mid-append) is skipped on load, and the next append starts on a
+      new line instead of being glued onto it
+    """
+
+    def __init__(self, path: Path, min_compact: int = 256):
+        self.path = Path(path)
+        self.journal_path = self.path.with_suffix(".journal")
+        self.min_compact = max(1, int(min_compact))
+        self.lines = 0
+        self._torn = False  # journal ends without "\n": next append must start a new line
+        self._snapshot: Optional[Callable[[], Any]] = None
+
+    def load(self, name: str) -> Tuple[Any, List[Dict[str, Any]]]:
+        """(snapshot data or None, journal records). `name` is only used in log messages."""
+
+        data: Any = None
+        try:
+            if self.path.exists():
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception as e:
+            logger.warning(f"[Qzone] 加载 {name} 失败: {e}")
+
+        records: List[Dict[str, Any]] = []
+        try:
+            if self.journal_path.exists():
+                text = self.journal_path.read_text(encoding="utf-8")
+                self._torn = bool(text) and not text.endswith("\n")
+                for line in text.splitlines():
+                    try:
+                        rec = json.loads(line)
+                    except Exception:
+                        continue
+                    if isinstance(rec, dict):
+                        records.append(rec)
+        except Exception as e:
+            logger.warning(f"[Qzone] 回放 {name} journal 失败: {e}")
+        self.lines = len(records)
+        return data, records
+
+    def bind(self, snapshot: Callable[[], Any]) -> None:
+        """Set the callable that returns the current full data for compaction."""
+
+        self._snapshot = snapshot
+
+    def append(self, records: List[Dict[str, Any]], live: int = 0) -> None:
+        """Append mutation records; compact when the journal exceeds max(min_compact, 2 * live)."""
+
+        if not records:
+            return
+        try:
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.journal_path.open("a", encoding="utf-8") as f:
+                f.write(("\n" if self._torn else "") + "".join(json.dumps(r, ensure_ascii=True) + "\n" for r in records))
+            self._torn = False
+            self.lines += len(records)
+        except Exception as e:
+            self._torn = True  # may have stopped mid-line; an extra empty line is skipped on load
+            logger.warning(f"[Qzone] 写入 {self.journal_path.name} 失败: {e}")
+            return
+        if self.lines > max(self.min_compact, 2 * live):
+            self.compact()
+
+    def compact(self) -> None:
+        if self._snapshot is None:
+            return
+        try:
+            atomic_write_json(self.path, self._snapshot())
+            if self.journal_path.exists():
+                self.journal_path.unlink()
+            self.lines = 0
+            self._torn = False
+        except Exception as e:
+            logger.warning(f"[Qzone] 保存 {self.path.name} 失败: {e}")
+
+    def close(self) -> None:
+        if self.lines:
+            self.compact()
@@ -0,0 +1,150 @@
+import asyncio
+import random
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from astrbot.api import logger
+
+
+@dataclass
+class LikeTarget:
+    """One watched space: its poll interval, dedup store and counters."""
+
+    uin: str
+    interval_sec: float
+    dedup: Any = None
+    next_due: float = 0.0
+    running: bool = False
+    rounds: int = 0
+    attempted: int = 0
+    liked: int = 0
+    errors: int = 0
+    last_run_ts: float = 0.0
+    last_error: str = ""
+
+
+def parse_like_targets(raw: Any, default_interval: float) -> List[Tuple[str, float]]:
+    """`like_targets` config -> [(uin, interval_sec)]. Items: "QQ" or "QQ:秒" (list or comma/space separated)."""
+
+    if isinstance(raw, str):
+        items: Iterable[Any] = re.split(r"[,，\s]+", raw)
+    elif isinstance(raw, (list, tuple)):
+        items = raw
+    else:
+        items = []
+    out: List[Tuple[str, float]] = []
+    seen = set()
+    for it in items:
+        m = re.match(r"^\s*(\d{5,12})\s*(?:[:：]\s*(\d+(?:\.\d+)?))?\s*$", str(it or ""))
+        if not m or m.group(1) in seen:
+            continue
+        seen.add(m.group(1))
+        interval = float(m.group(2)) if m.group(2) else float(default_interval)
+        out.append((m.group(1), max(1.0, interval)))
+    return out
+
+
+class LikeEngine:
+    """Polls many target spaces from one task.
+
+    - each target has its own poll interval (next_due = end of last round + interval, ±jitter)
+    - at most `max_concurrency` target rounds run at once; the rest wait for a free slot
+    - `run_round(target)` does one fetch+like round and returns (attempted, liked)
+    - set_targets() can be called while running; state of targets that stay is kept
+    """
+
+    def __init__(
+        self,
+        run_round: Callable[[LikeTarget], Awaitable[Tuple[int, int]]],
+        *,
+        max_concurrency: int = 3,
+        jitter: float = 0.1,
+    ):
+        self.run_round = run_round
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.jitter = max(0.0, float(jitter))
+        self.targets: Dict[str, LikeTarget] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._changed = asyncio.Event()
+
+    def set_targets(self, specs: List[Tuple[str, float]], make_dedup: Optional[Callable[[str], Any]] = None) -> None:
+        old = self.targets
+        new: Dict[str, LikeTarget] = {}
+        for uin, interval in specs:
+            t = old.get(uin)
+            if t is None:
+                t = LikeTarget(uin=uin, interval_sec=interval, dedup=make_dedup(uin) if make_dedup else None)
+            else:
+                t.interval_sec = interval
+            new[uin] = t
+        self.targets = new
+        self._changed.set()
+
+    def _schedule_next(self, t: LikeTarget) -> None:
+        j = t.interval_sec * self.jitter
+        t.next_due = time.time() + t.interval_sec + (random.uniform(-j, j) if j else 0.0)
+
+    async def _run_target(self, t: LikeTarget) -> None:
+        try:
+            attempted, ok = await self.run_round(t)
+            t.attempted += attempted
+            t.liked += ok
+            t.last_error = ""
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            t.errors += 1
+            t.last_error = str(e)[:200]
+            logger.error(f"[Qzone] like target={t.uin} 异常: {e}")
+        finally:
+            t.rounds += 1
+            t.running = False
+            t.last_run_ts = time.time()
+            self._schedule_next(t)
+            self._tasks.pop(t.uin, None)
+            self._changed.set()
+
+    async def run(self, stop: asyncio.Event) -> None:
+        try:
+            while not stop.is_set():
+                self._changed.clear()
+                now = time.time()
+                due = sorted((t for t in self.targets.values() if not t.running and t.next_due <= now), key=lambda x: x.next_due)
+                for t in due:
+                    if len(self._tasks) >= self.max_concurrency:
+                        break
+                    t.running = True
+                    self._tasks[t.uin] = asyncio.create_task(self._run_target(t))
+
+                timeout: Optional[float] = None
+                if len(self._tasks) < self.max_concurrency:
+                    idle = [t.next_due for t in self.targets.values() if not t.running]
+                    if idle:
+                        timeout = max(0.0, min(idle) - time.time())
+                waiters = [asyncio.ensure_future(stop.wait()), asyncio.ensure_future(self._changed.wait())]
+                try:
+                    await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    for w in waiters:
+                        w.cancel()
+        finally:
+            for task in list(self._tasks.values()):
+                task.cancel()
+            if self._tasks:
+                await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    def status_lines(self) -> List[str]:
+        now = time.time()
+        lines = []
+        for t in self.targets.values():
+            state = "running" if t.running else f"next={max(0, int(t.next_due - now))}s"
+            line = (
+                f"{t.uin} every={int(t.interval_sec)}s {state} rounds={t.rounds} "
+                f"attempted={t.attempted} liked={t.liked} errors={t.errors}"
+            )
+            if t.last_error:
+                line += f" last_error={t.last_error[:60]}"
+            lines.append(line)
+        return lines
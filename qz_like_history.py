@@ -0,0 +1,96 @@
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .qz_cache import TTLCache
+from .qz_journal import JournalFile
+
+_MOOD_KEY_RE = re.compile(r"(\d+)[\\/]+mood[\\/]+([0-9a-f]+)")
+
+
+def like_history_key(full_key: str) -> str:
+    """Compact, scheme/suffix-independent key for a mood link: `<host_uin>/<fid>`."""
+
+    m = _MOOD_KEY_RE.search(full_key or "")
+    if m:
+        return f"{m.group(1)}/{m.group(2)}"
+    return (full_key or "").strip()
+
+
+class LikeHistory:
+    """Liked mood keys with TTL, kept on disk so a restart doesn't re-like everything.
+
+    Same interface as the in-memory TTLCache it wraps (`in`, add/set, ttl, stats_line), plus
+    persistence: snapshot `{key: liked_ts}` + JournalFile appends, expired keys dropped on
+    compaction. path=None keeps it memory-only.
+    """
+
+    def __init__(self, path: Optional[Path], ttl: float = 0.0, max_size: int = 0):
+        self.cache = TTLCache(ttl=ttl, max_size=max_size)
+        self._journal: Optional[JournalFile] = None
+        if path is not None:
+            self._journal = JournalFile(Path(path), min_compact=1024)
+            self._journal.bind(self._snapshot)
+            self._load()
+
+    @property
+    def ttl(self) -> float:
+        return self.cache.ttl
+
+    @ttl.setter
+    def ttl(self, value: float) -> None:
+        self.cache.ttl = float(value or 0)
+
+    def _snapshot(self) -> Dict[str, float]:
+        return {str(k): round(ts, 1) for k, ts, _ in self.cache.items()}
+
+    def _load(self) -> None:
+        if self._journal is None:
+            return
+        data, records = self._journal.load("like_history")
+        rows = []
+        if isinstance(data, dict):
+            for k, ts in data.items():
+                try:
+                    rows.append((float(ts), str(k)))
+                except Exception:
+                    continue
+        rows.sort()
+        for rec in records:
+            try:
+                rows.append((float(rec.get("ts") or 0), str(rec.get("k") or "")))
+            except Exception:
+                continue
+        for ts, k in rows:
+            if k:
+                self.cache.set(k, now=ts)
+        if records:
+            self._journal.compact()
+
+    def __contains__(self, full_key: str) -> bool:
+        return like_history_key(full_key) in self.cache
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
+    def add(self, full_key: str, now: Optional[float] = None) -> None:
+        k = like_history_key(full_key)
+        if not k:
+            return
+        now = time.time() if now is None else now
+        self.cache.set(k, now=now)
+        if self._journal is not None:
+            self._journal.append([{"k": k, "ts": round(now, 1)}], len(self.cache))
+
+    set = add
+
+    def stats(self) -> Dict[str, Any]:
+        return self.cache.stats()
+
+    def stats_line(self) -> str:
+        return self.cache.stats_line() + (" persisted" if self._journal is not None else "")
+
+    def close(self) -> None:
+        if self._journal is not None:
+            self._journal.close()
@@ -0,0 +1,169 @@
+import asyncio
+import heapq
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from astrbot.api import logger
+
+from . import qzone_http
+from .qz_journal import JournalFile
+
+
+class PendingDeleteQueue:
+    """Persisted queue of timed post deletions (tid -> due_ts).
+
+    - min-heap on due_ts + tid index: queue/pop are O(log n), no re-sort or linear tid scan
+    - changes are appended to a JournalFile (`<name>.journal`); the JSON snapshot keeps the old
+      format and is only rewritten on compaction
+    - wait() sleeps until the earliest due time and returns early when queue() adds an earlier one
+
+    One instance is shared by the plugin and QzScheduler (same pending_deletes.json).
+    """
+
+    BACKOFF_SEC = 60.0
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._journal = JournalFile(self.path)
+        self._journal.bind(lambda: sorted(self._items.values(), key=lambda x: x["due_ts"]))
+        self._heap: List[Tuple[float, int, str]] = []
+        self._items: Dict[str, Dict[str, Any]] = {}
+        self._seq = 0
+        self._lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    # ---- heap/index ----
+    def _put(self, tid: str, due_ts: float, created_ts: float) -> None:
+        self._items[tid] = {"tid": tid, "due_ts": due_ts, "created_ts": created_ts}
+        self._seq += 1
+        heapq.heappush(self._heap, (due_ts, self._seq, tid))
+
+    def _prune(self) -> None:
+        # Heap entries are invalidated lazily (tid removed or moved to an earlier due_ts).
+        heap = self._heap
+        while heap:
+            due_ts, _, tid = heap[0]
+            it = self._items.get(tid)
+            if it is not None and it["due_ts"] == due_ts:
+                return
+            heapq.heappop(heap)
+
+    def next_due(self) -> Optional[float]:
+        self._prune()
+        return self._heap[0][0] if self._heap else None
+
+    # ---- persistence ----
+    def _load(self) -> None:
+        data, records = self._journal.load("pending_deletes")
+        if isinstance(data, list):
+            for it in data:
+                if not isinstance(it, dict):
+                    continue
+                try:
+                    tid = str(it.get("tid") or "").strip()
+                    due_ts = float(it.get("due_ts") or 0)
+                    created_ts = float(it.get("created_ts") or 0)
+                except Exception:
+                    continue
+                if not tid or due_ts <= 0:
+                    continue
+                self._put(tid, due_ts, created_ts or time.time())
+        for rec in records:
+            tid = str(rec.get("tid") or "")
+            if not tid:
+                continue
+            if rec.get("op") == "del":
+                self._items.pop(tid, None)
+            else:
+                self._put(tid, float(rec.get("due_ts") or 0), float(rec.get("created_ts") or 0) or time.time())
+        if records:
+            self._journal.compact()
+
+    def close(self) -> None:
+        self._journal.close()
+
+    # ---- queue API ----
+    async def queue(self, tid: str, due_ts: float, created_ts: Optional[float] = None) -> None:
+        """Schedule `tid` for deletion at `due_ts`; an already queued tid keeps the earlier due time."""
+
+        t = str(tid or "").strip()
+        if not t or due_ts <= 0:
+            return
+        async with self._lock:
+            old = self._items.get(t)
+            if old is not None and old["due_ts"] <= due_ts:
+                return
+            earliest = self.next_due()
+            created = old["created_ts"] if old is not None else (created_ts or time.time())
+            self._put(t, due_ts, created)
+            self._journal.append([{"op": "put", "tid": t, "due_ts": due_ts, "created_ts": created}], len(self._items))
+            if earliest is None or due_ts < earliest:
+                self._wakeup.set()
+
+    async def pop_due(self, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Remove and return every item due at `now` (earliest first)."""
+
+        now = time.time() if now is None else now
+        out: List[Dict[str, Any]] = []
+        async with self._lock:
+            while True:
+                due = self.next_due()
+                if due is None or due > now:
+                    break
+                _, _, tid = heapq.heappop(self._heap)
+                out.append(self._items.pop(tid))
+            self._journal.append([{"op": "del", "tid": it["tid"]} for it in out], len(self._items))
+        return out
+
+    async def wait(self, stop: asyncio.Event, timeout: Optional[float] = None) -> None:
+        """Sleep until the earliest due item, `timeout`, `stop`, or an earlier queue() — whichever comes first."""
+
+        self._wakeup.clear()
+        due = self.next_due()
+        if due is not None:
+            until_due = max(0.0, due - time.time())
+            timeout = until_due if timeout is None else min(timeout, until_due)
+        if stop.is_set() or (timeout is not None and timeout <= 0):
+            return
+        waiters = [asyncio.ensure_future(stop.wait()), asyncio.ensure_future(self._wakeup.wait())]
+        try:
+            await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for w in waiters:
+                w.cancel()
+
+    async def drain(self, poster: Any, on_deleted: Optional[Callable[[str], Awaitable[None]]] = None) -> int:
+        """Delete every due tid with `poster`; failures are re-queued after BACKOFF_SEC. Returns successes."""
+
+        ok_count = 0
+        for it in await self.pop_due():
+            tid = it["tid"]
+            try:
+                ds, dr = await qzone_http.call(poster.delete_by_tid, tid)
+                ok = bool(ds == 200 and getattr(dr, "ok", False))
+                logger.info(
+                    "[Qzone] pending delete 执行 | status=%s ok=%s code=%s msg=%s tid=%s",
+                    ds,
+                    getattr(dr, "ok", False),
+                    getattr(dr, "code", ""),
+                    getattr(dr, "message", ""),
+                    tid,
+                )
+                if ok:
+                    ok_count += 1
+                    if on_deleted is not None:
+                        try:
+                            await on_deleted(tid)
+                        except Exception:
+                            pass
+                    continue
+            except Exception as e:
+                logger.warning(f"[Qzone] pending delete 异常 tid={tid}: {e}")
+            # requeue failed delete with small backoff (avoid tight loop)
+            await self.queue(tid, time.time() + self.BACKOFF_SEC, it.get("created_ts"))
+        return ok_count
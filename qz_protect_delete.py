@@ -0,0 +1,112 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+from astrbot.api import logger
+
+from .qzone_protect import FeedCommentRef
+
+
+@dataclass
+class DeleteJob:
+    ref: FeedCommentRef
+    attempts: int = 0
+    next_try: float = 0.0
+    last_error: str = ""
+
+    @property
+    def key(self) -> str:
+        return f"{self.ref.topic_id}:{self.ref.comment_id}"
+
+
+class DeleteExecutor:
+    """Protect-mode comment deletion for one account.
+
+    - run(refs) deletes a round's comments concurrently (at most `concurrency` in flight), so
+      a burst of spam is gone in about one round trip instead of N sequential ones; the
+      account's delete_comment token bucket (qz_ratelimit) still caps the request rate
+    - `delete_one(ref)` -> (ok, retryable, detail); retryable failures go to a retry queue and
+      are attempted again in later rounds after retry_base, 2*retry_base, ... seconds, until
+      `max_attempts` is reached
+    """
+
+    def __init__(
+        self,
+        delete_one: Callable[[FeedCommentRef], Awaitable[Tuple[bool, bool, str]]],
+        *,
+        concurrency: int = 4,
+        max_attempts: int = 3,
+        retry_base: float = 10.0,
+        max_pending: int = 500,
+    ):
+        self.delete_one = delete_one
+        self.concurrency = max(1, int(concurrency))
+        self.max_attempts = max(1, int(max_attempts))
+        self.retry_base = max(1.0, float(retry_base))
+        self.max_pending = max(1, int(max_pending))
+        self._retry: Dict[str, DeleteJob] = {}
+        self.ok = 0
+        self.failed = 0
+        self.retried = 0
+        self.gave_up = 0
+        self.last_round = ""
+
+    @property
+    def pending(self) -> int:
+        return len(self._retry)
+
+    def _due_retries(self, now: float) -> List[DeleteJob]:
+        due = [j for j in self._retry.values() if j.next_try <= now]
+        for j in due:
+            self._retry.pop(j.key, None)
+        return due
+
+    async def _attempt(self, job: DeleteJob, sem: asyncio.Semaphore) -> bool:
+        async with sem:
+            job.attempts += 1
+            try:
+                ok, retryable, detail = await self.delete_one(job.ref)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                ok, retryable, detail = False, True, str(e)[:200]
+        if ok:
+            self.ok += 1
+            return True
+        self.failed += 1
+        job.last_error = detail
+        if not retryable or job.attempts >= self.max_attempts:
+            self.gave_up += 1
+            logger.warning(f"[Qzone] protect delete 放弃 {job.key} attempts={job.attempts}: {detail}")
+        elif len(self._retry) < self.max_pending:
+            job.next_try = time.time() + self.retry_base * (2 ** (job.attempts - 1))
+            self._retry[job.key] = job
+        return False
+
+    async def run(self, refs: List[FeedCommentRef]) -> Tuple[int, int, int]:
+        """Delete `refs` plus the retries that are due. Returns (tried, ok, failed) for this round."""
+
+        now = time.time()
+        retries = self._due_retries(now)
+        self.retried += len(retries)
+        # a ref that is already queued for retry (or due right now) is not attempted twice
+        by_key = {j.key: j for j in retries}
+        for r in refs:
+            job = DeleteJob(r)
+            if job.key not in self._retry and job.key not in by_key:
+                by_key[job.key] = job
+        jobs = list(by_key.values())
+        if not jobs:
+            return 0, 0, 0
+        sem = asyncio.Semaphore(self.concurrency)
+        results = await asyncio.gather(*(self._attempt(j, sem) for j in jobs))
+        ok = sum(1 for r in results if r)
+        self.last_round = f"ts={int(time.time())} try={len(jobs)} ok={ok} fail={len(jobs) - ok} retries={len(retries)}"
+        return len(jobs), ok, len(jobs) - ok
+
+    def status_line(self) -> str:
+        return (
+            f"concurrency={self.concurrency} ok={self.ok} failed={self.failed} retried={self.retried} "
+            f"gave_up={self.gave_up} pending_retry={self.pending}"
+        )
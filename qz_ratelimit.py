@@ -0,0 +1,276 @@
+import asyncio
+import random
+import re
+import time
+from typing import Any, Dict, Optional, Tuple
+
+# client method name -> endpoint bucket（qzone_http.call 按被调用的方法名自动取令牌）
+ENDPOINTS: Dict[str, str] = {
+    "send_like": "like",
+    "fetch_keys": "feeds",
+    "fetch_keys_self_legacy": "feeds",
+    "fetch_items": "feeds",
+    "fetch_items_self_legacy": "feeds",
+    "probe_head": "feeds",
+    "fetch_mood_posts": "feeds",
+    "scan_recent_comments": "feeds",
+    "fetch_feeds_module_html": "feeds",
+    "fetch_topic_comments_page": "feeds",  # list_topic_comments takes one per page
+    "list_comments_from_infocenter_callback": "feeds",
+    "add_comment": "comment",
+    "delete_comment": "delete_comment",
+    "publish_text": "publish",
+    "delete_by_tid": "delete",
+}
+
+# endpoint -> (rate per minute, burst)；like 由 like_rate_per_min / like_burst 决定
+DEFAULT_LIMITS: Dict[str, Tuple[float, int]] = {
+    "like": (4.0, 2),
+    "feeds": (30.0, 6),
+    "comment": (10.0, 3),
+    "delete_comment": (30.0, 5),
+    "publish": (4.0, 2),
+    "delete": (10.0, 3),
+}
+
+
+def parse_rate_limits(raw: Any) -> Dict[str, Tuple[float, int]]:
+    """`rate_limits` config ("feeds=30/6, comment=10") -> {endpoint: (rate_per_min, burst)}.
+
+    burst defaults to 1; rate 0 = unlimited. Unknown endpoints are kept (harmless).
+    """
+
+    out: Dict[str, Tuple[float, int]] = {}
+    for part in re.split(r"[,，;\s]+", str(raw or "")):
+        m = re.match(r"^([a-z_]+)\s*[=:]\s*(\d+(?:\.\d+)?)(?:/(\d+))?$", part.strip())
+        if not m:
+            continue
+        out[m.group(1)] = (float(m.group(2)), int(m.group(3) or 1))
+    return out
+
+
+class TokenBucket:
+    """Token bucket: `rate_per_min` tokens/min, up to `burst` banked while idle.
+
+    acquire() reserves a token up front (the balance may go negative), so concurrent
+    callers queue in arrival order on one event loop without a lock, and the sustained
+    rate never exceeds rate_per_min however many callers there are. Callers that have
+    to wait get an extra random 0..jitter*interval so the spacing isn't periodic;
+    requests with banked budget go out immediately.
+    """
+
+    def __init__(self, rate_per_min: float, burst: int = 1, jitter: float = 0.0):
+        self.rate_per_min = max(0.0, float(rate_per_min or 0))
+        self.burst = max(1, int(burst or 1))
+        self.jitter = max(0.0, float(jitter or 0))
+        self._tokens = float(self.burst)
+        self._ts = time.monotonic()
+        self.acquired = 0
+        self.waited = 0
+        self.wait_sec = 0.0
+
+    @property
+    def interval(self) -> float:
+        return 60.0 / self.rate_per_min if self.rate_per_min > 0 else 0.0
+
+    def _refill(self, now: float) -> None:
+        if self.rate_per_min > 0:
+            self._tokens = min(float(self.burst), self._tokens + (now - self._ts) * self.rate_per_min / 60.0)
+        self._ts = now
+
+    def tokens(self) -> float:
+        self._refill(time.monotonic())
+        return self._tokens
+
+    def set_rate(self, rate_per_min: float) -> None:
+        # Settle the balance at the old rate first, so the change only affects the future.
+        self._refill(time.monotonic())
+        self.rate_per_min = max(0.0, float(rate_per_min or 0))
+
+    def penalize(self, tokens: float = 1.0) -> None:
+        """Drop banked budget and go `tokens` into debt: the next caller waits that many intervals."""
+
+        self._refill(time.monotonic())
+        self._tokens = min(self._tokens, 0.0) - max(0.0, tokens)
+
+    def reserve(self) -> float:
+        """Take one token now; return how long the caller must wait before using it."""
+
+        self.acquired += 1
+        if self.rate_per_min <= 0:
+            return 0.0
+        self._refill(time.monotonic())
+        self._tokens -= 1.0
+        if self._tokens >= 0:
+            return 0.0
+        delay = -self._tokens * self.interval
+        if self.jitter:
+            delay += random.uniform(0, self.jitter * self.interval)
+        self.waited += 1
+        self.wait_sec += delay
+        return delay
+
+    async def acquire(self) -> float:
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+# Server replies that mean "slow down" rather than "this one failed".
+_THROTTLE_HINTS = ("记录成功", "频繁", "频率", "稍后再试", "验证码", "安全验证", "captcha", "verify")
+
+
+def classify_like_result(status: int, code: Optional[int], msg: str, resp_head: str = "") -> str:
+    """-> "ok" | "throttled" | "error" for one send_like reply.
+
+    "记录成功" comes with code 0 but the like is not applied: Qzone's soft throttle.
+    Verify/captcha pages and "操作过于频繁" are the hard ones.
+    """
+
+    if int(status or 0) in (429, 503):
+        return "throttled"
+    text = f"{msg or ''} {resp_head or ''}"
+    low = text.lower()
+    if any(h in text or h in low for h in _THROTTLE_HINTS):
+        return "throttled"
+    if code == 0:
+        return "ok"
+    return "error"
+
+
+class AimdPacer:
+    """Adaptive pacing for one TokenBucket (additive increase, multiplicative decrease).
+
+    - every "ok" adds `step` likes/min, up to max_rate
+    - "throttled" multiplies the rate by `decrease` (down to min_rate) and puts the bucket
+      `penalty` intervals into debt, so the next request waits instead of probing at once
+    - "error" (expired cookie, bad key, ...) says nothing about pacing and is ignored
+    """
+
+    def __init__(
+        self,
+        bucket: TokenBucket,
+        *,
+        min_rate: float = 0.5,
+        max_rate: float = 12.0,
+        step: float = 0.25,
+        decrease: float = 0.5,
+        penalty: float = 2.0,
+    ):
+        self.bucket = bucket
+        self.min_rate = max(0.01, float(min_rate))
+        self.max_rate = max(self.min_rate, float(max_rate))
+        self.step = max(0.0, float(step))
+        self.decrease = min(max(float(decrease), 0.05), 0.95)
+        self.penalty = max(0.0, float(penalty))
+        bucket.set_rate(min(max(bucket.rate_per_min, self.min_rate), self.max_rate))
+        self.ok = 0
+        self.throttled = 0
+        self.errors = 0
+        self.last_throttle_ts = 0.0
+        self.last_throttle_reason = ""
+
+    @property
+    def rate(self) -> float:
+        return self.bucket.rate_per_min
+
+    def record(self, outcome: str, reason: str = "") -> None:
+        if outcome == "ok":
+            self.ok += 1
+            self.bucket.set_rate(min(self.max_rate, self.rate + self.step))
+        elif outcome == "throttled":
+            self.throttled += 1
+            self.last_throttle_ts = time.time()
+            self.last_throttle_reason = (reason or "")[:60]
+            self.bucket.set_rate(max(self.min_rate, self.rate * self.decrease))
+            self.bucket.penalize(self.penalty)
+        else:
+            self.errors += 1
+
+    def status_line(self) -> str:
+        line = (
+            f"rate={self.rate:.2f}/min range=[{self.min_rate:g},{self.max_rate:g}] "
+            f"ok={self.ok} throttled={self.throttled} errors={self.errors}"
+        )
+        if self.last_throttle_ts:
+            ago = int(time.time() - self.last_throttle_ts)
+            line += f" last_throttle={ago}s ago ({self.last_throttle_reason})"
+        return line
+
+
+class AdaptivePollInterval:
+    """Poll interval that is `fast` while there is activity and decays toward `idle` otherwise.
+
+    record(True) snaps back to fast; every quiet round multiplies the interval by `factor`.
+    """
+
+    def __init__(self, fast: float, idle: float, factor: float = 1.5):
+        self.fast = max(1.0, float(fast))
+        self.idle = max(self.fast, float(idle))
+        self.factor = max(1.0, float(factor))
+        self.interval = self.fast
+
+    def record(self, active: bool) -> float:
+        self.interval = self.fast if active else min(self.idle, self.interval * self.factor)
+        return self.interval
+
+    def reset(self) -> None:
+        self.interval = self.fast
+
+
+class RateLimiter:
+    """Per-account limiter: one TokenBucket per endpoint, shared by every client of the account.
+
+    Clients built with limiter=... are throttled inside qzone_http.call(), keyed by the
+    called method name (ENDPOINTS). Endpoints without a configured limit are unthrottled.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, Tuple[float, int]]] = None, jitter: float = 0.3):
+        self.jitter = jitter
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.last_used: Dict[str, float] = {}  # endpoint -> time.time() the last call finished (limited or not)
+        for endpoint, (rate, burst) in (limits or {}).items():
+            self.set_limit(endpoint, rate, burst)
+
+    def set_limit(self, endpoint: str, rate_per_min: float, burst: int = 1) -> None:
+        self.buckets[endpoint] = TokenBucket(rate_per_min, burst, self.jitter)
+
+    def bucket(self, endpoint: str) -> Optional[TokenBucket]:
+        return self.buckets.get(endpoint)
+
+    async def acquire(self, endpoint: str) -> float:
+        b = self.buckets.get(endpoint)
+        return await b.acquire() if b is not None else 0.0
+
+    async def acquire_for(self, method_name: str) -> float:
+        endpoint = ENDPOINTS.get(method_name)
+        if not endpoint:
+            return 0.0
+        return await self.acquire(endpoint)
+
+    def mark_used(self, method_name: str) -> None:
+        """Record that a call of `method_name` just finished (qzone_http.call does this after the request).
+
+        Stamped on completion, not when the token is taken: a feeds page fetched while a post was
+        in flight must still count as older than the post.
+        """
+
+        endpoint = ENDPOINTS.get(method_name)
+        if endpoint:
+            self.last_used[endpoint] = time.time()
+
+    def last_call(self, *endpoints: str) -> float:
+        """Latest finish time of any of `endpoints` (0.0 = never called)."""
+
+        return max((self.last_used.get(e, 0.0) for e in endpoints), default=0.0)
+
+    def status_line(self) -> str:
+        parts = []
+        for name, b in self.buckets.items():
+            if b.rate_per_min <= 0:
+                continue
+            parts.append(
+                f"{name}={b.rate_per_min:g}/min tokens={b.tokens():.1f}/{b.burst} waited={b.waited}({int(b.wait_sec)}s)"
+            )
+        return " ".join(parts) or "unlimited"
@@ -1,15 +1,16 @@
 import asyncio
-import json
 import random
 import re
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, List, Optional
 
 from astrbot.api import logger
 
-from .qzone_post import QzonePoster
+from . import qzone_http
+from .qz_pending import PendingDeleteQueue
+from .qzone_post import AsyncQzonePoster, QzonePoster
 
 
 @dataclass
@@ -48,6 +49,10 @@ class QzScheduler:
         cookie: str,
         data_dir: Path,
         notify_cb=None,
+        pending: Optional[PendingDeleteQueue] = None,
+        pool: Optional[qzone_http.HttpPool] = None,
+        limiter: Any = None,
+        http_async: bool = False,
     ):
         self.context = context
         self.config = config
@@ -55,14 +60,15 @@ class QzScheduler:
         self.cookie = str(cookie or "").strip()
         self.data_dir = Path(data_dir)
         self.notify_cb = notify_cb  # async fn(kind:str, msg:str)
+        self.pool = pool  # None = process-wide pool
+        self.limiter = limiter  # the account's RateLimiter: posts/deletes share its budget and last_used
+        self.http_async = bool(http_async)  # AsyncQzonePoster (aiohttp) instead of QzonePoster + to_thread
 
         self._task: Optional[asyncio.Task] = None
         self._stop = asyncio.Event()
 
-        self._pending_delete_path = self.data_dir / "pending_deletes.json"
-        self._pending_deletes: List[Dict[str, Any]] = []
-        self._pending_lock = asyncio.Lock()
-        self._load_pending_deletes()
+        # Shared with the plugin when passed in (both use data/pending_deletes.json).
+        self._pending = pending if pending is not None else PendingDeleteQueue(self.data_dir / "pending_deletes.json")
 
     def running(self) -> bool:
         return self._task is not None and (not self._task.done())
@@ -82,119 +88,22 @@ class QzScheduler:
         except Exception:
             pass
 
-    def _load_pending_deletes(self) -> None:
-        try:
-            if not self._pending_delete_path.exists():
-                self._pending_deletes = []
-                return
-            data = json.loads(self._pending_delete_path.read_text(encoding="utf-8"))
-            if not isinstance(data, list):
-                self._pending_deletes = []
-                return
-            items: List[Dict[str, Any]] = []
-            for it in data:
-                if not isinstance(it, dict):
-                    continue
-                tid = str(it.get("tid") or "").strip()
-                due_ts = float(it.get("due_ts") or 0)
-                created_ts = float(it.get("created_ts") or 0)
-                if not tid or due_ts <= 0:
-                    continue
-                items.append({"tid": tid, "due_ts": due_ts, "created_ts": created_ts or time.time()})
-            items.sort(key=lambda x: float(x.get("due_ts") or 0))
-            self._pending_deletes = items
-        except Exception as e:
-            logger.warning(f"[Qzone] 加载 pending_deletes 失败: {e}")
-            self._pending_deletes = []
-
-    def _save_pending_deletes(self) -> None:
-        try:
-            self._pending_delete_path.parent.mkdir(parents=True, exist_ok=True)
-            self._pending_delete_path.write_text(
-                json.dumps(self._pending_deletes, ensure_ascii=True, indent=2),
-                encoding="utf-8",
-            )
-        except Exception as e:
-            logger.warning(f"[Qzone] 保存 pending_deletes 失败: {e}")
+    def close(self) -> None:
+        """Compact the pending-delete journal (call after stop())."""
+
+        self._pending.close()
 
     async def queue_delete(self, tid: str, delete_after_min: int) -> None:
-        t = str(tid or "").strip()
-        if not t or delete_after_min <= 0:
+        if delete_after_min <= 0:
             return
-        now = time.time()
-        due = now + delete_after_min * 60
-        async with self._pending_lock:
-            found = False
-            for it in self._pending_deletes:
-                if str(it.get("tid") or "") == t:
-                    old_due = float(it.get("due_ts") or 0)
-                    if old_due <= 0 or due < old_due:
-                        it["due_ts"] = due
-                    found = True
-                    break
-            if not found:
-                self._pending_deletes.append({"tid": t, "due_ts": due, "created_ts": now})
-            self._pending_deletes.sort(key=lambda x: float(x.get("due_ts") or 0))
-            self._save_pending_deletes()
+        await self._pending.queue(tid, time.time() + delete_after_min * 60)
 
     async def _drain_due_deletes(self, poster: QzonePoster) -> int:
-        now = time.time()
-        due_items: List[Dict[str, Any]] = []
-        async with self._pending_lock:
-            if not self._pending_deletes:
-                return 0
-            keep: List[Dict[str, Any]] = []
-            for it in self._pending_deletes:
-                try:
-                    due_ts = float(it.get("due_ts") or 0)
-                except Exception:
-                    due_ts = 0
-                if due_ts > 0 and due_ts <= now:
-                    due_items.append(it)
-                else:
-                    keep.append(it)
-            self._pending_deletes = keep
-            self._save_pending_deletes()
-
-        ok_count = 0
-        for it in due_items:
-            tid = str(it.get("tid") or "").strip()
-            if not tid:
-                continue
-            try:
-                ds, dr = await asyncio.to_thread(poster.delete_by_tid, tid)
-                ok = bool(ds == 200 and getattr(dr, "ok", False))
-                logger.info(
-                    "[Qzone] pending delete 执行 | status=%s ok=%s code=%s msg=%s tid=%s",
-                    ds,
-                    getattr(dr, "ok", False),
-                    getattr(dr, "code", ""),
-                    getattr(dr, "message", ""),
-                    tid,
-                )
-                if ok:
-                    ok_count += 1
-                    if self.notify_cb:
-                        try:
-                            await self.notify_cb("delete", f"定时删说说成功 tid={tid}")
-                        except Exception:
-                            pass
-                    continue
-
-                async with self._pending_lock:
-                    backoff_due = time.time() + 60
-                    self._pending_deletes.append({"tid": tid, "due_ts": backoff_due, "created_ts": float(it.get("created_ts") or time.time())})
-                    self._pending_deletes.sort(key=lambda x: float(x.get("due_ts") or 0))
-                    self._save_pending_deletes()
-            except Exception as e:
-                logger.warning(f"[Qzone] pending delete 异常 tid={tid}: {e}")
-                async with self._pending_lock:
-                    backoff_due = time.time() + 60
-                    self._pending_deletes.append({"tid": tid, "due_ts": backoff_due, "created_ts": float(it.get("created_ts") or time.time())})
-                    self._pending_deletes.sort(key=lambda x: float(x.get("due_ts") or 0))
-                    self._save_pending_deletes()
+        async def _notify(tid: str) -> None:
+            if self.notify_cb:
+                await self.notify_cb("delete", f"定时删说说成功 tid={tid}")
 
-        return ok_count
+        return await self._pending.drain(poster, on_deleted=_notify)
 
     def _seconds_until(self, hhmm: str) -> Optional[int]:
         m = re.match(r"^(\d{1,2}):(\d{2})$", hhmm or "")
@@ -260,7 +169,7 @@ class QzScheduler:
             mark=mark,
             last_run_ts=last,
             next_run=next_run,
-            pending_deletes=len(self._pending_deletes),
+            pending_deletes=len(self._pending),
         )
 
     async def _gen_and_post(self, poster: QzonePoster, prompt: str) -> None:
@@ -272,7 +181,7 @@ class QzScheduler:
                 return
             if len(content) > 120:
                 content = content[:120].rstrip()
-            status, result = await asyncio.to_thread(poster.publish_text, content)
+            status, result = await qzone_http.call(poster.publish_text, content)
             try:
                 self.config["ai_post_last_run_ts"] = time.time()
                 if hasattr(self.config, "save_config"):
@@ -313,14 +222,15 @@ class QzScheduler:
             logger.info("[Qzone] AI post：未配置 interval/daily，任务退出")
             return
 
-        poster = QzonePoster(self.my_qq, self.cookie)
+        poster_cls = AsyncQzonePoster if self.http_async else QzonePoster
+        poster = poster_cls(self.my_qq, self.cookie, pool=self.pool, limiter=self.limiter)
 
         def next_interval_due_ts() -> Optional[float]:
             if interval_min <= 0:
                 return None
             last = float(self.config.get("ai_post_last_run_ts", 0) or 0)
             if last <= 0:
-                return time.time()
+                return 0.0  # never ran: due now (time.time() here would always be just after `now`)
             return last + interval_min * 60
 
         def next_daily_due_ts() -> Optional[float]:
@@ -335,7 +245,7 @@ class QzScheduler:
 
         while not self._stop.is_set():
             try:
-                # drain deletes often
+                # drain due deletes; the waits below also return when the next delete is due
                 try:
                     drained = await self._drain_due_deletes(poster)
                     if drained:
@@ -345,7 +255,7 @@ class QzScheduler:
 
                 enabled = bool(self.config.get("ai_post_enabled", False))
                 if not enabled:
-                    await asyncio.wait_for(self._stop.wait(), timeout=5)
+                    await self._pending.wait(self._stop, timeout=5)
                     continue
 
                 now = time.time()
@@ -358,13 +268,12 @@ class QzScheduler:
                     cands.append(dts)
 
                 if not cands:
-                    await asyncio.wait_for(self._stop.wait(), timeout=5)
+                    await self._pending.wait(self._stop, timeout=5)
                     continue
 
                 next_due = min(cands)
                 if next_due > now:
-                    sleep_s = min(30.0, max(0.0, next_due - now))
-                    await asyncio.wait_for(self._stop.wait(), timeout=sleep_s)
+                    await self._pending.wait(self._stop, timeout=next_due - now)
                     continue
 
                 # due now: prefer interval if due
@@ -12,6 +12,8 @@ from typing import Any, Dict, Optional, Tuple
 
 import requests
 
+from .qzone_http import HttpPool, async_post, get_session
+
 
 def _get_gtk(skey: str) -> int:
     hash_val = 5381
@@ -84,7 +86,7 @@ class CommentResult:
 
 
 class QzoneCommenter:
-    def __init__(self, my_qq: str, cookie: str):
+    def __init__(self, my_qq: str, cookie: str, session: Optional[requests.Session] = None, pool: Optional[HttpPool] = None, limiter: Any = None):
         self.my_qq = str(my_qq).strip()
 
         cookie = (cookie or "").strip()
@@ -107,25 +109,17 @@ class QzoneCommenter:
             "referer": f"https://user.qzone.qq.com/{self.my_qq}/main",
             "content-type": "application/x-www-form-urlencoded;charset=UTF-8",
         }
+        self.pool = pool
+        self.limiter = limiter  # qz_ratelimit.RateLimiter，经 qzone_http.call 调用时按接口取令牌
+        self.session = session or (pool.session if pool is not None else get_session())
 
-    def add_comment(self, tid: str, text: str, topic_id: str = "") -> Tuple[int, CommentResult]:
-        t = (tid or "").strip()
-        content = (text or "").strip()
-        if not t:
-            return 0, CommentResult(False, None, "empty tid", "", "", "")
-        if not content:
-            return 0, CommentResult(False, None, "empty text", "", "", "")
-
+    def _add_request(self, tid: str, content: str, topic_id: str) -> Tuple[str, Dict[str, Any]]:
         url = (
             "https://user.qzone.qq.com/proxy/domain/taotao.qzone.qq.com"
             f"/cgi-bin/emotion_cgi_addcomment_ugc?&g_tk={self.g_tk}"
         )
 
         # Aligned with browser FormData (minimal required fields).
-        # topicId format observed: "<hostUin>_<tid>__1".
-        # Prefer caller-provided topic_id (for commenting other user's space).
-        topic_id = (topic_id or "").strip() or (f"{self.my_qq}_{t}__1" if "_" not in t else t)
-
         data: Dict[str, Any] = {
             "g_tk": str(self.g_tk),
             "topicId": topic_id,
@@ -148,40 +142,9 @@ class QzoneCommenter:
             "qzreferrer": f"https://user.qzone.qq.com/{self.my_qq}/infocenter?via=toolbar",
         }
         data["rand"] = str(int(time.time() * 1000)) + str(random.randint(100, 999))
+        return url, data
 
-        res = requests.post(url, headers=self.headers, data=data, timeout=20)
-        head = (res.text or "")[:300].replace("\n", " ").replace("\r", " ")
-
-        payload = _try_extract_json(res.text or "")
-        if isinstance(payload, dict):
-            code = None
-            try:
-                if "code" in payload:
-                    code = int(payload.get("code"))
-            except Exception:
-                code = None
-            msg = str(payload.get("message") or payload.get("msg") or "")
-            cid = str(
-                payload.get("commentid")
-                or payload.get("comment_id")
-                or payload.get("cid")
-                or (payload.get("data") or {}).get("id")
-                or (payload.get("data") or {}).get("commentId")
-                or ""
-            )
-            ok = code == 0
-            return res.status_code, CommentResult(ok, code, msg, head, cid, topic_id)
-
-        return res.status_code, CommentResult(False, None, "non-json response", head, "", topic_id)
-
-    def delete_comment(self, tid: str, comment_id: str) -> Tuple[int, CommentResult]:
-        t = (tid or "").strip()
-        cid = (comment_id or "").strip()
-        if not t:
-            return 0, CommentResult(False, None, "empty tid", "", "", "")
-        if not cid:
-            return 0, CommentResult(False, None, "empty comment_id", "", "", "")
-
+    def _delete_request(self, topic_id: str, cid: str) -> Tuple[str, Dict[str, Any]]:
         url = (
             "https://user.qzone.qq.com/proxy/domain/taotao.qzone.qq.com"
             f"/cgi-bin/emotion_cgi_delcomment_ugc?&g_tk={self.g_tk}"
@@ -196,7 +159,7 @@ class QzoneCommenter:
             "source": "ic",
             "hostUin": self.my_qq,
             "uin": self.my_qq,
-            "topicId": t if "_" in t else f"{self.my_qq}_{t}__1",
+            "topicId": topic_id,
             "feedsType": "100",
             "commentId": cid,
             "commentUin": self.my_qq,
@@ -206,11 +169,14 @@ class QzoneCommenter:
             "qzreferrer": f"https://user.qzone.qq.com/{self.my_qq}/infocenter?via=toolbar",
         }
         data["rand"] = str(int(time.time() * 1000)) + str(random.randint(100, 999))
+        return url, data
 
-        res = requests.post(url, headers=self.headers, data=data, timeout=20)
-        head = (res.text or "")[:300].replace("\n", " ").replace("\r", " ")
+    @staticmethod
+    def _parse_result(text: str, topic_id: str, cid: str = "") -> CommentResult:
+        """Parse add/delete comment response. For delete, `cid` is echoed back as-is."""
+        head = (text or "")[:300].replace("\n", " ").replace("\r", " ")
 
-        payload = _try_extract_json(res.text or "")
+        payload = _try_extract_json(text or "")
         if isinstance(payload, dict):
             code = None
             try:
@@ -219,9 +185,77 @@ class QzoneCommenter:
             except Exception:
                 code = None
             msg = str(payload.get("message") or payload.get("msg") or "")
+            if not cid:
+                cid = str(
+                    payload.get("commentid")
+                    or payload.get("comment_id")
+                    or payload.get("cid")
+                    or (payload.get("data") or {}).get("id")
+                    or (payload.get("data") or {}).get("commentId")
+                    or ""
+                )
             ok = code == 0
-            topic_id = t if "_" in t else f"{self.my_qq}_{t}__1"
-            return res.status_code, CommentResult(ok, code, msg, head, cid, topic_id)
+            return CommentResult(ok, code, msg, head, cid, topic_id)
+
+        return CommentResult(False, None, "non-json response", head, cid, topic_id)
+
+    def _topic_for(self, tid: str, topic_id: str = "") -> str:
+        # topicId format observed: "<hostUin>_<tid>__1".
+        # Prefer caller-provided topic_id (for commenting other user's space).
+        return (topic_id or "").strip() or (f"{self.my_qq}_{tid}__1" if "_" not in tid else tid)
+
+    def add_comment(self, tid: str, text: str, topic_id: str = "") -> Tuple[int, CommentResult]:
+        t = (tid or "").strip()
+        content = (text or "").strip()
+        if not t:
+            return 0, CommentResult(False, None, "empty tid", "", "", "")
+        if not content:
+            return 0, CommentResult(False, None, "empty text", "", "", "")
+
+        topic_id = self._topic_for(t, topic_id)
+        url, data = self._add_request(t, content, topic_id)
+        res = self.session.post(url, headers=self.headers, data=data, timeout=20)
+        return res.status_code, self._parse_result(res.text or "", topic_id)
+
+    def delete_comment(self, tid: str, comment_id: str) -> Tuple[int, CommentResult]:
+        t = (tid or "").strip()
+        cid = (comment_id or "").strip()
+        if not t:
+            return 0, CommentResult(False, None, "empty tid", "", "", "")
+        if not cid:
+            return 0, CommentResult(False, None, "empty comment_id", "", "", "")
+
+        topic_id = self._topic_for(t)
+        url, data = self._delete_request(topic_id, cid)
+        res = self.session.post(url, headers=self.headers, data=data, timeout=20)
+        return res.status_code, self._parse_result(res.text or "", topic_id, cid)
+
+
+class AsyncQzoneCommenter(QzoneCommenter):
+    """Same API as QzoneCommenter, but methods are awaitable (non-blocking HTTP)."""
+
+    async def add_comment(self, tid: str, text: str, topic_id: str = "") -> Tuple[int, CommentResult]:
+        t = (tid or "").strip()
+        content = (text or "").strip()
+        if not t:
+            return 0, CommentResult(False, None, "empty tid", "", "", "")
+        if not content:
+            return 0, CommentResult(False, None, "empty text", "", "", "")
+
+        topic_id = self._topic_for(t, topic_id)
+        url, data = self._add_request(t, content, topic_id)
+        res = await async_post(url, headers=self.headers, data=data, timeout=20, pool=self.pool)
+        return res.status_code, self._parse_result(res.text, topic_id)
+
+    async def delete_comment(self, tid: str, comment_id: str) -> Tuple[int, CommentResult]:
+        t = (tid or "").strip()
+        cid = (comment_id or "").strip()
+        if not t:
+            return 0, CommentResult(False, None, "empty tid", "", "", "")
+        if not cid:
+            return 0, CommentResult(False, None, "empty comment_id", "", "", "")
 
-        topic_id = t if "_" in t else f"{self.my_qq}_{t}__1"
-        return res.status_code, CommentResult(False, None, "non-json response", head, cid, topic_id)
+        topic_id = self._topic_for(t)
+        url, data = self._delete_request(topic_id, cid)
+        res = await async_post(url, headers=self.headers, data=data, timeout=20, pool=self.pool)
+        return res.status_code, self._parse_result(res.text, topic_id, cid)
@@ -1,15 +1,20 @@
 # qzone_comments_list.py
-# QQ空间评论列表抓取（基于 infocenter feeds 的 Callback 数据里内嵌的 comments-list HTML）
+# QQ空间评论列表抓取
+# - list_topic_comments：按话题分页拉评论（taotao / emotion_cgi_msgdetail_v6，pos/num），带内容和昵称；
+#   每页经 qzone_http.call 单独取 feeds 令牌（同步/异步两个变体都要 await）
+# - list_comments_from_infocenter_callback：旧方式，从 infocenter feeds 内嵌的 comments-list HTML 里找
 
 from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 
 from .qzone_comment import _get_gtk, _pick_skey_for_gtk
+from .qzone_http import HttpPool, async_get, call, get_session
+from .qzone_jsparse import parse_callback
 
 
 @dataclass
@@ -18,10 +23,28 @@ class CommentItem:
     comment_uin: str
     nick: str
     content: str
+    create_time: int = 0
+    reply_num: int = 0
+
+
+def _split_topic_id(topic_id: str, default_host: str) -> Tuple[str, str]:
+    """"<host_uin>_<tid>__1" -> (host_uin, tid); a bare tid belongs to default_host."""
+
+    m = re.match(r"^(\d{5,12})_([0-9A-Za-z]+)", topic_id)
+    if m:
+        return m.group(1), m.group(2)
+    return default_host, topic_id
+
+
+def _as_int(v: Any) -> int:
+    try:
+        return int(v or 0)
+    except (TypeError, ValueError):
+        return 0
 
 
 class QzoneCommentLister:
-    def __init__(self, my_qq: str, cookie: str):
+    def __init__(self, my_qq: str, cookie: str, session: Optional[requests.Session] = None, pool: Optional[HttpPool] = None, limiter: Any = None):
         self.my_qq = str(my_qq).strip()
         cookie = (cookie or "").strip()
         if cookie.lower().startswith("cookie:"):
@@ -42,19 +65,104 @@ class QzoneCommentLister:
             "origin": "https://user.qzone.qq.com",
             "referer": f"https://user.qzone.qq.com/{self.my_qq}/infocenter?via=toolbar",
         }
+        self.pool = pool
+        self.limiter = limiter  # qz_ratelimit.RateLimiter，经 qzone_http.call 调用时按接口取令牌
+        self.session = session or (pool.session if pool is not None else get_session())
 
-    def list_comments_from_infocenter_callback(self, topic_id: str, max_items: int = 50) -> Tuple[int, List[CommentItem]]:
-        """Fetch infocenter feeds and parse comments from embedded HTML.
+    # ---- per-topic listing (emotion_cgi_msgdetail_v6) ----
+    PAGE_SIZE = 20
+    MAX_PAGES = 50  # 1000 comments at the default page size
 
-        This is a pragmatic approach: the infocenter API response contains a huge HTML snippet
-        for each feed; within it there's <li class="comments-item" ... data-tid="..." data-uin="...">.
-        We parse those attributes as comment id/uin.
+    def _msgdetail_request(self, topic_id: str, pos: int, num: int) -> Tuple[str, Dict[str, str]]:
+        host, tid = _split_topic_id(topic_id, self.my_qq)
+        url = "https://user.qzone.qq.com/proxy/domain/taotao.qq.com/cgi-bin/emotion_cgi_msgdetail_v6"
+        params = {
+            "uin": host,
+            "tid": tid,
+            "t1_source": "1",
+            "ftype": "0",
+            "sort": "0",
+            "pos": str(max(0, int(pos))),
+            "num": str(max(1, int(num))),
+            "need_private_comment": "1",
+            "code_version": "1",
+            "format": "json",
+            "g_tk": str(self.g_tk),
+        }
+        return url, params
+
+    @staticmethod
+    def _parse_msgdetail(text: str) -> Tuple[int, int, List[CommentItem], str]:
+        """-> (code, total comment count, items of this page, message). code=-1 when unparsable."""
+
+        payload = parse_callback(text or "")
+        if not isinstance(payload, dict):
+            return -1, 0, [], "invalid payload"
+        code = _as_int(payload.get("code"))
+        items: List[CommentItem] = []
+        for c in payload.get("commentlist") or []:
+            if not isinstance(c, dict):
+                continue
+            items.append(
+                CommentItem(
+                    comment_id=str(c.get("tid") or ""),
+                    comment_uin=str(c.get("uin") or ""),
+                    nick=str(c.get("name") or ""),
+                    content=str(c.get("content") or ""),
+                    create_time=_as_int(c.get("create_time") or c.get("createTime")),
+                    reply_num=_as_int(c.get("reply_num") or c.get("replyNum")),
+                )
+            )
+        return code, _as_int(payload.get("cmtnum")), items, str(payload.get("message") or "")
+
+    def fetch_topic_comments_page(self, topic_id: str, pos: int = 0, num: int = PAGE_SIZE) -> Tuple[int, int, List[CommentItem]]:
+        """One page of a topic's comments, oldest first -> (status, total comments, items).
+
+        status is the HTTP status, or -1 when the reply is not a code=0 comment list.
         """
 
-        tid = (topic_id or "").strip()
-        if not tid:
+        url, params = self._msgdetail_request(topic_id, pos, num)
+        res = self.session.get(url, headers=self.headers, params=params, timeout=20)
+        return self._page_result(res.status_code, res.text or "")
+
+    @staticmethod
+    def _page_result(status: int, text: str) -> Tuple[int, int, List[CommentItem]]:
+        if status != 200:
+            return status, 0, []
+        code, total, items, _ = QzoneCommentLister._parse_msgdetail(text)
+        return (200 if code == 0 else -1), total, items
+
+    async def list_topic_comments(
+        self, topic_id: str, max_items: int = 0, page_size: int = PAGE_SIZE, max_pages: int = MAX_PAGES
+    ) -> Tuple[int, List[CommentItem]]:
+        """All comments of one topic (up to max_items, 0 = all), paging pos/num through the thread.
+
+        Only the requested topic is downloaded, so long threads are complete instead of being
+        cut off by a fixed slice of the infocenter feed. Awaitable in both variants: every page
+        is a separate fetch_topic_comments_page call through qzone_http.call, so each takes its
+        own "feeds" token. Paging stops after max_pages, or at a page without new comment ids
+        (cmtnum missing and the server ignoring pos would otherwise repeat the same page).
+        """
+
+        topic = (topic_id or "").strip()
+        if not topic:
             return 0, []
+        out: List[CommentItem] = []
+        seen = set()
+        for _ in range(max(1, int(max_pages))):
+            status, total, page = await call(self.fetch_topic_comments_page, topic, len(out), page_size)
+            if status != 200:
+                # a failed later page still returns what was collected
+                return (200 if out else status), out
+            fresh = [c for c in page if (c.comment_id, c.comment_uin, c.create_time) not in seen]
+            seen.update((c.comment_id, c.comment_uin, c.create_time) for c in fresh)
+            out.extend(fresh)
+            if not fresh or (total and len(out) >= total) or (max_items > 0 and len(out) >= max_items):
+                break
+        return 200, out[:max_items] if max_items > 0 else out
 
+    # ---- legacy: infocenter feed slice ----
+    def _infocenter_request(self) -> Tuple[str, Dict[str, str]]:
         url = "https://h5.qzone.qq.com/proxy/domain/ic2.qzone.qq.com/cgi-bin/feeds/feeds3_html_more"
         params = {
             "uin": self.my_qq,
@@ -65,14 +173,14 @@ class QzoneCommentLister:
             "count": "20",
             "g_tk": str(self.g_tk),
         }
+        return url, params
 
-        res = requests.get(url, headers=self.headers, params=params, timeout=20)
-        text = res.text or ""
-
+    @staticmethod
+    def _parse_infocenter_comments(text: str, tid: str, max_items: int) -> List[CommentItem]:
         # Find the block that contains our topicId
         pos = text.find(tid)
         if pos < 0:
-            return res.status_code, []
+            return []
 
         # Slice around to limit regex cost
         seg = text[max(0, pos - 20000) : pos + 20000]
@@ -89,4 +197,41 @@ class QzoneCommentLister:
             if max_items > 0 and len(items) >= max_items:
                 break
 
-        return res.status_code, items
+        return items
+
+    def list_comments_from_infocenter_callback(self, topic_id: str, max_items: int = 50) -> Tuple[int, List[CommentItem]]:
+        """Fetch infocenter feeds and parse comments from embedded HTML (ids only, no content).
+
+        Prefer list_topic_comments(): this only sees the 20 newest feeds and a 40 KB slice.
+        This is a pragmatic approach: the infocenter API response contains a huge HTML snippet
+        for each feed; within it there's <li class="comments-item" ... data-tid="..." data-uin="...">.
+        We parse those attributes as comment id/uin.
+        """
+
+        tid = (topic_id or "").strip()
+        if not tid:
+            return 0, []
+
+        url, params = self._infocenter_request()
+        res = self.session.get(url, headers=self.headers, params=params, timeout=20)
+        return res.status_code, self._parse_infocenter_comments(res.text or "", tid, max_items)
+
+
+class AsyncQzoneCommentLister(QzoneCommentLister):
+    """Same API as QzoneCommentLister, but methods are awaitable (non-blocking HTTP)."""
+
+    async def fetch_topic_comments_page(
+        self, topic_id: str, pos: int = 0, num: int = QzoneCommentLister.PAGE_SIZE
+    ) -> Tuple[int, int, List[CommentItem]]:
+        url, params = self._msgdetail_request(topic_id, pos, num)
+        res = await async_get(url, headers=self.headers, params=params, timeout=20, pool=self.pool)
+        return self._page_result(res.status_code, res.text)
+
+    async def list_comments_from_infocenter_callback(self, topic_id: str, max_items: int = 50) -> Tuple[int, List[CommentItem]]:
+        tid = (topic_id or "").strip()
+        if not tid:
+            return 0, []
+
+        url, params = self._infocenter_request()
+        res = await async_get(url, headers=self.headers, params=params, timeout=20, pool=self.pool)
+        return res.status_code, self._parse_infocenter_comments(res.text, tid, max_items)
@@ -6,7 +6,7 @@ from __future__ import annotations
 import random
 import time
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 import requests
 
@@ -16,6 +16,7 @@ from .qzone_comment import (
     _pick_skey_for_gtk,
     _try_extract_json,
 )
+from .qzone_http import HttpPool, async_post, get_session
 
 
 @dataclass
@@ -27,7 +28,7 @@ class DelCommentResult:
 
 
 class QzoneCommentDeleter:
-    def __init__(self, my_qq: str, cookie: str):
+    def __init__(self, my_qq: str, cookie: str, session: Optional[requests.Session] = None, pool: Optional[HttpPool] = None, limiter: Any = None):
         self.my_qq = str(my_qq).strip()
 
         cookie = (cookie or "").strip()
@@ -50,15 +51,11 @@ class QzoneCommentDeleter:
             "referer": f"https://user.qzone.qq.com/{self.my_qq}/infocenter?via=toolbar",
             "content-type": "application/x-www-form-urlencoded;charset=UTF-8",
         }
+        self.pool = pool
+        self.limiter = limiter  # qz_ratelimit.RateLimiter，经 qzone_http.call 调用时按接口取令牌
+        self.session = session or (pool.session if pool is not None else get_session())
 
-    def delete_comment(self, topic_id: str, comment_id: str, comment_uin: str = "") -> Tuple[int, DelCommentResult]:
-        topic = (topic_id or "").strip()
-        cid = (comment_id or "").strip()
-        if not topic:
-            return 0, DelCommentResult(False, None, "empty topicId", "")
-        if not cid:
-            return 0, DelCommentResult(False, None, "empty commentId", "")
-
+    def _delete_request(self, topic: str, cid: str, comment_uin: str) -> Tuple[str, Dict[str, Any]]:
         # commentUin is required by browser payload; default to self uin if missing.
         cuin = (comment_uin or "").strip()
         if not cuin:
@@ -72,7 +69,7 @@ class QzoneCommentDeleter:
             f"/cgi-bin/emotion_cgi_delcomment_ugc?&g_tk={self.g_tk}"
         )
 
-        data = {
+        data: Dict[str, Any] = {
             "g_tk": str(self.g_tk),
             "inCharset": "utf-8",
             "outCharset": "utf-8",
@@ -90,11 +87,13 @@ class QzoneCommentDeleter:
             "qzreferrer": f"https://user.qzone.qq.com/{self.my_qq}/infocenter?via=toolbar",
         }
         data["rand"] = str(int(time.time() * 1000)) + str(random.randint(100, 999))
+        return url, data
 
-        res = requests.post(url, headers=self.headers, data=data, timeout=20)
-        head = (res.text or "")[:300].replace("\n", " ").replace("\r", " ")
+    @staticmethod
+    def _parse_result(text: str) -> DelCommentResult:
+        head = (text or "")[:300].replace("\n", " ").replace("\r", " ")
 
-        payload = _try_extract_json(res.text or "")
+        payload = _try_extract_json(text or "")
         if isinstance(payload, dict):
             code = None
             try:
@@ -104,6 +103,34 @@ class QzoneCommentDeleter:
                 code = None
             msg = str(payload.get("message") or payload.get("msg") or "")
             ok = code == 0
-            return res.status_code, DelCommentResult(ok, code, msg, head)
+            return DelCommentResult(ok, code, msg, head)
+
+        return DelCommentResult(False, None, "non-json response", head)
+
+    def delete_comment(self, topic_id: str, comment_id: str, comment_uin: str = "") -> Tuple[int, DelCommentResult]:
+        topic = (topic_id or "").strip()
+        cid = (comment_id or "").strip()
+        if not topic:
+            return 0, DelCommentResult(False, None, "empty topicId", "")
+        if not cid:
+            return 0, DelCommentResult(False, None, "empty commentId", "")
+
+        url, data = self._delete_request(topic, cid, comment_uin)
+        res = self.session.post(url, headers=self.headers, data=data, timeout=20)
+        return res.status_code, self._parse_result(res.text or "")
+
+
+class AsyncQzoneCommentDeleter(QzoneCommentDeleter):
+    """Same API as QzoneCommentDeleter, but delete_comment is awaitable (non-blocking HTTP)."""
+
+    async def delete_comment(self, topic_id: str, comment_id: str, comment_uin: str = "") -> Tuple[int, DelCommentResult]:
+        topic = (topic_id or "").strip()
+        cid = (comment_id or "").strip()
+        if not topic:
+            return 0, DelCommentResult(False, None, "empty topicId", "")
+        if not cid:
+            return 0, DelCommentResult(False, None, "empty commentId", "")
 
-        return res.status_code, DelCommentResult(False, None, "non-json response", head)
+        url, data = self._delete_request(topic, cid, comment_uin)
+        res = await async_post(url, headers=self.headers, data=data, timeout=20, pool=self.pool)
+        return res.status_code, self._parse_result(res.text)
@@ -11,6 +11,11 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 
+from .qz_feed_cache import FeedCache, FeedPage
+from .qzone_feed_html import FeedItem, feed_items
+from .qzone_http import HttpPool, async_get, get_session
+from .qzone_jsparse import JsParseError, iter_array, slice_html_items
+
 
 @dataclass
 class MoodPost:
@@ -80,91 +85,103 @@ def _try_extract_json_from_callback(text: str) -> Optional[dict]:
 
 
 def _extract_feed_items_from_js_callback(text: str) -> List[Dict[str, Any]]:
-    if not text:
-        return []
+    """Feed items (html + abstime) from a JS-literal `_Callback(...)` payload.
 
-    # Extract friend_data / host_data arrays from JS callback body without full JS parsing.
-    # We only need each item's html + abstime.
-    s = text
-
-    def _find_array(var_name: str) -> str:
-        m = re.search(r"\b" + re.escape(var_name) + r"\s*:\s*\[", s)
-        if not m:
-            return ""
-        i = m.end()  # position after '['
-        depth = 1
-        in_str = False
-        esc = False
-        quote = ""
-        j = i
-        while j < len(s):
-            ch = s[j]
-            if in_str:
-                if esc:
-                    esc = False
-                elif ch == "\\":
-                    esc = True
-                elif ch == quote:
-                    in_str = False
-            else:
-                if ch in ("\"", "'"):
-                    in_str = True
-                    quote = ch
-                elif ch == "[":
-                    depth += 1
-                elif ch == "]":
-                    depth -= 1
-                    if depth == 0:
-                        return s[i:j]
-            j += 1
-        return ""
+    Parses friend_data / host_data lazily with qzone_jsparse (at most 200 items are materialized);
+    falls back to anchor slicing when the payload is not a well-formed JS literal.
+    """
 
-    arr = _find_array("friend_data") or _find_array("host_data")
-    if not arr:
+    if not text:
         return []
 
-    items: List[Dict[str, Any]] = []
-    abstime_pat = re.compile(r"\babstime\s*:\s*'?([0-9]{6,})'?")
-
-    # The old regex `html:'...'` is too fragile for real payloads.
-    # Instead, slice from `html:` to the next `,opuin:` (present in items) and decode afterward.
-    for m in re.finditer(r"\bhtml\s*:\s*", arr):
-        end_m = re.search(r",\s*opuin\s*:\s*", arr[m.end() :])
-        if not end_m:
-            continue
-
-        html_blob = arr[m.end() : m.end() + end_m.start()]
-        html_blob = html_blob.strip().rstrip(",")
-
-        if len(html_blob) >= 2 and html_blob[0] in ("'", '"') and html_blob[-1] == html_blob[0]:
-            html = html_blob[1:-1]
-        else:
-            html = html_blob
-
-        html = html.replace("\\x3C", "<").replace("\\x3E", ">")
-        html = html.replace("\\/", "/")
-        html = html.replace("\\\"", '"').replace("\\'", "'")
-        html = html.replace("\\x22", '"')
-
-        tail = arr[m.end() : m.end() + 2000]
-        am = abstime_pat.search(tail)
-        abstime = am.group(1) if am else ""
-
-        items.append({"html": html, "abstime": abstime})
-        if len(items) >= 200:
-            break
-
-    return items
+    try:
+        for name in ("friend_data", "host_data"):
+            items: List[Dict[str, Any]] = []
+            for x in iter_array(text, name):
+                if not isinstance(x, dict) or not x.get("html"):
+                    continue
+                items.append(
+                    {"html": str(x.get("html")), "abstime": str(x.get("abstime") or ""), "feedstime": str(x.get("feedstime") or "")}
+                )
+                if len(items) >= 200:
+                    break
+            if items:
+                return items
+    except JsParseError:
+        pass
+
+    for name in ("friend_data", "host_data"):
+        sliced = slice_html_items(text, name, limit=200)
+        if sliced:
+            return sliced
+    return []
+
+
+def parse_act_all_page(text: str) -> Tuple[List[FeedItem], int]:
+    """FeedItems of a feeds_html_act_all response (friend_data / host_data).
+
+    The second value counts the entries recovered from the JS literal (0 = strict JSON payload).
+    """
+
+    payload = _try_extract_json_from_callback(text)
+    data_items: List[Dict[str, Any]] = []
+    if isinstance(payload, dict):
+        d = payload.get("data")
+        if isinstance(d, dict):
+            if isinstance(d.get("data"), dict):
+                d = d.get("data")
+            for k in ("friend_data", "host_data"):
+                arr = d.get(k)
+                if isinstance(arr, list):
+                    data_items = [x for x in arr if isinstance(x, dict)]
+                    if data_items:
+                        break
+
+    extracted_items = 0
+    if not data_items:
+        data_items = _extract_feed_items_from_js_callback(text)
+        extracted_items = len(data_items)
+    return feed_items(data_items), extracted_items
+
+
+def _act_all_parse_error(text: str) -> str:
+    payload = _try_extract_json_from_callback(text)
+    head = (text or "")[:500].replace("\n", " ").replace("\r", " ")
+    data_obj = payload.get("data") if isinstance(payload, dict) else None
+    if isinstance(data_obj, dict) and isinstance(data_obj.get("data"), dict):
+        data_obj = data_obj.get("data")
+    keys = []
+    if isinstance(data_obj, dict):
+        keys = sorted(list(data_obj.keys()))
+    types = {}
+    if isinstance(data_obj, dict):
+        for k in ("friend_data", "host_data", "about_data", "firstpage_data"):
+            v = data_obj.get(k)
+            types[k] = type(v).__name__
+    return (
+        "feeds_html_act_all parse failed: no data_items; "
+        f"data_keys={keys}; data_types={types}; head={head}"
+    )
 
 
 class QzoneFeedFetcher:
-    def __init__(self, host_uin: str, cookie: str, my_qq: str = ""):
+    def __init__(
+        self,
+        host_uin: str,
+        cookie: str,
+        my_qq: str = "",
+        session: Optional[requests.Session] = None,
+        pool: Optional[HttpPool] = None,
+        limiter: Any = None,
+        feed_cache: Optional[FeedCache] = None,
+    ):
         # host_uin: whose space to fetch
         # my_qq: your own QQ (used only when you want to filter self posts)
         self.host_uin = str(host_uin).strip()
         self.my_qq = str(my_qq or "").strip()
         self.last_diag: str = ""
         self.last_sample_html_head: str = ""
+        self._page_stats: Tuple[int, int, int] = (0, 0, 0)
 
         cookie = (cookie or "").strip()
         if cookie.lower().startswith("cookie:"):
@@ -188,234 +205,88 @@ class QzoneFeedFetcher:
             "origin": "https://user.qzone.qq.com",
             "referer": f"https://user.qzone.qq.com/{self.my_qq}/main",
         }
+        self.pool = pool
+        self.limiter = limiter  # qz_ratelimit.RateLimiter，经 qzone_http.call 调用时按接口取令牌
+        self.feed_cache = feed_cache  # qz_feed_cache.FeedCache (shared with QzoneLikeClient), None = no cache
+        self.session = session or (pool.session if pool is not None else get_session())
 
-    def fetch_mood_posts(self, count: int = 20, max_pages: int = 3) -> Tuple[int, List[MoodPost]]:
-        """Fetch latest mood posts from your own space (main page feed), across pages.
-
-        Uses feeds_html_act_all with uin=loginQQ and hostuin=targetQQ (here we use my_qq).
-        This matches what the browser loads on /<uin>/main.
-        """
-
-        count = int(count) if count else 20
-        if count <= 0:
-            count = 20
-        max_pages = int(max_pages) if max_pages else 1
-        if max_pages <= 0:
-            max_pages = 1
-
-        posts: List[MoodPost] = []
-        start = 0
+    def _page_key(self, start: int, count: int) -> Tuple[str, str, int, int]:
+        # Same key as QzoneLikeClient._feeds_key: both request the same feeds_html_act_all page.
+        return ("act_all", self.host_uin, int(start), int(count))
 
-        for _ in range(max_pages):
-            url = (
-                "https://user.qzone.qq.com/proxy/domain/ic2.qzone.qq.com/cgi-bin/feeds/feeds_html_act_all"
-                f"?uin={self.my_qq or self.host_uin}&hostuin={self.host_uin}"
-                "&scope=0&filter=all&flag=1&refresh=0&firstGetGroup=0&mixnocache=0&scene=0"
-                f"&begintime=undefined&icServerTime=&start={start}&count={count}"
-                "&sidomain=qzonestyle.gtimg.cn&useutf8=1&outputhtmlfeed=1&refer=2"
-                f"&r={random.random()}&g_tk={self.g_tk}"
-            )
+    def _load_page(self, start: int, count: int) -> Tuple[int, str]:
+        res = self.session.get(self._page_url(start, count), headers=self.headers, timeout=20)
+        return res.status_code, res.text or ""
 
-            res = requests.get(url, headers=self.headers, timeout=20)
-            status = res.status_code
-            text = res.text or ""
-            if status != 200 or not text:
-                if start == 0:
-                    return status, []
-                break
+    def _get_page(self, start: int, count: int) -> FeedPage:
+        if self.feed_cache is None:
+            return FeedPage(*self._load_page(start, count))
+        return self.feed_cache.get_sync(self._page_key(start, count), lambda: self._load_page(start, count))
 
-            payload = _try_extract_json_from_callback(text)
-            data_items: List[Dict[str, Any]] = []
-            if isinstance(payload, dict):
-                d = payload.get("data")
-                if isinstance(d, dict):
-                    if isinstance(d.get("data"), dict):
-                        d = d.get("data")
-                    for k in ("friend_data", "host_data"):
-                        arr = d.get(k)
-                        if isinstance(arr, list):
-                            data_items = [x for x in arr if isinstance(x, dict)]
-                            if data_items:
-                                break
-
-            extracted_items = 0
-            if not data_items:
-                data_items = _extract_feed_items_from_js_callback(text)
-                extracted_items = len(data_items)
-
-            feed_data_tag_hits = 0
-            self_posts = 0
-
-            if data_items:
-                try:
-                    raw_html = str(data_items[0].get("html") or "")
-                    sample = raw_html[:260].replace("\n", " ").replace("\r", " ")
-                    self.last_sample_html_head = sample
-                except Exception:
-                    self.last_sample_html_head = ""
-
-            if not data_items:
-                head = (text or "")[:500].replace("\n", " ").replace("\r", " ")
-                data_obj = payload.get("data") if isinstance(payload, dict) else None
-                if isinstance(data_obj, dict) and isinstance(data_obj.get("data"), dict):
-                    data_obj = data_obj.get("data")
-                keys = []
-                if isinstance(data_obj, dict):
-                    keys = sorted(list(data_obj.keys()))
-                types = {}
-                if isinstance(data_obj, dict):
-                    for k in ("friend_data", "host_data", "about_data", "firstpage_data"):
-                        v = data_obj.get(k)
-                        types[k] = type(v).__name__
-                raise RuntimeError(
-                    "feeds_html_act_all parse failed: no data_items; "
-                    f"data_keys={keys}; data_types={types}; head={head}"
-                )
+    def _page_posts(self, page: FeedPage) -> List[MoodPost]:
+        """This host's mood posts on `page`.
 
-            for item in data_items:
-                html = str(item.get("html") or "")
-                if not html:
-                    continue
-
-                tag = ""
-                m = re.search(r"<i[^>]*\bname=\"feed_data\"[^>]*>", html)
-                if m:
-                    tag = m.group(0)
-
-                if not tag:
-                    m = re.search(r"<i[^>]*\bname='feed_data'[^>]*>", html)
-                    if m:
-                        tag = m.group(0)
-
-                if not tag:
-                    m = re.search(r"<i[^>]*\bname=\\\"feed_data\\\"[^>]*>", html)
-                    if m:
-                        tag = m.group(0)
-
-                if not tag:
-                    m = re.search(r"<i[^>]*\bname=\\'feed_data\\'[^>]*>", html)
-                    if m:
-                        tag = m.group(0)
-
-                if not tag:
-                    continue
-
-                feed_data_tag_hits += 1
-
-                tid = ""
-                host_uin = ""
-                topic_id = ""
-
-                for pat, key in (
-                    (r"\bdata-tid=\\\"([^\\\"]+)\\\"", "tid"),
-                    (r"\bdata-uin=\\\"(\d+)\\\"", "uin"),
-                    (r"\bdata-topicid=\\\"([^\\\"]+)\\\"", "topic"),
-                    (r"\bdata-tid=\"([^\"]+)\"", "tid"),
-                    (r"\bdata-uin=\"(\d+)\"", "uin"),
-                    (r"\bdata-topicid=\"([^\"]+)\"", "topic"),
-                    (r"\bdata-tid='([^']+)'", "tid"),
-                    (r"\bdata-uin='(\d+)'", "uin"),
-                    (r"\bdata-topicid='([^']+)'", "topic"),
-                ):
-                    mm = re.search(pat, tag)
-                    if not mm:
-                        continue
-                    if key == "tid" and not tid:
-                        tid = mm.group(1)
-                    elif key == "uin" and not host_uin:
-                        host_uin = mm.group(1)
-                    elif key == "topic" and not topic_id:
-                        topic_id = mm.group(1)
-
-                if not tid or not host_uin or not topic_id:
-                    continue
+        The page's FeedItems are parsed once per cached page and shared with QzoneLikeClient
+        (same cache key); only the MoodPost view is built here.
+        """
 
-                if host_uin != self.host_uin:
-                    continue
+        items, extracted_items = page.memo("act_all_items", lambda: parse_act_all_page(page.text))
+        if not items:
+            raise RuntimeError(_act_all_parse_error(page.text))
+        self.last_sample_html_head = items[0].html[:260].replace("\n", " ").replace("\r", " ")
 
-                self_posts += 1
+        feed_data_tag_hits = 0
+        self_posts = 0
+        posts: List[MoodPost] = []
+        for item in items:
+            if not item.attrs:
+                continue
+            feed_data_tag_hits += 1
 
-                if "_" not in topic_id or "__" not in topic_id:
-                    continue
+            tid, host_uin, topic_id = item.tid, item.host_uin, item.topic_id
+            if not tid or not host_uin or not topic_id or not host_uin.isdigit():
+                continue
+            if host_uin != self.host_uin:
+                continue
+            self_posts += 1
+            if "_" not in topic_id or "__" not in topic_id:
+                continue
 
-                abstime = 0
-                feedstime = ""
-
-                # Prefer data-abstime from feed_data tag; it's present in the embedded HTML and avoids JS-literal parsing quirks.
-                m_ab = re.search(r"\bdata-abstime=\\\"(\d+)\\\"", tag)
-                if not m_ab:
-                    m_ab = re.search(r"\bdata-abstime=\"(\d+)\"", tag)
-                if not m_ab:
-                    m_ab = re.search(r"\bdata-abstime='(\d+)'", tag)
-                if m_ab:
-                    try:
-                        abstime = int(m_ab.group(1))
-                    except Exception:
-                        abstime = 0
-
-                if not abstime:
-                    try:
-                        if "abstime" in item:
-                            abstime = int(str(item.get("abstime") or 0))
-                    except Exception:
-                        abstime = 0
-
-                # Prefer human-readable time string from payload/html; it matches what Qzone shows and avoids server tz issues.
-                try:
-                    fs = str(item.get("feedstime") or "").strip()
-                    if fs:
-                        feedstime = fs
-                except Exception:
-                    pass
-
-                if not feedstime:
-                    # fallback: extract from HTML header span (e.g. 2025年12月11日 01:39)
-                    m_fs = re.search(
-                        r"<span[^>]*\bclass=\\\"[^\\\"]*\bstate\b[^\\\"]*\\\"[^>]*>\s*(\d{4}年\d{1,2}月\d{1,2}日\s*\d{1,2}:\d{2})\s*</span>",
-                        html,
-                        re.S,
-                    )
-                    if not m_fs:
-                        m_fs = re.search(
-                            r"<span[^>]*\bclass=\"[^\"]*\bstate\b[^\"]*\"[^>]*>\s*(\d{4}年\d{1,2}月\d{1,2}日\s*\d{1,2}:\d{2})\s*</span>",
-                            html,
-                            re.S,
-                        )
-                    if m_fs:
-                        feedstime = m_fs.group(1).strip()
-
-                # Extract visible text from feed item HTML.
-                m_info = re.search(r"<div[^>]*class=\\\"f-info\\\"[^>]*>(.*?)</div>", html, re.S)
-                if not m_info:
-                    m_info = re.search(r"<div[^>]*class=\"f-info\"[^>]*>(.*?)</div>", html, re.S)
-                raw_info = m_info.group(1) if m_info else ""
-                # Strip tags and normalize whitespace.
-                info_txt = re.sub(r"<[^>]+>", "", raw_info)
-                info_txt = (
-                    info_txt.replace("\\x3C", "<")
-                    .replace("\\x3E", ">")
-                    .replace("&nbsp;", " ")
-                    .replace("&amp;", "&")
-                    .replace("&lt;", "<")
-                    .replace("&gt;", ">")
-                    .replace("&#39;", "'")
-                    .replace("&quot;", "\"")
-                )
-                info_txt = re.sub(r"\s+", " ", info_txt).strip()
-
-                posts.append(
-                    MoodPost(
-                        host_uin=host_uin,
-                        tid=tid,
-                        topic_id=topic_id,
-                        abstime=abstime,
-                        feedstime=feedstime,
-                        text=info_txt,
-                    )
+            posts.append(
+                MoodPost(
+                    host_uin=host_uin,
+                    tid=tid,
+                    topic_id=topic_id,
+                    abstime=item.abstime,
+                    feedstime=item.feedstime,
+                    text=item.text,
                 )
+            )
 
-            start += count
+        self._page_stats = (extracted_items, feed_data_tag_hits, self_posts)
+        return posts
+
+    def _page_url(self, start: int, count: int) -> str:
+        return (
+            "https://user.qzone.qq.com/proxy/domain/ic2.qzone.qq.com/cgi-bin/feeds/feeds_html_act_all"
+            f"?uin={self.my_qq or self.host_uin}&hostuin={self.host_uin}"
+            "&scope=0&filter=all&flag=1&refresh=0&firstGetGroup=0&mixnocache=0&scene=0"
+            f"&begintime=undefined&icServerTime=&start={start}&count={count}"
+            "&sidomain=qzonestyle.gtimg.cn&useutf8=1&outputhtmlfeed=1&refer=2"
+            f"&r={random.random()}&g_tk={self.g_tk}"
+        )
+
+    @staticmethod
+    def _normalize_paging(count: int, max_pages: int) -> Tuple[int, int]:
+        count = int(count) if count else 20
+        if count <= 0:
+            count = 20
+        max_pages = int(max_pages) if max_pages else 1
+        if max_pages <= 0:
+            max_pages = 1
+        return count, max_pages
 
+    def _finish(self, posts: List[MoodPost]) -> List[MoodPost]:
         seen = set()
         out: List[MoodPost] = []
         for p in posts:
@@ -425,6 +296,7 @@ class QzoneFeedFetcher:
             out.append(p)
 
         try:
+            extracted_items, feed_data_tag_hits, self_posts = self._page_stats
             msg = (
                 "[Qzone][feed_fetch] "
                 f"status=200 extracted_items={extracted_items} feed_data_tag_hits={feed_data_tag_hits} "
@@ -434,4 +306,57 @@ class QzoneFeedFetcher:
         except Exception:
             self.last_diag = ""
 
-        return 200, out
+        return out
+
+    def fetch_mood_posts(self, count: int = 20, max_pages: int = 3) -> Tuple[int, List[MoodPost]]:
+        """Fetch latest mood posts from your own space (main page feed), across pages.
+
+        Uses feeds_html_act_all with uin=loginQQ and hostuin=targetQQ (here we use my_qq).
+        This matches what the browser loads on /<uin>/main.
+        """
+
+        count, max_pages = self._normalize_paging(count, max_pages)
+        posts: List[MoodPost] = []
+        start = 0
+
+        for _ in range(max_pages):
+            page = self._get_page(start, count)
+            if page.status != 200 or not page.text:
+                if start == 0:
+                    return page.status, []
+                break
+
+            posts.extend(self._page_posts(page))
+            start += count
+
+        return 200, self._finish(posts)
+
+
+class AsyncQzoneFeedFetcher(QzoneFeedFetcher):
+    """Same API as QzoneFeedFetcher, but fetch_mood_posts is awaitable (non-blocking HTTP)."""
+
+    async def _load_page(self, start: int, count: int) -> Tuple[int, str]:
+        res = await async_get(self._page_url(start, count), headers=self.headers, timeout=20, pool=self.pool)
+        return res.status_code, res.text or ""
+
+    async def _get_page(self, start: int, count: int) -> FeedPage:
+        if self.feed_cache is None:
+            return FeedPage(*await self._load_page(start, count))
+        return await self.feed_cache.get(self._page_key(start, count), lambda: self._load_page(start, count))
+
+    async def fetch_mood_posts(self, count: int = 20, max_pages: int = 3) -> Tuple[int, List[MoodPost]]:
+        count, max_pages = self._normalize_paging(count, max_pages)
+        posts: List[MoodPost] = []
+        start = 0
+
+        for _ in range(max_pages):
+            page = await self._get_page(start, count)
+            if page.status != 200 or not page.text:
+                if start == 0:
+                    return page.status, []
+                break
+
+            posts.extend(self._page_posts(page))
+            start += count
+
+        return 200, self._finish(posts)
@@ -0,0 +1,297 @@
+# qzone_feed_html.py
+# feed 条目内嵌 HTML 的公共提取：先把 \" \' \/ \x3C 等转义统一还原一次，再用预编译的单个正则取属性，
+# 避免对每条 feed 反复跑“转义双引号 / 双引号 / 单引号”三套正则。
+
+from __future__ import annotations
+
+import hashlib
+import re
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+_HTML_ESCAPES = (
+    ('\\"', '"'),
+    ("\\'", "'"),
+    ("\\/", "/"),
+    ("\\x3C", "<"),
+    ("\\x3E", ">"),
+    ("\\x22", '"'),
+)
+
+_FEED_DATA_TAG_RE = re.compile(r"<i\b[^>]*\bname=[\"']feed_data[\"'][^>]*>", re.I)
+# 一条 feed 的外层 <li class="f-single ...">（不匹配 f-single-head 之类的子元素）
+_FEED_BLOCK_RE = re.compile(r"<li\b[^>]*\bclass=[\"'](?:[^\"']*\s)?f-single(?=[\s\"'])", re.I)
+# data-xxx="..." / data-xxx='...' / data-xxx=bare
+_DATA_ATTR_RE = re.compile(r"\b(data-[\w-]+)\s*=\s*(?:\"([^\"]*)\"|'([^']*)'|([^\s\"'>]+))")
+_STATE_TIME_RE = re.compile(
+    r"<span[^>]*\bclass=[\"'][^\"']*\bstate\b[^\"']*[\"'][^>]*>\s*(\d{4}年\d{1,2}月\d{1,2}日\s*\d{1,2}:\d{2})\s*</span>",
+    re.S,
+)
+_F_INFO_RE = re.compile(r"<div[^>]*class=[\"']f-info[\"'][^>]*>(.*?)</div>", re.S)
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+# mood 链接（点赞用 key），回包里可能是 http:\/\/ 转义形式
+_MOOD_LINK_RE = re.compile(r"(http[s]?[:\\/]+user\.qzone\.qq\.com[:\\/]+\d+[:\\/]+mood[:\\/]+[a-f0-9]+)")
+_COMMENT_ROOT_RE = re.compile(
+    r"comments-item[^>]*data-type=\"commentroot\"[^>]*data-tid=\"(\d+)\"[^>]*data-uin=\"(\d+)\"",
+    re.I,
+)
+
+
+@dataclass
+class FeedTag:
+    """Attributes of one feed's `<i name="feed_data" ...>` tag (plus the normalized html)."""
+
+    html: str
+    attrs: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def tid(self) -> str:
+        return self.attrs.get("data-tid", "")
+
+    @property
+    def topic_id(self) -> str:
+        return self.attrs.get("data-topicid", "")
+
+    @property
+    def uin(self) -> str:
+        return self.attrs.get("data-uin", "")
+
+    @property
+    def abstime(self) -> int:
+        v = self.attrs.get("data-abstime", "")
+        return int(v) if v.isdigit() else 0
+
+
+def normalize_html(html: str) -> str:
+    """Undo the JS string escapes left in feed html (\\" \\' \\/ \\x3C ...), once."""
+
+    if "\\" not in html:
+        return html
+    for esc, ch in _HTML_ESCAPES:
+        if esc in html:
+            html = html.replace(esc, ch)
+    return html
+
+
+def parse_data_attrs(tag: str) -> Dict[str, str]:
+    """All data-* attributes of a tag in one pass (first occurrence wins)."""
+
+    out: Dict[str, str] = {}
+    for m in _DATA_ATTR_RE.finditer(tag):
+        key = m.group(1).lower()
+        if key not in out:
+            v = m.group(2)
+            if v is None:
+                v = m.group(3) if m.group(3) is not None else m.group(4)
+            out[key] = v
+    return out
+
+
+def feed_data(html: str) -> FeedTag:
+    """Normalize `html` and extract its feed_data tag attributes (empty attrs when absent)."""
+
+    html = normalize_html(html or "")
+    m = _FEED_DATA_TAG_RE.search(html)
+    if not m:
+        return FeedTag(html)
+    return FeedTag(html, parse_data_attrs(m.group(0)))
+
+
+def iter_feed_blocks(html: str) -> Iterator[Tuple[Dict[str, str], int, int]]:
+    """(feed_data attrs, start, end) of each feed in a multi-feed document (normalized html).
+
+    The document is cut once at the feed boundaries (`<li class="f-single">`, or the feed_data
+    tags themselves when those are missing), so the ranges never overlap and every comment in
+    the document falls in exactly one feed. Blocks without a feed_data tag are skipped.
+    """
+
+    starts = [m.start() for m in _FEED_BLOCK_RE.finditer(html)]
+    if starts:
+        bounds = starts + [len(html)]
+        for start, end in zip(bounds, bounds[1:]):
+            m = _FEED_DATA_TAG_RE.search(html, start, end)
+            if m:
+                yield parse_data_attrs(m.group(0)), start, end
+        return
+
+    tags = list(_FEED_DATA_TAG_RE.finditer(html))
+    for i, m in enumerate(tags):
+        end = tags[i + 1].start() if i + 1 < len(tags) else len(html)
+        yield parse_data_attrs(m.group(0)), m.end(), end
+
+
+def state_time(html: str) -> str:
+    """Display time from the header `<span class="state">2025年12月11日 01:39</span>` (normalized html)."""
+
+    m = _STATE_TIME_RE.search(html)
+    return m.group(1).strip() if m else ""
+
+
+def info_text(html: str) -> str:
+    """Visible mood text from the `<div class="f-info">` block (normalized html)."""
+
+    m = _F_INFO_RE.search(html)
+    raw_info = m.group(1) if m else ""
+    if not raw_info:
+        return ""
+    # Strip tags and normalize whitespace.
+    txt = _TAG_RE.sub("", raw_info)
+    txt = (
+        txt.replace("&nbsp;", " ")
+        .replace("&amp;", "&")
+        .replace("&lt;", "<")
+        .replace("&gt;", ">")
+        .replace("&#39;", "'")
+        .replace("&quot;", "\"")
+    )
+    return _WS_RE.sub(" ", txt).strip()
+
+
+@dataclass
+class FeedItem:
+    """One feed entry of a feeds response, parsed once and shared by like / comment / protect.
+
+    tid, topic_id, host_uin and abstime come from the feed_data tag; everything else (like key,
+    liked-by-me, comments, text, digest) is only parsed when a consumer first asks for it, so
+    each consumer pays for its own slice and nobody parses the same entry twice.
+    """
+
+    html: str  # normalized
+    attrs: Dict[str, str] = field(default_factory=dict)
+    abstime: int = 0
+    payload_time: str = ""  # feedstime field of the payload entry, when present
+    raw_html: str = field(default="", repr=False)
+
+    @property
+    def tid(self) -> str:
+        return self.attrs.get("data-tid", "")
+
+    @property
+    def topic_id(self) -> str:
+        return self.attrs.get("data-topicid", "")
+
+    @property
+    def host_uin(self) -> str:
+        return self.attrs.get("data-uin", "")
+
+    @cached_property
+    def digest(self) -> str:
+        """Digest of the raw html: an entry identical to an earlier poll has nothing new."""
+
+        return feed_digest(self.raw_html or self.html)
+
+    @cached_property
+    def _like_button(self) -> Dict[str, str]:
+        # <a class="item qz_like_btn_v3" data-islike="0|1" data-unikey="<mood 链接>" ...>
+        i = self.html.find("qz_like_btn")
+        if i < 0:
+            return {}
+        start = self.html.rfind("<a", 0, i)
+        end = self.html.find(">", i)
+        if start < 0 or end < 0:
+            return {}
+        return parse_data_attrs(self.html[start:end])
+
+    @cached_property
+    def like_key(self) -> str:
+        """Mood link for internal_dolike_app (without the ".1" suffix); "" when not likeable.
+
+        send_like only speaks the mood (appid 311) protocol, so photo / share / blog feeds get no
+        key even though their like button carries a unikey.
+        """
+
+        if self.attrs.get("data-appid", "311") != "311":
+            return ""
+        btn = self._like_button
+        key = (btn.get("data-unikey") or btn.get("data-curkey") or "").replace("\\", "")
+        if key and _MOOD_LINK_RE.fullmatch(key):
+            return key
+        m = _MOOD_LINK_RE.search(self.html)
+        if m:
+            return m.group(1).replace("\\", "")
+        if self.attrs.get("data-appid") == "311" and self.host_uin and self.tid:
+            return f"http://user.qzone.qq.com/{self.host_uin}/mood/{self.tid}"
+        return ""
+
+    @cached_property
+    def liked(self) -> Optional[bool]:
+        """data-islike of the like button (already liked by the viewer); None when unknown."""
+
+        v = self._like_button.get("data-islike")
+        return v == "1" if v in ("0", "1") else None
+
+    @cached_property
+    def comments(self) -> List[Tuple[str, str]]:
+        """(comment_id, comment_uin) of the root comments shown under this entry."""
+
+        return list(iter_comment_roots(self.html))
+
+    @cached_property
+    def text(self) -> str:
+        return info_text(self.html)
+
+    @cached_property
+    def feedstime(self) -> str:
+        return self.payload_time or state_time(self.html)
+
+
+def feed_digest(html: str) -> str:
+    return hashlib.blake2b(html.encode("utf-8", "ignore"), digest_size=8).hexdigest()
+
+
+def feed_item(raw: Dict[str, Any]) -> Optional[FeedItem]:
+    """FeedItem from a payload entry ({html, abstime, feedstime, ...}); None when it has no html."""
+
+    raw_html = str(raw.get("html") or "")
+    if not raw_html:
+        return None
+    feed = feed_data(raw_html)
+    # data-abstime in the embedded html avoids JS-literal quirks; the payload field is the fallback
+    abstime = feed.abstime
+    if not abstime:
+        try:
+            abstime = int(str(raw.get("abstime") or 0))
+        except Exception:
+            abstime = 0
+    return FeedItem(
+        html=feed.html,
+        attrs=feed.attrs,
+        abstime=abstime,
+        payload_time=str(raw.get("feedstime") or "").strip(),
+        raw_html=raw_html,
+    )
+
+
+def feed_items(raw_items: List[Dict[str, Any]]) -> List[FeedItem]:
+    out: List[FeedItem] = []
+    for raw in raw_items:
+        if isinstance(raw, dict):
+            item = feed_item(raw)
+            if item is not None:
+                out.append(item)
+    return out
+
+
+def iter_comment_roots(html: str, pos: int = 0, endpos: int = -1) -> Iterator[Tuple[str, str]]:
+    """(comment_id, comment_uin) of each root comment `<li class="comments-item" data-type="commentroot">`."""
+
+    if endpos < 0:
+        endpos = len(html)
+    for m in _COMMENT_ROOT_RE.finditer(html, pos, endpos):
+        yield m.group(1), m.group(2)
+
+
+def mood_keys(text: str) -> Set[str]:
+    """Unique mood links (like keys) in a raw feeds response, with `\\/` escapes removed."""
+
+    return {link.replace("\\", "") for link in _MOOD_LINK_RE.findall(text or "")}
+
+
+def like_keys(items: List[FeedItem], text: str = "") -> Set[str]:
+    """Like keys of `items`; falls back to scanning the raw response when no entry could be parsed."""
+
+    if not items and text:
+        return mood_keys(text)
+    return {it.like_key for it in items if it.like_key}
@@ -0,0 +1,348 @@
+# qzone_http.py
+# 进程级 HTTP 连接池：所有 Qzone 客户端共用 keep-alive 连接，避免每次请求都重新握手 TLS。
+# 同时提供非阻塞（asyncio）传输层，供各客户端的 Async* 变体使用。
+# 可选 base_url：把所有 *.qzone.qq.com 请求改写到本地 mock（benchmarks/mock_qzone.py）做压测，不碰真实账号。
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+from dataclasses import dataclass
+from functools import cached_property
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import aiohttp
+except Exception:  # aiohttp ships with AstrBot; without it the async path falls back to threads.
+    aiohttp = None
+
+# user.qzone.qq.com / h5.qzone.qq.com 是主要目标，留一点余量给跳转后的域名。
+DEFAULT_POOL_HOSTS = 8
+DEFAULT_MAX_CONNECTIONS = 16
+
+_lock = threading.Lock()
+_session: Optional[requests.Session] = None
+_pool_hosts = DEFAULT_POOL_HOSTS
+_max_connections = DEFAULT_MAX_CONNECTIONS
+
+_base_url = ""
+
+
+
+def rewrite_url(url: str, base_url: Optional[str] = None) -> str:
+    """Point a *.qzone.qq.com URL at `base_url` (default: the configured one), keeping path + query.
+
+    Other hosts and the no-base_url case are returned unchanged.
+    """
+
+    base = _base_url if base_url is None else base_url
+    if not base:
+        return url
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    if host != "qzone.qq.com" and not host.endswith(".qzone.qq.com"):
+        return url
+    tail = parts.path or "/"
+    if parts.query:
+        tail += "?" + parts.query
+    return base.rstrip("/") + tail
+
+
+class _QzoneSession(requests.Session):
+    """requests.Session that applies rewrite_url() to every request."""
+
+    base_url: Optional[str] = None  # None = follow the process-wide setting
+
+    def request(self, method: str, url: Any, *args: Any, **kwargs: Any) -> requests.Response:
+        return super().request(method, rewrite_url(str(url), self.base_url), *args, **kwargs)
+
+
+def new_session(
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    pool_hosts: int = DEFAULT_POOL_HOSTS,
+    base_url: Optional[str] = None,
+) -> requests.Session:
+    """Build a keep-alive session with one connection pool per host.
+
+    - pool_hosts: how many host pools are cached
+    - max_connections: max kept-alive connections per host
+    - base_url: rewrite Qzone hosts to this origin (None = process-wide setting, "" = never)
+
+    Cookies are always sent explicitly via the `cookie` header, so the session cookie jar
+    is disabled; otherwise Set-Cookie from one response could leak into other requests.
+    """
+
+    max_connections = max(1, int(max_connections or DEFAULT_MAX_CONNECTIONS))
+    pool_hosts = max(1, int(pool_hosts or DEFAULT_POOL_HOSTS))
+
+    s = _QzoneSession()
+    s.base_url = base_url
+    s.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_connections=pool_hosts, pool_maxsize=max_connections, pool_block=False)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    return s
+
+
+def configure(max_connections: int = 0, pool_hosts: int = 0, base_url: Optional[str] = None) -> None:
+    """Resize the shared pool. Existing idle connections are closed; in-flight ones finish normally.
+
+    base_url (e.g. "http://127.0.0.1:8780") redirects all Qzone requests, sync and async, to a
+    mock server; "" restores the real hosts, None leaves the current setting.
+    """
+
+    global _session, _max_connections, _pool_hosts, _base_url
+    if base_url is not None:
+        _base_url = str(base_url).strip()
+    with _lock:
+        mc = max(1, int(max_connections or _max_connections))
+        ph = max(1, int(pool_hosts or _pool_hosts))
+        if _session is not None and (mc, ph) == (_max_connections, _pool_hosts):
+            return
+        _max_connections, _pool_hosts = mc, ph
+        old, _session = _session, None
+    if old is not None:
+        try:
+            old.close()
+        except Exception:
+            pass
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide pooled session (created lazily)."""
+
+    global _session
+    s = _session
+    if s is not None:
+        return s
+    with _lock:
+        if _session is None:
+            _session = new_session(_max_connections, _pool_hosts)
+        return _session
+
+
+def close() -> None:
+    """Drop the shared session (used on plugin unload / hot reload)."""
+
+    global _session
+    with _lock:
+        old, _session = _session, None
+    if old is not None:
+        try:
+            old.close()
+        except Exception:
+            pass
+
+
+@dataclass
+class HttpResult:
+    """Minimal response object returned by the async transport.
+
+    Mirrors the parts of requests.Response the clients use (status_code/content/text),
+    so response parsing is shared between sync and async clients.
+    """
+
+    status_code: int
+    content: bytes
+    encoding: str = "utf-8"
+
+    @cached_property
+    def text(self) -> str:
+        try:
+            return self.content.decode(self.encoding or "utf-8", errors="replace")
+        except LookupError:
+            return self.content.decode("utf-8", errors="replace")
+
+
+def _new_async_session(max_connections: int, pool_hosts: int) -> Any:
+    connector = aiohttp.TCPConnector(
+        limit=max_connections * pool_hosts,
+        limit_per_host=max_connections,
+        keepalive_timeout=30,
+    )
+    # Same as the sync session: cookies are sent explicitly, never stored.
+    return aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar())
+
+
+class _AsyncSessions:
+    """aiohttp sessions keyed by event loop.
+
+    A session (and its pooled connections) belongs to the loop it was created on, so each loop
+    gets its own instead of replacing, and leaking, the previous one. aclose() closes them all,
+    another running loop's session through run_coroutine_threadsafe. Sessions of loops closed in
+    the meantime are closed on the next lookup; aiohttp can't touch a closed loop's transports,
+    so their idle sockets are only released by the GC (call aclose() before closing a loop).
+    """
+
+    def __init__(self) -> None:
+        self._by_loop: Dict[asyncio.AbstractEventLoop, Any] = {}
+        self._lock = threading.Lock()
+
+    async def get(self, max_connections: int, pool_hosts: int) -> Any:
+        if aiohttp is None:
+            raise RuntimeError("aiohttp is not installed")
+        loop = asyncio.get_running_loop()
+        dead = []
+        with self._lock:
+            s = self._by_loop.get(loop)
+            if s is None or s.closed:
+                dead = [self._by_loop.pop(l) for l in list(self._by_loop) if l.is_closed()]
+                s = self._by_loop[loop] = _new_async_session(max_connections, pool_hosts)
+        for old in dead:
+            await _close_session(old)
+        return s
+
+    async def aclose(self) -> None:
+        with self._lock:
+            sessions, self._by_loop = list(self._by_loop.items()), {}
+        current = asyncio.get_running_loop()
+        for loop, s in sessions:
+            if loop is current or loop.is_closed() or not loop.is_running():
+                await _close_session(s)
+            else:
+                try:
+                    await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(_close_session(s), loop))
+                except Exception:
+                    pass
+
+
+async def _close_session(s: Any) -> None:
+    if s is not None and not s.closed:
+        try:
+            await s.close()
+        except Exception:
+            pass
+
+
+_async_sessions = _AsyncSessions()
+
+
+async def get_async_session() -> Any:
+    """Return the aiohttp session bound to the running loop (created lazily).
+
+    Connections are pooled per host (limit_per_host=max_connections) and requests beyond
+    the limit wait in the connector instead of occupying executor threads.
+    """
+
+    return await _async_sessions.get(_max_connections, _pool_hosts)
+
+
+class HttpPool:
+    """A private pair of pools (requests + aiohttp) for one account.
+
+    The process-wide pool above is shared by everything that doesn't pass a pool; extra
+    accounts get their own so a slow or throttled account can't hold another one's
+    connections. base_url rewriting applies the same way.
+    """
+
+    def __init__(self, max_connections: int = DEFAULT_MAX_CONNECTIONS, pool_hosts: int = DEFAULT_POOL_HOSTS):
+        self.max_connections = max(1, int(max_connections or DEFAULT_MAX_CONNECTIONS))
+        self.pool_hosts = max(1, int(pool_hosts or DEFAULT_POOL_HOSTS))
+        self._session: Optional[requests.Session] = None
+        self._lock = threading.Lock()
+        self._async_sessions = _AsyncSessions()
+
+    @property
+    def session(self) -> requests.Session:
+        # reached from to_thread workers too: same double-checked lock as get_session()
+        s = self._session
+        if s is not None:
+            return s
+        with self._lock:
+            if self._session is None:
+                self._session = new_session(self.max_connections, self.pool_hosts)
+            return self._session
+
+    async def get_async_session(self) -> Any:
+        return await self._async_sessions.get(self.max_connections, self.pool_hosts)
+
+    def close(self) -> None:
+        with self._lock:
+            old, self._session = self._session, None
+        if old is not None:
+            try:
+                old.close()
+            except Exception:
+                pass
+
+    async def aclose(self) -> None:
+        self.close()
+        await self._async_sessions.aclose()
+
+
+async def async_request(
+    method: str,
+    url: str,
+    *,
+    headers: Optional[Dict[str, str]] = None,
+    params: Optional[Dict[str, Any]] = None,
+    data: Optional[Dict[str, Any]] = None,
+    timeout: float = 20,
+    pool: Optional[HttpPool] = None,
+) -> HttpResult:
+    url = rewrite_url(url)
+    if aiohttp is None:
+        sync_session = pool.session if pool is not None else get_session()
+        res = await asyncio.to_thread(
+            sync_session.request, method, url, headers=headers, params=params, data=data, timeout=timeout
+        )
+        # requests falls back to ISO-8859-1 for text/* without a charset, which garbles Chinese;
+        # like resp.charset below, only an explicit charset counts, otherwise utf-8.
+        explicit = "charset=" in str(res.headers.get("content-type", "")).lower()
+        return HttpResult(res.status_code, res.content or b"", (res.encoding if explicit else "") or "utf-8")
+
+    s = await (pool.get_async_session() if pool is not None else get_async_session())
+    async with s.request(
+        method,
+        url,
+        headers=headers,
+        params=params,
+        data=data,
+        timeout=aiohttp.ClientTimeout(total=timeout),
+    ) as resp:
+        body = await resp.read()
+        return HttpResult(resp.status, body, resp.charset or "utf-8")
+
+
+async def async_get(url: str, **kwargs: Any) -> HttpResult:
+    return await async_request("GET", url, **kwargs)
+
+
+async def async_post(url: str, **kwargs: Any) -> HttpResult:
+    return await async_request("POST", url, **kwargs)
+
+
+async def aclose() -> None:
+    """Close the aiohttp sessions (used on plugin unload / hot reload)."""
+
+    await _async_sessions.aclose()
+
+
+async def call(fn: Any, *args: Any, **kwargs: Any) -> Any:
+    """Run a client method from the event loop.
+
+    Async client methods are awaited directly; sync ones go to the default thread pool,
+    so callers don't need to know which client variant they hold.
+
+    If the bound client carries a `limiter` (qz_ratelimit.RateLimiter), a token for the
+    method's endpoint is taken first, so every call site shares the account's budget, and
+    the endpoint's last_used is stamped once the call has finished.
+    """
+
+    limiter = getattr(getattr(fn, "__self__", None), "limiter", None)
+    name = getattr(fn, "__name__", "")
+    if limiter is not None:
+        await limiter.acquire_for(name)
+    try:
+        if inspect.iscoroutinefunction(fn):
+            return await fn(*args, **kwargs)
+        return await asyncio.to_thread(fn, *args, **kwargs)
+    finally:
+        if limiter is not None:
+            limiter.mark_used(name)
@@ -0,0 +1,354 @@
+# qzone_jsparse.py
+# Qzone `_Callback({...})` 回包解析：这些接口返回的是 JS 对象字面量（单引号、无引号 key、undefined、\x3C 转义），
+# 不是严格 JSON，json.loads 基本都会失败。这里用一个单遍的增量解析器把它转成 Python dict/list。
+#
+# - parse_value(text, pos) / parse(text)：解析一个 JS 字面量值
+# - parse_callback(text)：定位 _Callback( / callback( / frameElement.callback( 并解析其中的对象
+# - iter_array(text, name)：快速路径，只逐个产出 `name:[...]` 数组里的元素（调用方可随时停止）
+# - slice_html_items(text, name)：回包不是合法字面量时的兜底，按 `html:` ... `,opuin:` 锚点切出每条的 html
+
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+_WS_RE = re.compile(r"\s*")
+_IDENT_RE = re.compile(r"[A-Za-z_$][\w$]*")
+_NUM_RE = re.compile(r"[+-]?(?:0[xX][0-9a-fA-F]+|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)")
+_STRING_RE = {
+    "'": re.compile(r"'([^'\\]*(?:\\.[^'\\]*)*)'", re.S),
+    '"': re.compile(r'"([^"\\]*(?:\\.[^"\\]*)*)"', re.S),
+}
+_ESCAPE_RE = re.compile(r"\\(?:x([0-9a-fA-F]{2})|u\{([0-9a-fA-F]{1,6})\}|u([0-9a-fA-F]{4})|(\r\n|[\s\S]))")
+_SURROGATE_RE = re.compile("[\ud800-\udfff]")
+_COMMON_ESCAPES = (
+    ("\\x3C", "<"),
+    ("\\x3E", ">"),
+    ("\\x3c", "<"),
+    ("\\x3e", ">"),
+    ("\\x22", '"'),
+    ("\\x27", "'"),
+    ("\\x26", "&"),
+    ("\\/", "/"),
+    ('\\"', '"'),
+    ("\\'", "'"),
+)
+_SIMPLE_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "v": "\v", "0": "\0"}
+_KEYWORDS: Dict[str, Any] = {
+    "true": True,
+    "false": False,
+    "null": None,
+    "undefined": None,
+    "NaN": float("nan"),
+    "Infinity": float("inf"),
+}
+_CALLBACK_RE = re.compile(r"(?:\b_Callback|\bcallback|\bcb)\s*\(\s*")
+_ARRAY_TOKEN_RE = re.compile(r"[\"'\[\]]")
+# Body of a quoted JS string after its opening quote, up to and including the closing quote.
+_STRING_TAIL_RE = {
+    "'": re.compile(r"[^'\\]*(?:\\.[^'\\]*)*'", re.S),
+    '"': re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.S),
+}
+_HTML_KEY_RE = re.compile(r"\bhtml\s*:\s*")
+_OPUIN_KEY_RE = re.compile(r",\s*opuin\s*:\s*")
+_UIN_KEY_RE = re.compile(r",\s*uin\s*:\s*")
+_ABSTIME_RE = re.compile(r"\babstime\s*:\s*'?([0-9]{6,})'?")
+
+
+class JsParseError(ValueError):
+    def __init__(self, msg: str, pos: int):
+        super().__init__(f"{msg} at {pos}")
+        self.pos = pos
+
+
+def _unescape_match(m: re.Match) -> str:
+    hx, ucp, u4, other = m.group(1), m.group(2), m.group(3), m.group(4)
+    if hx is not None:
+        return chr(int(hx, 16))
+    if u4 is not None:
+        return chr(int(u4, 16))
+    if ucp is not None:
+        cp = int(ucp, 16)
+        return chr(cp) if cp <= 0x10FFFF else ""
+    if other in ("\n", "\r\n", "\r", "\u2028", "\u2029"):
+        return ""  # line continuation
+    return _SIMPLE_ESCAPES.get(other, other)
+
+
+def unescape(raw: str) -> str:
+    """Decode JS string escapes (\\x3C, \\u4f60, \\/, \\', \\n ...). Surrogate pairs are joined."""
+
+    if "\\" not in raw:
+        return raw
+    out = raw
+    if "\\\\" not in out:
+        # Fast path for the escapes Qzone html is full of. Without escaped backslashes every `\` starts
+        # an escape and none of these replacements produce one, so the leftovers can be decoded after.
+        for esc, ch in _COMMON_ESCAPES:
+            if esc in out:
+                out = out.replace(esc, ch)
+        if "\\" not in out:
+            return out
+    out = _ESCAPE_RE.sub(_unescape_match, out)
+    if _SURROGATE_RE.search(out):
+        out = out.encode("utf-16", "surrogatepass").decode("utf-16", "replace")
+    return out
+
+
+def _skip_ws(s: str, pos: int) -> int:
+    return _WS_RE.match(s, pos).end()
+
+
+def _parse_string(s: str, pos: int) -> Tuple[str, int]:
+    m = _STRING_RE[s[pos]].match(s, pos)
+    if not m:
+        raise JsParseError("unterminated string", pos)
+    return unescape(m.group(1)), m.end()
+
+
+def _parse_number(s: str, pos: int) -> Tuple[Any, int]:
+    m = _NUM_RE.match(s, pos)
+    if not m:
+        raise JsParseError("bad number", pos)
+    t = m.group(0)
+    try:
+        if "x" in t or "X" in t:
+            return int(t, 16), m.end()
+        if "." in t or "e" in t or "E" in t:
+            return float(t), m.end()
+        return int(t), m.end()
+    except ValueError:
+        raise JsParseError("bad number", pos)
+
+
+def _parse_key(s: str, pos: int) -> Tuple[str, int]:
+    ch = s[pos] if pos < len(s) else ""
+    if ch in ("'", '"'):
+        return _parse_string(s, pos)
+    m = _IDENT_RE.match(s, pos) or _NUM_RE.match(s, pos)
+    if not m:
+        raise JsParseError("bad object key", pos)
+    return m.group(0), m.end()
+
+
+def _parse_object(s: str, pos: int) -> Tuple[Dict[str, Any], int]:
+    out: Dict[str, Any] = {}
+    pos = _skip_ws(s, pos + 1)
+    while True:
+        if pos >= len(s):
+            raise JsParseError("unterminated object", pos)
+        if s[pos] == "}":
+            return out, pos + 1
+        key, pos = _parse_key(s, pos)
+        pos = _skip_ws(s, pos)
+        if pos >= len(s) or s[pos] != ":":
+            raise JsParseError("expected ':'", pos)
+        value, pos = parse_value(s, pos + 1)
+        out[key] = value
+        pos = _skip_ws(s, pos)
+        if pos < len(s) and s[pos] == ",":
+            pos = _skip_ws(s, pos + 1)
+        elif pos < len(s) and s[pos] != "}":
+            raise JsParseError("expected ',' or '}'", pos)
+
+
+def _iter_array_items(s: str, pos: int, end_box: List[int]) -> Iterator[Any]:
+    """Yield elements of the array whose body starts at `pos` (just after `[`).
+
+    The offset just past the closing `]` is appended to `end_box` once the array is exhausted.
+    """
+
+    pos = _skip_ws(s, pos)
+    while True:
+        if pos >= len(s):
+            raise JsParseError("unterminated array", pos)
+        ch = s[pos]
+        if ch == "]":
+            end_box.append(pos + 1)
+            return
+        if ch == ",":
+            # elision: [a,,b]
+            yield None
+            pos = _skip_ws(s, pos + 1)
+            continue
+        value, pos = parse_value(s, pos)
+        yield value
+        pos = _skip_ws(s, pos)
+        if pos < len(s) and s[pos] == ",":
+            pos = _skip_ws(s, pos + 1)
+        elif pos < len(s) and s[pos] != "]":
+            raise JsParseError("expected ',' or ']'", pos)
+
+
+def parse_value(s: str, pos: int = 0) -> Tuple[Any, int]:
+    """Parse one JS literal value starting at `pos` (leading whitespace allowed).
+
+    Returns (value, end_pos). Raises JsParseError on malformed input.
+    """
+
+    pos = _skip_ws(s, pos)
+    if pos >= len(s):
+        raise JsParseError("unexpected end", pos)
+    ch = s[pos]
+    if ch == "{":
+        return _parse_object(s, pos)
+    if ch == "[":
+        end_box: List[int] = []
+        items = list(_iter_array_items(s, pos + 1, end_box))
+        return items, end_box[0]
+    if ch in ("'", '"'):
+        return _parse_string(s, pos)
+    if ch.isdigit() or ch in "+-.":
+        return _parse_number(s, pos)
+    m = _IDENT_RE.match(s, pos)
+    if m and m.group(0) in _KEYWORDS:
+        return _KEYWORDS[m.group(0)], m.end()
+    raise JsParseError(f"unexpected {ch!r}", pos)
+
+
+def parse(text: str) -> Any:
+    """Parse a complete JS literal (trailing `;` / whitespace allowed)."""
+
+    value, end = parse_value(text, 0)
+    end = _skip_ws(text, end)
+    if end < len(text) and text[end:].strip() not in ("", ";"):
+        raise JsParseError("trailing data", end)
+    return value
+
+
+def parse_callback(text: str) -> Optional[Any]:
+    """Parse `_Callback({...});`, `frameElement.callback({...})`, `cb({...})` or a bare `{...}`.
+
+    Returns None when no callback payload can be parsed.
+    """
+
+    if not text:
+        return None
+    pos = _skip_ws(text, 0)
+    if pos < len(text) and text[pos] in "{[":
+        start = pos
+    else:
+        m = _CALLBACK_RE.search(text)
+        if not m:
+            return None
+        start = m.end()
+    try:
+        value, _ = parse_value(text, start)
+    except JsParseError:
+        return None
+    return value
+
+
+def iter_array(text: str, name: str) -> Iterator[Any]:
+    """Lazily yield the elements of the first `name:[...]` array in `text`.
+
+    Only the elements actually consumed are materialized, so callers that need the first N
+    feed items can stop early without parsing the rest of the payload. Yields nothing when
+    the key is absent; raises JsParseError on malformed elements.
+    """
+
+    if not text:
+        return
+    m = re.search(r"\b" + re.escape(name) + r"\s*:\s*\[", text)
+    if not m:
+        return
+    yield from _iter_array_items(text, m.end(), [])
+
+
+def _find_array_end(s: str, i: int) -> int:
+    """Return the index of the `]` closing the array whose body starts at `i` (-1 if unbalanced).
+
+    Jumps from token to token with positional regex searches; quoted strings are skipped whole,
+    so brackets inside html strings don't count.
+    """
+
+    depth = 1
+    pos = i
+    while True:
+        m = _ARRAY_TOKEN_RE.search(s, pos)
+        if not m:
+            return -1
+        ch = m.group(0)
+        if ch == "[":
+            depth += 1
+            pos = m.end()
+        elif ch == "]":
+            depth -= 1
+            if depth == 0:
+                return m.start()
+            pos = m.end()
+        else:
+            sm = _STRING_TAIL_RE[ch].match(s, m.end())
+            if not sm:
+                return -1
+            pos = sm.end()
+
+
+def _decode_html_blob(blob: str) -> str:
+    blob = blob.strip().rstrip(",")
+    if len(blob) >= 2 and blob[0] in ("'", '"') and blob[-1] == blob[0]:
+        html = blob[1:-1]
+    else:
+        html = blob
+
+    html = html.replace("\\x3C", "<").replace("\\x3E", ">")
+    html = html.replace("\\/", "/")
+    html = html.replace("\\\"", '"').replace("\\'", "'")
+    html = html.replace("\\x22", '"')
+    return html
+
+
+def slice_html_items(text: str, name: str, limit: int = 200) -> Optional[List[Dict[str, str]]]:
+    """Fallback for payloads iter_array can't parse: `{"html", "abstime"}` of each `name:[...]` item.
+
+    Slices from `html:` to the item's next `,opuin:` (`,uin:` when an item has no opuin) and decodes
+    the common escapes. Single forward pass bounded by the array: every search starts at the current
+    offset, never at a copied tail. Returns None when the array is absent or unbalanced.
+    """
+
+    if not text:
+        return None
+    m = re.search(r"\b" + re.escape(name) + r"\s*:\s*\[", text)
+    if not m:
+        return None
+    start = m.end()
+    end = _find_array_end(text, start)
+    if end < 0:
+        return None
+
+    out: List[Dict[str, str]] = []
+    pos = start
+    # Positions of the next `,opuin:` / `,uin:` anchors; reused while still ahead of `pos`
+    # so items without an opuin don't trigger a rescan of the whole remaining array.
+    next_opuin: Optional[re.Match] = None
+    next_uin: Optional[re.Match] = None
+    opuin_done = False
+    uin_done = False
+
+    while pos < end:
+        m = _HTML_KEY_RE.search(text, pos, end)
+        if not m:
+            break
+        blob_start = m.end()
+
+        end_m = None
+        if not opuin_done:
+            if next_opuin is None or next_opuin.start() < blob_start:
+                next_opuin = _OPUIN_KEY_RE.search(text, blob_start, end)
+                opuin_done = next_opuin is None
+            end_m = next_opuin
+        if end_m is None and not uin_done:
+            if next_uin is None or next_uin.start() < blob_start:
+                next_uin = _UIN_KEY_RE.search(text, blob_start, end)
+                uin_done = next_uin is None
+            end_m = next_uin
+        if end_m is None:
+            break
+
+        am = _ABSTIME_RE.search(text, blob_start, min(blob_start + 2000, end))
+        out.append({"html": _decode_html_blob(text[blob_start : end_m.start()]), "abstime": am.group(1) if am else ""})
+        if limit > 0 and len(out) >= limit:
+            break
+        pos = end_m.end()
+
+    return out
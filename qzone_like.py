@@ -0,0 +1,249 @@
+# qzone_like.py
+# QQ空间点赞（拉取 feeds 里的 mood 链接 + internal_dolike_app）
+
+from __future__ import annotations
+
+import random
+import re
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import requests
+
+from .qz_feed_cache import FeedCache, FeedPage
+from .qzone_comment import _get_gtk, _pick_skey_for_gtk
+from .qzone_feed_fetch import parse_act_all_page
+from .qzone_feed_html import FeedItem, like_keys
+from .qzone_http import HttpPool, async_get, async_post, get_session
+from .qzone_protect import feeds3_request, parse_feeds3_page
+
+
+class QzoneLikeClient:
+    def __init__(
+        self,
+        my_qq: str,
+        cookie: str,
+        session: Optional[requests.Session] = None,
+        pool: Optional[HttpPool] = None,
+        limiter: Any = None,
+        feed_cache: Optional[FeedCache] = None,
+    ):
+        # my_qq: 当前登录 Cookie 对应的 QQ（用于 referer / opuin）
+        self.my_qq = my_qq
+
+        # 兼容用户从 DevTools 里复制整行 "cookie: ..." 的情况
+        cookie = (cookie or "").strip()
+        if cookie.lower().startswith("cookie:"):
+            cookie = cookie.split(":", 1)[1].strip()
+
+        self.cookie = cookie
+
+        skey_for_gtk = _pick_skey_for_gtk(cookie)
+        if not skey_for_gtk:
+            raise ValueError("cookie 缺少 p_skey/skey/media_p_skey（无法计算 g_tk）")
+
+        self.g_tk = _get_gtk(skey_for_gtk)
+        self.headers = {
+            "user-agent": (
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                "(KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36"
+            ),
+            "cookie": cookie,
+            "referer": f"https://user.qzone.qq.com/{my_qq}",
+        }
+        # 共用进程级连接池（keep-alive），避免每次点赞/拉取都重新 TLS 握手。
+        self.pool = pool
+        self.limiter = limiter  # qz_ratelimit.RateLimiter，经 qzone_http.call 调用时按接口取令牌
+        # 账号级 feeds 页缓存：act_all 页与 QzoneFeedFetcher 共用，feeds3 页与护评扫描共用；None = 不缓存
+        self.feed_cache = feed_cache
+        self.session = session or (pool.session if pool is not None else get_session())
+
+    def _feeds_key(self, count: int, target_qq: Optional[str] = None, start: int = 0) -> Tuple[str, str, int, int]:
+        return ("act_all", str(target_qq or self.my_qq).strip(), int(start), int(count))
+
+    def _load_feeds(self, count: int, target_qq: Optional[str] = None, start: int = 0) -> Tuple[int, str]:
+        res = self.session.get(self._feeds_url(count, target_qq, start), headers=self.headers, timeout=20)
+        return res.status_code, res.text or ""
+
+    def _legacy_key(self, count: int, pagenum: int = 1) -> Tuple[str, str, int, int]:
+        # Same request and key as QzoneProtectScanner: the protect worker's pages serve auto-like too.
+        return ("more", self.my_qq, max(1, int(pagenum)), int(count))
+
+    def _load_legacy(self, count: int, pagenum: int = 1) -> Tuple[int, str]:
+        url, params = feeds3_request(self.my_qq, self.g_tk, pagenum, count)
+        res = self.session.get(url, headers=self.headers, params=params, timeout=20)
+        return res.status_code, res.text or ""
+
+    @staticmethod
+    def _act_all_items(page: FeedPage) -> List[FeedItem]:
+        return page.memo("act_all_items", lambda: parse_act_all_page(page.text))[0]
+
+    @staticmethod
+    def _feeds3_items(page: FeedPage) -> List[FeedItem]:
+        return page.memo("feeds3_items", lambda: parse_feeds3_page(page.text)).items
+
+    def _feeds_url(self, count: int, target_qq: Optional[str] = None, start: int = 0) -> str:
+        target = str(target_qq or self.my_qq).strip()
+
+        # feeds_html_act_all 参数含义：uin=登录QQ，hostuin=目标空间QQ
+        return (
+            "https://user.qzone.qq.com/proxy/domain/ic2.qzone.qq.com/cgi-bin/feeds/"
+            f"feeds_html_act_all?uin={self.my_qq}&hostuin={target}"
+            f"&scope=0&filter=all&flag=1&refresh=0&firstGetGroup=0&mixnocache=0&scene=0"
+            f"&begintime=undefined&icServerTime=&start={int(start)}&count={count}"
+            f"&sidomain=qzonestyle.gtimg.cn&useutf8=1&outputhtmlfeed=1&refer=2"
+            f"&r={random.random()}&g_tk={self.g_tk}"
+        )
+
+    def _like_request(self, full_key: str) -> Tuple[str, Dict[str, str], Dict[str, str]]:
+        # 复刻浏览器：h5.qzone.qq.com 的 proxy/domain -> w.qzone.qq.com likes CGI。
+        like_url = f"https://h5.qzone.qq.com/proxy/domain/w.qzone.qq.com/cgi-bin/likes/internal_dolike_app?g_tk={self.g_tk}"
+
+        headers = dict(self.headers)
+        headers["origin"] = "https://user.qzone.qq.com"
+        headers["referer"] = "https://user.qzone.qq.com/"
+
+        # full_key 形如：http(s)://user.qzone.qq.com/<hostuin>/mood/<fid>.1
+        # 浏览器实际传的是不带 .1 的 unikey/curkey，并额外带 from/abstime/fid 等字段。
+        hostuin = ""
+        fid = full_key
+        m = re.search(r"user\.qzone\.qq\.com/(\d+)/mood/([a-f0-9]+)", full_key)
+        if m:
+            hostuin = m.group(1)
+            fid = m.group(2)
+        else:
+            if fid.endswith(".1"):
+                fid = fid[:-2]
+            if "/mood/" in fid:
+                fid = fid.split("/mood/", 1)[1]
+
+        payload = {
+            "qzreferrer": f"https://user.qzone.qq.com/",
+            "opuin": self.my_qq,
+            "unikey": full_key[:-2] if full_key.endswith(".1") else full_key,
+            "curkey": full_key[:-2] if full_key.endswith(".1") else full_key,
+            "from": "1",
+            "appid": "311",
+            "typeid": "0",
+            "abstime": str(int(time.time())),
+            "fid": fid,
+            "active": "0",
+            "fupdate": "1",
+        }
+
+        # 与浏览器一致：如果能解析到 hostuin，就把更完整的 qzreferrer 补上。
+        if hostuin:
+            payload["qzreferrer"] = (
+                "https://user.qzone.qq.com/proxy/domain/ic2.qzone.qq.com/cgi-bin/feeds/feeds_html_module"
+                "?g_iframeUser=1"
+                f"&i_uin={hostuin}"
+                f"&i_login_uin={self.my_qq}"
+                "&mode=4&previewV8=1&style=35&version=8&needDelOpr=true&transparence=true"
+                "&hideExtend=false&showcount=5"
+                "&MORE_FEEDS_CGI=http%3A%2F%2Fic2.s8.qzone.qq.com%2Fcgi-bin%2Ffeeds%2Ffeeds_html_act_all"
+                "&refer=2"
+                "&paramstring=os-winxp%7C100"
+            )
+
+        return like_url, headers, payload
+
+    def fetch_items(self, count: int, target_qq: Optional[str] = None, start: int = 0) -> Tuple[int, List[FeedItem], str]:
+        """Feed entries of the target space (the count entries from `start`), plus the raw page text.
+
+        The page and its parsed FeedItems come from the account's feed cache when one is set, so
+        /说说 and /评论 reading the same page do not fetch or parse it again.
+        """
+        if self.feed_cache is None:
+            page = FeedPage(*self._load_feeds(count, target_qq, start))
+        else:
+            key = self._feeds_key(count, target_qq, start)
+            page = self.feed_cache.get_sync(key, lambda: self._load_feeds(count, target_qq, start))
+        return page.status, self._act_all_items(page), page.text
+
+    def fetch_items_self_legacy(self, count: int, pagenum: int = 1) -> Tuple[int, List[FeedItem], str]:
+        """Own-space feed entries from feeds3_html_more (pagenum starts at 1), shared with the protect scan."""
+        if self.feed_cache is None:
+            page = FeedPage(*self._load_legacy(count, pagenum))
+        else:
+            page = self.feed_cache.get_sync(self._legacy_key(count, pagenum), lambda: self._load_legacy(count, pagenum))
+        return page.status, self._feeds3_items(page), page.text
+
+    def fetch_keys(self, count: int, target_qq: Optional[str] = None, start: int = 0) -> Tuple[int, Set[str], int]:
+        """拉取目标空间的动态链接集合（第 start 条起的 count 条）。
+
+        该接口用于“手动 /点赞”（支持 target_qq + 分页）。
+        自动轮询不走这里（自动轮询用 legacy 自用接口，见 fetch_keys_self_legacy）。
+        """
+        status, items, text = self.fetch_items(count, target_qq, start)
+        return status, like_keys(items, text), len(text)
+
+    def fetch_keys_self_legacy(self, count: int, pagenum: int = 1) -> Tuple[int, Set[str], int]:
+        """自动轮询专用：旧版 feeds3_html_more（仅拉取自己的说说，pagenum 从 1 开始）。
+
+        你这边实测该接口更稳定能返回 mood 链接；只用于 worker，不影响手动 /点赞。
+        请求与护评扫描完全相同（qzone_protect.feeds3_request），两边共用同一份缓存页。
+        """
+        status, items, text = self.fetch_items_self_legacy(count, pagenum)
+        return status, like_keys(items, text), len(text)
+
+    @staticmethod
+    def _head(text: str, size: int) -> str:
+        return (text or "")[:size].replace("\n", " ").replace("\r", " ")
+
+    def probe_head(self, count: int, target_qq: Optional[str] = None, size: int = 300) -> Tuple[int, str]:
+        """Status + first `size` chars (one line) of the act_all page, for diagnosing a page without keys.
+
+        Reads through fetch_items, so a page just fetched comes from the feed cache instead of a second request.
+        """
+        status, _, text = self.fetch_items(count, target_qq)
+        return status, self._head(text, size)
+
+    def send_like(self, full_key: str) -> Tuple[int, str]:
+        like_url, headers, payload = self._like_request(full_key)
+        res = self.session.post(like_url, headers=headers, data=payload, timeout=20)
+        return res.status_code, res.text or ""
+
+
+class AsyncQzoneLikeClient(QzoneLikeClient):
+    """非阻塞版本：接口同 QzoneLikeClient，但方法需 await（走 aiohttp，不占线程池）。"""
+
+    async def _load_feeds(self, count: int, target_qq: Optional[str] = None, start: int = 0) -> Tuple[int, str]:
+        res = await async_get(self._feeds_url(count, target_qq, start), headers=self.headers, timeout=20, pool=self.pool)
+        return res.status_code, res.text
+
+    async def _load_legacy(self, count: int, pagenum: int = 1) -> Tuple[int, str]:
+        url, params = feeds3_request(self.my_qq, self.g_tk, pagenum, count)
+        res = await async_get(url, headers=self.headers, params=params, timeout=20, pool=self.pool)
+        return res.status_code, res.text
+
+    async def fetch_items(self, count: int, target_qq: Optional[str] = None, start: int = 0) -> Tuple[int, List[FeedItem], str]:
+        if self.feed_cache is None:
+            page = FeedPage(*await self._load_feeds(count, target_qq, start))
+        else:
+            key = self._feeds_key(count, target_qq, start)
+            page = await self.feed_cache.get(key, lambda: self._load_feeds(count, target_qq, start))
+        return page.status, self._act_all_items(page), page.text
+
+    async def fetch_items_self_legacy(self, count: int, pagenum: int = 1) -> Tuple[int, List[FeedItem], str]:
+        if self.feed_cache is None:
+            page = FeedPage(*await self._load_legacy(count, pagenum))
+        else:
+            page = await self.feed_cache.get(self._legacy_key(count, pagenum), lambda: self._load_legacy(count, pagenum))
+        return page.status, self._feeds3_items(page), page.text
+
+    async def fetch_keys(self, count: int, target_qq: Optional[str] = None, start: int = 0) -> Tuple[int, Set[str], int]:
+        status, items, text = await self.fetch_items(count, target_qq, start)
+        return status, like_keys(items, text), len(text)
+
+    async def fetch_keys_self_legacy(self, count: int, pagenum: int = 1) -> Tuple[int, Set[str], int]:
+        status, items, text = await self.fetch_items_self_legacy(count, pagenum)
+        return status, like_keys(items, text), len(text)
+
+    async def probe_head(self, count: int, target_qq: Optional[str] = None, size: int = 300) -> Tuple[int, str]:
+        status, _, text = await self.fetch_items(count, target_qq)
+        return status, self._head(text, size)
+
+    async def send_like(self, full_key: str) -> Tuple[int, str]:
+        like_url, headers, payload = self._like_request(full_key)
+        res = await async_post(like_url, headers=headers, data=payload, timeout=20, pool=self.pool)
+        return res.status_code, res.text
@@ -12,6 +12,8 @@ from typing import Any, Dict, Optional, Tuple
 
 import requests
 
+from .qzone_http import HttpPool, async_post, get_session
+
 
 def _get_gtk(p_skey: str) -> int:
     hash_val = 5381
@@ -79,7 +81,7 @@ class PublishResult:
 
 
 class QzonePoster:
-    def __init__(self, my_qq: str, cookie: str):
+    def __init__(self, my_qq: str, cookie: str, session: Optional[requests.Session] = None, pool: Optional[HttpPool] = None, limiter: Any = None):
         # Supports publish + delete.
         self.my_qq = str(my_qq).strip()
 
@@ -103,13 +105,11 @@ class QzonePoster:
             "referer": f"https://user.qzone.qq.com/{self.my_qq}",
             "content-type": "application/x-www-form-urlencoded;charset=UTF-8",
         }
+        self.pool = pool
+        self.limiter = limiter  # qz_ratelimit.RateLimiter，经 qzone_http.call 调用时按接口取令牌
+        self.session = session or (pool.session if pool is not None else get_session())
 
-    def publish_text(self, content: str) -> Tuple[int, PublishResult]:
-        """Publish plain-text mood."""
-        text = (content or "").strip()
-        if not text:
-            return 0, PublishResult(False, None, "empty content", "", "")
-
+    def _publish_request(self, text: str) -> Tuple[str, Dict[str, Any]]:
         url = (
             "https://user.qzone.qq.com/proxy/domain/taotao.qzone.qq.com"
             f"/cgi-bin/emotion_cgi_publish_v6?&g_tk={self.g_tk}"
@@ -131,11 +131,29 @@ class QzonePoster:
         }
 
         data["rand"] = str(int(time.time() * 1000)) + str(random.randint(100, 999))
+        return url, data
+
+    def _delete_request(self, tid: str) -> Tuple[str, Dict[str, Any]]:
+        url = (
+            "https://user.qzone.qq.com/proxy/domain/taotao.qzone.qq.com"
+            f"/cgi-bin/emotion_cgi_delete_v6?&g_tk={self.g_tk}"
+        )
+
+        data: Dict[str, Any] = {
+            "hostuin": self.my_qq,
+            "tid": tid,
+            "t1": tid,
+            "format": "fs",
+            "qzreferrer": f"https://user.qzone.qq.com/{self.my_qq}",
+        }
+        return url, data
 
-        res = requests.post(url, headers=self.headers, data=data, timeout=20)
-        head = (res.text or "")[:300].replace("\n", " ").replace("\r", " ")
+    @staticmethod
+    def _parse_result(text: str, tid: str = "") -> PublishResult:
+        """Parse publish/delete response. For delete, `tid` is echoed back as-is."""
+        head = (text or "")[:300].replace("\n", " ").replace("\r", " ")
 
-        payload = _try_extract_json(res.text or "")
+        payload = _try_extract_json(text or "")
         if isinstance(payload, dict):
             code = None
             try:
@@ -144,11 +162,22 @@ class QzonePoster:
             except Exception:
                 code = None
             msg = str(payload.get("message") or payload.get("msg") or "")
-            tid = str(payload.get("tid") or payload.get("t1") or payload.get("feedid") or "")
+            if not tid:
+                tid = str(payload.get("tid") or payload.get("t1") or payload.get("feedid") or "")
             ok = code == 0
-            return res.status_code, PublishResult(ok, code, msg, head, tid)
+            return PublishResult(ok, code, msg, head, tid)
 
-        return res.status_code, PublishResult(False, None, "non-json response", head, "")
+        return PublishResult(False, None, "non-json response", head, tid)
+
+    def publish_text(self, content: str) -> Tuple[int, PublishResult]:
+        """Publish plain-text mood."""
+        text = (content or "").strip()
+        if not text:
+            return 0, PublishResult(False, None, "empty content", "", "")
+
+        url, data = self._publish_request(text)
+        res = self.session.post(url, headers=self.headers, data=data, timeout=20)
+        return res.status_code, self._parse_result(res.text or "")
 
     def delete_by_tid(self, tid: str) -> Tuple[int, PublishResult]:
         """Delete a mood by tid.
@@ -159,32 +188,28 @@ class QzonePoster:
         if not t:
             return 0, PublishResult(False, None, "empty tid", "", "")
 
-        url = (
-            "https://user.qzone.qq.com/proxy/domain/taotao.qzone.qq.com"
-            f"/cgi-bin/emotion_cgi_delete_v6?&g_tk={self.g_tk}"
-        )
+        url, data = self._delete_request(t)
+        res = self.session.post(url, headers=self.headers, data=data, timeout=20)
+        return res.status_code, self._parse_result(res.text or "", t)
 
-        data: Dict[str, Any] = {
-            "hostuin": self.my_qq,
-            "tid": t,
-            "t1": t,
-            "format": "fs",
-            "qzreferrer": f"https://user.qzone.qq.com/{self.my_qq}",
-        }
 
-        res = requests.post(url, headers=self.headers, data=data, timeout=20)
-        head = (res.text or "")[:300].replace("\n", " ").replace("\r", " ")
+class AsyncQzonePoster(QzonePoster):
+    """Same API as QzonePoster, but methods are awaitable (non-blocking HTTP)."""
 
-        payload = _try_extract_json(res.text or "")
-        if isinstance(payload, dict):
-            code = None
-            try:
-                if "code" in payload:
-                    code = int(payload.get("code"))
-            except Exception:
-                code = None
-            msg = str(payload.get("message") or payload.get("msg") or "")
-            ok = code == 0
-            return res.status_code, PublishResult(ok, code, msg, head, t)
+    async def publish_text(self, content: str) -> Tuple[int, PublishResult]:
+        text = (content or "").strip()
+        if not text:
+            return 0, PublishResult(False, None, "empty content", "", "")
+
+        url, data = self._publish_request(text)
+        res = await async_post(url, headers=self.headers, data=data, timeout=20, pool=self.pool)
+        return res.status_code, self._parse_result(res.text)
+
+    async def delete_by_tid(self, tid: str) -> Tuple[int, PublishResult]:
+        t = (tid or "").strip()
+        if not t:
+            return 0, PublishResult(False, None, "empty tid", "", "")
 
-        return res.status_code, PublishResult(False, None, "non-json response", head, t)
+        url, data = self._delete_request(t)
+        res = await async_post(url, headers=self.headers, data=data, timeout=20, pool=self.pool)
+        return res.status_code, self._parse_result(res.text, t)
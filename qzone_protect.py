@@ -6,11 +6,18 @@ from __future__ import annotations
 import json
 import re
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from itertools import islice
 from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 
+from .qz_cache import TTLCache
+from .qz_feed_cache import FeedCache, FeedPage
+from .qzone_feed_html import FeedItem, feed_digest, feed_items, iter_comment_roots, iter_feed_blocks
+from .qzone_http import HttpPool, async_get, get_session
+from .qzone_jsparse import JsParseError, iter_array, slice_html_items
+
 
 def _get_gtk(skey: str) -> int:
     hash_val = 5381
@@ -37,90 +44,6 @@ def _pick_skey_for_gtk(cookie: str) -> str:
     return ""
 
 
-def _extract_data_array_from_callback(text: str) -> str:
-    """Extract the `data:[ ... ]` array body from a _Callback(...) JS-literal response.
-
-    This endpoint often returns JS object literal (unquoted keys, single quotes, undefined),
-    so we cannot rely on json.loads. We only need to locate the `data:[ ... ]` segment
-    and return the inner content (without the surrounding brackets).
-    """
-
-    if not text:
-        return ""
-
-    s = text
-    m = re.search(r"\bdata\s*:\s*\[", s)
-    if not m:
-        return ""
-
-    i = m.end()  # position after '['
-    depth = 1
-    in_str = False
-    esc = False
-    quote = ""
-    j = i
-    while j < len(s):
-        ch = s[j]
-        if in_str:
-            if esc:
-                esc = False
-            elif ch == "\\":
-                esc = True
-            elif ch == quote:
-                in_str = False
-        else:
-            if ch in ("\"", "'"):
-                in_str = True
-                quote = ch
-            elif ch == "[":
-                depth += 1
-            elif ch == "]":
-                depth -= 1
-                if depth == 0:
-                    return s[i:j]
-        j += 1
-
-    return ""
-
-
-def _iter_html_blobs_from_data_array(arr_body: str, limit: int = 200) -> List[str]:
-    """Extract html:'...'</li> blobs from the array body using anchor slicing.
-
-    We slice from `html:` to the next `,opuin:` when present (matches real payloads)
-    and decode common escapes.
-    """
-
-    if not arr_body:
-        return []
-
-    out: List[str] = []
-    for m in re.finditer(r"\bhtml\s*:\s*", arr_body):
-        tail = arr_body[m.end() :]
-        end_m = re.search(r",\s*opuin\s*:\s*", tail)
-        if not end_m:
-            # fallback: try to end at next `,\s*uin:` (some items may differ)
-            end_m = re.search(r",\s*uin\s*:\s*", tail)
-        if not end_m:
-            continue
-
-        blob = tail[: end_m.start()].strip().rstrip(",")
-        if len(blob) >= 2 and blob[0] in ("'", '"') and blob[-1] == blob[0]:
-            html = blob[1:-1]
-        else:
-            html = blob
-
-        html = html.replace("\\x3C", "<").replace("\\x3E", ">")
-        html = html.replace("\\/", "/")
-        html = html.replace("\\\"", '"').replace("\\'", "'")
-        html = html.replace("\\x22", '"')
-
-        out.append(html)
-        if limit > 0 and len(out) >= limit:
-            break
-
-    return out
-
-
 def _try_extract_json_from_callback(text: str) -> Optional[dict]:
     # Best-effort strict JSON parse; many responses are JS-literal and will fail.
     if not text:
@@ -151,6 +74,79 @@ def _try_extract_json_from_callback(text: str) -> Optional[dict]:
     return None
 
 
+def feeds3_request(my_qq: str, g_tk: int, pagenum: int, count: int) -> Tuple[str, Dict[str, str]]:
+    """(url, params) of one own-space feeds3_html_more page.
+
+    The protect scan and the auto-like worker (QzoneLikeClient.fetch_items_self_legacy) send this
+    exact request, so the page one of them caches is the page the other would have fetched.
+    """
+
+    url = "https://user.qzone.qq.com/proxy/domain/ic2.qzone.qq.com/cgi-bin/feeds/feeds3_html_more"
+    params = {
+        "uin": my_qq,
+        "scope": "0",
+        "view": "1",
+        "flag": "1",
+        "filter": "all",
+        "applist": "all",
+        "refresh": "0",
+        "pagenum": str(max(1, int(pagenum))),
+        "count": str(count),
+        "useutf8": "1",
+        "outputhtmlfeed": "1",
+        "g_tk": str(g_tk),
+    }
+    return url, params
+
+
+@dataclass
+class Feeds3Items:
+    """Feed entries of one feeds3_html_more page (see parse_feeds3_page)."""
+
+    items: List[FeedItem] = field(default_factory=list)
+    raw_items: int = 0  # entries in the payload (strict JSON / JS literal)
+    html_blobs: int = 0  # html blobs recovered by anchor slicing (malformed literal)
+    error: str = ""  # why the page is unusable, "" = usable
+    fatal: bool = False  # unusable as a whole (login page, no data array): a first page like this aborts the scan
+
+
+def parse_feeds3_page(raw_text: str) -> Feeds3Items:
+    """FeedItems of a feeds3_html_more response: strict JSON, JS-literal callback, or anchor slicing."""
+
+    payload = _try_extract_json_from_callback(raw_text)
+
+    # Path A: strict JSON (rare; also the {"code": -3000, "message": "请先登录空间"} login reply)
+    if isinstance(payload, dict):
+        data = payload.get("data")
+        if not isinstance(data, dict):
+            msg = str(payload.get("message") or "")[:60]
+            return Feeds3Items(error=f"missing_data code={payload.get('code')} msg={msg}", fatal=True)
+        arr = data.get("data")
+        if not isinstance(arr, list):
+            head = raw_text[:1200].replace("\n", " ").replace("\r", " ")
+            return Feeds3Items(error=f"data.data_not_list type={type(arr).__name__} head={head}", fatal=True)
+        return Feeds3Items(feed_items(arr), raw_items=len(arr))
+
+    # Path B: JS-literal callback (common)
+    head = raw_text[:1200].replace("\n", " ").replace("\r", " ")
+    if "<!DOCTYPE html" in raw_text[:2000] or "<html" in raw_text[:2000]:
+        return Feeds3Items(error=f"invalid_payload html_page head={head}", fatal=True)
+
+    # B1: real JS-literal parse of the data:[...] items (first 200).
+    try:
+        arr = list(islice(iter_array(raw_text, "data"), 200))
+    except JsParseError:
+        arr = []
+    if arr:
+        return Feeds3Items(feed_items(arr), raw_items=len(arr))
+
+    # B2: malformed literal -> anchor slicing heuristics.
+    sliced = slice_html_items(raw_text, "data", limit=200)
+    if sliced is None:
+        return Feeds3Items(error=f"js_literal data_array_not_found head={head}", fatal=True)
+    return Feeds3Items(feed_items(sliced), html_blobs=len(sliced))
+
+
 @dataclass
 class FeedCommentRef:
     topic_id: str
@@ -160,11 +156,98 @@ class FeedCommentRef:
     comment_uin: str
 
 
+@dataclass
+class ProtectWatermark:
+    """Incremental protect-scan state, kept across polls (one per account).
+
+    - feed_hashes: digest of each feed item's html -> last seen ts. An item whose html is
+      identical to an earlier poll, and whose highest comment id is not above its topic mark,
+      has nothing new and is skipped (if it shows no comments it still goes to the module fallback).
+    - topics: topic_id -> highest root comment id already reported (ids grow per topic), so a
+      changed item only yields the comments added since.
+    A page without any changed item ends the scan (older pages were processed before); every
+    `full_scan_every` scans all pages are fetched anyway, in case an older post got a comment.
+    """
+
+    full_scan_every: int = 30
+    max_hashes: int = 2000
+    max_topics: int = 2000
+    feed_hashes: Dict[str, float] = field(default_factory=dict)
+    topics: Dict[str, int] = field(default_factory=dict)
+    scans: int = 0
+    early_stops: int = 0
+    skipped: int = 0
+
+    @staticmethod
+    def digest(html: str) -> str:
+        return feed_digest(html)
+
+    def full_scan_due(self) -> bool:
+        return self.full_scan_every <= 1 or self.scans % self.full_scan_every == 0
+
+    def advance(self, new_marks: Dict[str, int]) -> None:
+        for topic_id, cid in new_marks.items():
+            if cid > self.topics.get(topic_id, 0):
+                self.topics.pop(topic_id, None)
+                self.topics[topic_id] = cid
+        # Bounded: drop the least recently seen hashes / least recently advanced topics.
+        if len(self.feed_hashes) > self.max_hashes:
+            keep = sorted(self.feed_hashes.items(), key=lambda kv: kv[1])[-self.max_hashes :]
+            self.feed_hashes = dict(keep)
+        while len(self.topics) > self.max_topics:
+            self.topics.pop(next(iter(self.topics)))
+
+    def stats_line(self) -> str:
+        return (
+            f"scans={self.scans} early_stops={self.early_stops} skipped_items={self.skipped} "
+            f"hashes={len(self.feed_hashes)} topics={len(self.topics)}"
+        )
+
+
+@dataclass
+class _ScanState:
+    out: List[FeedCommentRef] = field(default_factory=list)
+    marks: Optional[ProtectWatermark] = None
+    new_marks: Dict[str, int] = field(default_factory=dict)
+    module_cache: Optional[TTLCache] = None
+    quiet: List[str] = field(default_factory=list)  # "topic:digest" of feed items without comments
+    module_cached: int = 0
+    newest: int = 0
+    cutoff: int = 0  # abstime older than this is outside the protection window (0 = no window)
+    out_of_window: int = 0
+    window_run: int = 0  # consecutive out-of-window items; a pinned old post alone doesn't end the scan
+    window_stop: int = 0
+    changed: int = 0
+    unchanged: int = 0
+    below_mark: int = 0
+    stopped_at: int = 0
+    feeds_items: int = 0
+    html_items: int = 0
+    comment_hits: int = 0
+    html_blobs: int = 0
+    topic_hits: int = 0
+    module_status: int = 0
+    module_hits: int = 0
+    module_comment_hits: int = 0
+
+
 class QzoneProtectScanner:
-    def __init__(self, my_qq: str, cookie: str):
+    # Out-of-window items in a row (newest-first) before paging stops; the feed may start with a pinned old post.
+    WINDOW_STOP_RUN = 3
+
+    def __init__(
+        self,
+        my_qq: str,
+        cookie: str,
+        session: Optional[requests.Session] = None,
+        pool: Optional[HttpPool] = None,
+        limiter: Any = None,
+        feed_cache: Optional[FeedCache] = None,
+    ):
         self.my_qq = str(my_qq).strip()
         self.last_diag: str = ""
         self.last_errors: list[str] = []
+        self.last_newest_abstime = 0  # newest post time seen by the last scan (0 = unknown)
 
         cookie = (cookie or "").strip()
         if cookie.lower().startswith("cookie:"):
@@ -185,13 +268,13 @@ class QzoneProtectScanner:
             "origin": "https://user.qzone.qq.com",
             "referer": f"https://user.qzone.qq.com/{self.my_qq}/infocenter?via=toolbar",
         }
+        self.pool = pool
+        self.limiter = limiter  # qz_ratelimit.RateLimiter，经 qzone_http.call 调用时按接口取令牌
+        # 每页都重新拉取（护评要最新评论），拉到的页放进账号的 feed 缓存，自动点赞在 TTL 内直接复用同一份解析结果
+        self.feed_cache = feed_cache
+        self.session = session or (pool.session if pool is not None else get_session())
 
-    def fetch_feeds_module_html(self, host_uin: str, showcount: int = 5) -> Tuple[int, str]:
-        """Fetch feeds_html_module HTML used by the web UI (contains comments-list).
-
-        This does not require JS parsing; it returns a full HTML document.
-        """
-
+    def _module_url(self, host_uin: str, showcount: int = 5) -> str:
         host_uin = str(host_uin or "").strip() or self.my_qq
         showcount = int(showcount) if showcount else 5
         if showcount <= 0:
@@ -199,7 +282,7 @@ class QzoneProtectScanner:
         if showcount > 20:
             showcount = 20
 
-        url = (
+        return (
             "https://user.qzone.qq.com/proxy/domain/ic2.qzone.qq.com/cgi-bin/feeds/feeds_html_module"
             "?g_iframeUser=1"
             f"&i_uin={host_uin}"
@@ -212,299 +295,285 @@ class QzoneProtectScanner:
             "&paramstring=os-winxp%7C100"
         )
 
-        res = requests.get(url, headers=self.headers, timeout=20)
+    @staticmethod
+    def _decode_module(res: Any) -> str:
         # requests may guess encoding incorrectly; force utf-8 for stable diagnostics
         try:
             raw = res.content or b""
-            text = raw.decode("utf-8", errors="ignore")
+            return raw.decode("utf-8", errors="ignore")
         except Exception:
-            text = res.text or ""
-        return res.status_code, text
+            return res.text or ""
 
-    def scan_recent_comments(self, pages: int = 2, count: int = 10) -> Tuple[int, List[FeedCommentRef]]:
-        out: List[FeedCommentRef] = []
-        self.last_diag = ""
-        self.last_errors = []
-        feeds_items = 0
-        html_items = 0
-        comment_hits = 0
-        html_blobs = 0
-        topic_hits = 0
-
-        module_status = 0
-        module_hits = 0
-        module_comment_hits = 0
+    def fetch_feeds_module_html(self, host_uin: str, showcount: int = 5) -> Tuple[int, str]:
+        """Fetch feeds_html_module HTML used by the web UI (contains comments-list).
+
+        This does not require JS parsing; it returns a full HTML document.
+        """
+
+        res = self.session.get(self._module_url(host_uin, showcount), headers=self.headers, timeout=20)
+        return res.status_code, self._decode_module(res)
+
+    def _page_request(self, pagenum: int, count: int) -> Tuple[str, Dict[str, str]]:
+        return feeds3_request(self.my_qq, self.g_tk, pagenum, count)
+
+    def _page_key(self, pagenum: int, count: int) -> Tuple[str, str, int, int]:
+        # Same key as QzoneLikeClient._legacy_key: both send feeds3_request() for the own space.
+        return ("more", self.my_qq, max(1, int(pagenum)), int(count))
+
+    def _load_page(self, pagenum: int, count: int) -> Tuple[int, str]:
+        url, params = self._page_request(pagenum, count)
+        res = self.session.get(url, headers=self.headers, params=params, timeout=20)
+        return res.status_code, res.text or ""
+
+    def _get_page(self, pagenum: int, count: int) -> FeedPage:
+        if self.feed_cache is None:
+            return FeedPage(*self._load_page(pagenum, count))
+        return self.feed_cache.get_sync(self._page_key(pagenum, count), lambda: self._load_page(pagenum, count), refresh=True)
+
+    @staticmethod
+    def _normalize_paging(pages: int, count: int) -> Tuple[int, int]:
         pages = int(pages) if pages else 1
         if pages <= 0:
             pages = 1
         count = int(count) if count else 10
         if count <= 0:
             count = 10
+        return pages, count
+
+    def _begin_scan(
+        self,
+        marks: Optional[ProtectWatermark] = None,
+        module_cache: Optional[TTLCache] = None,
+        window_minutes: int = 0,
+    ) -> _ScanState:
+        self.last_diag = ""
+        self.last_errors = []
+        st = _ScanState(marks=marks, module_cache=module_cache)
+        if window_minutes and window_minutes > 0:
+            st.cutoff = int(time.time()) - int(window_minutes) * 60
+        if marks is not None and marks.full_scan_due():
+            # Periodic full pass (and the first one): hashes still skip unchanged items, but every page is fetched.
+            st.stopped_at = -1
+        return st
 
-        for pagenum in range(1, pages + 1):
-            url = "https://user.qzone.qq.com/proxy/domain/ic2.qzone.qq.com/cgi-bin/feeds/feeds3_html_more"
-            params = {
-                "uin": self.my_qq,
-                "scope": "0",
-                "view": "1",
-                "flag": "1",
-                "filter": "all",
-                "applist": "all",
-                "refresh": "0",
-                "pagenum": str(pagenum),
-                "count": str(count),
-                "useutf8": "1",
-                "outputhtmlfeed": "1",
-                "g_tk": str(self.g_tk),
-            }
-            res = requests.get(url, headers=self.headers, params=params, timeout=20)
-            if res.status_code != 200:
-                if pagenum == 1:
-                    return res.status_code, []
-                break
+    @staticmethod
+    def _past_window(st: _ScanState, pagenum: int) -> bool:
+        """Feeds are newest-first: after a run of posts older than the window, later pages only have older ones.
 
-            raw_text = res.text or ""
-            payload = _try_extract_json_from_callback(raw_text)
-
-            # Path A: strict JSON (rare)
-            if isinstance(payload, dict):
-                data = payload.get("data")
-                if not isinstance(data, dict):
-                    self.last_errors.append(f"page={pagenum} missing_data")
-                    break
-
-                arr = data.get("data")
-                if not isinstance(arr, list):
-                    head = raw_text[:1200].replace("\n", " ").replace("\r", " ")
-                    self.last_errors.append(f"page={pagenum} data.data_not_list type={type(arr).__name__} head={head}")
-                    break
-
-                feeds_items += len(arr)
-
-                for item in arr:
-                    if not isinstance(item, dict):
-                        continue
-
-                    html = str(item.get("html") or "")
-                    if not html:
-                        continue
-                    html_items += 1
-
-                    m = re.search(r"<i[^>]*\bname=\\\"feed_data\\\"[^>]*>", html, re.I)
-                    tag = m.group(0) if m else ""
-                    if not tag:
-                        m = re.search(r"<i[^>]*\bname=\"feed_data\"[^>]*>", html, re.I)
-                        tag = m.group(0) if m else ""
-                    if not tag:
-                        m = re.search(r"<i[^>]*\bname='feed_data'[^>]*>", html, re.I)
-                        tag = m.group(0) if m else ""
-
-                    tid = ""
-                    topic_id = ""
-                    if tag:
-                        mm = re.search(r"\bdata-tid=\\\"([^\\\"]+)\\\"", tag)
-                        if mm:
-                            tid = mm.group(1)
-                        mm = re.search(r"\bdata-topicid=\\\"([^\\\"]+)\\\"", tag)
-                        if mm:
-                            topic_id = mm.group(1)
-
-                        if not tid:
-                            mm = re.search(r"\bdata-tid=\"([^\"]+)\"", tag)
-                            if mm:
-                                tid = mm.group(1)
-                        if not topic_id:
-                            mm = re.search(r"\bdata-topicid=\"([^\"]+)\"", tag)
-                            if mm:
-                                topic_id = mm.group(1)
-
-                        if not tid:
-                            mm = re.search(r"\bdata-tid='([^']+)'", tag)
-                            if mm:
-                                tid = mm.group(1)
-                        if not topic_id:
-                            mm = re.search(r"\bdata-topicid='([^']+)'", tag)
-                            if mm:
-                                topic_id = mm.group(1)
-
-                    if not tid or not topic_id:
-                        continue
-
-                    topic_hits += 1
-
-                    abstime = 0
-                    try:
-                        if "abstime" in item:
-                            abstime = int(str(item.get("abstime") or 0))
-                    except Exception:
-                        abstime = 0
-
-                    for cm in re.finditer(
-                        r"comments-item[^>]*data-type=\\\"commentroot\\\"[^>]*data-tid=\\\"(\d+)\\\"[^>]*data-uin=\\\"(\d+)\\\"",
-                        html,
-                        re.I,
-                    ):
-                        cid = cm.group(1)
-                        cuin = cm.group(2)
-                        comment_hits += 1
-                        out.append(
-                            FeedCommentRef(
-                                topic_id=topic_id,
-                                tid=tid,
-                                abstime=abstime,
-                                comment_id=cid,
-                                comment_uin=cuin,
-                            )
-                        )
+        A single old item (e.g. a pinned post at the top) is not enough; the run resets on any post in the window.
+        """
 
-                continue
+        if not st.cutoff or st.window_run < QzoneProtectScanner.WINDOW_STOP_RUN:
+            return False
+        st.window_stop = pagenum
+        return True
 
-            # Path B: JS-literal callback (common)
-            head = raw_text[:1200].replace("\n", " ").replace("\r", " ")
-            if "<!DOCTYPE html" in raw_text[:2000] or "<html" in raw_text[:2000]:
-                self.last_errors.append(f"page={pagenum} invalid_payload html_page head={head}")
-                if pagenum == 1:
-                    return res.status_code, []
-                break
+    @staticmethod
+    def _caught_up(st: _ScanState, pagenum: int, changed_before: int) -> bool:
+        """Incremental mode: stop paging after a page where nothing changed since the last poll."""
 
-            arr_body = _extract_data_array_from_callback(raw_text)
-            if not arr_body:
-                self.last_errors.append(f"page={pagenum} js_literal data_array_not_found head={head}")
-                if pagenum == 1:
-                    return res.status_code, []
-                break
+        if st.marks is None or st.stopped_at < 0 or st.changed != changed_before or not st.unchanged:
+            return False
+        st.stopped_at = pagenum
+        return True
 
-            html_list = _iter_html_blobs_from_data_array(arr_body, limit=200)
-            html_blobs += len(html_list)
-            for html in html_list:
-                html_items += 1
-
-                m = re.search(
-                    r"<i[^>]*\bname=\\\"feed_data\\\"[^>]*>",
-                    html,
-                    re.I,
-                )
-                tag = m.group(0) if m else ""
-                if not tag:
-                    m = re.search(r"<i[^>]*\bname=\"feed_data\"[^>]*>", html, re.I)
-                    tag = m.group(0) if m else ""
-                if not tag:
-                    m = re.search(r"<i[^>]*\bname='feed_data'[^>]*>", html, re.I)
-                    tag = m.group(0) if m else ""
-
-                tid = ""
-                topic_id = ""
-
-                if tag:
-                    mm = re.search(r"\bdata-tid=\\\"([^\\\"]+)\\\"", tag)
-                    if mm:
-                        tid = mm.group(1)
-                    mm = re.search(r"\bdata-topicid=\\\"([^\\\"]+)\\\"", tag)
-                    if mm:
-                        topic_id = mm.group(1)
-
-                    if not tid:
-                        mm = re.search(r"\bdata-tid=\"([^\"]+)\"", tag)
-                        if mm:
-                            tid = mm.group(1)
-                    if not topic_id:
-                        mm = re.search(r"\bdata-topicid=\"([^\"]+)\"", tag)
-                        if mm:
-                            topic_id = mm.group(1)
-
-                    if not tid:
-                        mm = re.search(r"\bdata-tid='([^']+)'", tag)
-                        if mm:
-                            tid = mm.group(1)
-                    if not topic_id:
-                        mm = re.search(r"\bdata-topicid='([^']+)'", tag)
-                        if mm:
-                            topic_id = mm.group(1)
-
-                if not tid or not topic_id:
-                    continue
+    def _scan_page(self, st: _ScanState, pagenum: int, page: FeedPage) -> str:
+        """Collect one feeds3_html_more page's comment refs into st.out.
 
-                topic_hits += 1
-
-                abstime = 0
-                m_ab = re.search(r"\babstime\s*:\s*'?([0-9]{6,})'?", arr_body[m.start() : m.start() + 2000])
-                if m_ab:
-                    try:
-                        abstime = int(m_ab.group(1))
-                    except Exception:
-                        abstime = 0
-
-                for cm in re.finditer(
-                    r"comments-item[^>]*data-type=\\\"commentroot\\\"[^>]*data-tid=\\\"(\d+)\\\"[^>]*data-uin=\\\"(\d+)\\\"",
-                    html,
-                    re.I,
-                ):
-                    cid = cm.group(1)
-                    cuin = cm.group(2)
-                    comment_hits += 1
-                    out.append(
-                        FeedCommentRef(
-                            topic_id=topic_id,
-                            tid=tid,
-                            abstime=abstime,
-                            comment_id=cid,
-                            comment_uin=cuin,
-                        )
-                    )
+        Returns "next" to keep paging, "stop" to stop paging, or "abort" when the first page is
+        unusable (the scan then reports the HTTP status with no refs).
+        """
+
+        parsed = page.memo("feeds3_items", lambda: parse_feeds3_page(page.text))
+        if parsed.error:
+            self.last_errors.append(f"page={pagenum} {parsed.error}")
+            return "abort" if parsed.fatal and pagenum == 1 else "stop"
+        st.feeds_items += parsed.raw_items
+        st.html_blobs += parsed.html_blobs
+        for item in parsed.items:
+            st.html_items += 1
+            self._scan_item(st, item)
+        return "next"
 
+    @staticmethod
+    def _scan_item(st: _ScanState, item: FeedItem) -> None:
+        abstime = item.abstime
+        if abstime > st.newest:
+            st.newest = abstime
+        if st.cutoff and 0 < abstime < st.cutoff:
+            # outside the protection window: no comment extraction
+            st.out_of_window += 1
+            st.window_run += 1
+            return
+        if abstime > 0:
+            st.window_run = 0
+        tid, topic_id = item.tid, item.topic_id
+        marks = st.marks
+        if marks is not None:
+            seen = item.digest in marks.feed_hashes
+            marks.feed_hashes[item.digest] = time.time()
+            if seen and QzoneProtectScanner._top_comment(item) <= marks.topics.get(topic_id, 0):
+                st.unchanged += 1
+                marks.skipped += 1
+                if tid and topic_id and not item.comments:
+                    # comments the feed html doesn't show only turn up in the module document
+                    st.topic_hits += 1
+                    st.quiet.append(f"{topic_id}:{item.digest}")
+                return
+            st.changed += 1
+
+        if not tid or not topic_id:
+            return
+        st.topic_hits += 1
+
+        for cid, cuin in item.comments:
+            st.comment_hits += 1
+            QzoneProtectScanner._add_ref(st, topic_id, tid, abstime, cid, cuin)
+        if not item.comments:
+            st.quiet.append(f"{topic_id}:{item.digest}")
+
+    @staticmethod
+    def _top_comment(item: FeedItem) -> int:
+        return max((int(cid) for cid, _ in item.comments if cid.isdigit()), default=0)
+
+    @staticmethod
+    def _add_ref(st: _ScanState, topic_id: str, tid: str, abstime: int, cid: str, cuin: str) -> bool:
+        if st.cutoff and 0 < abstime < st.cutoff:
+            return False
+        marks = st.marks
+        if marks is not None and cid.isdigit():
+            n = int(cid)
+            if n <= marks.topics.get(topic_id, 0):
+                # already reported by an earlier poll
+                st.below_mark += 1
+                return False
+            if n > st.new_marks.get(topic_id, 0):
+                st.new_marks[topic_id] = n
+        st.out.append(
+            FeedCommentRef(
+                topic_id=topic_id,
+                tid=tid,
+                abstime=abstime,
+                comment_id=cid,
+                comment_uin=cuin,
+            )
+        )
+        return True
+
+    @staticmethod
+    def _needs_module_fallback(st: _ScanState) -> bool:
         # If feeds3 stream doesn't include comments, fall back to module HTML which usually contains comment list.
         # Note: this is heavier but makes protect actually workable.
-        if comment_hits == 0 and topic_hits > 0:
-            try:
-                module_status, module_html = self.fetch_feeds_module_html(self.my_qq, showcount=max(5, min(20, count)))
-                if module_status == 200 and module_html:
-                    module_hits = 1
-
-                    # Extract each feed block's feed_data tag to get topicId/tid/abstime.
-                    for m_feed in re.finditer(r"<i[^>]*\bname=\"feed_data\"[^>]*>", module_html, re.I):
-                        tag = m_feed.group(0)
-                        mm_tid = re.search(r"\bdata-tid=\"([^\"]+)\"", tag)
-                        mm_topic = re.search(r"\bdata-topicid=\"([^\"]+)\"", tag)
-                        mm_ab = re.search(r"\bdata-abstime=\"([0-9]{6,})\"", tag)
-                        tid = mm_tid.group(1) if mm_tid else ""
-                        topic_id = mm_topic.group(1) if mm_topic else ""
-                        abstime = int(mm_ab.group(1)) if mm_ab else 0
-                        if not tid or not topic_id:
-                            continue
-
-                        # Find the nearest comments-item blocks after this tag (within a window).
-                        window = module_html[m_feed.end() : m_feed.end() + 150000]
-                        for cm in re.finditer(
-                            r"comments-item[^>]*data-type=\"commentroot\"[^>]*data-tid=\"(\d+)\"[^>]*data-uin=\"(\d+)\"",
-                            window,
-                            re.I,
-                        ):
-                            cid = cm.group(1)
-                            cuin = cm.group(2)
-                            module_comment_hits += 1
-                            out.append(
-                                FeedCommentRef(
-                                    topic_id=topic_id,
-                                    tid=tid,
-                                    abstime=abstime,
-                                    comment_id=cid,
-                                    comment_uin=cuin,
-                                )
-                            )
-            except Exception as e:
-                self.last_errors.append(f"module_parse_error: {e}")
+        return st.comment_hits == 0 and st.topic_hits > 0
+
+    @staticmethod
+    def _module_key(st: _ScanState) -> str:
+        # The module document is only worth re-fetching when one of the comment-less feed items changed.
+        return ProtectWatermark.digest("|".join(sorted(st.quiet)))
+
+    def _module_from_cache(self, st: _ScanState) -> bool:
+        """Reuse the module refs parsed for the same feed signals (within the cache TTL)."""
+
+        if st.module_cache is None:
+            return False
+        refs = st.module_cache.get(self._module_key(st))
+        if refs is None:
+            return False
+        st.module_cached = 1
+        for r in refs:
+            st.module_comment_hits += 1
+            self._add_ref(st, r.topic_id, r.tid, r.abstime, r.comment_id, r.comment_uin)
+        return True
 
+    @staticmethod
+    def parse_module_html(module_html: str) -> List[FeedCommentRef]:
+        """Comment refs of a feeds_html_module document; each comment belongs to exactly one feed block."""
+
+        out: List[FeedCommentRef] = []
+        seen = set()
+        for attrs, start, end in iter_feed_blocks(module_html):
+            tid = attrs.get("data-tid", "")
+            topic_id = attrs.get("data-topicid", "")
+            ab = attrs.get("data-abstime", "")
+            abstime = int(ab) if ab.isdigit() and len(ab) >= 6 else 0
+            if not tid or not topic_id:
+                continue
+            for cid, cuin in iter_comment_roots(module_html, start, end):
+                if (topic_id, cid) in seen:
+                    continue
+                seen.add((topic_id, cid))
+                out.append(FeedCommentRef(topic_id=topic_id, tid=tid, abstime=abstime, comment_id=cid, comment_uin=cuin))
+        return out
+
+    def _apply_module_html(self, st: _ScanState, module_status: int, module_html: str) -> None:
+        st.module_status = module_status
+        if module_status != 200 or not module_html:
+            return
+        st.module_hits = 1
+
+        refs = self.parse_module_html(module_html)
+        if st.module_cache is not None:
+            st.module_cache.set(self._module_key(st), refs)
+        for r in refs:
+            st.module_comment_hits += 1
+            self._add_ref(st, r.topic_id, r.tid, r.abstime, r.comment_id, r.comment_uin)
+
+    def _finish_scan(self, st: _ScanState, pages: int, count: int, marks: Optional[ProtectWatermark] = None) -> List[FeedCommentRef]:
+        self.last_newest_abstime = st.newest
+        if marks is not None:
+            marks.scans += 1
+            if st.stopped_at > 0:
+                marks.early_stops += 1
+            marks.advance(st.new_marks)
         try:
             self.last_diag = (
                 "[Qzone][protect_scan] "
-                f"pages={pages} count={count} feeds_items={feeds_items} html_items={html_items} html_blobs={html_blobs} "
-                f"topic_hits={topic_hits} comment_hits={comment_hits} module_hits={module_hits} module_status={module_status} "
-                f"module_comment_hits={module_comment_hits} out={len(out)} errors={len(self.last_errors)}"
+                f"pages={pages} count={count} feeds_items={st.feeds_items} html_items={st.html_items} html_blobs={st.html_blobs} "
+                f"topic_hits={st.topic_hits} comment_hits={st.comment_hits} module_hits={st.module_hits} module_status={st.module_status} "
+                f"module_comment_hits={st.module_comment_hits} module_cached={st.module_cached} out={len(st.out)} errors={len(self.last_errors)}"
             )
+            if marks is not None:
+                mode = "full" if st.stopped_at < 0 else f"stop@{st.stopped_at}" if st.stopped_at else "all_pages"
+                self.last_diag += f" incremental={mode} unchanged={st.unchanged} below_mark={st.below_mark}"
+            if st.cutoff:
+                self.last_diag += f" out_of_window={st.out_of_window} window_stop={st.window_stop or '-'}"
         except Exception:
             self.last_diag = ""
+        return st.out
+
+    def scan_recent_comments(
+        self,
+        pages: int = 2,
+        count: int = 10,
+        marks: Optional[ProtectWatermark] = None,
+        module_cache: Optional[TTLCache] = None,
+        window_minutes: int = 0,
+    ) -> Tuple[int, List[FeedCommentRef]]:
+        st = self._begin_scan(marks, module_cache, window_minutes)
+        pages, count = self._normalize_paging(pages, count)
+
+        for pagenum in range(1, pages + 1):
+            page = self._get_page(pagenum, count)
+            if page.status != 200:
+                if pagenum == 1:
+                    return page.status, []
+                break
+
+            changed_before = st.changed
+            step = self._scan_page(st, pagenum, page)
+            if step == "abort":
+                return page.status, []
+            if step == "stop" or self._past_window(st, pagenum) or self._caught_up(st, pagenum, changed_before):
+                break
+
+        if self._needs_module_fallback(st) and not self._module_from_cache(st):
+            try:
+                module_status, module_html = self.fetch_feeds_module_html(self.my_qq, showcount=max(5, min(20, count)))
+                self._apply_module_html(st, module_status, module_html)
+            except Exception as e:
+                self.last_errors.append(f"module_parse_error: {e}")
 
-        return 200, out
+        return 200, self._finish_scan(st, pages, count, marks)
 
     @staticmethod
     def filter_within_window(items: List[FeedCommentRef], window_minutes: int) -> List[FeedCommentRef]:
@@ -519,3 +588,55 @@ class QzoneProtectScanner:
             if now - int(it.abstime) <= win:
                 out.append(it)
         return out
+
+
+class AsyncQzoneProtectScanner(QzoneProtectScanner):
+    """Same API as QzoneProtectScanner, but network methods are awaitable (non-blocking HTTP)."""
+
+    async def _load_page(self, pagenum: int, count: int) -> Tuple[int, str]:
+        url, params = self._page_request(pagenum, count)
+        res = await async_get(url, headers=self.headers, params=params, timeout=20, pool=self.pool)
+        return res.status_code, res.text or ""
+
+    async def _get_page(self, pagenum: int, count: int) -> FeedPage:
+        if self.feed_cache is None:
+            return FeedPage(*await self._load_page(pagenum, count))
+        return await self.feed_cache.get(self._page_key(pagenum, count), lambda: self._load_page(pagenum, count), refresh=True)
+
+    async def fetch_feeds_module_html(self, host_uin: str, showcount: int = 5) -> Tuple[int, str]:
+        res = await async_get(self._module_url(host_uin, showcount), headers=self.headers, timeout=20, pool=self.pool)
+        return res.status_code, self._decode_module(res)
+
+    async def scan_recent_comments(
+        self,
+        pages: int = 2,
+        count: int = 10,
+        marks: Optional[ProtectWatermark] = None,
+        module_cache: Optional[TTLCache] = None,
+        window_minutes: int = 0,
+    ) -> Tuple[int, List[FeedCommentRef]]:
+        st = self._begin_scan(marks, module_cache, window_minutes)
+        pages, count = self._normalize_paging(pages, count)
+
+        for pagenum in range(1, pages + 1):
+            page = await self._get_page(pagenum, count)
+            if page.status != 200:
+                if pagenum == 1:
+                    return page.status, []
+                break
+
+            changed_before = st.changed
+            step = self._scan_page(st, pagenum, page)
+            if step == "abort":
+                return page.status, []
+            if step == "stop" or self._past_window(st, pagenum) or self._caught_up(st, pagenum, changed_before):
+                break
+
+        if self._needs_module_fallback(st) and not self._module_from_cache(st):
+            try:
+                module_status, module_html = await self.fetch_feeds_module_html(self.my_qq, showcount=max(5, min(20, count)))
+                self._apply_module_html(st, module_status, module_html)
+            except Exception as e:
+                self.last_errors.append(f"module_parse_error: {e}")
+
+        return 200, self._finish_scan(st, pages, count, marks)
@@ -0,0 +1,78 @@
+# tests/conftest.py
+# 以包的形式导入插件模块（插件内部全是相对导入），与 benchmarks/_common.load 相同。
+# 没装 AstrBot 时用一个最小的 astrbot.api 替身（logger + 插件注册用到的几个名字），
+# 这样 qz_journal / qz_pending / main 等模块在普通 checkout 里也能测。
+#
+#   python -m pytest -q tests
+
+from __future__ import annotations
+
+import importlib
+import logging
+import sys
+import types
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+FIXTURES = ROOT / "benchmarks" / "fixtures"
+
+
+def _stub_astrbot() -> None:
+    try:
+        import astrbot.api  # noqa: F401
+
+        return
+    except ImportError:
+        pass
+
+    class _Filter:
+        class EventMessageType:
+            ALL = "all"
+
+        def __getattr__(self, name: str) -> Any:
+            return lambda *a, **k: (lambda f: f)
+
+    class Star:
+        def __init__(self, context: Any = None):
+            self.context = context
+
+    api = types.ModuleType("astrbot.api")
+    api.logger = logging.getLogger("astrbot")
+    api.ToolSet = type("ToolSet", (), {})
+    star = types.ModuleType("astrbot.api.star")
+    star.Star = Star
+    star.register = lambda *a, **k: (lambda cls: cls)
+    event = types.ModuleType("astrbot.api.event")
+    event.filter = _Filter()
+    event.AstrMessageEvent = type("AstrMessageEvent", (), {})
+    root = types.ModuleType("astrbot")
+    root.api = api
+    api.star, api.event = star, event
+    sys.modules.update({"astrbot": root, "astrbot.api": api, "astrbot.api.star": star, "astrbot.api.event": event})
+
+
+_stub_astrbot()
+
+
+def _load(module: str) -> Any:
+    parent = str(ROOT.parent)
+    if parent not in sys.path:
+        sys.path.insert(0, parent)
+    return importlib.import_module(f"{ROOT.name}.{module}")
+
+
+@pytest.fixture
+def load() -> Callable[[str], Any]:
+    """`load("qzone_protect")` -> the plugin module, imported as `<plugin dir>.qzone_protect`."""
+
+    return _load
+
+
+@pytest.fixture
+def fixture_text() -> Callable[[str], str]:
+    """Raw text of a recorded response in benchmarks/fixtures/."""
+
+    return lambda name: (FIXTURES / name).read_text(encoding="utf-8")
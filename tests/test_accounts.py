@@ -0,0 +1,95 @@
+import asyncio
+import json
+
+import pytest
+
+COOKIE = "uin=o20002; p_skey=test"
+
+
+@pytest.fixture
+def accounts(load):
+    return load("qz_accounts")
+
+
+def test_parse_accounts(accounts):
+    specs = accounts.parse_accounts(
+        [
+            {"qq": "20002", "cookie": COOKIE, "like_targets": "30003", "protect": "false", "post": 1},
+            '{"uin": "20003", "cookie": "c", "name": "alt", "like": false}',
+            "20004|c",
+            "20002|duplicate",
+            '{"qq": broken',
+            {"qq": "abc", "cookie": "c"},
+        ]
+    )
+    assert [(s.uin, s.name, s.like_targets, s.like, s.protect, s.post) for s in specs] == [
+        ("20002", "", ["30003"], True, False, True),
+        ("20003", "alt", [], False, None, False),
+        ("20004", "", [], True, None, False),
+    ]
+
+
+def test_account_config_keeps_writes_per_account(accounts, tmp_path):
+    base = {"ai_post_interval_min": 60}
+    cfg = accounts.AccountConfig(tmp_path / "state.json", base)
+    cfg["ai_post_last_run_ts"] = 123.0
+    cfg.save_config()
+    assert "ai_post_last_run_ts" not in base
+    again = accounts.AccountConfig(tmp_path / "state.json", base)
+    assert (again["ai_post_last_run_ts"], again["ai_post_interval_min"]) == (123.0, 60)
+    assert json.loads((tmp_path / "state.json").read_text(encoding="utf-8")) == {"ai_post_last_run_ts": 123.0}
+
+
+def test_failing_task_stays_inside_its_account(accounts, tmp_path):
+    acct = accounts.QzAccount("20002", COOKIE, data_dir=tmp_path)
+
+    async def boom(stop):
+        raise RuntimeError("cookie expired")
+
+    async def main():
+        acct.supervise("like", boom)
+        await asyncio.sleep(0.05)  # failed once, now in its restart backoff
+        assert acct.task_names() == ["like"]
+        await acct.stop("like", timeout=1)
+        return acct.task_names()
+
+    assert asyncio.run(main()) == []
+    assert (acct.errors, acct.last_error) == (1, "like: cookie expired")
+
+
+def test_stop_extras_stops_only_the_named_task(accounts, tmp_path):
+    primary = accounts.QzAccount("10001", COOKIE, data_dir=tmp_path, primary=True)
+    registry = accounts.AccountRegistry(primary)
+    extra = accounts.QzAccount("20002", COOKIE, data_dir=tmp_path / "20002")
+    registry.add(extra)
+    registry.add(accounts.QzAccount("10001", COOKIE, data_dir=tmp_path))  # same as my_qq: ignored
+
+    async def idle(stop):
+        await stop.wait()
+
+    async def main():
+        extra.supervise("like", idle)
+        extra.supervise("protect", idle)
+        await registry.stop_extras("like")
+        names = extra.task_names()
+        await registry.close_extras()
+        return names, extra.task_names()
+
+    assert asyncio.run(main()) == (["protect"], [])
+    assert registry.extras() == [extra]
+
+
+def test_close_compacts_the_scheduler_queue(accounts, load, tmp_path):
+    scheduler = load("qz_scheduler")
+    acct = accounts.QzAccount("20002", COOKIE, data_dir=tmp_path)
+    acct.scheduler = scheduler.QzScheduler(
+        context=None, config={}, my_qq=acct.uin, cookie=acct.cookie, data_dir=tmp_path
+    )
+
+    async def main():
+        await acct.scheduler.queue_delete("tid1", 10)
+        await acct.close()
+
+    asyncio.run(main())
+    assert not (tmp_path / "pending_deletes.journal").exists()
+    assert [it["tid"] for it in json.loads((tmp_path / "pending_deletes.json").read_text(encoding="utf-8"))] == ["tid1"]
@@ -0,0 +1,59 @@
+import time
+
+import pytest
+
+
+@pytest.fixture
+def bloom(load):
+    return load("qz_bloom")
+
+
+def _key(i):
+    return f"http://user.qzone.qq.com/10001/mood/{i:024x}.1"
+
+
+def test_added_keys_are_always_found(bloom):
+    b = bloom.RotatingBloom(None, capacity=1000, fpr=0.01)
+    for i in range(1000):
+        b.add(_key(i))
+    assert all(_key(i) in b for i in range(1000))
+
+
+def test_false_positive_rate_stays_near_target(bloom):
+    b = bloom.RotatingBloom(None, capacity=2000, fpr=0.01)
+    for i in range(2000):
+        b.add(_key(i))
+    fp = sum(1 for i in range(10000, 20000) if _key(i) in b)
+    assert fp / 10000 < 0.03
+
+
+def test_full_generations_rotate_out(bloom):
+    b = bloom.RotatingBloom(None, capacity=10, fpr=0.01, generations=2)
+    for i in range(10):
+        b.add(_key(i))
+    for i in range(10, 30):  # fills two more generations
+        b.add(_key(i))
+    assert _key(0) not in b
+    assert _key(29) in b
+    assert b.rotations >= 2
+
+
+def test_keys_age_out_after_ttl(bloom):
+    b = bloom.RotatingBloom(None, ttl=0.3, capacity=100, fpr=0.01, generations=3)
+    b.add(_key(1))
+    assert _key(1) in b
+    for i in range(5):  # a generation every ttl / 3 while the filter is in use
+        time.sleep(0.12)
+        b.add(_key(100 + i))
+    assert _key(1) not in b
+    assert _key(104) in b
+
+
+def test_persisted_filter_reloads(bloom, tmp_path):
+    path = tmp_path / "like_bloom_self.bin"
+    b = bloom.RotatingBloom(path, ttl=3600, capacity=500, fpr=0.01)
+    b.add(_key(1))
+    b.close()
+    assert _key(1) in bloom.RotatingBloom(path, ttl=3600, capacity=500, fpr=0.01)
+    # sizing changed in config: old bits don't fit, start empty
+    assert _key(1) not in bloom.RotatingBloom(path, ttl=3600, capacity=800, fpr=0.01)
@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+
+MY_QQ = "10001"
+COOKIE = "uin=o10001; p_skey=test"
+TOPIC = "10001_6a1f2b3c4d5e6f7a8b9c0d01__1"
+
+
+@pytest.fixture
+def comments_list(load):
+    return load("qzone_comments_list")
+
+
+def _lister(comments_list, serve, limiter=None):
+    """Sync lister whose pages come from `serve(pos, num)` -> (total, [comment ids]); records every call."""
+
+    class _Lister(comments_list.QzoneCommentLister):
+        calls = []
+
+        def fetch_topic_comments_page(self, topic_id, pos=0, num=20):
+            self.calls.append(pos)
+            total, ids = serve(pos, num)
+            return 200, total, [comments_list.CommentItem(str(i), "20002", "nick", f"c{i}") for i in ids]
+
+    return _Lister(MY_QQ, COOKIE, limiter=limiter)
+
+
+def test_pages_through_the_thread(comments_list):
+    lister = _lister(comments_list, lambda pos, num: (45, range(pos + 1, min(pos + num, 45) + 1)))
+    status, items = asyncio.run(lister.list_topic_comments(TOPIC))
+    assert status == 200
+    assert [c.comment_id for c in items] == [str(i) for i in range(1, 46)]
+    assert lister.calls == [0, 20, 40]
+
+
+def test_max_items_cuts_the_listing(comments_list):
+    lister = _lister(comments_list, lambda pos, num: (100, range(pos + 1, pos + num + 1)))
+    status, items = asyncio.run(lister.list_topic_comments(TOPIC, max_items=25))
+    assert (status, len(items), lister.calls) == (200, 25, [0, 20])
+
+
+def test_a_repeated_page_ends_the_listing(comments_list):
+    # no cmtnum and the server ignores pos: the same page comes back every time
+    lister = _lister(comments_list, lambda pos, num: (0, range(1, num + 1)))
+    status, items = asyncio.run(lister.list_topic_comments(TOPIC))
+    assert (status, len(items), lister.calls) == (200, 20, [0, 20])
+
+
+def test_max_pages_caps_an_endless_thread(comments_list):
+    lister = _lister(comments_list, lambda pos, num: (0, range(pos + 1, pos + num + 1)))
+    status, items = asyncio.run(lister.list_topic_comments(TOPIC, max_pages=3))
+    assert (status, len(items), len(lister.calls)) == (200, 60, 3)
+
+
+def test_every_page_takes_a_feeds_token(comments_list, load):
+    ratelimit = load("qz_ratelimit")
+    limiter = ratelimit.RateLimiter({"feeds": (60, 10)})
+    lister = _lister(comments_list, lambda pos, num: (45, range(pos + 1, min(pos + num, 45) + 1)), limiter)
+    qzone_http = load("qzone_http")
+    asyncio.run(qzone_http.call(lister.list_topic_comments, TOPIC))
+    assert limiter.bucket("feeds").acquired == 3
+    assert ratelimit.ENDPOINTS.get("list_topic_comments") is None
+
+
+def test_parse_msgdetail(comments_list):
+    text = '_Callback({"code":0,"cmtnum":2,"commentlist":[{"tid":1,"uin":20002,"name":"a","content":"hi","create_time":1700000000},"x"]});'
+    code, total, items, _ = comments_list.QzoneCommentLister._parse_msgdetail(text)
+    assert (code, total) == (0, 2)
+    assert [(c.comment_id, c.comment_uin, c.nick, c.content, c.create_time) for c in items] == [
+        ("1", "20002", "a", "hi", 1700000000)
+    ]
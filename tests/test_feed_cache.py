@@ -0,0 +1,107 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+
+@pytest.fixture
+def feed_cache(load):
+    return load("qz_feed_cache")
+
+
+def test_hit_within_ttl_and_refresh_reloads(feed_cache):
+    cache = feed_cache.FeedCache(ttl=60)
+    calls = []
+
+    def load():
+        calls.append(1)
+        return 200, f"page {len(calls)}"
+
+    assert cache.get_sync("k", load).text == "page 1"
+    assert cache.get_sync("k", load).text == "page 1"
+    assert cache.get_sync("k", load, refresh=True).text == "page 2"
+    assert cache.get_sync("k", load).text == "page 2"
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_failed_load_is_not_cached(feed_cache):
+    cache = feed_cache.FeedCache(ttl=60)
+    assert cache.get_sync("k", lambda: (503, "busy")).status == 503
+    assert cache.peek("k") is None
+    assert cache.get_sync("k", lambda: (200, "ok")).text == "ok"
+
+
+def test_stale_before_drops_older_pages(feed_cache):
+    changed = [0.0]
+    cache = feed_cache.FeedCache(ttl=60, stale_before=lambda: changed[0])
+    cache.get_sync("k", lambda: (200, "before publish"))
+    changed[0] = time.time() + 1
+    assert cache.peek("k") is None
+    assert cache.get_sync("k", lambda: (200, "after publish")).text == "after publish"
+
+
+def test_sync_and_async_callers_share_one_load(feed_cache):
+    cache = feed_cache.FeedCache(ttl=60)
+    calls = []
+    started = threading.Event()
+
+    def slow_load():
+        calls.append("sync")
+        started.set()
+        time.sleep(0.2)
+        return 200, "from sync"
+
+    async def async_load():
+        calls.append("async")
+        return 200, "from async"
+
+    async def main():
+        sync_caller = asyncio.create_task(asyncio.to_thread(cache.get_sync, "k", slow_load))
+        await asyncio.to_thread(started.wait)
+        pages = await asyncio.gather(cache.get("k", async_load), cache.get("k", async_load), sync_caller)
+        return [p.text for p in pages]
+
+    assert asyncio.run(main()) == ["from sync"] * 3
+    assert calls == ["sync"]
+    assert cache.coalesced == 2
+
+
+def test_waiters_see_the_loader_error(feed_cache):
+    cache = feed_cache.FeedCache(ttl=60)
+
+    async def failing():
+        await asyncio.sleep(0.05)
+        raise ValueError("boom")
+
+    async def main():
+        return await asyncio.gather(cache.get("k", failing), cache.get("k", failing), return_exceptions=True)
+
+    errors = asyncio.run(main())
+    assert [type(e) for e in errors] == [ValueError, ValueError]
+    assert cache.peek("k") is None
+
+
+def test_page_loaded_across_a_publish_is_stale(feed_cache, load):
+    qzone_http = load("qzone_http")
+    limiter = load("qz_ratelimit").RateLimiter()
+    cache = feed_cache.FeedCache(ttl=60, stale_before=lambda: limiter.last_call("publish", "delete"))
+
+    class _Poster:
+        def __init__(self):
+            self.limiter = limiter
+
+        async def publish_text(self, content):
+            await asyncio.sleep(0.02)
+            return 200, None
+
+    async def slow_load():
+        await asyncio.sleep(0.1)
+        return 200, "page without the new post"
+
+    async def main():
+        # the feed request goes out before the post and comes back after it
+        await asyncio.gather(cache.get("k", slow_load), qzone_http.call(_Poster().publish_text, "hi"))
+
+    asyncio.run(main())
+    assert cache.peek("k") is None
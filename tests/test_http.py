@@ -0,0 +1,56 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+BODY = "说说内容".encode("utf-8")
+
+
+@pytest.fixture
+def http(load):
+    return load("qzone_http")
+
+
+@pytest.fixture
+def server():
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")  # no charset
+            self.send_header("Content-Length", str(len(BODY)))
+            self.end_headers()
+            self.wfile.write(BODY)
+
+        def log_message(self, *args):
+            pass
+
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{srv.server_address[1]}/"
+    srv.shutdown()
+    srv.server_close()
+
+
+def test_pool_session_is_created_once_across_threads(http):
+    pool = http.HttpPool(4)
+    start = threading.Barrier(8)
+
+    def _get(_):
+        start.wait()
+        return pool.session
+
+    with ThreadPoolExecutor(8) as ex:
+        sessions = list(ex.map(_get, range(8)))
+    assert len({id(s) for s in sessions}) == 1
+    pool.close()
+
+
+def test_thread_fallback_decodes_utf8_without_charset(http, server, monkeypatch):
+    monkeypatch.setattr(http, "aiohttp", None)
+    pool = http.HttpPool(2)
+    res = asyncio.run(http.async_get(server, pool=pool))
+    pool.close()
+    assert res.status_code == 200
+    assert res.text == "说说内容"
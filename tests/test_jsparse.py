@@ -0,0 +1,45 @@
+from itertools import islice
+
+import pytest
+
+
+@pytest.fixture
+def jsparse(load):
+    return load("qzone_jsparse")
+
+
+def test_parse_callback_js_literal(jsparse):
+    text = r"""_Callback({code:0,msg:'it\'s \x3Cb\x3E',list:[1,,0x10,-2.5e1],flag:undefined,"q":"你"});"""
+    assert jsparse.parse_callback(text) == {
+        "code": 0,
+        "msg": "it's <b>",
+        "list": [1, None, 16, -25.0],
+        "flag": None,
+        "q": "你",
+    }
+
+
+def test_parse_callback_rejects_garbage(jsparse):
+    assert jsparse.parse_callback("<html>need login</html>") is None
+    assert jsparse.parse_callback("_Callback({code:0,") is None
+
+
+def test_iter_array_is_lazy(jsparse):
+    # elements after the second one are malformed, but are never reached
+    text = "_Callback({data:{data:[{a:1},{a:2},{a:!broken}]}})"
+    assert list(islice(jsparse.iter_array(text, "data"), 2)) == [{"a": 1}, {"a": 2}]
+    with pytest.raises(jsparse.JsParseError):
+        list(jsparse.iter_array(text, "data"))
+
+
+def test_slice_html_items_on_malformed_literal(jsparse, fixture_text):
+    text = fixture_text("feeds3_html_more.js").replace("clscFold:undefined", "clscFold:un defined", 1)
+    with pytest.raises(jsparse.JsParseError):
+        list(jsparse.iter_array(text, "data"))
+
+    items = jsparse.slice_html_items(text, "data")
+    assert len(items) == 3
+    assert items[0]["html"].startswith('<li class="f-single')
+    assert 'data-tid="6a1f2b3c4d5e6f7a8b9c0d01"' in items[0]["html"]
+    assert jsparse.slice_html_items(text, "limit_me", limit=1) is None
+    assert len(jsparse.slice_html_items(text, "data", limit=1)) == 1
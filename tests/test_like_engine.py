@@ -0,0 +1,74 @@
+import asyncio
+import time
+
+import pytest
+
+
+@pytest.fixture
+def engine_mod(load):
+    return load("qz_like_engine")
+
+
+def test_parse_like_targets(engine_mod):
+    assert engine_mod.parse_like_targets("10001, 10002:30，10001:5 bad 10003：0.5", 20) == [
+        ("10001", 20.0),
+        ("10002", 30.0),
+        ("10003", 1.0),  # at least one second
+    ]
+    assert engine_mod.parse_like_targets(["10004", 10005], 15) == [("10004", 15.0), ("10005", 15.0)]
+    assert engine_mod.parse_like_targets(None, 15) == []
+
+
+def _run(engine, seconds):
+    async def main():
+        stop = asyncio.Event()
+        task = asyncio.create_task(engine.run(stop))
+        await asyncio.sleep(seconds)
+        stop.set()
+        await task
+
+    asyncio.run(main())
+
+
+def test_rounds_share_the_concurrency_limit(engine_mod):
+    running = []
+    peak = []
+
+    async def run_round(t):
+        running.append(t.uin)
+        peak.append(len(running))
+        await asyncio.sleep(0.1)
+        running.remove(t.uin)
+        return 1, 1
+
+    engine = engine_mod.LikeEngine(run_round, max_concurrency=2, jitter=0)
+    engine.set_targets([(str(10001 + i), 60.0) for i in range(5)])
+    _run(engine, 0.5)
+    assert max(peak) == 2
+    assert all(t.rounds == 1 and t.liked == 1 for t in engine.targets.values())
+
+
+def test_each_target_keeps_its_own_interval_and_errors(engine_mod):
+    async def run_round(t):
+        if t.uin == "10002":
+            raise RuntimeError("feeds 500")
+        return 0, 0
+
+    engine = engine_mod.LikeEngine(run_round, max_concurrency=3, jitter=0)
+    engine.set_targets([("10001", 0.1), ("10002", 60.0)])
+    _run(engine, 0.45)
+    fast, failing = engine.targets["10001"], engine.targets["10002"]
+    assert fast.rounds >= 3
+    assert (failing.rounds, failing.errors, failing.last_error) == (1, 1, "feeds 500")
+    assert failing.next_due > time.time() + 50
+
+
+def test_set_targets_keeps_state_of_remaining_targets(engine_mod):
+    engine = engine_mod.LikeEngine(lambda t: None, jitter=0)
+    made = []
+    engine.set_targets([("10001", 20.0)], lambda uin: made.append(uin) or uin)
+    engine.targets["10001"].liked = 7
+    engine.set_targets([("10001", 40.0), ("10002", 20.0)], lambda uin: made.append(uin) or uin)
+    assert engine.targets["10001"].liked == 7
+    assert engine.targets["10001"].interval_sec == 40.0
+    assert made == ["10001", "10002"]
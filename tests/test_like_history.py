@@ -0,0 +1,49 @@
+import json
+import time
+
+import pytest
+
+KEY = "http://user.qzone.qq.com/10001/mood/6a1f2b3c4d5e6f7a8b9c0d01.1"
+
+
+@pytest.fixture
+def history(load):
+    return load("qz_like_history")
+
+
+def test_key_ignores_scheme_and_suffix(history):
+    assert history.like_history_key(KEY) == "10001/6a1f2b3c4d5e6f7a8b9c0d01"
+    assert history.like_history_key(r"https:\/\/user.qzone.qq.com\/10001\/mood\/6a1f2b3c4d5e6f7a8b9c0d01") == (
+        "10001/6a1f2b3c4d5e6f7a8b9c0d01"
+    )
+
+
+def test_history_survives_a_restart(history, tmp_path):
+    path = tmp_path / "like_history.json"
+    h = history.LikeHistory(path, ttl=3600)
+    h.add(KEY)
+    # no close(): only the journal line is on disk
+    h = history.LikeHistory(path, ttl=3600)
+    assert KEY in h
+    assert KEY.replace("http://", "https://") in h
+    h.close()
+    assert list(json.loads(path.read_text(encoding="utf-8"))) == ["10001/6a1f2b3c4d5e6f7a8b9c0d01"]
+
+
+def test_expired_likes_are_dropped_on_reload(history, tmp_path):
+    path = tmp_path / "like_history.json"
+    h = history.LikeHistory(path, ttl=60)
+    h.add(KEY, now=time.time() - 120)
+    h.add(KEY.replace("10001", "10002"))
+    h.close()
+    h = history.LikeHistory(path, ttl=60)
+    assert KEY not in h
+    assert len(h) == 1
+
+
+def test_memory_only_writes_nothing(history, tmp_path):
+    h = history.LikeHistory(None, ttl=60)
+    h.add(KEY)
+    h.close()
+    assert KEY in h
+    assert list(tmp_path.iterdir()) == []
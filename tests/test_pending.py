@@ -0,0 +1,62 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture
+def pending(load):
+    return load("qz_pending")
+
+
+def test_pop_due_in_due_order(pending, tmp_path):
+    async def main():
+        q = pending.PendingDeleteQueue(tmp_path / "pending_deletes.json")
+        await q.queue("c", 300.0)
+        await q.queue("a", 100.0)
+        await q.queue("b", 200.0)
+        await q.queue("c", 150.0)  # moved earlier
+        await q.queue("a", 250.0)  # later due time is ignored
+        return [it["tid"] for it in await q.pop_due(now=200.0)], len(q), q.next_due()
+
+    assert asyncio.run(main()) == (["a", "c", "b"], 0, None)
+
+
+def test_wait_wakes_up_for_an_earlier_item(pending, tmp_path):
+    async def main():
+        q = pending.PendingDeleteQueue(tmp_path / "pending_deletes.json")
+        await q.queue("late", time.time() + 60)
+        stop = asyncio.Event()
+        waiter = asyncio.create_task(q.wait(stop))
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+        await q.queue("soon", time.time() + 0.1)
+        await asyncio.wait_for(waiter, timeout=1)
+        await asyncio.wait_for(q.wait(stop), timeout=1)  # sleeps until "soon" is due
+        return [it["tid"] for it in await q.pop_due()]
+
+    assert asyncio.run(main()) == ["soon"]
+
+
+def test_drain_requeues_failures_with_backoff(pending, tmp_path):
+    class _Poster:
+        def delete_by_tid(self, tid):
+            return 200, SimpleNamespace(ok=tid != "bad", code=0, message="")
+
+    deleted = []
+
+    async def on_deleted(tid):
+        deleted.append(tid)
+
+    async def main():
+        q = pending.PendingDeleteQueue(tmp_path / "pending_deletes.json")
+        await q.queue("good", 1.0)
+        await q.queue("bad", 2.0)
+        ok = await q.drain(_Poster(), on_deleted=on_deleted)
+        return ok, len(q), q.next_due()
+
+    before = time.time()
+    ok, left, next_due = asyncio.run(main())
+    assert (ok, left, deleted) == (1, 1, ["good"])
+    assert next_due >= before + pending.PendingDeleteQueue.BACKOFF_SEC
@@ -0,0 +1,220 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+MY_QQ = "10001"
+COOKIE = "uin=o10001; p_skey=test"
+
+
+@pytest.fixture
+def plugin(load):
+    """QzoneAutoLikePlugin with nothing persisted and no background task started."""
+
+    main = load("main")
+
+    def make(**config):
+        cfg = {"my_qq": MY_QQ, "cookie": COOKIE, "like_history_persist": False}
+        cfg.update(config)
+        return main.QzoneAutoLikePlugin(None, cfg)
+
+    return make
+
+
+def test_protect_seen_outlives_window_and_delete_retries(plugin):
+    p = plugin(protect_window_minutes=30, protect_poll_interval_sec=10, protect_delete_retries=2)
+    assert p._protect_seen.ttl >= 30 * 60
+    # retries alone (10s + 20s) span longer than a one-minute window
+    p = plugin(protect_window_minutes=1, protect_poll_interval_sec=60, protect_delete_retries=3)
+    assert p._protect_seen.ttl >= 60 * (1 + 2 + 4)
+
+
+def test_scheduler_shares_the_primary_account_budget(plugin):
+    p = plugin(http_async_enabled=True)
+    assert p._scheduler.limiter is p._primary.limiter
+    assert p._scheduler.pool is p._primary.pool
+    assert p._scheduler.http_async is True
+
+
+def _key(n):
+    return f"http://user.qzone.qq.com/30003/mood/{n:024x}.1"
+
+
+class _FakeLikeClient:
+    """Async like client serving fixed feed pages; no limiter, so qzone_http.call just awaits it."""
+
+    limiter = None
+
+    def __init__(self, pages, liked=()):
+        self.pages = pages
+        self.liked = set(liked)
+        self.fetches = []
+        self.probes = 0
+        self.likes = []
+
+    def _page(self, index):
+        keys = self.pages[index] if index < len(self.pages) else []
+        return 200, [SimpleNamespace(like_key=k, liked=k in self.liked) for k in keys], "<html/>"
+
+    async def fetch_items(self, count, target_qq=None, start=0):
+        self.fetches.append(start)
+        return self._page(start // count)
+
+    async def fetch_items_self_legacy(self, count, pagenum=1):
+        self.fetches.append(pagenum)
+        return self._page(pagenum - 1)
+
+    async def probe_head(self, count, target_qq=None):
+        self.probes += 1
+        return 200, "<html/>"
+
+    async def send_like(self, full_key):
+        self.likes.append(full_key)
+        return 200, '{"code":0,"message":"succ"}'
+
+
+def test_like_once_pages_until_a_short_page(plugin):
+    p = plugin(like_ramp_step=2)
+    client = _FakeLikeClient([[_key(1), _key(2)], [_key(3), _key(4)], [_key(5)]])
+    assert asyncio.run(p._like_once(client, "30003", 10)) == (5, 5)
+    assert client.fetches == [0, 2, 4]
+    assert sorted(client.likes) == [_key(i) for i in range(1, 6)]
+
+
+def test_like_once_stops_at_the_limit(plugin):
+    p = plugin(like_ramp_step=2)
+    client = _FakeLikeClient([[_key(i), _key(i + 1)] for i in range(1, 20, 2)])
+    assert asyncio.run(p._like_once(client, "30003", 3)) == (3, 3)
+    assert len(client.likes) == 3
+    # bounded queue: the producer is at most a couple of pages ahead of the likes
+    assert len(client.fetches) <= 4
+
+
+def test_like_once_dedup_skips_liked_and_stops_paging(plugin):
+    p = plugin(like_ramp_step=2)
+    pages = [[_key(1), _key(2)], [_key(3), _key(4)]]
+    client = _FakeLikeClient(pages, liked=[_key(2)])
+    assert asyncio.run(p._like_once(client, "30003", 10, dedup=True)) == (3, 3)
+    assert _key(2) not in client.likes
+
+    again = _FakeLikeClient(pages)
+    assert asyncio.run(p._like_once(again, "30003", 10, dedup=True)) == (0, 0)
+    # the first page holds nothing new, so older pages are not fetched
+    assert again.fetches == [0]
+
+
+def test_like_once_probes_the_head_of_an_empty_first_page(plugin):
+    p = plugin(like_ramp_step=2)
+    client = _FakeLikeClient([])
+    assert asyncio.run(p._like_once(client, "30003", 5)) == (0, 0)
+    assert client.probes == 1 and client.likes == []
+
+
+def test_probe_head_uses_the_feeds_budget_and_the_cache(load):
+    like = load("qzone_like")
+    qzone_http = load("qzone_http")
+    cache = load("qz_feed_cache").FeedCache(ttl=60)
+    acquired = []
+
+    class _Limiter:
+        async def acquire_for(self, name):
+            acquired.append(name)
+
+        def mark_used(self, name):
+            pass
+
+    client = like.QzoneLikeClient(MY_QQ, COOKIE, limiter=_Limiter(), feed_cache=cache)
+    loads = []
+
+    def _load(count, target_qq=None, start=0):
+        loads.append(start)
+        return 200, "not\nlogged in " + "x" * 400
+
+    client._load_feeds = _load
+
+    async def run():
+        await qzone_http.call(client.fetch_items, 10, "30003")
+        return await qzone_http.call(client.probe_head, 10, "30003")
+
+    status, head = asyncio.run(run())
+    assert (status, len(head)) == (200, 300) and "\n" not in head
+    assert loads == [0]  # the probe read the page fetch_items had just cached
+    assert acquired == ["fetch_items", "probe_head"]
+    assert load("qz_ratelimit").ENDPOINTS["probe_head"] == "feeds"
+
+
+def test_a_scheduled_post_wakes_dormant_protect(plugin, load, monkeypatch):
+    published = []
+
+    def publish_text(self, content):
+        published.append(content)
+        return 200, SimpleNamespace(ok=True, code=0, message="", tid="tid1")
+
+    monkeypatch.setattr(load("qzone_post").QzonePoster, "publish_text", publish_text)
+    p = plugin(
+        protect_poll_interval_sec=1,
+        protect_dormant_check_sec=0,
+        ai_post_enabled=True,
+        ai_post_interval_min=60,
+        ai_post_fixed_text="hello",
+        ai_post_prompt="hello",
+    )
+
+    async def main():
+        stop = asyncio.Event()
+        dormant = asyncio.create_task(p._protect_dormant(p._primary, stop))
+        await asyncio.sleep(0.1)
+        assert not dormant.done()
+        await p._scheduler.start()
+        try:
+            await asyncio.wait_for(dormant, timeout=3)
+        finally:
+            stop.set()
+            await p._scheduler.stop()
+
+    asyncio.run(main())
+    assert published == ["hello"]
+
+
+def test_del_comment_with_only_a_topic_lists_its_comments(plugin, load, monkeypatch):
+    comments_list = load("qzone_comments_list")
+    topic = "10001_6a1f2b3c4d5e6f7a8b9c0d01__1"
+    requested = []
+
+    def fetch_topic_comments_page(self, topic_id, pos=0, num=20):
+        requested.append((topic_id, pos))
+        items = [comments_list.CommentItem("7", "20002", "alice", "first\nline"), comments_list.CommentItem("9", "20003", "bob", "hi")]
+        return 200, 2, items
+
+    monkeypatch.setattr(comments_list.QzoneCommentLister, "fetch_topic_comments_page", fetch_topic_comments_page)
+    p = plugin()
+    event = SimpleNamespace(message_str=f"/删评 {topic}", plain_result=lambda text: text)
+
+    async def main():
+        return [r async for r in p.del_comment(event)]
+
+    (reply,) = asyncio.run(main())
+    assert requested == [(topic, 0)]
+    assert "7 | 20002 alice: first line" in reply and "9 | 20003 bob: hi" in reply
+
+
+def test_a_scheduled_post_invalidates_the_feed_cache(plugin, load, monkeypatch):
+    def publish_text(self, content):
+        return 200, SimpleNamespace(ok=True, code=0, message="", tid="tid1")
+
+    monkeypatch.setattr(load("qzone_post").QzonePoster, "publish_text", publish_text)
+    p = plugin(ai_post_enabled=True, ai_post_interval_min=60, ai_post_fixed_text="hello", ai_post_prompt="hello")
+    cache = p._feed_cache(p._primary)
+    cache.get_sync("k", lambda: (200, "before the post"))
+    assert cache.peek("k") is not None
+
+    async def main():
+        await p._scheduler.start()
+        for _ in range(40):
+            if cache.peek("k") is None:
+                break
+            await asyncio.sleep(0.05)
+        await p._scheduler.stop()
+
+    asyncio.run(main())
+    assert cache.peek("k") is None
@@ -0,0 +1,90 @@
+import asyncio
+import time
+
+import pytest
+
+
+@pytest.fixture
+def deleter(load):
+    return load("qz_protect_delete")
+
+
+@pytest.fixture
+def ref(load):
+    protect = load("qzone_protect")
+    return lambda cid="1": protect.FeedCommentRef(topic_id="10001_t__1", tid="t", abstime=0, comment_id=cid, comment_uin="20002")
+
+
+def _failing(calls):
+    async def delete_one(r):
+        calls.append(r.comment_id)
+        return False, True, "busy"
+
+    return delete_one
+
+
+def test_resubmitted_ref_is_left_to_the_retry_queue(deleter, ref):
+    calls = []
+    ex = deleter.DeleteExecutor(_failing(calls), max_attempts=3, retry_base=60)
+
+    async def main():
+        await ex.run([ref()])
+        assert await ex.run([ref()]) == (0, 0, 0)  # still backing off
+        ex._retry["10001_t__1:1"].next_try = 0  # retry is due; the scan sees the same ref again
+        return await ex.run([ref()])
+
+    assert asyncio.run(main()) == (1, 0, 1)
+    assert calls == ["1", "1"]
+
+
+def test_run_deletes_concurrently_up_to_the_limit(deleter, ref):
+    inflight, peak = 0, 0
+
+    async def delete_one(r):
+        nonlocal inflight, peak
+        inflight += 1
+        peak = max(peak, inflight)
+        await asyncio.sleep(0.01)
+        inflight -= 1
+        return True, False, ""
+
+    ex = deleter.DeleteExecutor(delete_one, concurrency=3)
+    assert asyncio.run(ex.run([ref(str(i)) for i in range(10)])) == (10, 10, 0)
+    assert peak == 3
+    assert (ex.ok, ex.pending) == (10, 0)
+
+
+def test_retryable_failures_back_off_then_give_up(deleter, ref):
+    calls = []
+    ex = deleter.DeleteExecutor(_failing(calls), max_attempts=2, retry_base=10)
+
+    async def main():
+        before = time.time()
+        await ex.run([ref()])
+        job = ex._retry["10001_t__1:1"]
+        assert before + 10 <= job.next_try <= time.time() + 10
+        job.next_try = 0
+        assert await ex.run([]) == (1, 0, 1)
+        return await ex.run([])
+
+    assert asyncio.run(main()) == (0, 0, 0)
+    assert calls == ["1", "1"]
+    assert (ex.gave_up, ex.pending, ex.retried) == (1, 0, 1)
+
+
+def test_non_retryable_failure_is_not_queued(deleter, ref):
+    async def delete_one(r):
+        return False, False, "no permission"
+
+    ex = deleter.DeleteExecutor(delete_one)
+    assert asyncio.run(ex.run([ref()])) == (1, 0, 1)
+    assert (ex.gave_up, ex.pending) == (1, 0)
+
+
+def test_exception_counts_as_retryable(deleter, ref):
+    async def delete_one(r):
+        raise ConnectionError("reset")
+
+    ex = deleter.DeleteExecutor(delete_one, max_attempts=3)
+    assert asyncio.run(ex.run([ref()])) == (1, 0, 1)
+    assert ex.pending == 1 and "reset" in ex._retry["10001_t__1:1"].last_error
@@ -0,0 +1,133 @@
+import time
+
+import pytest
+
+MY_QQ = "10001"
+COOKIE = "uin=o10001; p_skey=test"
+TOPIC = "10001_6a1f2b3c4d5e6f7a8b9c0d01__1"
+# one more root comment (id 3) for the first feed item, in the fixture's escaped form
+NEW_COMMENT = r'\x3Cli class=\"comments-item bor3\" data-type=\"commentroot\" data-tid=\"3\" data-uin=\"10004\"\x3E\x3C\/li\x3E'
+
+
+@pytest.fixture
+def protect(load):
+    return load("qzone_protect")
+
+
+@pytest.fixture
+def feeds3(fixture_text):
+    return fixture_text("feeds3_html_more.js")
+
+
+def _scanner(protect, responses):
+    """Scanner whose page 1 answers are popped from `responses`; no network, no module fallback."""
+
+    class _Scanner(protect.QzoneProtectScanner):
+        def _load_page(self, pagenum, count):
+            return responses.pop(0)
+
+        def fetch_feeds_module_html(self, host_uin, showcount=5):
+            return 500, ""
+
+    return _Scanner(MY_QQ, COOKIE)
+
+
+def _scan(protect, marks, response):
+    return _scanner(protect, [response]).scan_recent_comments(1, 10, marks=marks)
+
+
+def _snapshot(marks):
+    return dict(marks.topics), dict(marks.feed_hashes), marks.scans
+
+
+def test_advance_never_lowers_a_mark(protect):
+    marks = protect.ProtectWatermark()
+    marks.advance({"t1": 5, "t2": 2})
+    marks.advance({"t1": 3, "t2": 4})
+    assert marks.topics == {"t1": 5, "t2": 4}
+
+
+def test_advance_bounds_topics(protect):
+    marks = protect.ProtectWatermark(max_topics=2)
+    marks.advance({"a": 1})
+    marks.advance({"b": 1})
+    marks.advance({"c": 1})
+    assert list(marks.topics) == ["b", "c"]
+
+
+def test_rescan_reports_only_new_comments(protect, feeds3):
+    marks = protect.ProtectWatermark()
+    status, refs = _scan(protect, marks, (200, feeds3))
+    assert status == 200
+    assert len(refs) == 6
+    assert marks.topics[TOPIC] == 2
+
+    # same page again: every item is unchanged and skipped
+    status, refs = _scan(protect, marks, (200, feeds3))
+    assert (status, refs) == (200, [])
+    assert marks.skipped == 3
+
+    # a new comment changes one item; only the comment above the mark is reported
+    status, refs = _scan(protect, marks, (200, feeds3.replace(r"\x3C\/ul\x3E", NEW_COMMENT + r"\x3C\/ul\x3E", 1)))
+    assert [(r.topic_id, r.comment_id, r.comment_uin) for r in refs] == [(TOPIC, "3", "10004")]
+    assert marks.topics[TOPIC] == 3
+
+
+@pytest.mark.parametrize("response", [(500, ""), (200, "need_login")])
+def test_failed_scan_leaves_marks_untouched(protect, feeds3, fixture_text, response):
+    marks = protect.ProtectWatermark()
+    _scan(protect, marks, (200, feeds3))
+    before = _snapshot(marks)
+
+    status, body = response
+    if body == "need_login":
+        body = fixture_text("need_login.html")
+    assert _scan(protect, marks, (status, body))[1] == []
+    assert _snapshot(marks) == before
+
+
+def test_failed_first_scan_loses_nothing(protect, feeds3):
+    marks = protect.ProtectWatermark()
+    assert _scan(protect, marks, (500, "")) == (500, [])
+    status, refs = _scan(protect, marks, (200, feeds3))
+    assert len(refs) == 6
+
+
+def test_unchanged_item_above_its_mark_is_rescanned(protect, feeds3):
+    marks = protect.ProtectWatermark()
+    _scan(protect, marks, (200, feeds3))
+    # the topic's mark was evicted (bounded table) while the html digest stayed
+    marks.topics.pop(TOPIC)
+    status, refs = _scan(protect, marks, (200, feeds3))
+    assert sorted((r.topic_id, r.comment_id) for r in refs) == [(TOPIC, "1"), (TOPIC, "2")]
+    assert marks.skipped == 2
+
+
+def _item(load, n, abstime, html="<div class=\"f-info\">hi</div>"):
+    attrs = {"data-tid": f"tid{n}", "data-topicid": f"{MY_QQ}_tid{n}__1", "data-abstime": str(abstime)}
+    return load("qzone_feed_html").FeedItem(html=html, attrs=attrs, abstime=abstime, raw_html=html + str(n))
+
+
+def test_unchanged_quiet_item_still_goes_to_the_module_fallback(protect, load):
+    marks = protect.ProtectWatermark()
+    item = _item(load, 1, int(time.time()))
+    for _ in range(2):
+        st = protect._ScanState(marks=marks)
+        protect.QzoneProtectScanner._scan_item(st, item)
+        assert st.quiet == [f"{item.topic_id}:{item.digest}"]
+        assert protect.QzoneProtectScanner._needs_module_fallback(st)
+    assert st.unchanged == 1
+
+
+def test_a_pinned_old_post_does_not_end_the_window(protect, load):
+    now = int(time.time())
+    scanner = protect.QzoneProtectScanner
+    st = protect._ScanState(cutoff=now - 600)
+    pinned, recent = _item(load, 0, now - 86400), [_item(load, n, now - n) for n in range(1, 4)]
+    for it in [pinned, *recent]:
+        scanner._scan_item(st, it)
+    assert st.out_of_window == 1 and not scanner._past_window(st, 1)
+
+    for n in range(4, 4 + scanner.WINDOW_STOP_RUN):
+        scanner._scan_item(st, _item(load, n, now - 86400 - n))
+    assert scanner._past_window(st, 2) and st.window_stop == 2
@@ -0,0 +1,120 @@
+import asyncio
+import time
+
+import pytest
+
+
+@pytest.fixture
+def ratelimit(load):
+    return load("qz_ratelimit")
+
+
+def test_burst_is_free_then_callers_queue(ratelimit):
+    bucket = ratelimit.TokenBucket(rate_per_min=60, burst=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    # reservations go into debt, so concurrent callers line up one interval apart
+    assert bucket.reserve() == pytest.approx(1.0, abs=0.05)
+    assert bucket.reserve() == pytest.approx(2.0, abs=0.05)
+    assert bucket.waited == 2
+
+
+def test_zero_rate_never_waits(ratelimit):
+    bucket = ratelimit.TokenBucket(rate_per_min=0)
+    assert [bucket.reserve() for _ in range(5)] == [0.0] * 5
+
+
+def test_parse_rate_limits(ratelimit):
+    assert ratelimit.parse_rate_limits("feeds=30/6, comment:10; bogus delete_comment=0") == {
+        "feeds": (30.0, 6),
+        "comment": (10.0, 1),
+        "delete_comment": (0.0, 1),
+    }
+
+
+def test_client_calls_take_their_endpoint_token(ratelimit, load):
+    http = load("qzone_http")
+    limiter = ratelimit.RateLimiter({"like": (60, 1), "feeds": (0, 1)})
+
+    class _Client:
+        def __init__(self):
+            self.limiter = limiter
+
+        def send_like(self, key):
+            return 200, key
+
+        async def fetch_items(self, count):
+            return 200, [], ""
+
+    async def main():
+        c = _Client()
+        await http.call(c.fetch_items, 10)
+        await http.call(c.send_like, "k1")
+        return limiter.bucket("like").reserve()  # the like token is gone: next one waits
+
+    assert asyncio.run(main()) == pytest.approx(1.0, abs=0.3)
+    assert limiter.bucket("feeds").acquired == 1
+
+
+def test_penalize_drops_banked_budget(ratelimit):
+    bucket = ratelimit.TokenBucket(rate_per_min=60, burst=5)
+    bucket.penalize(2)
+    assert bucket.reserve() == pytest.approx(3.0, abs=0.05)
+
+
+def test_aimd_pacer(ratelimit):
+    bucket = ratelimit.TokenBucket(rate_per_min=4, burst=1)
+    pacer = ratelimit.AimdPacer(bucket, min_rate=1, max_rate=5, step=0.5, decrease=0.5, penalty=1)
+    for _ in range(4):
+        pacer.record("ok")
+    assert pacer.rate == 5  # capped at max_rate
+    pacer.record("throttled", "记录成功")
+    assert pacer.rate == 2.5
+    assert bucket.tokens() < 0  # next request waits
+    pacer.record("error")  # says nothing about pacing
+    assert pacer.rate == 2.5
+    for _ in range(3):
+        pacer.record("throttled")
+    assert pacer.rate == 1  # floored at min_rate
+
+
+@pytest.mark.parametrize(
+    "status, code, msg, expected",
+    [
+        (200, 0, "succ", "ok"),
+        (200, 0, "记录成功", "throttled"),
+        (503, None, "", "throttled"),
+        (200, -3000, "请先登录", "error"),
+    ],
+)
+def test_classify_like_result(ratelimit, status, code, msg, expected):
+    assert ratelimit.classify_like_result(status, code, msg) == expected
+
+
+def test_adaptive_poll_interval(ratelimit):
+    poll = ratelimit.AdaptivePollInterval(fast=10, idle=40, factor=2)
+    assert [poll.record(False) for _ in range(4)] == [20, 40, 40, 40]
+    assert poll.record(True) == 10
+    poll.record(False)
+    poll.reset()
+    assert poll.interval == 10
+
+
+def test_last_used_is_stamped_when_the_call_finishes(ratelimit, load):
+    http = load("qzone_http")
+    limiter = ratelimit.RateLimiter()
+    inside = []
+
+    class _Poster:
+        def __init__(self):
+            self.limiter = limiter
+
+        async def publish_text(self, content):
+            await asyncio.sleep(0.05)
+            inside.append(time.time())
+            return 200, None
+
+    asyncio.run(http.call(_Poster().publish_text, "hi"))
+    assert limiter.last_call("publish") >= inside[0]
+    assert limiter.last_call("publish", "delete") == limiter.last_used["publish"]
+    assert limiter.last_call("delete") == 0.0
@@ -0,0 +1,67 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture
+def scheduler(load):
+    return load("qz_scheduler")
+
+
+def _config(**kw):
+    cfg = {
+        "ai_post_enabled": True,
+        "ai_post_interval_min": 60,
+        "ai_post_mode": "fixed",
+        "ai_post_fixed_text": "hello",
+        "ai_post_prompt": "hello",
+    }
+    cfg.update(kw)
+    return cfg
+
+
+def _fake_publish(published):
+    def publish_text(self, content):
+        published.append(content)
+        return 200, SimpleNamespace(ok=True, code=0, message="", tid=f"tid{len(published)}")
+
+    return publish_text
+
+
+def _run(scheduler, tmp_path, config, published, seconds=1.5, **kw):
+    async def main():
+        s = scheduler.QzScheduler(
+            context=None,
+            config=config,
+            my_qq="10001",
+            cookie="uin=o10001; p_skey=test",
+            data_dir=tmp_path,
+            **kw,
+        )
+        await s.start()
+        for _ in range(int(seconds * 20)):
+            if published:
+                break
+            await asyncio.sleep(0.05)
+        await s.stop()
+        return s
+
+    return asyncio.run(main())
+
+
+def test_first_interval_post_is_due_immediately(scheduler, tmp_path, monkeypatch):
+    published = []
+    monkeypatch.setattr(scheduler.QzonePoster, "publish_text", _fake_publish(published))
+    config = _config()
+    _run(scheduler, tmp_path, config, published)
+    assert published == ["hello"]
+    assert config["ai_post_last_run_ts"] > 0
+
+
+def test_interval_post_waits_for_the_interval(scheduler, tmp_path, monkeypatch):
+    published = []
+    monkeypatch.setattr(scheduler.QzonePoster, "publish_text", _fake_publish(published))
+    _run(scheduler, tmp_path, _config(ai_post_last_run_ts=time.time()), published, seconds=0.5)
+    assert published == []
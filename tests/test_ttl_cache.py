@@ -0,0 +1,50 @@
+import pytest
+
+
+@pytest.fixture
+def cache_mod(load):
+    return load("qz_cache")
+
+
+def test_entries_expire_in_write_order(cache_mod):
+    c = cache_mod.TTLCache(ttl=10)
+    c.set("a", now=100.0)
+    c.set("b", now=105.0)
+    assert c.get("a", now=109.0) is True
+    assert c.get("a", now=110.0) is None  # a expired, b still live
+    assert c.get("b", now=110.0) is True
+    assert c.expired == 1
+
+
+def test_rewrite_moves_entry_to_the_back(cache_mod):
+    c = cache_mod.TTLCache(ttl=10)
+    c.set("a", now=100.0)
+    c.set("b", now=101.0)
+    c.set("a", now=105.0)
+    assert c.get("b", now=112.0) is None
+    assert c.get("a", now=112.0) is True
+
+
+def test_max_size_evicts_oldest_write(cache_mod):
+    c = cache_mod.TTLCache(max_size=2)
+    for k in "abc":
+        c.add(k)
+    assert [k for k, _, _ in c.items()] == ["b", "c"]
+    assert "a" not in c
+    assert c.evicted == 1
+
+
+def test_ttl_change_applies_to_existing_entries(cache_mod):
+    c = cache_mod.TTLCache(ttl=0)
+    c.set("a", now=0.0)
+    assert "a" in c  # ttl 0: never expires
+    c.ttl = 60
+    assert "a" not in c
+
+
+def test_stats_count_hits_and_misses(cache_mod):
+    c = cache_mod.TTLCache()
+    c.add("a")
+    assert "a" in c and "b" not in c
+    s = c.stats()
+    assert (s["size"], s["hits"], s["misses"], s["hit_ratio"]) == (1, 1, 1, 0.5)